@@ -25,6 +25,7 @@ from marshmallow.exceptions import ValidationError
 from sqlalchemy.exc import SQLAlchemyError
 
 from bridge.cachekeys.schemas import CacheInvalidationRequestSchema
+from bridge.common.utils.query_cache_manager import get_response_version_key
 from bridge.connectors.sqla.models import SqlaTable
 from bridge.extensions import cache_manager, db, event_logger
 from bridge.models.cache import CacheKey
@@ -101,6 +102,10 @@ class CacheRestApi(BaseBridgeModelRestApi):
         cache_keys = [c.cache_key for c in cache_key_objs]
         if cache_key_objs:
             all_keys_deleted = cache_manager.cache.delete_many(*cache_keys)
+            # drop the chart data responses built from the invalidated entries
+            cache_manager.data_cache.delete_many(
+                *[get_response_version_key(cache_key) for cache_key in cache_keys]
+            )
 
             if not all_keys_deleted:
                 # expected behavior as keys may expire and cache is not a
@@ -0,0 +1,312 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import json
+import logging
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterator, List, Optional
+
+from flask import current_app
+from sqlalchemy.engine.reflection import Inspector
+from sqlalchemy.orm import Session
+
+from bridge.databases.utils import get_col_type
+from bridge.models.catalog import CatalogColumn, CatalogSchema, CatalogTable
+from bridge.models.core import Database
+from bridge.utils.core import base_json_conv
+
+logger = logging.getLogger(__name__)
+
+# the number of rows deleted or inserted per statement
+BATCH_SIZE = 500
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, default=base_json_conv)
+
+
+def _batches(items: List[Any]) -> Iterator[List[Any]]:
+    for start in range(0, len(items), BATCH_SIZE):
+        yield items[start : start + BATCH_SIZE]
+
+
+class CatalogCrawler:
+    """
+    Crawls the metadata of the schemas and tables of a database into the catalog
+    index.
+
+    The crawl is incremental: the tables and views of the schemas listed longer than
+    `ttl` seconds ago are listed again, adding the new ones to the index and removing
+    the dropped ones. Then the columns and keys of up to `max_tables` tables are
+    reflected, starting with the tables never reflected and then the ones reflected
+    the longest ago, if longer than `ttl` seconds ago.
+    """
+
+    def __init__(
+        self,
+        database: Database,
+        session: Session,
+        ttl: Optional[int] = None,
+        max_tables: Optional[int] = None,
+    ) -> None:
+        self.database = database
+        self.session = session
+        self.ttl = timedelta(
+            seconds=current_app.config["CATALOG_INDEX_TTL"] if ttl is None else ttl
+        )
+        self.max_tables = (
+            current_app.config["CATALOG_INDEX_MAX_TABLES_PER_CRAWL"]
+            if max_tables is None
+            else max_tables
+        )
+
+    def _is_stale(self, crawled_on: Optional[datetime]) -> bool:
+        return crawled_on is None or crawled_on < datetime.utcnow() - self.ttl
+
+    def crawl(
+        self, schema_names: Optional[List[str]] = None, force: bool = False
+    ) -> Dict[str, int]:
+        """
+        Crawl the database.
+
+        :param schema_names: The schemas to crawl, all of them when None, in which
+            case the schemas that were dropped are removed from the index
+        :param force: Whether to crawl the schemas and tables regardless of the TTL
+        :returns: The number of schemas listed and tables reflected
+        """
+        schemas = self.crawl_schemas(schema_names)
+        crawled_schemas = 0
+        for schema in schemas:
+            if force or self._is_stale(schema.crawled_on):
+                try:
+                    self.crawl_schema(schema)
+                except Exception:  # pylint: disable=broad-except
+                    self.session.rollback()
+                    logger.warning(
+                        "Unable to crawl schema %s of database %s",
+                        schema.name,
+                        self.database.id,
+                        exc_info=True,
+                    )
+                else:
+                    crawled_schemas += 1
+
+        crawled_tables = self.crawl_tables(
+            [schema.id for schema in schemas if schema.crawled_on], force
+        )
+        return {"schemas": crawled_schemas, "tables": crawled_tables}
+
+    def crawl_schemas(
+        self, schema_names: Optional[List[str]] = None
+    ) -> List[CatalogSchema]:
+        """
+        Add the schemas to the index, along with all the schemas of the database when
+        none are given, in which case the dropped schemas are removed.
+
+        :param schema_names: The schemas to add, all of them when None
+        :returns: The indexed schemas
+        """
+        indexed_schemas = {
+            schema.name: schema
+            for schema in self.session.query(CatalogSchema).filter(
+                CatalogSchema.database_id == self.database.id
+            )
+        }
+        if schema_names is None:
+            schema_names = self.database.get_all_schema_names()
+            for name in set(indexed_schemas) - set(schema_names):
+                schema = indexed_schemas.pop(name)
+                self._delete_tables(
+                    [
+                        table_id
+                        for (table_id,) in self.session.query(CatalogTable.id).filter(
+                            CatalogTable.schema_id == schema.id
+                        )
+                    ]
+                )
+                self.session.delete(schema)
+
+        for name in schema_names:
+            if name not in indexed_schemas:
+                indexed_schemas[name] = CatalogSchema(
+                    database_id=self.database.id, name=name
+                )
+                self.session.add(indexed_schemas[name])
+        self.session.commit()
+        return [indexed_schemas[name] for name in schema_names]
+
+    def crawl_schema(self, schema: CatalogSchema) -> None:
+        """
+        List the tables and views of a schema, adding the new ones to the index and
+        removing the dropped ones.
+        """
+        db_engine_spec = self.database.db_engine_spec
+        inspector = self.database.inspector
+        table_types = {
+            name: "table"
+            for name in db_engine_spec.get_table_names(
+                database=self.database, inspector=inspector, schema=schema.name
+            )
+        }
+        table_types.update(
+            (name, "view")
+            for name in db_engine_spec.get_view_names(
+                database=self.database, inspector=inspector, schema=schema.name
+            )
+        )
+
+        indexed_tables = {
+            name: (table_id, table_type)
+            for table_id, name, table_type in self.session.query(
+                CatalogTable.id, CatalogTable.name, CatalogTable.type
+            ).filter(CatalogTable.schema_id == schema.id)
+        }
+        self._delete_tables(
+            [
+                table_id
+                for name, (table_id, _) in indexed_tables.items()
+                if name not in table_types
+            ]
+        )
+        for name, (table_id, table_type) in indexed_tables.items():
+            if name in table_types and table_types[name] != table_type:
+                self.session.query(CatalogTable).filter(
+                    CatalogTable.id == table_id
+                ).update({"type": table_types[name]}, synchronize_session=False)
+        new_tables = [
+            {"schema_id": schema.id, "name": name, "type": table_type}
+            for name, table_type in table_types.items()
+            if name not in indexed_tables
+        ]
+        for batch in _batches(new_tables):
+            self.session.execute(CatalogTable.__table__.insert(), batch)
+
+        schema.crawled_on = datetime.utcnow()
+        self.session.commit()
+
+    def refresh_schema(self, schema_name: str) -> None:
+        """
+        List the tables and views of a schema again, regardless of the TTL, and mark
+        its tables as not reflected: their metadata is reflected from the database,
+        eg after a table was altered, until they are crawled again.
+
+        :param schema_name: The schema to refresh
+        """
+        schema = self.crawl_schemas([schema_name])[0]
+        self.crawl_schema(schema)
+        self.session.query(CatalogTable).filter(
+            CatalogTable.schema_id == schema.id
+        ).update({"crawled_on": None}, synchronize_session=False)
+        self.session.commit()
+
+    def crawl_tables(self, schema_ids: List[int], force: bool = False) -> int:
+        """
+        Reflect the columns and keys of the tables of the schemas that are stale,
+        starting with the tables never reflected.
+
+        :param schema_ids: The ids of the indexed schemas
+        :param force: Whether to reflect the tables regardless of the TTL
+        :returns: The number of tables reflected
+        """
+        if not schema_ids:
+            return 0
+
+        query = self.session.query(CatalogTable).filter(
+            CatalogTable.schema_id.in_(schema_ids)
+        )
+        if not force:
+            query = query.filter(
+                (CatalogTable.crawled_on.is_(None))
+                | (CatalogTable.crawled_on < datetime.utcnow() - self.ttl)
+            )
+        tables = (
+            query.order_by(
+                CatalogTable.crawled_on.isnot(None),
+                CatalogTable.crawled_on,
+                CatalogTable.id,
+            )
+            .limit(self.max_tables)
+            .all()
+        )
+
+        # the inspector caches what it reflects, use one per batch of tables
+        crawled_tables = 0
+        for batch in _batches(tables):
+            inspector = self.database.inspector
+            for table in batch:
+                try:
+                    self.crawl_table(table, inspector)
+                except Exception:  # pylint: disable=broad-except
+                    logger.warning(
+                        "Unable to crawl table %s.%s of database %s",
+                        table.schema.name,
+                        table.name,
+                        self.database.id,
+                        exc_info=True,
+                    )
+                    # don't retry it before the other stale tables
+                    table.crawled_on = datetime.utcnow()
+                else:
+                    crawled_tables += 1
+            self.session.commit()
+        return crawled_tables
+
+    def crawl_table(
+        self, table: CatalogTable, inspector: Optional[Inspector] = None
+    ) -> None:
+        """
+        Reflect the columns, keys and comment of a table.
+        """
+        database = self.database
+        inspector = inspector or database.inspector
+        schema_name = table.schema.name
+
+        # reflect everything before updating the table, which is left as is if
+        # any of it fails. Dialects may reorder the column list the inspector
+        # caches when reflecting the keys (e.g. SQLite), copy it first.
+        columns = list(database.get_columns(table.name, schema_name, inspector))
+        primary_key = database.get_pk_constraint(table.name, schema_name, inspector)
+        foreign_keys = database.get_foreign_keys(table.name, schema_name, inspector)
+        indexes = database.get_indexes(table.name, schema_name, inspector)
+        comment = database.get_table_comment(table.name, schema_name, inspector)
+
+        table.primary_key = _dumps(primary_key)
+        table.foreign_keys = _dumps(foreign_keys)
+        table.indexes = _dumps(indexes)
+        table.comment = comment
+        table.columns = [
+            CatalogColumn(
+                position=position,
+                name=column["name"],
+                type=get_col_type(column),
+                comment=column.get("comment"),
+            )
+            for position, column in enumerate(columns)
+        ]
+        table.crawled_on = datetime.utcnow()
+
+    def _delete_tables(self, table_ids: List[int]) -> None:
+        for batch in _batches(table_ids):
+            self.session.execute(
+                CatalogColumn.__table__.delete().where(
+                    CatalogColumn.table_id.in_(batch)
+                )
+            )
+            self.session.execute(
+                CatalogTable.__table__.delete().where(CatalogTable.id.in_(batch))
+            )
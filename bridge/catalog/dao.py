@@ -0,0 +1,101 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from typing import List, Optional
+
+from sqlalchemy.orm import joinedload, load_only
+
+from bridge.extensions import db
+from bridge.models.catalog import CatalogSchema, CatalogTable
+from bridge.models.core import Database
+
+
+class CatalogDAO:
+    """
+    Queries of the catalog index, see `CatalogCrawler`
+    """
+
+    @staticmethod
+    def get_schema(database: Database, schema_name: str) -> Optional[CatalogSchema]:
+        return (
+            db.session.query(CatalogSchema)
+            .filter(
+                CatalogSchema.database_id == database.id,
+                CatalogSchema.name == schema_name,
+            )
+            .one_or_none()
+        )
+
+    @staticmethod
+    def find_tables(
+        database: Database,
+        schema_name: str,
+        prefix: Optional[str] = None,
+        table_type: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> Optional[List[CatalogTable]]:
+        """
+        Find the indexed tables and views of a schema, by name prefix.
+
+        :param database: The database
+        :param schema_name: The schema
+        :param prefix: The prefix of the names of the tables
+        :param table_type: Either "table" or "view", both when None
+        :param limit: The maximum number of tables
+        :returns: The tables, ordered by name, None if the schema was never crawled
+        """
+        schema = CatalogDAO.get_schema(database, schema_name)
+        if not schema or not schema.crawled_on:
+            return None
+
+        query = (
+            db.session.query(CatalogTable)
+            .options(load_only(CatalogTable.name, CatalogTable.type))
+            .filter(CatalogTable.schema_id == schema.id)
+        )
+        if prefix:
+            escaped_prefix = (
+                prefix.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            )
+            query = query.filter(
+                CatalogTable.name.like(f"{escaped_prefix}%", escape="\\")
+            )
+        if table_type:
+            query = query.filter(CatalogTable.type == table_type)
+        return query.order_by(CatalogTable.name).limit(limit).all()
+
+    @staticmethod
+    def get_table(
+        database: Database, schema_name: str, table_name: str
+    ) -> Optional[CatalogTable]:
+        """
+        Get an indexed table along with its columns.
+
+        :returns: The table, None if it isn't indexed or its columns were never
+            reflected
+        """
+        return (
+            db.session.query(CatalogTable)
+            .join(CatalogSchema)
+            .options(joinedload(CatalogTable.columns))
+            .filter(
+                CatalogSchema.database_id == database.id,
+                CatalogSchema.name == schema_name,
+                CatalogTable.name == table_name,
+                CatalogTable.crawled_on.isnot(None),
+            )
+            .one_or_none()
+        )
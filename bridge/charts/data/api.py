@@ -18,10 +18,11 @@ from __future__ import annotations
 
 import json
 import logging
+from itertools import chain
 from typing import Any, Dict, Optional, TYPE_CHECKING
 
 import simplejson
-from flask import current_app, make_response, request, Response
+from flask import current_app, make_response, request, Response, stream_with_context
 from flask_appbuilder.api import expose, protect
 from flask_babel import gettext as _
 from marshmallow import ValidationError
@@ -37,6 +38,7 @@ from bridge.charts.data.commands.create_async_job_command import (
 )
 from bridge.charts.data.commands.get_data_command import ChartDataCommand
 from bridge.charts.data.query_context_cache_loader import QueryContextCacheLoader
+from bridge.charts.data.response_cache import ChartDataResponseCache
 from bridge.charts.post_processing import apply_post_process
 from bridge.charts.schemas import ChartDataQueryContextSchema
 from bridge.common.chart_data import ChartDataResultFormat, ChartDataResultType
@@ -45,7 +47,14 @@ from bridge.dao.exceptions import DatasourceNotFound
 from bridge.exceptions import QueryObjectValidationError
 from bridge.extensions import event_logger
 from bridge.utils.async_query_manager import AsyncQueryTokenException
-from bridge.utils.core import create_zip, get_user_id, json_int_dttm_ser
+from bridge.utils.columnar import ARROW_STREAM_MIMETYPE
+from bridge.utils.core import (
+    create_zip,
+    error_msg_from_exception,
+    get_user_id,
+    json_int_dttm_ser,
+    parse_boolean_string,
+)
 from bridge.views.base import CsvResponse, generate_download_headers
 from bridge.views.base_api import statsd_metrics
 
@@ -82,7 +91,10 @@ class ChartDataRestApi(ChartRestApi):
             description: The chart ID
           - in: query
             name: format
-            description: The format in which the data should be returned
+            description: >-
+              The format in which the data should be returned: `json` records,
+              `json_columnar` arrays of values by column, `csv` or an `arrow`
+              IPC stream
             schema:
               type: string
           - in: query
@@ -95,6 +107,13 @@ class ChartDataRestApi(ChartRestApi):
             description: Should the queries be forced to load from the source
             schema:
                 type: boolean
+          - in: query
+            name: stream
+            description: >-
+              Stream the data of a single query back as CSV, or as a JSON array of
+              records, instead of the full payload
+            schema:
+                type: boolean
           responses:
             200:
               description: Query result
@@ -153,6 +172,9 @@ class ChartDataRestApi(ChartRestApi):
                 )
             )
 
+        if self._should_stream(query_context):
+            return self._get_data_stream_response(query_context)
+
         # TODO: support CSV, SQL query and other non-JSON types
         if (
             is_feature_enabled("GLOBAL_ASYNC_QUERIES")
@@ -195,6 +217,14 @@ class ChartDataRestApi(ChartRestApi):
               application/json:
                 schema:
                   $ref: "#/components/schemas/ChartDataQueryContextSchema"
+          parameters:
+          - in: query
+            name: stream
+            description: >-
+              Stream the data of a single query back as CSV, or as a JSON array of
+              records, instead of the full payload
+            schema:
+                type: boolean
           responses:
             200:
               description: Query result
@@ -243,6 +273,9 @@ class ChartDataRestApi(ChartRestApi):
                 )
             )
 
+        if self._should_stream(query_context):
+            return self._get_data_stream_response(query_context)
+
         # TODO: support CSV, SQL query and other non-JSON types
         if (
             is_feature_enabled("GLOBAL_ASYNC_QUERIES")
@@ -351,6 +384,14 @@ class ChartDataRestApi(ChartRestApi):
         # This is needed for sending reports based on text charts that do the
         # post-processing of data, eg, the pivot table.
         if result_type == ChartDataResultType.POST_PROCESSED:
+            if result_format not in (
+                ChartDataResultFormat.CSV,
+                ChartDataResultFormat.JSON,
+            ):
+                return self.response_400(
+                    message=f"Unsupported result_format for post-processing: "
+                    f"{result_format}"
+                )
             result = apply_post_process(result, form_data, datasource)
 
         if result_format == ChartDataResultFormat.CSV:
@@ -378,7 +419,32 @@ class ChartDataRestApi(ChartRestApi):
                 mimetype="application/zip",
             )
 
-        if result_format == ChartDataResultFormat.JSON:
+        if result_format == ChartDataResultFormat.ARROW:
+            if not result["queries"]:
+                return self.response_400(_("Empty query result"))
+
+            if len(result["queries"]) == 1:
+                # return single query results as an Arrow IPC stream
+                return Response(
+                    result["queries"][0]["data"], mimetype=ARROW_STREAM_MIMETYPE
+                )
+
+            # return multi-query Arrow results bundled as a zip file
+            files = {
+                f"query_{idx + 1}.arrow": result["data"]
+                for idx, result in enumerate(result["queries"])
+            }
+            return Response(
+                create_zip(files),
+                headers=generate_download_headers("zip"),
+                mimetype="application/zip",
+            )
+
+        if result_format in (
+            ChartDataResultFormat.JSON,
+            ChartDataResultFormat.JSON_COLUMNAR,
+        ):
+            # the columnar data is already serialized, column by column
             response_data = simplejson.dumps(
                 {"result": result["queries"]},
                 default=json_int_dttm_ser,
@@ -390,6 +456,44 @@ class ChartDataRestApi(ChartRestApi):
 
         return self.response_400(message=f"Unsupported result_format: {result_format}")
 
+    @staticmethod
+    def _should_stream(query_context: QueryContext) -> bool:
+        """
+        Whether the data of a single query should be streamed back, as requested
+        by the `stream` query parameter
+        """
+        return (
+            parse_boolean_string(request.args.get("stream"))
+            and len(query_context.queries) == 1
+            and query_context.result_format
+            in (ChartDataResultFormat.CSV, ChartDataResultFormat.JSON)
+            and query_context.result_type
+            in (ChartDataResultType.FULL, ChartDataResultType.RESULTS)
+        )
+
+    def _get_data_stream_response(self, query_context: QueryContext) -> Response:
+        """
+        Stream the data of a query as CSV, or as a JSON array of records
+        """
+        if query_context.result_format == ChartDataResultFormat.CSV:
+            # Verify user has permission to export CSV file
+            if not security_manager.can_access("can_csv", "Bridge"):
+                return self.response_403()
+
+        try:
+            chunks = query_context.get_data_chunks(query_context.queries[0])
+            # run the query before starting the response so that its errors can
+            # still be reported
+            first_chunk = next(chunks)
+        except Exception as ex:  # pylint: disable=broad-except
+            logger.warning("Failed to stream chart data", exc_info=True)
+            return self.response_400(message=error_msg_from_exception(ex))
+
+        data = stream_with_context(chain([first_chunk], chunks))
+        if query_context.result_format == ChartDataResultFormat.CSV:
+            return CsvResponse(data, headers=generate_download_headers("csv"))
+        return Response(data, mimetype="application/json")
+
     def _get_data_response(
         self,
         command: ChartDataCommand,
@@ -397,6 +501,11 @@ class ChartDataRestApi(ChartRestApi):
         form_data: Optional[Dict[str, Any]] = None,
         datasource: Optional[BaseDatasource] = None,
     ) -> Response:
+        response_cache = ChartDataResponseCache(command.query_context, form_data)
+        cached_response = response_cache.get()
+        if cached_response:
+            return cached_response
+
         try:
             result = command.run(force_cached=force_cached)
         except ChartDataCacheLoadError as exc:
@@ -404,7 +513,8 @@ class ChartDataRestApi(ChartRestApi):
         except ChartDataQueryFailedError as exc:
             return self.response_400(message=exc.message)
 
-        return self._send_chart_response(result, form_data, datasource)
+        response = self._send_chart_response(result, form_data, datasource)
+        return response_cache.set(response, result["queries"])
 
     # pylint: disable=invalid-name, no-self-use
     def _load_query_context_form_from_cache(self, cache_key: str) -> Dict[str, Any]:
@@ -0,0 +1,240 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import gzip
+import hashlib
+import logging
+import uuid
+from datetime import datetime
+from typing import Any, Dict, List, Optional, TYPE_CHECKING
+
+from flask import current_app, request, Response
+from flask_caching.backends import NullCache
+
+from bridge.common.chart_data import ChartDataResultFormat, ChartDataResultType
+from bridge.common.utils.query_cache_manager import get_response_version_key
+from bridge.extensions import cache_manager
+from bridge.utils.cache import generate_cache_key
+
+if TYPE_CHECKING:
+    from bridge.common.query_context import QueryContext
+
+logger = logging.getLogger(__name__)
+
+CACHEABLE_RESULT_TYPES = (
+    ChartDataResultType.FULL,
+    ChartDataResultType.POST_PROCESSED,
+)
+CACHEABLE_RESULT_FORMATS = (
+    ChartDataResultFormat.JSON,
+    ChartDataResultFormat.JSON_COLUMNAR,
+    ChartDataResultFormat.ARROW,
+)
+
+
+class ChartDataResponseCache:
+    """
+    Cache of the serialized responses of the chart data API, see
+    `CHART_DATA_RESPONSE_CACHE`.
+
+    Every data cache key a response is built from has a version, stored next to it in
+    the data cache, which is part of the key of the response. The version is dropped
+    whenever the data cache entry is written or deleted, which orphans the responses
+    built from the previous entry.
+    """
+
+    def __init__(
+        self,
+        query_context: QueryContext,
+        form_data: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        self._query_context = query_context
+        self._form_data = form_data
+        self._data_cache_keys: List[str] = []
+        self._versions: List[str] = []
+        self._key: Optional[str] = None
+        if self._is_cacheable():
+            try:
+                self._key = self._get_key()
+            except Exception as ex:  # pylint: disable=broad-except
+                # let the request fail, if it must, where its errors are handled
+                logger.warning("Unable to compute chart data response key: %s", ex)
+
+    @staticmethod
+    def _stats_incr(key: str) -> None:
+        current_app.config["STATS_LOGGER"].incr(f"chart_data_response_cache.{key}")
+
+    def _is_cacheable(self) -> bool:
+        query_context = self._query_context
+        return (
+            current_app.config["CHART_DATA_RESPONSE_CACHE"]
+            and not query_context.force
+            and not isinstance(cache_manager.data_cache.cache, NullCache)
+            and query_context.result_format in CACHEABLE_RESULT_FORMATS
+            and bool(query_context.queries)
+            and all(
+                (query_obj.result_type or query_context.result_type)
+                in CACHEABLE_RESULT_TYPES
+                for query_obj in query_context.queries
+            )
+        )
+
+    def _get_versions(self) -> List[Optional[str]]:
+        return list(
+            cache_manager.data_cache.get_many(
+                *[get_response_version_key(key) for key in self._data_cache_keys]
+            )
+        )
+
+    def _get_key(self) -> Optional[str]:
+        query_context = self._query_context
+        for query_obj in query_context.queries:
+            data_cache_key = query_context.query_cache_key(query_obj)
+            if not data_cache_key:
+                return None
+            self._data_cache_keys.append(data_cache_key)
+
+        # versions are created before the data is loaded, so that the response can't
+        # be stored under a version created after its data was replaced
+        for data_cache_key, version in zip(self._data_cache_keys, self._get_versions()):
+            if version is None:
+                cache_manager.data_cache.add(
+                    get_response_version_key(data_cache_key),
+                    uuid.uuid4().hex,
+                    timeout=query_context.get_cache_timeout(),
+                )
+        versions = self._get_versions()
+        if None in versions:
+            return None
+        self._versions = versions  # type: ignore
+
+        post_processing = (
+            self._form_data
+            if query_context.result_type == ChartDataResultType.POST_PROCESSED
+            else None
+        )
+        return generate_cache_key(
+            {
+                "data_cache_keys": self._data_cache_keys,
+                "versions": self._versions,
+                "result_type": query_context.result_type,
+                "result_format": query_context.result_format,
+                "post_processing": post_processing,
+            },
+            "chart_data_response-",
+        )
+
+    def get(self) -> Optional[Response]:
+        """
+        Get the cached response, or a 304 response if it matches the ETag of the
+        request.
+
+        :returns: The cached response, None if there's none
+        """
+        if not self._key:
+            return None
+
+        cache_value = cache_manager.data_cache.get(self._key)
+        if not cache_value:
+            self._stats_incr("miss")
+            return None
+
+        self._stats_incr("hit")
+        if "gzip" in request.accept_encodings:
+            response = Response(
+                cache_value["body"], content_type=cache_value["content_type"]
+            )
+            response.headers["Content-Encoding"] = "gzip"
+        else:
+            response = Response(
+                gzip.decompress(cache_value["body"]),
+                content_type=cache_value["content_type"],
+            )
+        response.headers.extend(cache_value["headers"])
+        return self._make_conditional(response, cache_value["etag"])
+
+    def set(self, response: Response, queries: List[Dict[str, Any]]) -> Response:
+        """
+        Store a response, if all of its data was served from the data cache.
+
+        :param response: The response to a request for the query context
+        :param queries: The payloads of the queries of the response
+        :returns: The response, with an ETag when it was stored
+        """
+        if (
+            not self._key
+            or response.status_code != 200
+            or response.is_streamed
+            or not all(query.get("is_cached") for query in queries)
+            or self._get_versions() != self._versions
+        ):
+            return response
+
+        timeout = self._get_timeout(queries)
+        if timeout is None:
+            return response
+
+        body = response.get_data()
+        etag = hashlib.md5(body).hexdigest()
+        cache_value = {
+            "body": gzip.compress(
+                body,
+                compresslevel=current_app.config[
+                    "CHART_DATA_RESPONSE_CACHE_COMPRESSION_LEVEL"
+                ],
+            ),
+            "etag": etag,
+            "content_type": response.content_type,
+            "headers": [
+                (name, value)
+                for name, value in response.headers.items()
+                if name == "Content-Disposition"
+            ],
+        }
+        try:
+            cache_manager.data_cache.set(self._key, cache_value, timeout=timeout)
+        except Exception as ex:  # pylint: disable=broad-except
+            logger.warning("Unable to cache chart data response: %s", ex)
+            return response
+        self._stats_incr("set")
+        return self._make_conditional(response, etag)
+
+    @staticmethod
+    def _get_timeout(queries: List[Dict[str, Any]]) -> Optional[int]:
+        """
+        The time left until the first of the data cache entries of the queries
+        expires, 0 if none of them expires, None if one of them already did
+        """
+        timeouts = []
+        now = datetime.utcnow()
+        for query in queries:
+            if not query.get("cache_timeout"):
+                continue
+            cached_dttm = datetime.fromisoformat(query["cached_dttm"])
+            age = int((now - cached_dttm).total_seconds())
+            timeouts.append(query["cache_timeout"] - age)
+        if not timeouts:
+            return 0
+        timeout = min(timeouts)
+        return timeout if timeout > 0 else None
+
+    @staticmethod
+    def _make_conditional(response: Response, etag: str) -> Response:
+        response.set_etag(etag, weak=True)
+        response.vary.add("Accept-Encoding")
+        return response.make_conditional(request)
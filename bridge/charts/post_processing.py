@@ -29,7 +29,9 @@ for these chart types.
 from io import StringIO
 from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
 
+import numpy as np
 import pandas as pd
+from pandas.api.types import is_numeric_dtype
 
 from bridge.common.chart_data import ChartDataResultFormat
 from bridge.utils.core import (
@@ -56,6 +58,48 @@ def get_column_key(label: Tuple[str, ...], metrics: List[str]) -> Tuple[Any, ...
     return tuple(parts)
 
 
+def get_subtotal_positions(
+    labels: pd.MultiIndex, metric_name: str
+) -> Tuple[List[Tuple[Any, ...]], List[slice], np.ndarray]:
+    """
+    Compute the totals and subtotals of a pivoted axis.
+
+    Every prefix of the labels gets a subtotal aggregating the labels starting
+    with it. The subtotal goes right after the last of these labels and after the
+    subtotals of its own subgroups. The overall total goes last.
+
+    :param labels: The labels of the pivoted axis, sorted so that groups are
+        contiguous
+    :param metric_name: The name of the overall total
+    :returns: The names of the subtotals, the slices of labels they aggregate and
+        the positions of the labels followed by the subtotals in the final order
+    """
+    tuples = labels.to_list()
+    names: List[Tuple[Any, ...]] = []
+    slices: List[slice] = []
+    sort_keys = [
+        list(range(len(tuples))),
+        [0] * len(tuples),
+        [0] * len(tuples),
+    ]
+    for level in range(labels.nlevels):
+        # a single pass per level to find the bounds of each group
+        bounds: Dict[Tuple[Any, ...], List[int]] = {}
+        for position, label in enumerate(tuples):
+            bounds.setdefault(label[:level], [position, position])[1] = position
+
+        depth = labels.nlevels - level - 1
+        total = metric_name if level == 0 else "Subtotal"
+        for subgroup, (start, stop) in bounds.items():
+            names.append((*subgroup, total, *([""] * depth)))
+            slices.append(slice(start, stop + 1))
+            sort_keys[0].append(stop)
+            sort_keys[1].append(1)
+            sort_keys[2].append(-level)
+
+    return names, slices, np.lexsort(sort_keys[::-1])
+
+
 def pivot_df(  # pylint: disable=too-many-locals, too-many-arguments, too-many-statements, too-many-branches
     df: pd.DataFrame,
     rows: List[str],
@@ -147,38 +191,36 @@ def pivot_df(  # pylint: disable=too-many-locals, too-many-arguments, too-many-s
         df.columns = pd.MultiIndex.from_tuples([(str(i),) for i in df.columns])
 
     if show_rows_total:
-        # add subtotal for each group and overall total; we start from the
-        # overall group, and iterate deeper into subgroups
-        groups = df.columns
-        for level in range(df.columns.nlevels):
-            subgroups = {group[:level] for group in groups}
-            for subgroup in subgroups:
-                slice_ = df.columns.get_loc(subgroup)
-                subtotal = pivot_v2_aggfunc_map[aggfunc](df.iloc[:, slice_], axis=1)
-                depth = df.columns.nlevels - len(subgroup) - 1
-                total = metric_name if level == 0 else "Subtotal"
-                subtotal_name = tuple([*subgroup, total, *([""] * depth)])
-                # insert column after subgroup
-                df.insert(int(slice_.stop), subtotal_name, subtotal)
+        # add subtotal for each group and overall total as new columns
+        names, slices, order = get_subtotal_positions(df.columns, metric_name)
+        subtotals = pd.concat(
+            [
+                pivot_v2_aggfunc_map[aggfunc](df.iloc[:, slice_], axis=1)
+                for slice_ in slices
+            ],
+            axis=1,
+        )
+        subtotals.columns = pd.MultiIndex.from_tuples(names, names=df.columns.names)
+        df = pd.concat([df, subtotals], axis=1).iloc[:, order]
 
     if rows and show_columns_total:
-        # add subtotal for each group and overall total; we start from the
-        # overall group, and iterate deeper into subgroups
-        groups = df.index
-        for level in range(df.index.nlevels):
-            subgroups = {group[:level] for group in groups}
-            for subgroup in subgroups:
-                slice_ = df.index.get_loc(subgroup)
-                subtotal = pivot_v2_aggfunc_map[aggfunc](
-                    df.iloc[slice_, :].apply(pd.to_numeric), axis=0
-                )
-                depth = df.index.nlevels - len(subgroup) - 1
-                total = metric_name if level == 0 else "Subtotal"
-                subtotal.name = tuple([*subgroup, total, *([""] * depth)])
-                # insert row after subgroup
-                df = pd.concat(
-                    [df[: slice_.stop], subtotal.to_frame().T, df[slice_.stop :]]
+        # add subtotal for each group and overall total as new rows
+        names, slices, order = get_subtotal_positions(df.index, metric_name)
+        is_numeric = all(is_numeric_dtype(dtype) for dtype in df.dtypes)
+        subtotals = pd.concat(
+            [
+                pivot_v2_aggfunc_map[aggfunc](
+                    df.iloc[slice_, :]
+                    if is_numeric
+                    else df.iloc[slice_, :].apply(pd.to_numeric),
+                    axis=0,
                 )
+                for slice_ in slices
+            ],
+            axis=1,
+        ).T
+        subtotals.index = pd.MultiIndex.from_tuples(names)
+        df = pd.concat([df, subtotals]).iloc[order]
 
     # if we want to apply the metrics on the rows we need to pivot the
     # dataframe back
@@ -324,7 +366,10 @@ def apply_post_process(
     post_processor = post_processors[viz_type]
 
     for query in result["queries"]:
-        if query["result_format"] not in (rf.value for rf in ChartDataResultFormat):
+        if query["result_format"] not in (
+            ChartDataResultFormat.JSON,
+            ChartDataResultFormat.CSV,
+        ):
             raise Exception(f"Result format {query['result_format']} not supported")
 
         if not query["data"]:
@@ -31,6 +31,7 @@ from bridge.commands.importers.v1.utils import (
     load_metadata,
     validate_metadata_type,
 )
+from bridge.connectors.sqla.models import SqlaTable
 from bridge.dashboards.commands.importers.v1.utils import (
     find_chart_uuids,
     import_dashboard,
@@ -39,7 +40,10 @@ from bridge.dashboards.commands.importers.v1.utils import (
 from bridge.dashboards.schemas import ImportV1DashboardSchema
 from bridge.databases.commands.importers.v1.utils import import_database
 from bridge.databases.schemas import ImportV1DatabaseSchema
-from bridge.datasets.commands.importers.v1.utils import import_dataset
+from bridge.datasets.commands.importers.v1.utils import (
+    import_dataset,
+    load_datasets_data,
+)
 from bridge.datasets.schemas import ImportV1DatasetSchema
 from bridge.models.dashboard import dashboard_slices
 from bridge.queries.saved_queries.commands.importers.v1.utils import (
@@ -88,16 +92,22 @@ class ImportAssetsCommand(BaseCommand):
 
         # import datasets
         dataset_info: Dict[str, Dict[str, Any]] = {}
+        pending_data: List[Tuple[str, SqlaTable]] = []
         for file_name, config in configs.items():
             if file_name.startswith("datasets/"):
                 config["database_id"] = database_ids[config["database_uuid"]]
-                dataset = import_dataset(session, config, overwrite=True)
+                dataset = import_dataset(
+                    session, config, overwrite=True, pending_data=pending_data
+                )
                 dataset_info[str(dataset.uuid)] = {
                     "datasource_id": dataset.id,
                     "datasource_type": dataset.datasource_type,
                     "datasource_name": dataset.table_name,
                 }
 
+        # load the data of the datasets, concurrently when possible
+        load_datasets_data(session, pending_data)
+
         # import charts
         chart_ids: Dict[str, int] = {}
         for file_name, config in configs.items():
@@ -27,6 +27,7 @@ from bridge.charts.commands.importers.v1.utils import import_chart
 from bridge.charts.schemas import ImportV1ChartSchema
 from bridge.commands.exceptions import CommandException
 from bridge.commands.importers.v1 import ImportModelsCommand
+from bridge.connectors.sqla.models import SqlaTable
 from bridge.dao.base import BaseDAO
 from bridge.dashboards.commands.importers.v1 import ImportDashboardsCommand
 from bridge.dashboards.commands.importers.v1.utils import (
@@ -39,7 +40,10 @@ from bridge.databases.commands.importers.v1 import ImportDatabasesCommand
 from bridge.databases.commands.importers.v1.utils import import_database
 from bridge.databases.schemas import ImportV1DatabaseSchema
 from bridge.datasets.commands.importers.v1 import ImportDatasetsCommand
-from bridge.datasets.commands.importers.v1.utils import import_dataset
+from bridge.datasets.commands.importers.v1.utils import (
+    import_dataset,
+    load_datasets_data,
+)
 from bridge.datasets.schemas import ImportV1DatasetSchema
 from bridge.models.dashboard import dashboard_slices
 from bridge.utils.core import get_example_default_schema
@@ -105,6 +109,7 @@ class ImportExamplesCommand(ImportModelsCommand):
         # We need to determine its ID so we can point the dataset to it.
         examples_db = get_example_database()
         dataset_info: Dict[str, Dict[str, Any]] = {}
+        pending_data: List[Tuple[str, SqlaTable]] = []
         for file_name, config in configs.items():
             if file_name.startswith("datasets/"):
                 # find the ID of the corresponding database
@@ -119,13 +124,13 @@ class ImportExamplesCommand(ImportModelsCommand):
                 if config["schema"] is None:
                     config["schema"] = get_example_default_schema()
 
-                dataset = import_dataset(
-                    session, config, overwrite=overwrite, force_data=force_data
-                )
-
                 try:
                     dataset = import_dataset(
-                        session, config, overwrite=overwrite, force_data=force_data
+                        session,
+                        config,
+                        overwrite=overwrite,
+                        force_data=force_data,
+                        pending_data=pending_data,
                     )
                 except MultipleResultsFound:
                     # Multiple result can be found for datasets. There was a bug in
@@ -142,6 +147,9 @@ class ImportExamplesCommand(ImportModelsCommand):
                     "datasource_name": dataset.table_name,
                 }
 
+        # load the data of the datasets, concurrently when possible
+        load_datasets_data(session, pending_data)
+
         # import charts
         chart_ids: Dict[str, int] = {}
         for file_name, config in configs.items():
@@ -22,8 +22,10 @@ class ChartDataResultFormat(str, Enum):
     Chart data response format
     """
 
+    ARROW = "arrow"
     CSV = "csv"
     JSON = "json"
+    JSON_COLUMNAR = "json_columnar"
 
 
 class ChartDataResultType(str, Enum):
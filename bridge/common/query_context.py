@@ -17,7 +17,7 @@
 from __future__ import annotations
 
 import logging
-from typing import Any, ClassVar, Dict, List, Optional, TYPE_CHECKING, Union
+from typing import Any, ClassVar, Dict, Iterator, List, Optional, TYPE_CHECKING, Union
 
 import pandas as pd
 
@@ -88,9 +88,12 @@ class QueryContext:
     def get_data(
         self,
         df: pd.DataFrame,
-    ) -> Union[str, List[Dict[str, Any]]]:
+    ) -> Union[str, bytes, Dict[str, Any], List[Dict[str, Any]]]:
         return self._processor.get_data(df)
 
+    def get_data_chunks(self, query_obj: QueryObject) -> Iterator[str]:
+        return self._processor.get_data_chunks(query_obj)
+
     def get_payload(
         self,
         cache_query_context: Optional[bool] = False,
@@ -19,10 +19,11 @@ from __future__ import annotations
 import copy
 import logging
 import re
-from typing import Any, ClassVar, Dict, List, Optional, TYPE_CHECKING, Union
+from typing import Any, ClassVar, Dict, Iterator, List, Optional, TYPE_CHECKING, Union
 
 import numpy as np
 import pandas as pd
+import simplejson
 from flask_babel import _
 from pandas import DateOffset
 from typing_extensions import TypedDict
@@ -46,8 +47,9 @@ from bridge.exceptions import (
 from bridge.extensions import cache_manager, security_manager
 from bridge.models.helpers import QueryResult
 from bridge.models.sql_lab import Query
-from bridge.utils import csv
+from bridge.utils import columnar, csv
 from bridge.utils.cache import generate_cache_key, set_and_log_cache
+from bridge.utils.concurrency import map_concurrently
 from bridge.utils.core import (
     DatasourceType,
     DateColumn,
@@ -58,6 +60,7 @@ from bridge.utils.core import (
     get_column_names_from_metrics,
     get_metric_names,
     get_xaxis_label,
+    json_int_dttm_ser,
     normalize_dttm_col,
     TIME_COMPARISON,
 )
@@ -114,39 +117,45 @@ class QueryContextProcessor:
         )
 
         if query_obj and cache_key and not cache.is_loaded:
-            try:
-                invalid_columns = [
-                    col
-                    for col in get_column_names_from_columns(query_obj.columns)
-                    + get_column_names_from_metrics(query_obj.metrics or [])
-                    if (
-                        col not in self._qc_datasource.column_names
-                        and col != DTTM_ALIAS
-                    )
-                ]
-
-                if invalid_columns:
-                    raise QueryObjectValidationError(
-                        _(
-                            "Columns missing in dataset: %(invalid_columns)s",
-                            invalid_columns=invalid_columns,
+            with QueryCacheManager.single_flight(
+                cache_key, CacheRegion.DATA, self._query_context.force
+            ) as coalesced_cache:
+                if coalesced_cache:
+                    cache = coalesced_cache
+                else:
+                    try:
+                        invalid_columns = [
+                            col
+                            for col in get_column_names_from_columns(query_obj.columns)
+                            + get_column_names_from_metrics(query_obj.metrics or [])
+                            if (
+                                col not in self._qc_datasource.column_names
+                                and col != DTTM_ALIAS
+                            )
+                        ]
+
+                        if invalid_columns:
+                            raise QueryObjectValidationError(
+                                _(
+                                    "Columns missing in dataset: %(invalid_columns)s",
+                                    invalid_columns=invalid_columns,
+                                )
+                            )
+
+                        query_result = self.get_query_result(query_obj)
+                        annotation_data = self.get_annotation_data(query_obj)
+                        cache.set_query_result(
+                            key=cache_key,
+                            query_result=query_result,
+                            annotation_data=annotation_data,
+                            force_query=self._query_context.force,
+                            timeout=self.get_cache_timeout(),
+                            datasource_uid=self._qc_datasource.uid,
+                            region=CacheRegion.DATA,
                         )
-                    )
-
-                query_result = self.get_query_result(query_obj)
-                annotation_data = self.get_annotation_data(query_obj)
-                cache.set_query_result(
-                    key=cache_key,
-                    query_result=query_result,
-                    annotation_data=annotation_data,
-                    force_query=self._query_context.force,
-                    timeout=self.get_cache_timeout(),
-                    datasource_uid=self._qc_datasource.uid,
-                    region=CacheRegion.DATA,
-                )
-            except QueryObjectValidationError as ex:
-                cache.error_message = str(ex)
-                cache.status = QueryStatus.FAILED
+                    except QueryObjectValidationError as ex:
+                        cache.error_message = str(ex)
+                        cache.status = QueryStatus.FAILED
 
         # the N-dimensional DataFrame has converteds into flat DataFrame
         # by `flatten operator`, "comma" in the column is escaped by `escape_separator`
@@ -309,8 +318,6 @@ class QueryContextProcessor:
         query_object: QueryObject,
     ) -> CachedTimeOffset:
         query_context = self._query_context
-        # ensure query_object is immutable
-        query_object_clone = copy.copy(query_object)
         queries: List[str] = []
         cache_keys: List[Optional[str]] = []
         rv_dfs: List[pd.DataFrame] = [df]
@@ -324,7 +331,12 @@ class QueryContextProcessor:
                     "when using a Time Comparison."
                 )
             )
+        offset_query_objects: Dict[str, QueryObject] = {}
+        offset_cache_keys: Dict[str, Optional[str]] = {}
+        offset_caches: Dict[str, QueryCacheManager] = {}
         for offset in time_offsets:
+            # ensure query_object is immutable
+            query_object_clone = copy.copy(query_object)
             try:
                 # pylint: disable=line-too-long
                 # Since the xaxis is also a column name for the time filter, xaxis_label will be set as granularity
@@ -358,12 +370,43 @@ class QueryContextProcessor:
                 for flt in query_object_clone.filter
                 if flt.get("col") != xaxis_label
             ]
+            offset_query_objects[offset] = query_object_clone
 
             # `offset` is added to the hash function
             cache_key = self.query_cache_key(query_object_clone, time_offset=offset)
-            cache = QueryCacheManager.get(
+            offset_cache_keys[offset] = cache_key
+            offset_caches[offset] = QueryCacheManager.get(
                 cache_key, CacheRegion.DATA, query_context.force
             )
+
+        # the offsets missing from the cache are independent queries, run them
+        # concurrently
+        uncached_offsets = [
+            offset for offset in time_offsets if not offset_caches[offset].is_loaded
+        ]
+        query_datasource = (
+            self._qc_datasource.exc_query
+            if isinstance(self._qc_datasource, Query)
+            else self._qc_datasource.query
+        )
+        results = dict(
+            zip(
+                uncached_offsets,
+                map_concurrently(
+                    query_datasource,
+                    [
+                        offset_query_objects[offset].to_dict()
+                        for offset in uncached_offsets
+                    ],
+                    database_id=self._qc_datasource.database.id,
+                ),
+            )
+        )
+
+        for offset in time_offsets:
+            query_object_clone = offset_query_objects[offset]
+            cache_key = offset_cache_keys[offset]
+            cache = offset_caches[offset]
             # whether hit on the cache
             if cache.is_loaded:
                 rv_dfs.append(cache.df)
@@ -381,11 +424,7 @@ class QueryContextProcessor:
             }
             join_keys = [col for col in df.columns if col not in metrics_mapping.keys()]
 
-            if isinstance(self._qc_datasource, Query):
-                result = self._qc_datasource.exc_query(query_object_clone_dct)
-            else:
-                result = self._qc_datasource.query(query_object_clone_dct)
-
+            result = results[offset]
             queries.append(result.query)
             cache_keys.append(None)
 
@@ -445,7 +484,9 @@ class QueryContextProcessor:
         rv_df = pd.concat(rv_dfs, axis=1, copy=False) if time_offsets else df
         return CachedTimeOffset(df=rv_df, queries=queries, cache_keys=cache_keys)
 
-    def get_data(self, df: pd.DataFrame) -> Union[str, List[Dict[str, Any]]]:
+    def get_data(
+        self, df: pd.DataFrame
+    ) -> Union[str, bytes, Dict[str, Any], List[Dict[str, Any]]]:
         if self._query_context.result_format == ChartDataResultFormat.CSV:
             include_index = not isinstance(df.index, pd.RangeIndex)
             columns = list(df.columns)
@@ -457,8 +498,86 @@ class QueryContextProcessor:
             )
             return result or ""
 
+        if self._query_context.result_format == ChartDataResultFormat.JSON_COLUMNAR:
+            return columnar.df_to_columnar_json(df)
+
+        if self._query_context.result_format == ChartDataResultFormat.ARROW:
+            return columnar.df_to_arrow_stream(df)
+
         return df.to_dict(orient="records")
 
+    def get_data_chunks(self, query_obj: QueryObject) -> Iterator[str]:
+        """
+        Streaming counterpart of `get_data`, returning the data of a query object in
+        chunks of up to `CHART_DATA_STREAMING_CHUNK_SIZE` rows.
+
+        Results that are cached, post-processed or compared to other time ranges
+        are loaded as a whole first. The others are fetched from the cursor chunk
+        by chunk, and aren't cached.
+        """
+        chunk_size = config["CHART_DATA_STREAMING_CHUNK_SIZE"]
+        cache = QueryCacheManager.get(
+            self.query_cache_key(query_obj),
+            CacheRegion.DATA,
+            self._query_context.force,
+        )
+        if (
+            not cache.is_loaded
+            and not query_obj.post_processing
+            and not query_obj.time_offsets
+        ):
+            try:
+                dfs = self._qc_datasource.iter_query(query_obj.to_dict(), chunk_size)
+            except NotImplementedError:
+                pass
+            else:
+                return self._get_data_chunks(
+                    (
+                        df if df.empty else self.normalize_df(df, query_obj)
+                        for df in dfs
+                    ),
+                    include_index=False,
+                )
+
+        payload = self.get_df_payload(query_obj)
+        if payload["status"] == QueryStatus.FAILED:
+            raise QueryObjectValidationError(payload["error"])
+        df = payload["df"]
+        return self._get_data_chunks(
+            (
+                df.iloc[start : start + chunk_size]
+                for start in range(0, max(len(df.index), 1), chunk_size)
+            ),
+            include_index=not isinstance(df.index, pd.RangeIndex),
+        )
+
+    def _get_data_chunks(
+        self, dfs: Iterator[pd.DataFrame], include_index: bool
+    ) -> Iterator[str]:
+        if self._query_context.result_format == ChartDataResultFormat.CSV:
+            verbose_map = self._qc_datasource.data.get("verbose_map", {})
+            for idx, df in enumerate(dfs):
+                if verbose_map:
+                    df = df.rename(columns=verbose_map, copy=False)
+                yield csv.df_to_escaped_csv(
+                    df, header=idx == 0, index=include_index, **config["CSV_EXPORT"]
+                )
+            return
+
+        yield "["
+        separator = ""
+        for df in dfs:
+            if not df.empty:
+                records = simplejson.dumps(
+                    df.to_dict(orient="records"),
+                    default=json_int_dttm_ser,
+                    ignore_nan=True,
+                )
+                # strip the brackets, the records of all chunks make a single array
+                yield separator + records[1:-1]
+                separator = ", "
+        yield "]"
+
     def get_payload(
         self,
         cache_query_context: Optional[bool] = False,
@@ -466,16 +585,25 @@ class QueryContextProcessor:
     ) -> Dict[str, Any]:
         """Returns the query results with both metadata and data"""
 
+        datasource = self._qc_datasource
+        if len(self._query_context.queries) > 1:
+            # the query objects are resolved concurrently, load the relationships of
+            # the datasource beforehand so that the worker threads don't lazy load
+            # them at the same time through the session of the request
+            for relationship in ("database", "columns", "metrics"):
+                getattr(datasource, relationship, None)
+
         # Get all the payloads from the QueryObjects
-        query_results = [
-            get_query_results(
+        query_results = map_concurrently(
+            lambda query_obj: get_query_results(
                 query_obj.result_type or self._query_context.result_type,
                 self._query_context,
                 query_obj,
                 force_cached,
-            )
-            for query_obj in self._query_context.queries
-        ]
+            ),
+            self._query_context.queries,
+            database_id=datasource.database.id,
+        )
         return_value = {"queries": query_results}
 
         if cache_query_context:
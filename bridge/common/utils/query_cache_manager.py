@@ -17,9 +17,13 @@
 from __future__ import annotations
 
 import logging
-from typing import Any, Dict, List, Optional
+import time
+import uuid
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
 
 from flask_caching import Cache
+from flask_caching.backends import NullCache
 from pandas import DataFrame
 
 from bridge import app
@@ -30,6 +34,7 @@ from bridge.extensions import cache_manager
 from bridge.models.helpers import QueryResult
 from bridge.stats_logger import BaseStatsLogger
 from bridge.utils.cache import set_and_log_cache
+from bridge.utils.cache_codecs import decode_dataframe, encode_dataframe
 from bridge.utils.core import error_msg_from_exception, get_stacktrace
 
 config = app.config
@@ -42,6 +47,14 @@ _cache: Dict[CacheRegion, Cache] = {
 }
 
 
+def get_lease_key(key: str) -> str:
+    return f"{key}__lease"
+
+
+def get_response_version_key(key: str) -> str:
+    return f"{key}__response_version"
+
+
 class QueryCacheManager:
     """
     Class for manage query-cache getting and setting
@@ -62,7 +75,9 @@ class QueryCacheManager:
         cache_dttm: Optional[str] = None,
         cache_value: Optional[Dict[str, Any]] = None,
     ) -> None:
-        self.df = df
+        self._df = df
+        self._df_payload: Any = None
+        self._df_codec: Optional[str] = None
         self.query = query
         self.annotation_data = {} if annotation_data is None else annotation_data
         self.applied_template_filters = applied_template_filters or []
@@ -75,6 +90,21 @@ class QueryCacheManager:
         self.cache_dttm = cache_dttm
         self.cache_value = cache_value
 
+    @property
+    def df(self) -> DataFrame:
+        """
+        The query result, decoded from the cached value on first access
+        """
+        if self._df_payload is not None:
+            self._df = decode_dataframe(self._df_payload, self._df_codec)
+            self._df_payload = None
+        return self._df
+
+    @df.setter
+    def df(self, df: DataFrame) -> None:
+        self._df = df
+        self._df_payload = None
+
     # pylint: disable=too-many-arguments
     def set_query_result(
         self,
@@ -103,13 +133,20 @@ class QueryCacheManager:
                     stats_logger.incr("loaded_from_source_without_force")
                 self.is_loaded = True
 
-            value = {
-                "df": self.df,
-                "query": self.query,
-                "applied_template_filters": self.applied_template_filters,
-                "annotation_data": self.annotation_data,
-            }
-            if self.is_loaded and key and self.status != QueryStatus.FAILED:
+            if (
+                self.is_loaded
+                and key
+                and self.status != QueryStatus.FAILED
+                and not isinstance(_cache[region].cache, NullCache)
+            ):
+                df_codec, df_payload = encode_dataframe(self.df)
+                value = {
+                    "df": df_payload,
+                    "df_codec": df_codec,
+                    "query": self.query,
+                    "applied_template_filters": self.applied_template_filters,
+                    "annotation_data": self.annotation_data,
+                }
                 self.set(
                     key=key,
                     value=value,
@@ -144,7 +181,9 @@ class QueryCacheManager:
             logger.info("Cache key: %s", key)
             stats_logger.incr("loading_from_cache")
             try:
-                query_cache.df = cache_value["df"]
+                # pylint: disable=protected-access
+                query_cache._df_payload = cache_value["df"]
+                query_cache._df_codec = cache_value.get("df_codec")
                 query_cache.query = cache_value["query"]
                 query_cache.annotation_data = cache_value.get("annotation_data", {})
                 query_cache.applied_template_filters = cache_value.get(
@@ -187,6 +226,9 @@ class QueryCacheManager:
         """
         if key:
             set_and_log_cache(_cache[region], key, value, timeout, datasource_uid)
+            if region == CacheRegion.DATA:
+                # the chart data responses built from the previous value are stale
+                _cache[region].delete(get_response_version_key(key))
 
     @staticmethod
     def delete(
@@ -195,6 +237,8 @@ class QueryCacheManager:
     ) -> None:
         if key:
             _cache[region].delete(key)
+            if region == CacheRegion.DATA:
+                _cache[region].delete(get_response_version_key(key))
 
     @staticmethod
     def has(
@@ -202,3 +246,101 @@ class QueryCacheManager:
         region: CacheRegion = CacheRegion.DEFAULT,
     ) -> bool:
         return bool(_cache[region].get(key)) if key else False
+
+    @classmethod
+    @contextmanager
+    def single_flight(
+        cls,
+        key: Optional[str],
+        region: CacheRegion = CacheRegion.DEFAULT,
+        force_query: Optional[bool] = False,
+    ) -> Iterator[Optional["QueryCacheManager"]]:
+        """
+        Coalesce concurrent computations of the same cache key.
+
+        Yields the value cached by a concurrent worker holding the lease for the key,
+        once it's available. Yields None when the caller should compute and cache the
+        value itself, in which case it holds the lease until the context exits, unless
+        the wait for the concurrent worker timed out.
+        """
+        if not key or force_query or not config["DATA_CACHE_SINGLE_FLIGHT"]:
+            yield None
+            return
+
+        token = cls.acquire_lease(key, region)
+        if token:
+            try:
+                yield None
+            finally:
+                cls.release_lease(key, token, region)
+            return
+
+        yield cls.wait_for_lease(key, region)
+
+    @staticmethod
+    def acquire_lease(
+        key: str, region: CacheRegion = CacheRegion.DEFAULT
+    ) -> Optional[str]:
+        """
+        Try to take the lease to compute the value of a cache key
+
+        :returns: A token identifying the lease if it was acquired, None otherwise
+        """
+        token = str(uuid.uuid4())
+        try:
+            acquired = _cache[region].add(
+                get_lease_key(key), token, timeout=config["DATA_CACHE_LEASE_TIMEOUT"]
+            )
+        except Exception as ex:  # pylint: disable=broad-except
+            # don't let a failing cache backend block the query, proceed as if the
+            # lease was acquired
+            logger.warning("Unable to acquire lease for key %s: %s", key, ex)
+            return token
+        if acquired:
+            stats_logger.incr("single_flight.lease_acquired")
+            return token
+        return None
+
+    @staticmethod
+    def release_lease(
+        key: str, token: str, region: CacheRegion = CacheRegion.DEFAULT
+    ) -> None:
+        """
+        Release a lease, unless it expired and was taken by another worker since
+        """
+        lease_key = get_lease_key(key)
+        try:
+            if _cache[region].get(lease_key) == token:
+                _cache[region].delete(lease_key)
+        except Exception as ex:  # pylint: disable=broad-except
+            logger.warning("Unable to release lease for key %s: %s", key, ex)
+
+    @classmethod
+    def wait_for_lease(
+        cls, key: str, region: CacheRegion = CacheRegion.DEFAULT
+    ) -> Optional["QueryCacheManager"]:
+        """
+        Wait for the holder of the lease of a cache key to cache its value
+
+        :returns: The cached value, or None if the lease was released without caching
+            a value (eg, the query failed) or the wait timed out
+        """
+        stats_logger.incr("single_flight.lease_wait")
+        start = time.monotonic()
+        deadline = start + config["DATA_CACHE_LEASE_WAIT_TIMEOUT"]
+        query_cache: Optional[QueryCacheManager] = None
+        while time.monotonic() < deadline:
+            time.sleep(config["DATA_CACHE_LEASE_POLL_INTERVAL"])
+            lease_released = not _cache[region].get(get_lease_key(key))
+            query_cache = cls.get(key, region)
+            if query_cache.is_loaded or lease_released:
+                break
+        stats_logger.timing(
+            "single_flight.lease_wait_time", (time.monotonic() - start) * 1000
+        )
+
+        if query_cache and query_cache.is_loaded:
+            stats_logger.incr("single_flight.coalesced")
+            return query_cache
+        stats_logger.incr("single_flight.lease_wait_miss")
+        return None
@@ -75,6 +75,10 @@ if TYPE_CHECKING:
 
 # Realtime stats logger, a StatsD implementation exists
 STATS_LOGGER = DummyStatsLogger()
+# Event logger, writing the logs of user actions to the `logs` table. To take these
+# writes off the request path, `bridge.utils.log.AsyncDBEventLogger` buffers them in
+# a bounded queue and writes them in batches from a background thread, eg:
+# EVENT_LOGGER = AsyncDBEventLogger(max_queue_size=10000, batch_size=500)
 EVENT_LOGGER = DBEventLogger()
 
 BRIDGE_LOG_VIEW = True
@@ -154,6 +158,15 @@ ROW_LIMIT = 50000
 SAMPLES_ROW_LIMIT = 1000
 # max rows retrieved by filter select auto complete
 FILTER_SELECT_ROW_LIMIT = 10000
+# Maximum number of queries of a single chart data request (eg time comparisons) run
+# concurrently, set to 1 to run them one after the other
+DATA_QUERY_MAX_WORKERS = 4
+# Maximum number of such concurrent queries run against a single database, per process
+DATA_QUERY_MAX_CONCURRENCY_PER_DATABASE = 8
+# Maximum number of datasets whose data is loaded concurrently when importing a
+# bundle (eg the examples), set to 1 to load them one after the other. Data loaded
+# into the metadata database or into SQLite is always loaded serially.
+DATASET_IMPORT_MAX_WORKERS = 4
 # default time filter in explore
 # values may be "Last day", "Last week", "<ISO date> : now", etc.
 DEFAULT_TIME_FILTER = NO_TIME_RANGE
@@ -256,6 +269,17 @@ FLASK_USE_RELOAD = True
 # to the page to see the call stack.
 PROFILING = False
 
+# Fraction of the requests and Celery tasks to profile with a sampling profiler,
+# for instance 0.01 to profile one request out of a hundred. Stacks are sampled
+# every PROFILING_SAMPLE_INTERVAL seconds and aggregated per endpoint or task name.
+# They are exported to PROFILING_OUTPUT_DIR every PROFILING_EXPORT_INTERVAL seconds,
+# as collapsed stacks (``.collapsed``, for flamegraph tools) and speedscope
+# (``.speedscope.json``) files. Like ``PROFILING``, this requires pyinstrument.
+PROFILING_SAMPLE_RATE = 0.0
+PROFILING_SAMPLE_INTERVAL = 0.001
+PROFILING_OUTPUT_DIR = os.path.join(DATA_DIR, "profiles")
+PROFILING_EXPORT_INTERVAL = int(timedelta(minutes=1).total_seconds())
+
 # Bridge allows server-side python stacktraces to be surfaced to the
 # user when this feature is on. This may has security implications
 # and it's more secure to turn it off in production settings.
@@ -591,7 +615,8 @@ SCREENSHOT_LOCATE_WAIT = int(timedelta(seconds=10).total_seconds())
 SCREENSHOT_LOAD_WAIT = int(timedelta(minutes=1).total_seconds())
 # Selenium destroy retries
 SCREENSHOT_SELENIUM_RETRIES = 5
-# Give selenium an headstart, in seconds
+# Maximum time given to the page to load before looking for the element to capture,
+# in seconds
 SCREENSHOT_SELENIUM_HEADSTART = 3
 # Wait for the chart animation, in seconds
 SCREENSHOT_SELENIUM_ANIMATION_WAIT = 5
@@ -602,6 +627,10 @@ SCREENSHOT_SELENIUM_ANIMATION_WAIT = 5
 # The file upload folder, when using models with files
 UPLOAD_FOLDER = BASE_DIR + "/app/static/uploads/"
 UPLOAD_CHUNK_SIZE = 4096
+# The number of rows of uploaded CSV, Excel and columnar files which are read,
+# coerced and written to the database at a time. It bounds the memory used by an
+# upload, while larger chunks make fewer round trips to the database.
+UPLOAD_ROWS_PER_CHUNK = 10000
 
 # The image upload folder, when using models with images
 IMG_UPLOAD_FOLDER = BASE_DIR + "/app/static/uploads/"
@@ -637,9 +666,52 @@ EXPLORE_FORM_DATA_CACHE_CONFIG: CacheConfig = {
     "REFRESH_TIMEOUT_ON_RETRIEVAL": True,
 }
 
+# Index the metadata of the schemas, tables and columns of the databases in the metadata
+# database, so that SQL Lab lists tables and shows their columns without reflecting them
+# from the database on every request. The index is filled by the
+# `catalog.crawl_databases` Celery task, scheduled below. Each crawl lists the tables of
+# the schemas listed more than CATALOG_INDEX_TTL seconds ago again, and reflects the
+# columns and keys of up to CATALOG_INDEX_MAX_TABLES_PER_CRAWL tables, the ones never
+# reflected first and then the ones reflected more than CATALOG_INDEX_TTL seconds ago.
+# Schemas and tables that weren't crawled yet are reflected from the database.
+CATALOG_INDEX_ENABLED = False
+CATALOG_INDEX_TTL = int(timedelta(days=1).total_seconds())
+CATALOG_INDEX_MAX_TABLES_PER_CRAWL = 1000
+
 # store cache keys by datasource UID (via CacheKey) for custom processing/invalidation
 STORE_CACHE_KEYS_IN_METADATA_DB = False
 
+# Coalesce concurrent data cache misses of the same chart query ("single-flight"):
+# the first worker missing the cache takes a lease, stored in the data cache, and runs
+# the query while the other workers wait for its result, for up to
+# DATA_CACHE_LEASE_WAIT_TIMEOUT seconds, before running the query themselves. The lease
+# expires after DATA_CACHE_LEASE_TIMEOUT seconds in case its holder dies. This requires
+# a data cache shared by all workers and supporting atomic adds, eg Redis.
+DATA_CACHE_SINGLE_FLIGHT = False
+DATA_CACHE_LEASE_TIMEOUT = int(timedelta(minutes=5).total_seconds())
+DATA_CACHE_LEASE_WAIT_TIMEOUT = 30
+DATA_CACHE_LEASE_POLL_INTERVAL = 0.25
+
+# Codec used to store query result DataFrames in the data cache. "arrow" stores them as
+# compressed Arrow IPC streams (DATA_CACHE_ARROW_COMPRESSION being "lz4", "zstd" or
+# None), which are smaller and faster to (de)serialize than pickled DataFrames;
+# DataFrames Arrow can't represent faithfully are pickled regardless. Additional codecs,
+# subclasses of `bridge.utils.cache_codecs.DataFrameCodec`, can be registered by name
+# in DATA_CACHE_DATAFRAME_CODECS.
+DATA_CACHE_DATAFRAME_CODEC = "arrow"
+DATA_CACHE_ARROW_COMPRESSION: Optional[str] = "lz4"
+DATA_CACHE_DATAFRAME_CODECS: Dict[str, Any] = {}
+
+# Store the serialized responses of the chart data API, gzipped, in the data cache so
+# that requests whose data is already cached are answered without deserializing and
+# encoding their DataFrames again. Responses are keyed by the data cache keys of their
+# queries along with the result type, format and post-processing form data, carry an
+# ETag, and are invalidated along with the data cache entries they were built from.
+# Only responses to requests served from the data cache are stored, which keeps their
+# `is_cached` and `cached_dttm` metadata accurate.
+CHART_DATA_RESPONSE_CACHE = False
+CHART_DATA_RESPONSE_CACHE_COMPRESSION_LEVEL = 6
+
 # CORS Options
 ENABLE_CORS = False
 CORS_OPTIONS: Dict[Any, Any] = {}
@@ -684,6 +756,12 @@ ALLOWED_EXTENSIONS = {*EXCEL_EXTENSIONS, *CSV_EXTENSIONS, *COLUMNAR_EXTENSIONS}
 # note: index option should not be overridden
 CSV_EXPORT = {"encoding": "utf-8"}
 
+# Number of rows per chunk of the chart data CSV and JSON exports streamed when
+# passing `stream=true` to the chart data API. Results which don't need to be cached,
+# post-processed or compared to other time ranges are fetched from the database
+# cursor chunk by chunk, bounding the memory used by large exports.
+CHART_DATA_STREAMING_CHUNK_SIZE = 10000
+
 # ---------------------------------------------------
 # Time grain configurations
 # ---------------------------------------------------
@@ -781,6 +859,12 @@ DISPLAY_MAX_ROW = 10000
 # the SQL Lab UI
 DEFAULT_SQLLAB_LIMIT = 1000
 
+# SQL Lab fetches results from the cursor this many rows at a time, converting
+# each chunk to Arrow before fetching the next one, so that the rows are never all
+# held as Python objects. Statements which can't be limited in SQL stop being
+# fetched past SQL_MAX_ROW rows. Set to 0 to fetch the whole result at once.
+SQLLAB_FETCH_CHUNK_SIZE = 10000
+
 # Adds a warning message on sqllab save query and schedule query modals.
 SQLLAB_SAVE_WARNING_MESSAGE = None
 SQLLAB_SCHEDULE_WARNING_MESSAGE = None
@@ -835,6 +919,10 @@ class CeleryConfig:  # pylint: disable=too-few-public-methods
             "task": "reports.prune_log",
             "schedule": crontab(minute=0, hour=0),
         },
+        "catalog.crawl_databases": {
+            "task": "catalog.crawl_databases",
+            "schedule": crontab(minute=30, hour="*"),
+        },
     }
 
 
@@ -943,6 +1031,13 @@ RESULTS_BACKEND: Optional[BaseCache] = None
 # in order to disable should breaking issues be discovered.
 RESULTS_BACKEND_USE_MSGPACK = True
 
+# When using PyArrow, results are stored in the Arrow IPC format split in record
+# batches of at most this many rows, so a page of the results can be served
+# without decoding the whole result set. Each batch is compressed with the given
+# codec ("lz4", "zstd" or None).
+RESULTS_BACKEND_ARROW_BATCH_SIZE = 10000
+RESULTS_BACKEND_ARROW_COMPRESSION: Optional[str] = "lz4"
+
 # The S3 bucket where you want to store your external hive tables created
 # from CSV files. For example, 'companyname-bridge'
 CSV_TO_HIVE_UPLOAD_S3_BUCKET = None
@@ -1110,6 +1205,27 @@ DASHBOARD_TEMPLATE_ID = None
 # as such `create_engine(url, **params)`
 DB_CONNECTION_MUTATOR = None
 
+# Reuse SQLAlchemy engines, and their connection pool, across queries instead of
+# creating a new engine with a ``NullPool`` (i.e. a new connection) for every query.
+# Engines are cached per process and keyed by database, final connection URL
+# (after schema adjustment, impersonation and ``DB_CONNECTION_MUTATOR``) and engine
+# params. They are disposed when the database is updated or deleted, or when the
+# least recently used engine is evicted once ``SQLALCHEMY_ENGINE_CACHE_SIZE`` is
+# reached. Updating a database only disposes its engines in the process handling the
+# update. SQL Lab queries, which can change the state of their session, always run on
+# a new connection.
+SQLALCHEMY_ENGINE_CACHE_ENABLED = False
+SQLALCHEMY_ENGINE_CACHE_SIZE = 100
+# Pool options of the cached engines, ``pool_size`` and ``max_overflow`` only apply
+# to dialects using a ``QueuePool``. The ``engine_params`` of a database take
+# precedence over these.
+SQLALCHEMY_ENGINE_POOL_OPTIONS: Dict[str, Any] = {
+    "pool_size": 5,
+    "max_overflow": 10,
+    "pool_recycle": 3600,
+    "pool_pre_ping": True,
+}
+
 
 # A function that intercepts the SQL to be executed and can alter it.
 # The use case is can be around adding some sort of comment header
@@ -1224,6 +1340,15 @@ WEBDRIVER_WINDOW = {
 # offline webdriver
 WEBDRIVER_AUTH_FUNC = None
 
+# Each worker process keeps up to WEBDRIVER_POOL_SIZE idle, authenticated drivers
+# to take the next screenshots with the same driver type, user and window size,
+# instead of starting a new browser every time. Drivers are restarted after
+# WEBDRIVER_POOL_MAX_AGE seconds or WEBDRIVER_POOL_MAX_USES screenshots. Pooling is
+# disabled by default: a new driver is started for every screenshot.
+WEBDRIVER_POOL_SIZE = 0
+WEBDRIVER_POOL_MAX_AGE = int(timedelta(hours=1).total_seconds())
+WEBDRIVER_POOL_MAX_USES = 100
+
 # Any config options to be passed as-is to the webdriver
 WEBDRIVER_CONFIGURATION: Dict[Any, Any] = {"service_log_path": "/dev/null"}
 
@@ -1303,6 +1428,19 @@ TALISMAN_CONFIG = {
 # }
 RLS_FORM_QUERY_REL_FIELDS: Optional[Dict[str, List[List[Any]]]] = None
 
+# The row level security filters of each (user roles, table) pair are cached in the
+# metadata cache (see `CACHE_CONFIG`) for this many seconds. Changing a filter
+# invalidates them all, once committed. A per-process cache, eg `SimpleCache`, can't
+# invalidate the filters cached by other workers, so they are only cached when the
+# metadata cache is shared by the processes, eg `RedisCache`.
+RLS_FILTERS_CACHE_TIMEOUT = int(timedelta(days=1).total_seconds())
+
+# The permissions of roles are indexed by each process, and reloaded after they are
+# changed or at least every this many seconds. The changes are signalled through
+# the metadata cache (see `CACHE_CONFIG`): when it isn't shared by the processes, eg
+# `NullCache` or `SimpleCache`, the permissions are loaded by each request instead.
+PERMISSION_INDEX_TIMEOUT = int(timedelta(minutes=5).total_seconds())
+
 #
 # Flask session cookie options
 #
@@ -19,7 +19,18 @@ from __future__ import annotations
 import json
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, Hashable, List, Optional, Set, Type, TYPE_CHECKING, Union
+from typing import (
+    Any,
+    Dict,
+    Hashable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Type,
+    TYPE_CHECKING,
+    Union,
+)
 
 from flask_appbuilder.security.sqla.models import User
 from sqlalchemy import and_, Boolean, Column, Integer, String, Text
@@ -37,6 +48,8 @@ from bridge.utils import core as utils
 from bridge.utils.core import GenericDataType, MediumText
 
 if TYPE_CHECKING:
+    import pandas as pd
+
     from bridge.db_engine_specs.base import BaseEngineSpec
 
 METRIC_FORM_DATA_PARAMS = [
@@ -464,6 +477,16 @@ class BaseDatasource(
         """
         raise NotImplementedError()
 
+    def iter_query(
+        self, query_obj: QueryObjectDict, chunk_size: int
+    ) -> Iterator[pd.DataFrame]:
+        """Executes the query and returns its result as dataframes of up to
+        ``chunk_size`` rows, fetched as they are consumed
+
+        Used to stream large results, datasources that can't stream them
+        raise ``NotImplementedError``"""
+        raise NotImplementedError()
+
     def values_for_column(self, column_name: str, limit: int = 10000) -> List[Any]:
         """Given a column, returns an iterable of distinct values
 
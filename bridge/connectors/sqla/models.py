@@ -24,12 +24,14 @@ import re
 from collections import defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
+from functools import partial
 from typing import (
     Any,
     Callable,
     cast,
     Dict,
     Hashable,
+    Iterator,
     List,
     NamedTuple,
     Optional,
@@ -1843,6 +1845,53 @@ class SqlaTable(Model, BaseDatasource):  # pylint: disable=too-many-public-metho
 
         return or_(*groups)
 
+    @staticmethod
+    def assign_column_label(
+        df: pd.DataFrame, labels_expected: List[str]
+    ) -> Optional[pd.DataFrame]:
+        """
+        Some engines change the case or generate bespoke column names, either by
+        default or due to lack of support for aliasing. This function ensures that
+        the column names in the DataFrame correspond to what is expected by
+        the viz components.
+
+        Sometimes a query may also contain only order by columns that are not used
+        as metrics or groupby columns, but need to present in the SQL `select`,
+        filtering by `labels_expected` make sure we only return columns users want.
+
+        :param df: Original DataFrame returned by the engine
+        :param labels_expected: The expected column labels
+        :return: Mutated DataFrame
+        """
+        if df is not None and not df.empty:
+            if len(df.columns) < len(labels_expected):
+                raise QueryObjectValidationError(
+                    _("Db engine did not return all queried columns")
+                )
+            if len(df.columns) > len(labels_expected):
+                df = df.iloc[:, 0 : len(labels_expected)]
+            df.columns = labels_expected
+        return df
+
+    def iter_query(
+        self, query_obj: QueryObjectDict, chunk_size: int
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Run the query, returning its result as DataFrames of up to `chunk_size` rows
+        fetched from the cursor as they are consumed. Unlike `query`, errors are
+        raised.
+        """
+        query_str_ext = self.get_query_str_extended(query_obj)
+        return self.database.iter_df(
+            query_str_ext.sql,
+            self.schema,
+            chunk_size=chunk_size,
+            mutator=partial(
+                self.assign_column_label,
+                labels_expected=query_str_ext.labels_expected,
+            ),
+        )
+
     def query(self, query_obj: QueryObjectDict) -> QueryResult:
         qry_start_dttm = datetime.now()
         query_str_ext = self.get_query_str_extended(query_obj)
@@ -1851,33 +1900,15 @@ class SqlaTable(Model, BaseDatasource):  # pylint: disable=too-many-public-metho
         errors = None
         error_message = None
 
-        def assign_column_label(df: pd.DataFrame) -> Optional[pd.DataFrame]:
-            """
-            Some engines change the case or generate bespoke column names, either by
-            default or due to lack of support for aliasing. This function ensures that
-            the column names in the DataFrame correspond to what is expected by
-            the viz components.
-
-            Sometimes a query may also contain only order by columns that are not used
-            as metrics or groupby columns, but need to present in the SQL `select`,
-            filtering by `labels_expected` make sure we only return columns users want.
-
-            :param df: Original DataFrame returned by the engine
-            :return: Mutated DataFrame
-            """
-            labels_expected = query_str_ext.labels_expected
-            if df is not None and not df.empty:
-                if len(df.columns) < len(labels_expected):
-                    raise QueryObjectValidationError(
-                        _("Db engine did not return all queried columns")
-                    )
-                if len(df.columns) > len(labels_expected):
-                    df = df.iloc[:, 0 : len(labels_expected)]
-                df.columns = labels_expected
-            return df
-
         try:
-            df = self.database.get_df(sql, self.schema, mutator=assign_column_label)
+            df = self.database.get_df(
+                sql,
+                self.schema,
+                mutator=partial(
+                    self.assign_column_label,
+                    labels_expected=query_str_ext.labels_expected,
+                ),
+            )
         except Exception as ex:  # pylint: disable=broad-except
             df = pd.DataFrame()
             status = QueryStatus.FAILED
@@ -2292,3 +2323,19 @@ class RowLevelSecurityFilter(Model, AuditMixinNullable):
         SqlaTable, secondary=RLSFilterTables, backref="row_level_security_filters"
     )
     clause = Column(Text, nullable=False)
+
+
+# roles and tables changes also mark the filter as dirty, and trigger `after_update`
+sa.event.listen(
+    RowLevelSecurityFilter, "after_insert", security_manager.invalidate_rls_filters
+)
+sa.event.listen(
+    RowLevelSecurityFilter, "after_update", security_manager.invalidate_rls_filters
+)
+sa.event.listen(
+    RowLevelSecurityFilter, "after_delete", security_manager.invalidate_rls_filters
+)
+sa.event.listen(Session, "after_commit", security_manager.on_rls_filters_after_commit)
+sa.event.listen(
+    Session, "after_rollback", security_manager.on_rls_filters_after_rollback
+)
@@ -117,6 +117,7 @@ MODEL_API_RW_METHOD_PERMISSION_MAP = {
     "related_objects": "read",
     "schemas": "read",
     "select_star": "read",
+    "tables": "read",
     "table_metadata": "read",
     "table_extra_metadata": "read",
     "test_connection": "read",
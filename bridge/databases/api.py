@@ -33,6 +33,8 @@ from bridge.commands.importers.exceptions import (
     IncorrectFormatError,
     NoValidFilesFoundError,
 )
+from bridge.catalog.crawler import CatalogCrawler
+from bridge.catalog.dao import CatalogDAO
 from bridge.commands.importers.v1.utils import get_contents_from_bundle
 from bridge.constants import MODEL_API_RW_METHOD_PERMISSION_MAP, RouteMethod
 from bridge.databases.commands.create import CreateDatabaseCommand
@@ -58,6 +60,7 @@ from bridge.databases.decorators import check_datasource_access
 from bridge.databases.filters import DatabaseFilter, DatabaseUploadEnabledFilter
 from bridge.databases.schemas import (
     database_schemas_query_schema,
+    database_tables_query_schema,
     DatabaseFunctionNamesResponse,
     DatabasePostSchema,
     DatabasePutSchema,
@@ -69,6 +72,7 @@ from bridge.databases.schemas import (
     SelectStarResponseSchema,
     TableExtraMetadataResponseSchema,
     TableMetadataResponseSchema,
+    TablesResponseSchema,
     ValidateSQLRequest,
     ValidateSQLResponse,
 )
@@ -76,10 +80,14 @@ from bridge.databases.utils import get_table_metadata
 from bridge.db_engine_specs import get_available_engine_specs
 from bridge.errors import ErrorLevel, BridgeError, BridgeErrorType
 from bridge.exceptions import BridgeErrorsException, BridgeException
-from bridge.extensions import security_manager
+from bridge.extensions import db, security_manager
 from bridge.models.core import Database
 from bridge.bridge_typing import FlaskResponse
-from bridge.utils.core import error_msg_from_exception, parse_js_uri_path_item
+from bridge.utils.core import (
+    DatasourceName,
+    error_msg_from_exception,
+    parse_js_uri_path_item,
+)
 from bridge.views.base import json_errors_response
 from bridge.views.base_api import (
     BaseBridgeModelRestApi,
@@ -101,6 +109,7 @@ class DatabaseRestApi(BaseBridgeModelRestApi):
         "table_extra_metadata",
         "select_star",
         "schemas",
+        "tables",
         "test_connection",
         "related_objects",
         "function_names",
@@ -200,6 +209,7 @@ class DatabaseRestApi(BaseBridgeModelRestApi):
 
     apispec_parameter_schemas = {
         "database_schemas_query_schema": database_schemas_query_schema,
+        "database_tables_query_schema": database_tables_query_schema,
         "get_export_ids_schema": get_export_ids_schema,
     }
 
@@ -213,6 +223,7 @@ class DatabaseRestApi(BaseBridgeModelRestApi):
         TableMetadataResponseSchema,
         SelectStarResponseSchema,
         SchemasResponseSchema,
+        TablesResponseSchema,
         ValidateSQLRequest,
         ValidateSQLResponse,
     )
@@ -491,6 +502,113 @@ class DatabaseRestApi(BaseBridgeModelRestApi):
         except BridgeException as ex:
             return self.response(ex.status, message=ex.message)
 
+    @expose("/<int:pk>/tables/")
+    @protect()
+    @safe
+    @rison(database_tables_query_schema)
+    @statsd_metrics
+    @event_logger.log_this_with_context(
+        action=lambda self, *args, **kwargs: f"{self.__class__.__name__}" f".tables",
+        log_to_statsd=False,
+    )
+    def tables(self, pk: int, **kwargs: Any) -> FlaskResponse:
+        """Get the tables and views of a schema
+        ---
+        get:
+          description: >-
+            Get the tables and views of a schema, by name prefix. They are read from
+            the catalog index when it's enabled, the schema being crawled first if
+            it wasn't yet or when forced.
+          parameters:
+          - in: path
+            schema:
+              type: integer
+            name: pk
+            description: The database id
+          - in: query
+            name: q
+            content:
+              application/json:
+                schema:
+                  $ref: '#/components/schemas/database_tables_query_schema'
+          responses:
+            200:
+              description: The tables and views of the schema, ordered by name
+              content:
+                application/json:
+                  schema:
+                    $ref: "#/components/schemas/TablesResponseSchema"
+            400:
+              $ref: '#/components/responses/400'
+            401:
+              $ref: '#/components/responses/401'
+            404:
+              $ref: '#/components/responses/404'
+            422:
+              $ref: '#/components/responses/422'
+            500:
+              $ref: '#/components/responses/500'
+        """
+        database = self.datamodel.get(pk, self._base_filters)
+        if not database:
+            return self.response_404()
+
+        schema_name = kwargs["rison"]["schema_name"]
+        prefix = kwargs["rison"].get("prefix", "")
+        force = kwargs["rison"].get("force", False)
+        try:
+            if app.config["CATALOG_INDEX_ENABLED"]:
+                tables = CatalogDAO.find_tables(database, schema_name, prefix)
+                if force:
+                    CatalogCrawler(database, db.session).refresh_schema(schema_name)
+                    tables = CatalogDAO.find_tables(database, schema_name, prefix)
+                elif tables is None:
+                    crawler = CatalogCrawler(database, db.session)
+                    crawler.crawl_schema(crawler.crawl_schemas([schema_name])[0])
+                    tables = CatalogDAO.find_tables(database, schema_name, prefix)
+                table_types = {table.name: table.type for table in tables or []}
+            else:
+                cache_kwargs = {
+                    "cache": database.table_cache_enabled,
+                    "cache_timeout": database.table_cache_timeout,
+                    "force": force,
+                }
+                table_types = {
+                    name: "table"
+                    for name, _ in database.get_all_table_names_in_schema(
+                        schema=schema_name, **cache_kwargs
+                    )
+                    if name.startswith(prefix)
+                }
+                table_types.update(
+                    (name, "view")
+                    for name, _ in database.get_all_view_names_in_schema(
+                        schema=schema_name, **cache_kwargs
+                    )
+                    if name.startswith(prefix)
+                )
+        except SQLAlchemyError as ex:
+            db.session.rollback()
+            return self.response_422(error_msg_from_exception(ex))
+        except BridgeException as ex:
+            db.session.rollback()
+            return self.response(ex.status, message=ex.message)
+
+        datasource_names = security_manager.get_datasources_accessible_by_user(
+            database=database,
+            schema=schema_name,
+            datasource_names=[
+                DatasourceName(name, schema_name) for name in sorted(table_types)
+            ],
+        )
+        result = [
+            {"value": datasource_name.table, "type": table_types[datasource_name.table]}
+            for datasource_name in datasource_names
+        ]
+        return self.response(
+            200, count=len(result), result=result[: kwargs["rison"].get("limit")]
+        )
+
     @expose("/<int:pk>/table/<table_name>/<schema_name>/", methods=["GET"])
     @protect()
     @check_datasource_access
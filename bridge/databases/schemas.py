@@ -43,6 +43,17 @@ database_schemas_query_schema = {
     "properties": {"force": {"type": "boolean"}},
 }
 
+database_tables_query_schema = {
+    "type": "object",
+    "properties": {
+        "schema_name": {"type": "string"},
+        "prefix": {"type": "string"},
+        "force": {"type": "boolean"},
+        "limit": {"type": "integer", "minimum": 1},
+    },
+    "required": ["schema_name"],
+}
+
 database_name_description = "A database name to identify this connection."
 port_description = "Port number for the database connection."
 cache_timeout_description = (
@@ -555,6 +566,16 @@ class SchemasResponseSchema(Schema):
     result = fields.List(fields.String(description="A database schema name"))
 
 
+class DatabaseTablesResponse(Schema):
+    value = fields.String(description="The table or view name")
+    type = fields.String(description="Either table or view")
+
+
+class TablesResponseSchema(Schema):
+    count = fields.Integer(description="The number of matching tables and views")
+    result = fields.List(fields.Nested(DatabaseTablesResponse))
+
+
 class ValidateSQLRequest(Schema):
     sql = fields.String(required=True, description="SQL statement to validate")
     schema = fields.String(required=False, allow_none=True)
@@ -14,8 +14,10 @@
 # KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations
 # under the License.
+import json
 from typing import Any, Dict, List, Optional, Union
 
+from flask import current_app
 from sqlalchemy.engine.url import make_url, URL
 
 from bridge.databases.commands.exceptions import DatabaseInvalidError
@@ -25,8 +27,10 @@ def get_foreign_keys_metadata(
     database: Any,
     table_name: str,
     schema_name: Optional[str],
+    foreign_keys: Optional[List[Dict[str, Any]]] = None,
 ) -> List[Dict[str, Any]]:
-    foreign_keys = database.get_foreign_keys(table_name, schema_name)
+    if foreign_keys is None:
+        foreign_keys = database.get_foreign_keys(table_name, schema_name)
     for fk in foreign_keys:
         fk["column_names"] = fk.pop("constrained_columns")
         fk["type"] = "fk"
@@ -34,9 +38,13 @@ def get_foreign_keys_metadata(
 
 
 def get_indexes_metadata(
-    database: Any, table_name: str, schema_name: Optional[str]
+    database: Any,
+    table_name: str,
+    schema_name: Optional[str],
+    indexes: Optional[List[Dict[str, Any]]] = None,
 ) -> List[Dict[str, Any]]:
-    indexes = database.get_indexes(table_name, schema_name)
+    if indexes is None:
+        indexes = database.get_indexes(table_name, schema_name)
     for idx in indexes:
         idx["type"] = "index"
     return indexes
@@ -58,23 +66,51 @@ def get_table_metadata(
     Get table metadata information, including type, pk, fks.
     This function raises SQLAlchemyError when a schema is not found.
 
+    The metadata is read from the catalog index when it covers the table, see
+    `CATALOG_INDEX_ENABLED`, and reflected from the database otherwise.
+
     :param database: The database model
     :param table_name: Table name
     :param schema_name: schema name
     :return: Dict table metadata ready for API response
     """
+    # pylint: disable=import-outside-toplevel
+    from bridge.catalog.dao import CatalogDAO
+
+    catalog_table = (
+        CatalogDAO.get_table(database, schema_name, table_name)
+        if current_app.config["CATALOG_INDEX_ENABLED"] and schema_name
+        else None
+    )
     keys = []
-    columns = database.get_columns(table_name, schema_name)
-    primary_key = database.get_pk_constraint(table_name, schema_name)
+    if catalog_table:
+        columns = [
+            {"name": column.name, "type": column.type, "comment": column.comment}
+            for column in catalog_table.columns
+        ]
+        primary_key = json.loads(catalog_table.primary_key or "{}")
+        foreign_keys = get_foreign_keys_metadata(
+            database,
+            table_name,
+            schema_name,
+            json.loads(catalog_table.foreign_keys or "[]"),
+        )
+        indexes = get_indexes_metadata(
+            database, table_name, schema_name, json.loads(catalog_table.indexes or "[]")
+        )
+        table_comment = catalog_table.comment
+    else:
+        columns = database.get_columns(table_name, schema_name)
+        primary_key = database.get_pk_constraint(table_name, schema_name)
+        foreign_keys = get_foreign_keys_metadata(database, table_name, schema_name)
+        indexes = get_indexes_metadata(database, table_name, schema_name)
+        table_comment = database.get_table_comment(table_name, schema_name)
     if primary_key and primary_key.get("constrained_columns"):
         primary_key["column_names"] = primary_key.pop("constrained_columns")
         primary_key["type"] = "pk"
         keys += [primary_key]
-    foreign_keys = get_foreign_keys_metadata(database, table_name, schema_name)
-    indexes = get_indexes_metadata(database, table_name, schema_name)
     keys += foreign_keys + indexes
     payload_columns: List[Dict[str, Any]] = []
-    table_comment = database.get_table_comment(table_name, schema_name)
     for col in columns:
         dtype = get_col_type(col)
         payload_columns.append(
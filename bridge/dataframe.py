@@ -17,9 +17,11 @@
 """ Bridge utilities for pandas.DataFrame.
 """
 import logging
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 
 from bridge.utils.core import JS_MAX_INTEGER
 
@@ -53,3 +55,156 @@ def df_to_records(dframe: pd.DataFrame) -> List[Dict[str, Any]]:
         dict(zip(columns, map(_convert_big_integers, row)))
         for row in zip(*[dframe[col] for col in columns])
     )
+
+
+def split_df(dframe: pd.DataFrame, chunk_size: int) -> Iterator[pd.DataFrame]:
+    """
+    Split a DataFrame in chunks.
+
+    :param dframe: the DataFrame to split
+    :param chunk_size: the maximum number of rows of a chunk
+    :returns: the chunks, at least one even if the DataFrame is empty
+    """
+    for start in range(0, max(len(dframe), 1), chunk_size):
+        yield dframe.iloc[start : start + chunk_size]
+
+
+def read_parquet_chunks(
+    sources: Iterable[Any],
+    chunk_size: int,
+    columns: Optional[List[str]] = None,
+) -> Iterator[pd.DataFrame]:
+    """
+    Read Parquet files in chunks, without loading them entirely in memory.
+
+    :param sources: the paths or file-like objects of the files to read
+    :param chunk_size: the maximum number of rows of a chunk
+    :param columns: the columns to read, all of them if not set
+    :returns: the chunks, at least one per file even if it is empty
+    """
+    for source in sources:
+        parquet_file = pq.ParquetFile(source)
+        if not parquet_file.metadata.num_rows:
+            yield parquet_file.schema_arrow.empty_table().select(
+                columns or parquet_file.schema_arrow.names
+            ).to_pandas()
+            continue
+        for batch in parquet_file.iter_batches(batch_size=chunk_size, columns=columns):
+            yield batch.to_pandas()
+
+
+def read_arrow_chunks(source: Any, chunk_size: int) -> Iterator[pd.DataFrame]:
+    """
+    Read an Arrow IPC file or stream in chunks, one record batch at a time.
+
+    :param source: the path or file-like object of the data to read, which must be
+        seekable unless it is in the streaming format
+    :param chunk_size: the maximum number of rows of a chunk
+    :returns: the chunks, at least one even if there is no data
+    """
+    try:
+        file_reader = pa.ipc.open_file(source)
+        schema = file_reader.schema
+        batches: Iterable[pa.RecordBatch] = (
+            file_reader.get_batch(i) for i in range(file_reader.num_record_batches)
+        )
+    except (pa.ArrowInvalid, OSError):
+        if hasattr(source, "seek"):
+            source.seek(0)
+        stream_reader = pa.ipc.open_stream(source)
+        schema = stream_reader.schema
+        batches = stream_reader
+
+    empty = True
+    for batch in batches:
+        for start in range(0, batch.num_rows, chunk_size):
+            empty = False
+            yield batch.slice(start, chunk_size).to_pandas()
+    if empty:
+        yield schema.empty_table().to_pandas()
+
+
+def _get_value_kind(series: pd.Series) -> Optional[str]:
+    """
+    Return the kind of the non-null values of a series, None if they're all null.
+    """
+    values = series.dropna()
+    if values.empty:
+        return None
+    if pd.api.types.is_datetime64_any_dtype(series.dtype):
+        return str(series.dtype)
+    kind = pd.api.types.infer_dtype(values, skipna=True)
+    if kind in {"integer", "floating", "boolean"}:
+        return kind
+    if kind == "mixed-integer-float":
+        return "floating"
+    return "object"
+
+
+def infer_chunks_dtypes(chunks: Iterable[pd.DataFrame]) -> Dict[Any, Any]:
+    """
+    Infer the dtypes which fit the values of all the chunks of a DataFrame.
+
+    The dtypes pandas infers for a chunk only depend on its own rows. They are
+    widened across the chunks the way concatenating them would: integers mixed with
+    floats become floats and any other mix becomes an object column. Chunks where a
+    column is entirely null don't constrain its dtype, and integer and boolean
+    columns with nulls are made nullable.
+
+    :param chunks: the chunks to infer the dtypes of
+    :returns: the dtype of each column
+    """
+    kinds: Dict[Any, Set[str]] = {}
+    nullable: Set[Any] = set()
+    fallback_dtypes: Dict[Any, Any] = {}
+    for chunk in chunks:
+        for name in chunk.columns:
+            series = chunk[name]
+            fallback_dtypes.setdefault(name, series.dtype)
+            column_kinds = kinds.setdefault(name, set())
+            kind = _get_value_kind(series)
+            if kind is not None:
+                column_kinds.add(kind)
+            if series.isna().any():
+                nullable.add(name)
+
+    dtypes: Dict[Any, Any] = {}
+    for name, column_kinds in kinds.items():
+        if not column_kinds:
+            dtypes[name] = fallback_dtypes[name]
+        elif column_kinds == {"integer"}:
+            dtypes[name] = "Int64" if name in nullable else "int64"
+        elif column_kinds == {"boolean"}:
+            dtypes[name] = "boolean" if name in nullable else "bool"
+        elif column_kinds <= {"integer", "floating"}:
+            dtypes[name] = "float64"
+        elif len(column_kinds) == 1 and "object" not in column_kinds:
+            # datetimes, of the same timezone
+            dtypes[name] = next(iter(column_kinds))
+        else:
+            dtypes[name] = "object"
+    return dtypes
+
+
+def coerce_chunks(
+    read_chunks: Callable[[], Iterable[pd.DataFrame]]
+) -> Iterator[pd.DataFrame]:
+    """
+    Coerce the chunks of a DataFrame to dtypes which fit all of them.
+
+    The chunks are read twice, first to infer the dtypes with `infer_chunks_dtypes`
+    and then to cast them, so that the table created from the first chunk fits the
+    values of the next ones while only holding one chunk in memory at a time.
+
+    :param read_chunks: returns the chunks, called once for each pass
+    :returns: the chunks, with consistent dtypes
+    """
+    dtypes = infer_chunks_dtypes(read_chunks())
+    for chunk in read_chunks():
+        yield chunk.astype(
+            {
+                name: dtype
+                for name, dtype in dtypes.items()
+                if name in chunk.columns and chunk[name].dtype != dtype
+            }
+        )
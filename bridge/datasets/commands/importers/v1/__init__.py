@@ -15,16 +15,20 @@
 # specific language governing permissions and limitations
 # under the License.
 
-from typing import Any, Dict, Set
+from typing import Any, Dict, List, Set, Tuple
 
 from marshmallow import Schema
 from sqlalchemy.orm import Session
 
 from bridge.commands.importers.v1 import ImportModelsCommand
+from bridge.connectors.sqla.models import SqlaTable
 from bridge.databases.commands.importers.v1.utils import import_database
 from bridge.databases.schemas import ImportV1DatabaseSchema
 from bridge.datasets.commands.exceptions import DatasetImportError
-from bridge.datasets.commands.importers.v1.utils import import_dataset
+from bridge.datasets.commands.importers.v1.utils import (
+    import_dataset,
+    load_datasets_data,
+)
 from bridge.datasets.dao import DatasetDAO
 from bridge.datasets.schemas import ImportV1DatasetSchema
 
@@ -60,10 +64,16 @@ class ImportDatasetsCommand(ImportModelsCommand):
                 database_ids[str(database.uuid)] = database.id
 
         # import datasets with the correct parent ref
+        pending_data: List[Tuple[str, SqlaTable]] = []
         for file_name, config in configs.items():
             if (
                 file_name.startswith("datasets/")
                 and config["database_uuid"] in database_ids
             ):
                 config["database_id"] = database_ids[config["database_uuid"]]
-                import_dataset(session, config, overwrite=overwrite)
+                import_dataset(
+                    session, config, overwrite=overwrite, pending_data=pending_data
+                )
+
+        # load the data of the datasets, concurrently when possible
+        load_datasets_data(session, pending_data)
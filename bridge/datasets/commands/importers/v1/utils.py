@@ -17,9 +17,13 @@
 import gzip
 import json
 import logging
+import os
 import re
-from typing import Any, Dict
-from urllib import request
+import shutil
+import tempfile
+from contextlib import closing, contextmanager
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+from urllib import parse, request
 
 import pandas as pd
 from flask import current_app, g
@@ -29,11 +33,16 @@ from sqlalchemy.orm.exc import MultipleResultsFound
 from sqlalchemy.sql.visitors import VisitableType
 
 from bridge.connectors.sqla.models import SqlaTable
+from bridge.dataframe import coerce_chunks, read_arrow_chunks, read_parquet_chunks
 from bridge.models.core import Database
+from bridge.sql_parse import Table
+from bridge.utils.concurrency import map_concurrently
 
 logger = logging.getLogger(__name__)
 
 CHUNKSIZE = 512
+# number of rows of a data file read, converted and loaded at a time
+READ_CHUNKSIZE = 10000
 VARCHAR = re.compile(r"VARCHAR\((\d+)\)", re.IGNORECASE)
 
 JSON_KEYS = {"params", "template_params", "extra"}
@@ -80,7 +89,15 @@ def import_dataset(
     config: Dict[str, Any],
     overwrite: bool = False,
     force_data: bool = False,
+    pending_data: Optional[List[Tuple[str, SqlaTable]]] = None,
 ) -> SqlaTable:
+    """
+    Import a dataset, and load its data if it has any and its table is missing.
+
+    When `pending_data` is passed the data isn't loaded, the data URI and the
+    dataset are appended to it instead, to be loaded with `load_datasets_data`
+    along with the data of the other datasets of a bundle.
+    """
     existing = session.query(SqlaTable).filter_by(uuid=config["uuid"]).first()
     if existing:
         if not overwrite:
@@ -139,8 +156,10 @@ def import_dataset(
         table_exists = True
 
     if data_uri and (not table_exists or force_data):
-        logger.info("Downloading data from %s", data_uri)
-        load_data(data_uri, dataset, dataset.database, session)
+        if pending_data is None:
+            load_data(data_uri, dataset, dataset.database, session)
+        else:
+            pending_data.append((data_uri, dataset))
 
     if hasattr(g, "user") and g.user:
         dataset.owners.append(g.user)
@@ -148,44 +167,135 @@ def import_dataset(
     return dataset
 
 
+@contextmanager
+def download_data(
+    data_uri: str, chunksize: int = READ_CHUNKSIZE
+) -> Iterator[Callable[[], Iterator[pd.DataFrame]]]:
+    """
+    Download the data file of a dataset to a temporary file, to read it in chunks.
+
+    The file is read as CSV, unless its extension is `.parquet`, or `.arrow`,
+    `.arrows` or `.feather` for Arrow IPC files. Files ending in `.gz` are
+    decompressed while downloading.
+
+    :param data_uri: the URI of the data file
+    :param chunksize: the maximum number of rows of a chunk
+    :returns: a function reading the chunks of the file, which can be called more
+        than once while the context is active
+    """
+    path = parse.urlparse(data_uri).path
+    compressed = path.endswith(".gz")
+    extension = os.path.splitext(path[:-3] if compressed else path)[1].lower()
+
+    logger.info("Downloading data from %s", data_uri)
+    with tempfile.TemporaryFile() as file:
+        with closing(request.urlopen(data_uri)) as response:
+            data = gzip.open(response) if compressed else response
+            shutil.copyfileobj(data, file)
+
+        def read_data() -> Iterator[pd.DataFrame]:
+            file.seek(0)
+            if extension == ".parquet":
+                yield from read_parquet_chunks([file], chunksize)
+            elif extension in {".arrow", ".arrows", ".feather"}:
+                yield from read_arrow_chunks(file, chunksize)
+            else:
+                yield from pd.read_csv(file, encoding="utf-8", chunksize=chunksize)
+
+        yield read_data
+
+
+def convert_temporal_columns(
+    chunks: Iterable[pd.DataFrame], dtype: Dict[str, VisitableType]
+) -> Iterator[pd.DataFrame]:
+    for df in chunks:
+        for column_name, sqla_type in dtype.items():
+            if isinstance(sqla_type, (Date, DateTime)):
+                df[column_name] = pd.to_datetime(df[column_name])
+        yield df
+
+
 def load_data(
     data_uri: str, dataset: SqlaTable, database: Database, session: Session
 ) -> None:
-    data = request.urlopen(data_uri)  # pylint: disable=consider-using-with
-    if data_uri.endswith(".gz"):
-        data = gzip.open(data)
-    df = pd.read_csv(data, encoding="utf-8")
-    dtype = get_dtype(df, dataset)
-
-    # convert temporal columns
-    for column_name, sqla_type in dtype.items():
-        if isinstance(sqla_type, (Date, DateTime)):
-            df[column_name] = pd.to_datetime(df[column_name])
-
-    # reuse session when loading data if possible, to make import atomic
-    if database.sqlalchemy_uri == current_app.config.get("SQLALCHEMY_DATABASE_URI"):
-        logger.info("Loading data inside the import transaction")
-        connection = session.connection()
-        df.to_sql(
-            dataset.table_name,
-            con=connection,
-            schema=dataset.schema,
-            if_exists="replace",
-            chunksize=CHUNKSIZE,
-            dtype=dtype,
-            index=False,
-            method="multi",
-        )
-    else:
-        logger.warning("Loading data outside the import transaction")
-        with database.get_sqla_engine_with_context() as engine:
-            df.to_sql(
-                dataset.table_name,
-                con=engine,
-                schema=dataset.schema,
-                if_exists="replace",
-                chunksize=CHUNKSIZE,
-                dtype=dtype,
-                index=False,
-                method="multi",
+    """
+    Load the data of a dataset into its table, one chunk at a time.
+
+    The rows are inserted with the bulk loader of the engine spec of the database.
+    """
+    with download_data(data_uri, READ_CHUNKSIZE) as read_data:
+        dtype = get_dtype(next(read_data()), dataset)
+        # the file is read twice, to infer the dtypes fitting all of its chunks
+        chunks = coerce_chunks(lambda: convert_temporal_columns(read_data(), dtype))
+        to_sql_kwargs = {
+            "chunksize": CHUNKSIZE,
+            "dtype": dtype,
+            "if_exists": "replace",
+            "index": False,
+        }
+
+        # reuse session when loading data if possible, to make import atomic
+        if database.sqlalchemy_uri == current_app.config.get("SQLALCHEMY_DATABASE_URI"):
+            logger.info("Loading data inside the import transaction")
+            connection = session.connection()
+            method = database.db_engine_spec.get_df_to_sql_method(connection.engine)
+            for df in chunks:
+                df.to_sql(
+                    dataset.table_name,
+                    con=connection,
+                    schema=dataset.schema,
+                    method=method,
+                    **to_sql_kwargs,
+                )
+                to_sql_kwargs["if_exists"] = "append"
+        else:
+            logger.warning("Loading data outside the import transaction")
+            database.db_engine_spec.df_chunks_to_sql(
+                database,
+                Table(table=dataset.table_name, schema=dataset.schema),
+                chunks,
+                to_sql_kwargs,
             )
+
+
+def load_datasets_data(
+    session: Session, pending_data: List[Tuple[str, SqlaTable]]
+) -> None:
+    """
+    Load the data of datasets, concurrently for independent ones.
+
+    Data loaded into the metadata database is loaded serially inside the import
+    transaction. The data of the datasets of each other database is loaded by up to
+    `DATASET_IMPORT_MAX_WORKERS` threads, but for SQLite which only allows a single
+    writer.
+
+    :param session: The session of the import
+    :param pending_data: The data URIs and datasets to load the data of
+    """
+    metadata_uri = current_app.config.get("SQLALCHEMY_DATABASE_URI")
+    pending_data_by_database: Dict[Database, List[Tuple[str, SqlaTable]]] = {}
+    for data_uri, dataset in pending_data:
+        database = dataset.database
+        # load the columns before handing the dataset over to another thread
+        list(dataset.columns)
+        if database.sqlalchemy_uri == metadata_uri:
+            load_data(data_uri, dataset, database, session)
+        else:
+            pending_data_by_database.setdefault(database, []).append(
+                (data_uri, dataset)
+            )
+
+    for database, database_pending_data in pending_data_by_database.items():
+        max_workers = (
+            1
+            if database.backend == "sqlite"
+            else current_app.config["DATASET_IMPORT_MAX_WORKERS"]
+        )
+        map_concurrently(
+            lambda item, database=database: load_data(
+                item[0], item[1], database, session
+            ),
+            database_pending_data,
+            database_id=database.id,
+            max_workers=max_workers,
+        )
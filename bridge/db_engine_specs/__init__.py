@@ -30,14 +30,15 @@ The general idea is to use static classes and an inheritance scheme.
 import inspect
 import logging
 import pkgutil
+import threading
 from collections import defaultdict
 from importlib import import_module
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Type
+from typing import Any, Dict, List, Optional, Set, Tuple, Type
 
 import sqlalchemy.databases
 import sqlalchemy.dialects
-from pkg_resources import iter_entry_points
+from pkg_resources import Distribution, iter_entry_points, working_set
 from sqlalchemy.engine.default import DefaultDialect
 from sqlalchemy.engine.url import URL
 
@@ -85,9 +86,13 @@ def load_engine_specs() -> List[Type[BaseEngineSpec]]:
     return engine_specs
 
 
-def get_engine_spec(backend: str, driver: Optional[str] = None) -> Type[BaseEngineSpec]:
+def find_engine_spec(
+    engine_specs: List[Type[BaseEngineSpec]],
+    backend: str,
+    driver: Optional[str] = None,
+) -> Type[BaseEngineSpec]:
     """
-    Return the DB engine spec associated with a given SQLAlchemy URL.
+    Return the first of the given DB engine specs supporting a backend and driver.
 
     Note that if a driver is not specified the function returns the first DB engine spec
     that supports the backend. Also, if a driver is specified but no DB engine explicitly
@@ -95,8 +100,6 @@ def get_engine_spec(backend: str, driver: Optional[str] = None) -> Type[BaseEngi
     drivers to work with Bridge even if they are not listed in the DB engine spec
     drivers.
     """
-    engine_specs = load_engine_specs()
-
     if driver is not None:
         for engine_spec in engine_specs:
             if engine_spec.supports_backend(backend, driver):
@@ -112,6 +115,16 @@ def get_engine_spec(backend: str, driver: Optional[str] = None) -> Type[BaseEngi
     return BaseEngineSpec
 
 
+def get_engine_spec(backend: str, driver: Optional[str] = None) -> Type[BaseEngineSpec]:
+    """
+    Return the DB engine spec associated with a given SQLAlchemy URL.
+
+    Lookups are served from the process-wide ``engine_spec_registry``, see
+    ``find_engine_spec`` for the matching rules.
+    """
+    return engine_spec_registry.get(backend, driver)
+
+
 # there's a mismatch between the dialect name reported by the driver in these
 # libraries and the dialect name used in the URI
 backend_replacements = {
@@ -120,9 +133,12 @@ backend_replacements = {
 }
 
 
-def get_available_engine_specs() -> Dict[Type[BaseEngineSpec], Set[str]]:
+def get_installed_drivers() -> Dict[str, Set[str]]:
     """
-    Return available engine specs and installed drivers for them.
+    Return the installed SQLAlchemy drivers for each backend.
+
+    This imports the DB API module of every known dialect and is therefore slow, use
+    ``engine_spec_registry.get_installed_drivers`` for a memoized version.
     """
     drivers: Dict[str, Set[str]] = defaultdict(set)
 
@@ -166,8 +182,17 @@ def get_available_engine_specs() -> Dict[Type[BaseEngineSpec], Set[str]]:
                 driver = driver.decode()
             drivers[backend].add(driver)
 
+    return drivers
+
+
+def get_available_engine_specs() -> Dict[Type[BaseEngineSpec], Set[str]]:
+    """
+    Return available engine specs and installed drivers for them.
+    """
+    drivers = engine_spec_registry.get_installed_drivers()
+
     available_engines = {}
-    for engine_spec in load_engine_specs():
+    for engine_spec in engine_spec_registry.engine_specs:
         driver = drivers[engine_spec.engine]
 
         # do not add denied db engine specs to available list
@@ -191,3 +216,67 @@ def get_available_engine_specs() -> Dict[Type[BaseEngineSpec], Set[str]]:
         available_engines[engine_spec] = driver
 
     return available_engines
+
+
+class EngineSpecRegistry:
+    """
+    Process-wide registry of the DB engine specs.
+
+    Loading the engine specs scans every module in this package as well as the
+    ``bridge.db_engine_specs`` entry points, and probing the installed drivers imports
+    the DB API module of every SQLAlchemy dialect. Both are done once, on first use,
+    and backend/driver lookups are indexed by ``(backend, driver)``.
+
+    The registry is invalidated whenever a distribution is added to the
+    ``pkg_resources`` working set, since it might provide new engine specs or dialects.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+        self._engine_specs: Optional[List[Type[BaseEngineSpec]]] = None
+        self._installed_drivers: Optional[Dict[str, Set[str]]] = None
+        self._index: Dict[Tuple[str, Optional[str]], Type[BaseEngineSpec]] = {}
+
+    @property
+    def engine_specs(self) -> List[Type[BaseEngineSpec]]:
+        engine_specs = self._engine_specs
+        if engine_specs is None:
+            with self._lock:
+                if self._engine_specs is None:
+                    self._engine_specs = list(load_engine_specs())
+                engine_specs = self._engine_specs
+        return engine_specs
+
+    def get_installed_drivers(self) -> Dict[str, Set[str]]:
+        installed_drivers = self._installed_drivers
+        if installed_drivers is None:
+            with self._lock:
+                if self._installed_drivers is None:
+                    self._installed_drivers = get_installed_drivers()
+                installed_drivers = self._installed_drivers
+        # return a copy, since callers index the defaultdict with missing backends
+        return defaultdict(set, installed_drivers)
+
+    def get(self, backend: str, driver: Optional[str] = None) -> Type[BaseEngineSpec]:
+        index = self._index
+        key = (backend, driver)
+        if key not in index:
+            index[key] = find_engine_spec(self.engine_specs, backend, driver)
+        return index[key]
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._engine_specs = None
+            self._installed_drivers = None
+            self._index = {}
+
+
+engine_spec_registry = EngineSpecRegistry()
+
+
+def _on_distribution_added(dist: Distribution) -> None:
+    logger.info("Distribution %s added, reloading DB engine specs", dist)
+    engine_spec_registry.invalidate()
+
+
+working_set.subscribe(_on_distribution_added, existing=False)
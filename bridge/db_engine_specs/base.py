@@ -25,6 +25,8 @@ from typing import (
     Callable,
     ContextManager,
     Dict,
+    Iterable,
+    Iterator,
     List,
     Match,
     NamedTuple,
@@ -38,6 +40,7 @@ from typing import (
 )
 
 import pandas as pd
+import pyarrow as pa
 import sqlparse
 from apispec import APISpec
 from apispec.ext.marshmallow import MarshmallowPlugin
@@ -366,6 +369,10 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
     # if True, database will be listed as option in the upload file form
     supports_file_upload = True
 
+    # Whether the DB-API cursor can return the result set as a pyarrow Table
+    # through ``cursor.fetch_arrow_table()``, skipping Python row tuples altogether
+    supports_arrow_fetch = False
+
     @classmethod
     def supports_url(cls, url: URL) -> bool:
         """
@@ -659,6 +666,51 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
         except Exception as ex:
             raise cls.get_dbapi_mapped_exception(ex) from ex
 
+    @classmethod
+    def fetch_data_chunks(
+        cls, cursor: Any, chunk_size: int
+    ) -> Iterator[List[Tuple[Any, ...]]]:
+        """
+        Fetch the result set `chunk_size` rows at a time, so that it never needs to
+        be held in memory as a whole.
+
+        :param cursor: Cursor instance
+        :param chunk_size: Maximum number of rows per chunk
+        :return: Iterator over the chunks of the result
+        """
+        if cls.arraysize:
+            cursor.arraysize = cls.arraysize
+        while True:
+            try:
+                data = cursor.fetchmany(chunk_size)
+            except Exception as ex:
+                raise cls.get_dbapi_mapped_exception(ex) from ex
+            if not data:
+                return
+            yield data
+
+    @classmethod
+    def fetch_data_as_arrow(
+        cls, cursor: Any, limit: Optional[int] = None
+    ) -> Optional[pa.Table]:
+        """
+        Fetch the result set as a pyarrow Table for drivers with native Arrow
+        support, see ``supports_arrow_fetch``.
+
+        :param cursor: Cursor instance
+        :param limit: Maximum number of rows to be returned by the cursor
+        :return: Result of query, or None if the cursor can't return Arrow data
+        """
+        if not cls.supports_arrow_fetch or not hasattr(cursor, "fetch_arrow_table"):
+            return None
+        try:
+            table = cursor.fetch_arrow_table()
+        except Exception as ex:
+            raise cls.get_dbapi_mapped_exception(ex) from ex
+        if limit is not None:
+            table = table.slice(0, limit)
+        return table
+
     @classmethod
     def expand_data(
         cls, columns: List[ResultSetColumnType], data: List[Dict[Any, Any]]
@@ -911,18 +963,74 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
         :param df: The dataframe with data to be uploaded
         :param to_sql_kwargs: The kwargs to be passed to pandas.DataFrame.to_sql` method
         """
+        cls.df_chunks_to_sql(database, table, [df], to_sql_kwargs)
 
-        to_sql_kwargs["name"] = table.table
+    @classmethod
+    def df_chunks_to_sql(
+        cls,
+        database: "Database",
+        table: Table,
+        chunks: Iterable[pd.DataFrame],
+        to_sql_kwargs: Dict[str, Any],
+        progress: Optional[Callable[[int], None]] = None,
+    ) -> int:
+        """
+        Upload data from Pandas DataFrames to a database, one chunk at a time.
+
+        The table is created, or replaced, as per `if_exists` with the first chunk and
+        the next ones are appended to it, all in a single transaction. Only one chunk
+        is held in memory at a time, provided `chunks` is lazy. The rows are inserted
+        with the `pandas.DataFrame.to_sql` method returned by `get_df_to_sql_method`,
+        which engines override with their native bulk loader.
+
+        Note this method does not create metadata for the table.
+
+        :param database: The database to upload the data to
+        :param table: The table to upload the data to
+        :param chunks: The dataframes with data to be uploaded, of consistent dtypes
+        :param to_sql_kwargs: The kwargs to be passed to pandas.DataFrame.to_sql` method
+        :param progress: Called with the number of rows uploaded after each chunk
+        :returns: The number of rows uploaded
+        """
+        to_sql_kwargs = {**to_sql_kwargs, "name": table.table}
 
         if table.schema:
             # Only add schema when it is preset and non empty.
             to_sql_kwargs["schema"] = table.schema
 
+        rows = 0
         with cls.get_engine(database) as engine:
-            if engine.dialect.supports_multivalues_insert:
-                to_sql_kwargs["method"] = "multi"
+            to_sql_kwargs.setdefault("method", cls.get_df_to_sql_method(engine))
 
-            df.to_sql(con=engine, **to_sql_kwargs)
+            with engine.begin() as connection:
+                for df in chunks:
+                    df.to_sql(con=connection, **to_sql_kwargs)
+                    to_sql_kwargs["if_exists"] = "append"
+                    rows += len(df)
+                    if progress:
+                        progress(rows)
+
+        return rows
+
+    @classmethod
+    def get_df_to_sql_method(
+        cls, engine: Engine
+    ) -> Optional[Union[str, Callable[..., Any]]]:
+        """
+        Return the `method` used by `pandas.DataFrame.to_sql` to insert the rows of
+        uploaded data.
+
+        Defaults to a multi-row `INSERT` per chunk when the dialect supports it, and
+        to the DB-API `executemany` otherwise. Can be overridden with a callable
+        taking the pandas table, the connection, the column names and an iterator
+        over the rows, to use a native bulk loader, e.g. `COPY` for PostgreSQL.
+
+        :param engine: The engine the data is uploaded with
+        :return: The `to_sql` insertion method
+        """
+        if engine.dialect.supports_multivalues_insert:
+            return "multi"
+        return None
 
     @classmethod
     def convert_dttm(  # pylint: disable=unused-argument
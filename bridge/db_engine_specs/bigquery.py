@@ -18,7 +18,19 @@ import json
 import re
 import urllib
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Pattern, Tuple, Type, TYPE_CHECKING
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Pattern,
+    Tuple,
+    Type,
+    TYPE_CHECKING,
+)
 
 import pandas as pd
 from apispec import APISpec
@@ -221,6 +233,15 @@ class BigQueryEngineSpec(BaseEngineSpec):
             data = [r.values() for r in data]  # type: ignore
         return data
 
+    @classmethod
+    def fetch_data_chunks(
+        cls, cursor: Any, chunk_size: int
+    ) -> Iterator[List[Tuple[Any, ...]]]:
+        for data in super().fetch_data_chunks(cursor, chunk_size):
+            if type(data[0]).__name__ == "Row":
+                data = [r.values() for r in data]  # type: ignore
+            yield data
+
     @staticmethod
     def _mutate_label(label: str) -> str:
         """
@@ -364,6 +385,40 @@ class BigQueryEngineSpec(BaseEngineSpec):
 
         pandas_gbq.to_gbq(df, **to_gbq_kwargs)
 
+    @classmethod
+    def df_chunks_to_sql(
+        cls,
+        database: "Database",
+        table: Table,
+        chunks: Iterable[pd.DataFrame],
+        to_sql_kwargs: Dict[str, Any],
+        progress: Optional[Callable[[int], None]] = None,
+    ) -> int:
+        """
+        Upload data from Pandas DataFrames to a database, one chunk at a time.
+
+        Each chunk is loaded with `pandas_gbq.DataFrame.to_gbq`, the first one as per
+        `if_exists` and the next ones appended to the table.
+
+        Note this method does not create metadata for the table.
+
+        :param database: The database to upload the data to
+        :param table: The table to upload the data to
+        :param chunks: The dataframes with data to be uploaded, of consistent dtypes
+        :param to_sql_kwargs: The kwargs to be passed to pandas.DataFrame.to_sql` method
+        :param progress: Called with the number of rows uploaded after each chunk
+        :returns: The number of rows uploaded
+        """
+        to_sql_kwargs = dict(to_sql_kwargs)
+        rows = 0
+        for df in chunks:
+            cls.df_to_sql(database, table, df, to_sql_kwargs)
+            to_sql_kwargs["if_exists"] = "append"
+            rows += len(df)
+            if progress:
+                progress(rows)
+        return rows
+
     @classmethod
     def build_sqlalchemy_uri(
         cls,
@@ -38,6 +38,7 @@ COLUMN_DOES_NOT_EXIST_REGEX = re.compile("no such column: (?P<column_name>.+)")
 class DuckDBEngineSpec(BaseEngineSpec):
     engine = "duckdb"
     engine_name = "DuckDB"
+    supports_arrow_fetch = True
 
     _time_grain_expressions = {
         None: "{col}",
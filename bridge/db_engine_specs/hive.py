@@ -14,13 +14,24 @@
 # KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations
 # under the License.
+import itertools
 import logging
 import os
 import re
 import tempfile
 import time
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TYPE_CHECKING,
+)
 from urllib import parse
 
 import numpy as np
@@ -161,6 +172,22 @@ class HiveEngineSpec(PrestoEngineSpec):
         except pyhive.exc.ProgrammingError:
             return []
 
+    @classmethod
+    def fetch_data_chunks(
+        cls, cursor: Any, chunk_size: int
+    ) -> Iterator[List[Tuple[Any, ...]]]:
+        # pylint: disable=import-outside-toplevel
+        import pyhive
+        from TCLIService import ttypes
+
+        state = cursor.poll()
+        if state.operationState == ttypes.TOperationState.ERROR_STATE:
+            raise Exception("Query error", state.errorMessage)
+        try:
+            yield from super().fetch_data_chunks(cursor, chunk_size)
+        except pyhive.exc.ProgrammingError:
+            return
+
     @classmethod
     def df_to_sql(
         cls,
@@ -184,10 +211,41 @@ class HiveEngineSpec(PrestoEngineSpec):
         :param df: The dataframe with data to be uploaded
         :param to_sql_kwargs: The kwargs to be passed to pandas.DataFrame.to_sql` method
         """
+        cls.df_chunks_to_sql(database, table, [df], to_sql_kwargs)
+
+    @classmethod
+    def df_chunks_to_sql(  # pylint: disable=too-many-locals
+        cls,
+        database: "Database",
+        table: Table,
+        chunks: Iterable[pd.DataFrame],
+        to_sql_kwargs: Dict[str, Any],
+        progress: Optional[Callable[[int], None]] = None,
+    ) -> int:
+        """
+        Upload data from Pandas DataFrames to a database, one chunk at a time.
+
+        The chunks are staged in a single Parquet file, written one row group per
+        chunk, which is then uploaded to S3 and exposed as an external table.
+
+        Note this method does not create metadata for the table.
+
+        :param database: The database to upload the data to
+        :param: table The table to upload the data to
+        :param chunks: The dataframes with data to be uploaded, of consistent dtypes
+        :param to_sql_kwargs: The kwargs to be passed to pandas.DataFrame.to_sql` method
+        :param progress: Called with the number of rows staged after each chunk
+        :returns: The number of rows uploaded
+        """
 
         if to_sql_kwargs["if_exists"] == "append":
             raise BridgeException("Append operation not currently supported")
 
+        chunks = iter(chunks)
+        first_chunk = next(chunks, None)
+        if first_chunk is None:
+            raise BridgeException("No data to upload")
+
         if to_sql_kwargs["if_exists"] == "fail":
 
             # Ensure table doesn't already exist.
@@ -206,41 +264,56 @@ class HiveEngineSpec(PrestoEngineSpec):
             with cls.get_engine(database) as engine:
                 engine.execute(f"DROP TABLE IF EXISTS {str(table)}")
 
-        def _get_hive_type(dtype: np.dtype) -> str:
+        def _get_hive_type(dtype: Any) -> str:
             hive_type_by_dtype = {
                 np.dtype("bool"): "BOOLEAN",
                 np.dtype("float64"): "DOUBLE",
                 np.dtype("int64"): "BIGINT",
                 np.dtype("object"): "STRING",
+                pd.BooleanDtype(): "BOOLEAN",
+                pd.Int64Dtype(): "BIGINT",
             }
 
             return hive_type_by_dtype.get(dtype, "STRING")
 
         schema_definition = ", ".join(
-            f"`{name}` {_get_hive_type(dtype)}" for name, dtype in df.dtypes.items()
+            f"`{name}` {_get_hive_type(dtype)}"
+            for name, dtype in first_chunk.dtypes.items()
         )
 
+        rows = 0
         with tempfile.NamedTemporaryFile(
             dir=current_app.config["UPLOAD_FOLDER"], suffix=".parquet"
         ) as file:
-            pq.write_table(pa.Table.from_pandas(df), where=file.name)
-
-            engine.execute(
-                text(
-                    f"""
-                    CREATE TABLE {str(table)} ({schema_definition})
-                    STORED AS PARQUET
-                    LOCATION :location
-                    """
-                ),
-                location=upload_to_s3(
-                    filename=file.name,
-                    upload_prefix=current_app.config[
-                        "CSV_TO_HIVE_UPLOAD_DIRECTORY_FUNC"
-                    ](database, g.user, table.schema),
-                    table=table,
-                ),
-            )
+            schema = pa.Schema.from_pandas(first_chunk, preserve_index=False)
+            with pq.ParquetWriter(file.name, schema) as writer:
+                for df in itertools.chain([first_chunk], chunks):
+                    writer.write_table(
+                        pa.Table.from_pandas(df, schema=schema, preserve_index=False)
+                    )
+                    rows += len(df)
+                    if progress:
+                        progress(rows)
+
+            with cls.get_engine(database) as engine:
+                engine.execute(
+                    text(
+                        f"""
+                        CREATE TABLE {str(table)} ({schema_definition})
+                        STORED AS PARQUET
+                        LOCATION :location
+                        """
+                    ),
+                    location=upload_to_s3(
+                        filename=file.name,
+                        upload_prefix=current_app.config[
+                            "CSV_TO_HIVE_UPLOAD_DIRECTORY_FUNC"
+                        ](database, g.user, table.schema),
+                        table=table,
+                    ),
+                )
+
+        return rows
 
     @classmethod
     def convert_dttm(
@@ -17,7 +17,7 @@
 import logging
 import re
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Pattern, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Pattern, Tuple
 
 from flask_babel import gettext as __
 
@@ -127,6 +127,13 @@ class MssqlEngineSpec(BaseEngineSpec):
         # Lists of `pyodbc.Row` need to be unpacked further
         return cls.pyodbc_rows_to_tuples(data)
 
+    @classmethod
+    def fetch_data_chunks(
+        cls, cursor: Any, chunk_size: int
+    ) -> Iterator[List[Tuple[Any, ...]]]:
+        for data in super().fetch_data_chunks(cursor, chunk_size):
+            yield cls.pyodbc_rows_to_tuples(data)
+
     @classmethod
     def extract_error_message(cls, ex: Exception) -> str:
         if str(ex).startswith("(8155,"):
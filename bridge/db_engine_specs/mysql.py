@@ -16,7 +16,7 @@
 # under the License.
 import re
 from datetime import datetime
-from typing import Any, Dict, Optional, Pattern, Tuple
+from typing import Any, Callable, Dict, Optional, Pattern, Tuple, Union
 from urllib import parse
 
 from flask_babel import gettext as __
@@ -32,6 +32,7 @@ from sqlalchemy.dialects.mysql import (
     TINYINT,
     TINYTEXT,
 )
+from sqlalchemy.engine.base import Engine
 from sqlalchemy.engine.url import URL
 
 from bridge.db_engine_specs.base import (
@@ -221,6 +222,17 @@ class MySQLEngineSpec(BaseEngineSpec, BasicParametersMixin):
     def epoch_to_dttm(cls) -> str:
         return "from_unixtime({col})"
 
+    @classmethod
+    def get_df_to_sql_method(
+        cls, engine: Engine
+    ) -> Optional[Union[str, Callable[..., Any]]]:
+        """
+        Use the DB-API `executemany`, which both mysqlclient and PyMySQL rewrite
+        into multi-row `INSERT` statements up to `max_allowed_packet`, instead of
+        binding the parameters of a single `INSERT` per chunk.
+        """
+        return None
+
     @classmethod
     def _extract_error_message(cls, ex: Exception) -> str:
         """Extract error message for queries"""
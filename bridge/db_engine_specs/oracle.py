@@ -15,7 +15,7 @@
 # specific language governing permissions and limitations
 # under the License.
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 from bridge.db_engine_specs.base import BaseEngineSpec, LimitMethod
 from bridge.utils import core as utils
@@ -75,3 +75,10 @@ class OracleEngineSpec(BaseEngineSpec):
         if not cursor.description:
             return []
         return super().fetch_data(cursor, limit)
+
+    @classmethod
+    def fetch_data_chunks(
+        cls, cursor: Any, chunk_size: int
+    ) -> Iterator[List[Tuple[Any, ...]]]:
+        if cursor.description:
+            yield from super().fetch_data_chunks(cursor, chunk_size)
@@ -14,15 +14,29 @@
 # KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations
 # under the License.
+import io
 import json
 import logging
 import re
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Pattern, Set, Tuple, TYPE_CHECKING
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Pattern,
+    Set,
+    Tuple,
+    TYPE_CHECKING,
+    Union,
+)
 
 from flask_babel import gettext as __
 from sqlalchemy.dialects.postgresql import ARRAY, DOUBLE_PRECISION, ENUM, JSON
 from sqlalchemy.dialects.postgresql.base import PGInspector
+from sqlalchemy.engine.base import Connection, Engine
 from sqlalchemy.types import String
 
 from bridge.db_engine_specs.base import (
@@ -75,6 +89,46 @@ COLUMN_DOES_NOT_EXIST_REGEX = re.compile(
 SYNTAX_ERROR_REGEX = re.compile('syntax error at or near "(?P<syntax_error>.*?)"')
 
 
+def _to_copy_value(value: Any) -> str:
+    # unquoted empty values are NULL in the CSV format of COPY, everything else is
+    # quoted so that empty strings are kept
+    if value is None:
+        return ""
+    return '"' + str(value).replace('"', '""') + '"'
+
+
+def copy_from_stdin(
+    table: Any,
+    connection: Connection,
+    keys: List[str],
+    data_iter: Iterator[Tuple[Any, ...]],
+) -> None:
+    """
+    Insert rows with `COPY FROM STDIN`, as a `pandas.DataFrame.to_sql` method.
+
+    :param table: The pandas table the rows are inserted into
+    :param connection: The connection, a psycopg2 one underneath
+    :param keys: The column names
+    :param data_iter: The rows
+    """
+    buffer = io.StringIO()
+    for row in data_iter:
+        buffer.write(",".join(_to_copy_value(value) for value in row))
+        buffer.write("\n")
+    buffer.seek(0)
+
+    quote = connection.dialect.identifier_preparer.quote
+    table_name = quote(table.name)
+    if table.schema:
+        table_name = f"{quote(table.schema)}.{table_name}"
+    columns = ", ".join(quote(key) for key in keys)
+
+    with connection.connection.cursor() as cursor:
+        cursor.copy_expert(
+            f"COPY {table_name} ({columns}) FROM STDIN WITH (FORMAT csv)", buffer
+        )
+
+
 class PostgresBaseEngineSpec(BaseEngineSpec):
     """Abstract class for Postgres 'like' databases"""
 
@@ -158,6 +212,13 @@ class PostgresBaseEngineSpec(BaseEngineSpec):
             return []
         return super().fetch_data(cursor, limit)
 
+    @classmethod
+    def fetch_data_chunks(
+        cls, cursor: Any, chunk_size: int
+    ) -> Iterator[List[Tuple[Any, ...]]]:
+        if cursor.description:
+            yield from super().fetch_data_chunks(cursor, chunk_size)
+
     @classmethod
     def epoch_to_dttm(cls) -> str:
         return "(timestamp 'epoch' + {col} * interval '1 second')"
@@ -225,6 +286,14 @@ class PostgresEngineSpec(PostgresBaseEngineSpec, BasicParametersMixin):
     ) -> List[Dict[str, str]]:
         return [{k: str(v) for k, v in row.items()} for row in raw_cost]
 
+    @classmethod
+    def get_df_to_sql_method(
+        cls, engine: Engine
+    ) -> Optional[Union[str, Callable[..., Any]]]:
+        if engine.dialect.driver == "psycopg2":
+            return copy_from_stdin
+        return super().get_df_to_sql_method(engine)
+
     @classmethod
     def get_table_names(
         cls, database: "Database", inspector: PGInspector, schema: Optional[str]
@@ -21,6 +21,7 @@ from typing import Any, Callable, Dict, List, Optional
 
 import celery
 from cachelib.base import BaseCache
+from celery.signals import task_postrun, task_prerun
 from flask import Flask
 from flask_appbuilder import AppBuilder, SQLA
 from flask_migrate import Migrate
@@ -31,9 +32,10 @@ from werkzeug.local import LocalProxy
 from bridge.utils.async_query_manager import AsyncQueryManager
 from bridge.utils.cache_manager import CacheManager
 from bridge.utils.encrypt import EncryptedFieldFactory
+from bridge.utils.engine_cache_manager import EngineCacheManager
 from bridge.utils.feature_flag_manager import FeatureFlagManager
 from bridge.utils.machine_auth import MachineAuthProviderFactory
-from bridge.utils.profiler import BridgeProfiler
+from bridge.utils.profiler import BridgeProfiler, SamplingProfiler
 
 
 class ResultsBackendManager:
@@ -104,9 +106,41 @@ class UIManifestProcessor:
 class ProfilingExtension:  # pylint: disable=too-few-public-methods
     def __init__(self, interval: float = 1e-4) -> None:
         self.interval = interval
+        self.sampling_profiler: Optional[SamplingProfiler] = None
 
     def init_app(self, app: Flask) -> None:
-        app.wsgi_app = BridgeProfiler(app.wsgi_app, self.interval)  # type: ignore
+        if app.config["PROFILING_SAMPLE_RATE"] > 0:
+            self.sampling_profiler = SamplingProfiler(
+                sample_rate=app.config["PROFILING_SAMPLE_RATE"],
+                interval=app.config["PROFILING_SAMPLE_INTERVAL"],
+                output_dir=app.config["PROFILING_OUTPUT_DIR"],
+                export_interval=app.config["PROFILING_EXPORT_INTERVAL"],
+            )
+            task_prerun.connect(self.start_task_profiling, weak=False)
+            task_postrun.connect(self.stop_task_profiling, weak=False)
+
+        app.wsgi_app = BridgeProfiler(  # type: ignore
+            app.wsgi_app,
+            self.interval,
+            instrument=app.config["PROFILING"],
+            sampling_profiler=self.sampling_profiler,
+            url_map=app.url_map,
+        )
+
+    def start_task_profiling(  # pylint: disable=unused-argument
+        self, task_id: str, task: celery.Task, **kwargs: Any
+    ) -> None:
+        if self.sampling_profiler:
+            stop = self.sampling_profiler.start(task.name)
+            if stop:
+                task.request.stop_profiling = stop
+
+    def stop_task_profiling(  # pylint: disable=unused-argument
+        self, task_id: str, task: celery.Task, **kwargs: Any
+    ) -> None:
+        stop = getattr(task.request, "stop_profiling", None)
+        if stop:
+            stop()
 
 
 APP_DIR = os.path.join(os.path.dirname(__file__), os.path.pardir)
@@ -118,6 +152,7 @@ csrf = CSRFProtect()
 db = SQLA()
 _event_logger: Dict[str, Any] = {}
 encrypted_field_factory = EncryptedFieldFactory()
+engine_cache_manager = EngineCacheManager()
 event_logger = LocalProxy(lambda: _event_logger.get("event_logger"))
 feature_flag_manager = FeatureFlagManager()
 machine_auth_provider_factory = MachineAuthProviderFactory()
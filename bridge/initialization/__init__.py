@@ -39,6 +39,7 @@ from bridge.extensions import (
     csrf,
     db,
     encrypted_field_factory,
+    engine_cache_manager,
     feature_flag_manager,
     machine_auth_provider_factory,
     manifest_processor,
@@ -492,6 +493,7 @@ class BridgeAppInitializer:  # pylint: disable=too-many-public-methods
     def configure_cache(self) -> None:
         cache_manager.init_app(self.bridge_app)
         results_backend_manager.init_app(self.bridge_app)
+        engine_cache_manager.init_app(self.bridge_app)
 
     def configure_feature_flags(self) -> None:
         feature_flag_manager.init_app(self.bridge_app)
@@ -634,7 +636,7 @@ class BridgeAppInitializer:  # pylint: disable=too-many-public-methods
         manifest_processor.init_app(self.bridge_app)
 
     def enable_profiling(self) -> None:
-        if self.config["PROFILING"]:
+        if self.config["PROFILING"] or self.config["PROFILING_SAMPLE_RATE"] > 0:
             profiling.init_app(self.bridge_app)
 
 
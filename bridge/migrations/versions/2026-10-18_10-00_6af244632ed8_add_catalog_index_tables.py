@@ -0,0 +1,86 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""add catalog index tables
+
+Revision ID: 6af244632ed8
+Revises: 4ce1d9b25135
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+
+# revision identifiers, used by Alembic.
+revision = "6af244632ed8"
+down_revision = "4ce1d9b25135"
+
+import sqlalchemy as sa
+from alembic import op
+
+
+def upgrade():
+    op.create_table(
+        "catalog_schemas",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("database_id", sa.Integer(), nullable=False),
+        sa.Column("name", sa.String(256), nullable=False),
+        sa.Column("crawled_on", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(["database_id"], ["dbs.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("database_id", "name"),
+    )
+    op.create_table(
+        "catalog_tables",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("schema_id", sa.Integer(), nullable=False),
+        sa.Column("name", sa.String(256), nullable=False),
+        sa.Column("type", sa.String(16), nullable=False),
+        sa.Column("comment", sa.Text(), nullable=True),
+        sa.Column("primary_key", sa.Text(), nullable=True),
+        sa.Column("foreign_keys", sa.Text(), nullable=True),
+        sa.Column("indexes", sa.Text(), nullable=True),
+        sa.Column("crawled_on", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["schema_id"], ["catalog_schemas.id"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("schema_id", "name"),
+    )
+    op.create_table(
+        "catalog_columns",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("table_id", sa.Integer(), nullable=False),
+        sa.Column("position", sa.Integer(), nullable=False),
+        sa.Column("name", sa.String(256), nullable=False),
+        sa.Column("type", sa.Text(), nullable=True),
+        sa.Column("comment", sa.Text(), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["table_id"], ["catalog_tables.id"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        op.f("ix_catalog_columns_table_id"),
+        "catalog_columns",
+        ["table_id"],
+        unique=False,
+    )
+
+
+def downgrade():
+    op.drop_index(op.f("ix_catalog_columns_table_id"), table_name="catalog_columns")
+    op.drop_table("catalog_columns")
+    op.drop_table("catalog_tables")
+    op.drop_table("catalog_schemas")
@@ -14,4 +14,11 @@
 # KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations
 # under the License.
-from . import core, datasource_access_request, dynamic_plugins, sql_lab, user_attributes
+from . import (
+    catalog,
+    core,
+    datasource_access_request,
+    dynamic_plugins,
+    sql_lab,
+    user_attributes,
+)
@@ -0,0 +1,101 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""Index of the metadata of the schemas and tables of the databases"""
+from flask_appbuilder import Model
+from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy.orm import backref, relationship
+from sqlalchemy.schema import UniqueConstraint
+
+from bridge.models.core import Database
+
+
+class CatalogSchema(Model):  # pylint: disable=too-few-public-methods
+
+    """A schema of a database, as last crawled."""
+
+    __tablename__ = "catalog_schemas"
+    __table_args__ = (UniqueConstraint("database_id", "name"),)
+
+    id = Column(Integer, primary_key=True)
+    database_id = Column(
+        Integer, ForeignKey("dbs.id", ondelete="CASCADE"), nullable=False
+    )
+    name = Column(String(256), nullable=False)
+    # when the tables and views of the schema were last listed
+    crawled_on = Column(DateTime, nullable=True)
+
+    database = relationship(
+        Database,
+        backref=backref(
+            "catalog_schemas", cascade="all, delete-orphan", passive_deletes=True
+        ),
+    )
+    tables = relationship(
+        "CatalogTable",
+        back_populates="schema",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+    )
+
+
+class CatalogTable(Model):  # pylint: disable=too-few-public-methods
+
+    """A table or view of a schema, as last crawled."""
+
+    __tablename__ = "catalog_tables"
+    __table_args__ = (UniqueConstraint("schema_id", "name"),)
+
+    id = Column(Integer, primary_key=True)
+    schema_id = Column(
+        Integer, ForeignKey("catalog_schemas.id", ondelete="CASCADE"), nullable=False
+    )
+    name = Column(String(256), nullable=False)
+    type = Column(String(16), nullable=False)
+    comment = Column(Text)
+    # JSON encoded primary key constraint, foreign keys and indexes
+    primary_key = Column(Text)
+    foreign_keys = Column(Text)
+    indexes = Column(Text)
+    # when the columns and keys of the table were last reflected, if ever
+    crawled_on = Column(DateTime, nullable=True)
+
+    schema = relationship(CatalogSchema, back_populates="tables")
+    columns = relationship(
+        "CatalogColumn",
+        order_by="CatalogColumn.position",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+    )
+
+
+class CatalogColumn(Model):  # pylint: disable=too-few-public-methods
+
+    """A column of a table, as last crawled."""
+
+    __tablename__ = "catalog_columns"
+
+    id = Column(Integer, primary_key=True)
+    table_id = Column(
+        Integer,
+        ForeignKey("catalog_tables.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    position = Column(Integer, nullable=False)
+    name = Column(String(256), nullable=False)
+    type = Column(Text)
+    comment = Column(Text)
@@ -24,7 +24,7 @@ from ast import literal_eval
 from contextlib import closing, contextmanager
 from copy import deepcopy
 from datetime import datetime
-from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Type
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple, Type
 
 import numpy
 import pandas as pd
@@ -48,7 +48,8 @@ from sqlalchemy.engine.reflection import Inspector
 from sqlalchemy.engine.url import URL
 from sqlalchemy.exc import ArgumentError, NoSuchModuleError
 from sqlalchemy.ext.hybrid import hybrid_property
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, Session
+from sqlalchemy.orm.mapper import Mapper
 from sqlalchemy.pool import NullPool
 from sqlalchemy.schema import UniqueConstraint
 from sqlalchemy.sql import expression, Select
@@ -57,7 +58,12 @@ from bridge import app, db_engine_specs
 from bridge.constants import PASSWORD_MASK
 from bridge.databases.utils import make_url_safe
 from bridge.db_engine_specs.base import MetricType, TimeGrain
-from bridge.extensions import cache_manager, encrypted_field_factory, security_manager
+from bridge.extensions import (
+    cache_manager,
+    encrypted_field_factory,
+    engine_cache_manager,
+    security_manager,
+)
 from bridge.models.helpers import AuditMixinNullable, ImportExportMixin
 from bridge.result_set import BridgeResultSet
 from bridge.utils import cache as cache_util, core as utils
@@ -371,7 +377,7 @@ class Database(
     def get_sqla_engine_with_context(
         self,
         schema: Optional[str] = None,
-        nullpool: bool = True,
+        nullpool: Optional[bool] = None,
         source: Optional[utils.QuerySource] = None,
     ) -> Engine:
         yield self._get_sqla_engine(schema=schema, nullpool=nullpool, source=source)
@@ -379,7 +385,7 @@ class Database(
     def _get_sqla_engine(
         self,
         schema: Optional[str] = None,
-        nullpool: bool = True,
+        nullpool: Optional[bool] = None,
         source: Optional[utils.QuerySource] = None,
     ) -> Engine:
         extra = self.get_extra()
@@ -396,6 +402,14 @@ class Database(
         masked_url = self.get_password_masked_url(sqlalchemy_url)
         logger.debug("Database._get_sqla_engine(). Masked URL: %s", str(masked_url))
 
+        # unless a pool is explicitly requested or refused, reuse pooled engines when
+        # the engine cache is enabled
+        use_engine_cache = (
+            engine_cache_manager.enabled and not nullpool and self.id is not None
+        )
+        if nullpool is None:
+            nullpool = not use_engine_cache
+
         params = extra.get("engine_params", {})
         if nullpool:
             params["poolclass"] = NullPool
@@ -425,6 +439,8 @@ class Database(
             )
 
         try:
+            if use_engine_cache:
+                return engine_cache_manager.get_engine(self.id, sqlalchemy_url, params)
             return create_engine(sqlalchemy_url, **params)
         except Exception as ex:
             raise self.db_engine_spec.get_dbapi_mapped_exception(ex)
@@ -437,21 +453,55 @@ class Database(
     def get_reserved_words(self) -> Set[str]:
         return self.get_dialect().preparer.reserved_words
 
-    def get_df(  # pylint: disable=too-many-locals
+    def get_df(
         self,
         sql: str,
         schema: Optional[str] = None,
         mutator: Optional[Callable[[pd.DataFrame], None]] = None,
     ) -> pd.DataFrame:
-        sqls = self.db_engine_spec.parse_sql(sql)
         engine = self._get_sqla_engine(schema)
+        with closing(engine.raw_connection()) as conn:
+            cursor = conn.cursor()
+            self._execute_sql(cursor, engine, sql, schema)
 
-        def needs_conversion(df_series: pd.Series) -> bool:
-            return (
-                not df_series.empty
-                and isinstance(df_series, pd.Series)
-                and isinstance(df_series[0], (list, dict))
-            )
+            data = self.db_engine_spec.fetch_data_as_arrow(cursor)
+            if data is None:
+                data = self.db_engine_spec.fetch_data(cursor)
+            return self._load_df(data, cursor.description, mutator)
+
+    def iter_df(
+        self,
+        sql: str,
+        schema: Optional[str] = None,
+        chunk_size: int = 10000,
+        mutator: Optional[Callable[[pd.DataFrame], None]] = None,
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Run a query, returning its result as DataFrames of up to `chunk_size` rows,
+        fetched from the cursor as they are consumed.
+
+        At least one, possibly empty, DataFrame is returned.
+        """
+        engine = self._get_sqla_engine(schema)
+        with closing(engine.raw_connection()) as conn:
+            cursor = conn.cursor()
+            self._execute_sql(cursor, engine, sql, schema)
+
+            is_empty = True
+            for data in self.db_engine_spec.fetch_data_chunks(cursor, chunk_size):
+                is_empty = False
+                yield self._load_df(data, cursor.description, mutator)
+            if is_empty:
+                yield self._load_df([], cursor.description, mutator)
+
+    def _execute_sql(
+        self, cursor: Any, engine: Engine, sql: str, schema: Optional[str]
+    ) -> None:
+        """
+        Execute the statements of `sql`, leaving the result of the last one to be
+        fetched from the cursor.
+        """
+        sqls = self.db_engine_spec.parse_sql(sql)
 
         def _log_query(sql: str) -> None:
             if log_query:
@@ -464,29 +514,37 @@ class Database(
                     security_manager,
                 )
 
-        with closing(engine.raw_connection()) as conn:
-            cursor = conn.cursor()
-            for sql_ in sqls[:-1]:
-                _log_query(sql_)
-                self.db_engine_spec.execute(cursor, sql_)
-                cursor.fetchall()
+        for sql_ in sqls[:-1]:
+            _log_query(sql_)
+            self.db_engine_spec.execute(cursor, sql_)
+            cursor.fetchall()
 
-            _log_query(sqls[-1])
-            self.db_engine_spec.execute(cursor, sqls[-1])
+        _log_query(sqls[-1])
+        self.db_engine_spec.execute(cursor, sqls[-1])
 
-            data = self.db_engine_spec.fetch_data(cursor)
-            result_set = BridgeResultSet(
-                data, cursor.description, self.db_engine_spec
+    def _load_df(
+        self,
+        data: Any,
+        cursor_description: Any,
+        mutator: Optional[Callable[[pd.DataFrame], None]] = None,
+    ) -> pd.DataFrame:
+        def needs_conversion(df_series: pd.Series) -> bool:
+            return (
+                not df_series.empty
+                and isinstance(df_series, pd.Series)
+                and isinstance(df_series[0], (list, dict))
             )
-            df = result_set.to_pandas_df()
-            if mutator:
-                df = mutator(df)
 
-            for col, coltype in df.dtypes.to_dict().items():
-                if coltype == numpy.object_ and needs_conversion(df[col]):
-                    df[col] = df[col].apply(utils.json_dumps_w_dates)
+        result_set = BridgeResultSet(data, cursor_description, self.db_engine_spec)
+        df = result_set.to_pandas_df()
+        if mutator:
+            df = mutator(df)
 
-            return df
+        for col, coltype in df.dtypes.to_dict().items():
+            if coltype == numpy.object_ and needs_conversion(df[col]):
+                df[col] = df[col].apply(utils.json_dumps_w_dates)
+
+        return df
 
     def compile_sqla_query(self, qry: Select, schema: Optional[str] = None) -> str:
         engine = self._get_sqla_engine(schema=schema)
@@ -538,6 +596,35 @@ class Database(
         engine = self._get_sqla_engine()
         return sqla.inspect(engine)
 
+    def _get_catalog_tables(
+        self, schema: str, table_type: str, force: bool = False
+    ) -> Optional[Set[Tuple[str, str]]]:
+        """
+        Get the tables or views of a schema from the catalog index, refreshing the
+        schema first when forced.
+
+        :param schema: schema name
+        :param table_type: Either "table" or "view"
+        :param force: whether to refresh the schema in the index
+        :return: The table/schema pairs, None if the schema was never crawled
+        """
+        # pylint: disable=import-outside-toplevel
+        from bridge.catalog.crawler import CatalogCrawler
+        from bridge.catalog.dao import CatalogDAO
+        from bridge.extensions import db
+
+        if force:
+            try:
+                CatalogCrawler(self, db.session).refresh_schema(schema)
+            except Exception as ex:
+                db.session.rollback()
+                raise self.db_engine_spec.get_dbapi_mapped_exception(ex)
+
+        catalog_tables = CatalogDAO.find_tables(self, schema, table_type=table_type)
+        if catalog_tables is None:
+            return None
+        return {(table.name, schema) for table in catalog_tables}
+
     @cache_util.memoized_func(
         key="db:{self.id}:schema:{schema}:table_list",
         cache=cache_manager.cache,
@@ -560,6 +647,11 @@ class Database(
         :param force: whether to force refresh the cache
         :return: The table/schema pairs
         """
+        if config["CATALOG_INDEX_ENABLED"]:
+            catalog_tables = self._get_catalog_tables(schema, "table", force)
+            if catalog_tables is not None:
+                return catalog_tables
+
         try:
             return {
                 (table, schema)
@@ -594,6 +686,11 @@ class Database(
         :param force: whether to force refresh the cache
         :return: set of views
         """
+        if config["CATALOG_INDEX_ENABLED"]:
+            catalog_tables = self._get_catalog_tables(schema, "view", force)
+            if catalog_tables is not None:
+                return catalog_tables
+
         try:
             return {
                 (view, schema)
@@ -688,14 +785,24 @@ class Database(
         )
 
     def get_table_comment(
-        self, table_name: str, schema: Optional[str] = None
+        self,
+        table_name: str,
+        schema: Optional[str] = None,
+        inspector: Optional[Inspector] = None,
     ) -> Optional[str]:
-        return self.db_engine_spec.get_table_comment(self.inspector, table_name, schema)
+        return self.db_engine_spec.get_table_comment(
+            inspector or self.inspector, table_name, schema
+        )
 
     def get_columns(
-        self, table_name: str, schema: Optional[str] = None
+        self,
+        table_name: str,
+        schema: Optional[str] = None,
+        inspector: Optional[Inspector] = None,
     ) -> List[Dict[str, Any]]:
-        return self.db_engine_spec.get_columns(self.inspector, table_name, schema)
+        return self.db_engine_spec.get_columns(
+            inspector or self.inspector, table_name, schema
+        )
 
     def get_metrics(
         self,
@@ -705,15 +812,23 @@ class Database(
         return self.db_engine_spec.get_metrics(self, self.inspector, table_name, schema)
 
     def get_indexes(
-        self, table_name: str, schema: Optional[str] = None
+        self,
+        table_name: str,
+        schema: Optional[str] = None,
+        inspector: Optional[Inspector] = None,
     ) -> List[Dict[str, Any]]:
-        indexes = self.inspector.get_indexes(table_name, schema)
+        indexes = (inspector or self.inspector).get_indexes(table_name, schema)
         return self.db_engine_spec.normalize_indexes(indexes)
 
     def get_pk_constraint(
-        self, table_name: str, schema: Optional[str] = None
+        self,
+        table_name: str,
+        schema: Optional[str] = None,
+        inspector: Optional[Inspector] = None,
     ) -> Dict[str, Any]:
-        pk_constraint = self.inspector.get_pk_constraint(table_name, schema) or {}
+        pk_constraint = (inspector or self.inspector).get_pk_constraint(
+            table_name, schema
+        ) or {}
 
         def _convert(value: Any) -> Any:
             try:
@@ -724,9 +839,12 @@ class Database(
         return {key: _convert(value) for key, value in pk_constraint.items()}
 
     def get_foreign_keys(
-        self, table_name: str, schema: Optional[str] = None
+        self,
+        table_name: str,
+        schema: Optional[str] = None,
+        inspector: Optional[Inspector] = None,
     ) -> List[Dict[str, Any]]:
-        return self.inspector.get_foreign_keys(table_name, schema)
+        return (inspector or self.inspector).get_foreign_keys(table_name, schema)
 
     def get_schema_access_for_file_upload(  # pylint: disable=invalid-name
         self,
@@ -810,9 +928,41 @@ class Database(
         return sqla_url.get_dialect()()
 
 
+def dispose_cached_engines(
+    _mapper: Mapper, _connection: Connection, target: Database
+) -> None:
+    engine_cache_manager.invalidate(target.id)
+
+
 sqla.event.listen(Database, "after_insert", security_manager.database_after_insert)
 sqla.event.listen(Database, "after_update", security_manager.database_after_update)
 sqla.event.listen(Database, "after_delete", security_manager.database_after_delete)
+sqla.event.listen(Database, "after_update", dispose_cached_engines)
+sqla.event.listen(Database, "after_delete", dispose_cached_engines)
+
+# changes to the permissions of roles, eg through the role views, invalidate the
+# permission index of the security manager
+sqla.event.listen(
+    security_manager.role_model, "after_update", security_manager.on_role_after_update
+)
+sqla.event.listen(
+    security_manager.permissionview_model,
+    "after_delete",
+    security_manager.invalidate_permission_index,
+)
+sqla.event.listen(
+    security_manager.viewmenu_model,
+    "after_update",
+    security_manager.invalidate_permission_index,
+)
+# the index is invalidated once the changes are committed, so that other processes
+# don't reload the permissions before they can read the changes
+sqla.event.listen(
+    Session, "after_commit", security_manager.permission_index.on_after_commit
+)
+sqla.event.listen(
+    Session, "after_rollback", security_manager.permission_index.on_after_rollback
+)
 
 
 class Log(Model):  # pylint: disable=too-few-public-methods
@@ -155,6 +155,10 @@ class ReportScheduleScreenshotFailedError(CommandException):
     message = _("Report Schedule execution failed when generating a screenshot.")
 
 
+class ReportScheduleChartDataFailedError(CommandException):
+    message = _("Report Schedule execution failed when fetching the chart data.")
+
+
 class ReportScheduleCsvFailedError(CommandException):
     message = _("Report Schedule execution failed when generating a csv.")
 
@@ -17,14 +17,17 @@
 import json
 import logging
 from datetime import datetime, timedelta
-from typing import Any, List, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 from uuid import UUID
 
 import pandas as pd
 from celery.exceptions import SoftTimeLimitExceeded
 from sqlalchemy.orm import Session
 
-from bridge import app
+from bridge import app, security_manager
+from bridge.charts.data.commands.get_data_command import ChartDataCommand
+from bridge.charts.post_processing import apply_post_process
+from bridge.charts.schemas import ChartDataQueryContextSchema
 from bridge.commands.base import BaseCommand
 from bridge.commands.exceptions import CommandException
 from bridge.common.chart_data import ChartDataResultFormat, ChartDataResultType
@@ -33,11 +36,12 @@ from bridge.dashboards.permalink.commands.create import (
 )
 from bridge.errors import ErrorLevel, BridgeError, BridgeErrorType
 from bridge.exceptions import BridgeErrorsException, BridgeException
-from bridge.extensions import feature_flag_manager, machine_auth_provider_factory
+from bridge.extensions import feature_flag_manager
 from bridge.reports.commands.alert import AlertCommand
 from bridge.reports.commands.exceptions import (
     ReportScheduleAlertGracePeriodError,
     ReportScheduleClientErrorsException,
+    ReportScheduleChartDataFailedError,
     ReportScheduleCsvFailedError,
     ReportScheduleCsvTimeout,
     ReportScheduleDataFrameFailedError,
@@ -71,8 +75,8 @@ from bridge.reports.notifications.base import NotificationContent
 from bridge.reports.notifications.exceptions import NotificationError
 from bridge.reports.utils import get_executor
 from bridge.utils.celery import session_scope
-from bridge.utils.core import HeaderDataType, override_user
-from bridge.utils.csv import get_chart_csv_data, get_chart_dataframe
+from bridge.utils.core import create_zip, HeaderDataType, override_user
+from bridge.utils.csv import chart_data_to_dataframe
 from bridge.utils.screenshots import ChartScreenshot, DashboardScreenshot
 from bridge.utils.urls import get_url_path
 from bridge.utils.webdriver import DashboardStandaloneMode
@@ -149,7 +153,6 @@ class BaseReportState:
     def _get_url(
         self,
         user_friendly: bool = False,
-        result_format: Optional[ChartDataResultFormat] = None,
         **kwargs: Any,
     ) -> str:
         """
@@ -157,17 +160,6 @@ class BaseReportState:
         """
         force = "true" if self._report_schedule.force_screenshot else "false"
         if self._report_schedule.chart:
-            if result_format in {
-                ChartDataResultFormat.CSV,
-                ChartDataResultFormat.JSON,
-            }:
-                return get_url_path(
-                    "ChartDataRestApi.get_data",
-                    pk=self._report_schedule.chart_id,
-                    format=result_format.value,
-                    type=ChartDataResultType.POST_PROCESSED.value,
-                    force=force,
-                )
             return get_url_path(
                 "ExploreView.root",
                 user_friendly=user_friendly,
@@ -229,24 +221,82 @@ class BaseReportState:
             raise ReportScheduleScreenshotFailedError()
         return [image]
 
-    def _get_csv_data(self) -> bytes:
-        url = self._get_url(result_format=ChartDataResultFormat.CSV)
-        user = get_executor(self._report_schedule)
-        auth_cookies = machine_auth_provider_factory.instance.get_auth_cookies(user)
+    def _get_chart_data(self, result_format: ChartDataResultFormat) -> Dict[str, Any]:
+        """
+        Run the saved query context of the chart in-process, as the executor of
+        the report, and post-process the results the way the chart data API does.
 
-        if self._report_schedule.chart.query_context is None:
+        :param result_format: the format of the query results, CSV or JSON
+        :returns: the chart data command result, with post-processed queries
+        """
+        chart = self._report_schedule.chart
+        if chart.query_context is None:
             logger.warning("No query context found, taking a screenshot to generate it")
             self._update_query_context()
+            # the query context is saved by the chart rendered for the screenshot
+            self._session.refresh(chart)
+
+        try:
+            json_body = json.loads(chart.query_context)
+        except (TypeError, json.decoder.JSONDecodeError):
+            json_body = None
+        if json_body is None:
+            raise ReportScheduleChartDataFailedError(
+                "Chart has no query context saved. Please save the chart again."
+            )
+
+        # override saved query context
+        json_body["result_format"] = result_format.value
+        json_body["result_type"] = ChartDataResultType.POST_PROCESSED.value
+        json_body["force"] = self._report_schedule.force_screenshot
+
+        try:
+            form_data = json.loads(chart.params)
+        except (TypeError, json.decoder.JSONDecodeError):
+            form_data = {}
+
+        user = get_executor(self._report_schedule)
+        logger.info("Getting data of chart %s as user %s", chart.id, user.username)
+        with override_user(user):
+            if (
+                result_format == ChartDataResultFormat.CSV
+                and not security_manager.can_access("can_csv", "Bridge")
+            ):
+                raise ReportScheduleChartDataFailedError(
+                    f"User {user.username} is not allowed to export CSV data"
+                )
+            query_context = ChartDataQueryContextSchema().load(json_body)
+            command = ChartDataCommand(query_context)
+            command.validate()
+            result = command.run()
+        return apply_post_process(result, form_data, query_context.datasource)
 
+    def _get_csv_data(self) -> bytes:
         try:
-            logger.info("Getting chart from %s as user %s", url, user.username)
-            csv_data = get_chart_csv_data(url, auth_cookies)
+            result = self._get_chart_data(ChartDataResultFormat.CSV)
         except SoftTimeLimitExceeded as ex:
             raise ReportScheduleCsvTimeout() from ex
+        except ReportScheduleChartDataFailedError as ex:
+            raise ReportScheduleCsvFailedError(ex.message) from ex
         except Exception as ex:
             raise ReportScheduleCsvFailedError(
                 f"Failed generating csv {str(ex)}"
             ) from ex
+
+        queries = result["queries"]
+        encoding = app.config["CSV_EXPORT"].get("encoding", "utf-8")
+        if len(queries) == 1:
+            csv_data = queries[0]["data"].encode(encoding)
+        elif queries:
+            # bundle multi-query csv results as a zip file
+            csv_data = create_zip(
+                {
+                    f"query_{idx + 1}.csv": query["data"].encode(encoding)
+                    for idx, query in enumerate(queries)
+                }
+            ).getvalue()
+        else:
+            csv_data = None
         if not csv_data:
             raise ReportScheduleCsvFailedError()
         return csv_data
@@ -255,32 +305,30 @@ class BaseReportState:
         """
         Return data as a Pandas dataframe, to embed in notifications as a table.
         """
-        url = self._get_url(result_format=ChartDataResultFormat.JSON)
-        user = get_executor(self._report_schedule)
-        auth_cookies = machine_auth_provider_factory.instance.get_auth_cookies(user)
-
-        if self._report_schedule.chart.query_context is None:
-            logger.warning("No query context found, taking a screenshot to generate it")
-            self._update_query_context()
-
         try:
-            logger.info("Getting chart from %s as user %s", url, user.username)
-            dataframe = get_chart_dataframe(url, auth_cookies)
+            result = self._get_chart_data(ChartDataResultFormat.JSON)
+            dataframe = (
+                chart_data_to_dataframe(result["queries"][0])
+                if result["queries"]
+                else None
+            )
         except SoftTimeLimitExceeded as ex:
             raise ReportScheduleDataFrameTimeout() from ex
+        except ReportScheduleChartDataFailedError as ex:
+            raise ReportScheduleDataFrameFailedError(ex.message) from ex
         except Exception as ex:
             raise ReportScheduleDataFrameFailedError(
                 f"Failed generating dataframe {str(ex)}"
             ) from ex
         if dataframe is None:
-            raise ReportScheduleCsvFailedError()
+            raise ReportScheduleDataFrameFailedError()
         return dataframe
 
     def _update_query_context(self) -> None:
         """
         Update chart query context.
 
-        To load CSV data from the endpoint the chart must have been saved
+        To load CSV data the chart must have been saved
         with its query context. For charts without saved query context we
         get a screenshot to force the chart to produce and save the query
         context.
@@ -291,7 +339,7 @@ class BaseReportState:
             ReportScheduleScreenshotFailedError,
             ReportScheduleScreenshotTimeout,
         ) as ex:
-            raise ReportScheduleCsvFailedError(
+            raise ReportScheduleChartDataFailedError(
                 "Unable to fetch data because the chart has no query context "
                 "saved, and an error occurred when fetching it via a screenshot. "
                 "Please try loading the chart and saving it again."
@@ -19,7 +19,17 @@
 import datetime
 import json
 import logging
-from typing import Any, Dict, List, Optional, Tuple, Type
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
 
 import numpy as np
 import pandas as pd
@@ -58,21 +68,27 @@ def dedup(l: List[str], suffix: str = "__", case_sensitive: bool = True) -> List
     return new_l
 
 
+# A single encoder is reused for all values: ``json.dumps`` with a custom
+# ``default`` builds a new ``JSONEncoder`` on every call.
+_json_encoder = json.JSONEncoder(default=utils.json_iso_dttm_ser)
+
+
 def stringify(obj: Any) -> str:
-    return json.dumps(obj, default=utils.json_iso_dttm_ser)
+    return _json_encoder.encode(obj)
 
 
 def stringify_values(array: np.ndarray) -> np.ndarray:
-    result = np.copy(array)
-
-    with np.nditer(result, flags=["refs_ok"], op_flags=["readwrite"]) as it:
-        for obj in it:
-            if pd.isna(obj):
-                # pandas <NA> type cannot be converted to string
-                obj[pd.isna(obj)] = None
-            else:
-                obj[...] = stringify(obj)
+    """
+    Serialize every non-null value of an object array to JSON.
 
+    Nulls are masked in bulk and kept as ``None`` (pandas ``<NA>`` cannot be
+    converted to string), the remaining values go through the C accelerated
+    JSON encoder in a single pass.
+    """
+    result = np.empty(array.shape, dtype=object)
+    mask = ~pd.isna(array)
+    if mask.any():
+        result[mask] = [stringify(obj) for obj in array[mask]]
     return result
 
 
@@ -93,20 +109,98 @@ def convert_to_string(value: Any) -> str:
     return str(value)
 
 
+# Number of leading values used to infer the Arrow type of a column before
+# converting it in full. Columns whose sample cannot be represented natively are
+# routed straight to the stringified fallback.
+TYPE_INFERENCE_SAMPLE_SIZE = 1000
+
+ARROW_CONVERSION_ERRORS = (
+    pa.lib.ArrowInvalid,
+    pa.lib.ArrowTypeError,
+    pa.lib.ArrowNotImplementedError,
+    TypeError,  # this is super hackey,
+    # https://issues.apache.org/jira/browse/ARROW-7855
+)
+
+
+def to_object_array(values: Sequence[Any]) -> np.ndarray:
+    """
+    Build a 1-D object array without letting numpy unpack nested sequences.
+    """
+    return np.fromiter(values, dtype=object, count=len(values))
+
+
+def transpose_rows(data: DbapiResult, num_columns: int) -> List[List[Any]]:
+    """
+    Transpose DBAPI rows into one list of values per column.
+
+    >>> transpose_rows([(1, "a"), (2, "b")], 2)
+    [[1, 2], ['a', 'b']]
+    """
+    if not data or not num_columns:
+        return []
+    if not isinstance(data, list):
+        data = list(data)
+    return [[row[i] for row in data] for i in range(num_columns)]
+
+
+# Maximum precision of the ``decimal128`` Arrow type
+MAX_DECIMAL_PRECISION = 38
+
+
+def get_common_arrow_type(
+    left: pa.DataType, right: pa.DataType
+) -> Optional[pa.DataType]:
+    """
+    Return the Arrow type the values of both types can be cast to without loss, the
+    way Arrow infers the type of a column holding values of both, or None when they
+    can only be serialized to strings.
+
+    >>> get_common_arrow_type(pa.int64(), pa.float64())
+    DataType(double)
+    >>> get_common_arrow_type(pa.decimal128(3, 2), pa.decimal128(5, 1))
+    Decimal128Type(decimal128(6, 2))
+    """
+    if left == right or pa.types.is_null(right):
+        return left
+    if pa.types.is_null(left):
+        return right
+    if pa.types.is_integer(left) and pa.types.is_integer(right):
+        if pa.types.is_signed_integer(left) == pa.types.is_signed_integer(right):
+            return pa.int64() if pa.types.is_signed_integer(left) else pa.uint64()
+        return None
+    if all(
+        pa.types.is_integer(type_) or pa.types.is_floating(type_)
+        for type_ in (left, right)
+    ):
+        return pa.float64()
+    if pa.types.is_decimal(left) and pa.types.is_decimal(right):
+        scale = max(left.scale, right.scale)
+        precision = max(left.precision - left.scale, right.precision - right.scale)
+        if precision + scale <= MAX_DECIMAL_PRECISION:
+            return pa.decimal128(precision + scale, scale)
+    return None
+
+
 class BridgeResultSet:
-    def __init__(  # pylint: disable=too-many-locals
+    def __init__(
         self,
-        data: DbapiResult,
+        data: Union[DbapiResult, pa.Table, pa.RecordBatch],
         cursor_description: DbapiDescription,
         db_engine_spec: Type[BaseEngineSpec],
     ):
+        """
+        :param data: DBAPI rows, or an Arrow-native result
+        :param cursor_description: DBAPI cursor description
+        :param db_engine_spec: Engine spec of the database the data comes from
+        """
         self.db_engine_spec = db_engine_spec
-        data = data or []
         column_names: List[str] = []
-        pa_data: List[pa.Array] = []
+        pa_data: List[Union[pa.Array, pa.ChunkedArray]] = []
         deduped_cursor_desc: List[Tuple[Any, ...]] = []
-        numpy_dtype: List[Tuple[str, ...]] = []
-        stringified_arr: np.ndarray
+
+        if isinstance(data, pa.RecordBatch):
+            data = pa.Table.from_batches([data])
 
         if cursor_description:
             # get deduped list of column names
@@ -119,56 +213,13 @@ class BridgeResultSet:
                 tuple([column_name, *list(description)[1:]])
                 for column_name, description in zip(column_names, cursor_description)
             ]
+        elif isinstance(data, pa.Table):
+            column_names = dedup(data.column_names)
 
-            # generate numpy structured array dtype
-            numpy_dtype = [(column_name, "object") for column_name in column_names]
-
-        # only do expensive recasting if datatype is not standard list of tuples
-        if data and (not isinstance(data, list) or not isinstance(data[0], tuple)):
-            data = [tuple(row) for row in data]
-        array = np.array(data, dtype=numpy_dtype)
-        if array.size > 0:
-            for column in column_names:
-                try:
-                    pa_data.append(pa.array(array[column].tolist()))
-                except (
-                    pa.lib.ArrowInvalid,
-                    pa.lib.ArrowTypeError,
-                    pa.lib.ArrowNotImplementedError,
-                    TypeError,  # this is super hackey,
-                    # https://issues.apache.org/jira/browse/ARROW-7855
-                ):
-                    # attempt serialization of values as strings
-                    stringified_arr = stringify_values(array[column])
-                    pa_data.append(pa.array(stringified_arr.tolist()))
-
-        if pa_data:  # pylint: disable=too-many-nested-blocks
-            for i, column in enumerate(column_names):
-                if pa.types.is_nested(pa_data[i].type):
-                    # TODO: revisit nested column serialization once nested types
-                    #  are added as a natively supported column type in Bridge
-                    #  (bridge.utils.core.GenericDataType).
-                    stringified_arr = stringify_values(array[column])
-                    pa_data[i] = pa.array(stringified_arr.tolist())
-
-                elif pa.types.is_temporal(pa_data[i].type):
-                    # workaround for bug converting
-                    # `psycopg2.tz.FixedOffsetTimezone` tzinfo values.
-                    # related: https://issues.apache.org/jira/browse/ARROW-5248
-                    sample = self.first_nonempty(array[column])
-                    if sample and isinstance(sample, datetime.datetime):
-                        try:
-                            if sample.tzinfo:
-                                tz = sample.tzinfo
-                                series = pd.Series(
-                                    array[column], dtype="datetime64[ns]"
-                                )
-                                series = pd.to_datetime(series).dt.tz_localize(tz)
-                                pa_data[i] = pa.Array.from_pandas(
-                                    series, type=pa.timestamp("ns", tz=tz)
-                                )
-                        except Exception as ex:  # pylint: disable=broad-except
-                            logger.exception(ex)
+        if isinstance(data, pa.Table):
+            pa_data = self._arrays_from_table(data)
+        else:
+            pa_data = self._arrays_from_rows(data or [], len(column_names))
 
         if not pa_data:
             column_names = []
@@ -185,6 +236,164 @@ class BridgeResultSet:
         except Exception as ex:  # pylint: disable=broad-except
             logger.exception(ex)
 
+    def _arrays_from_table(
+        self, table: pa.Table
+    ) -> List[Union[pa.Array, pa.ChunkedArray]]:
+        """
+        Reuse the columns of an Arrow-native result as-is, only stringifying the
+        nested ones as is done for row based results.
+        """
+        if table.num_rows == 0:
+            return []
+
+        pa_data: List[Union[pa.Array, pa.ChunkedArray]] = []
+        for column in table.columns:
+            if pa.types.is_nested(column.type):
+                stringified_arr = stringify_values(to_object_array(column.to_pylist()))
+                pa_data.append(pa.array(stringified_arr.tolist()))
+            else:
+                pa_data.append(column)
+        return pa_data
+
+    def _arrays_from_rows(
+        self, data: DbapiResult, num_columns: int
+    ) -> List[Union[pa.Array, pa.ChunkedArray]]:
+        """
+        Convert DBAPI rows into one Arrow array per column.
+
+        Rows are transposed once into per-column value sequences which are handed
+        to Arrow directly. The type of each column is first inferred from a sample
+        so that columns which can't be represented natively (mixed or nested
+        values) skip the full conversion attempt and go straight to the string
+        fallback; all other columns are converted without an intermediate copy.
+        """
+        return [
+            self._array_from_values(values)[0]
+            for values in transpose_rows(data, num_columns)
+        ]
+
+    def _array_from_values(self, values: Sequence[Any]) -> Tuple[pa.Array, bool]:
+        """
+        Convert the values of a single column into an Arrow array.
+
+        :returns: The array, and whether the values had to be serialized to strings
+        """
+        pa_array: Optional[pa.Array] = None
+        try:
+            sample_type = pa.array(values[:TYPE_INFERENCE_SAMPLE_SIZE]).type
+            if not pa.types.is_nested(sample_type):
+                pa_array = pa.array(values)
+        except ARROW_CONVERSION_ERRORS:
+            pass
+
+        if pa_array is None or pa.types.is_nested(pa_array.type):
+            # attempt serialization of values as strings
+            # TODO: revisit nested column serialization once nested types
+            #  are added as a natively supported column type in Bridge
+            #  (bridge.utils.core.GenericDataType).
+            stringified_arr = stringify_values(to_object_array(values))
+            return pa.array(stringified_arr.tolist()), True
+        if pa.types.is_temporal(pa_array.type):
+            pa_array = self._localize_temporal(values, pa_array)
+        return pa_array, False
+
+    @classmethod
+    def table_from_chunks(  # pylint: disable=too-many-locals
+        cls,
+        chunks: Iterable[DbapiResult],
+        db_engine_spec: Type[BaseEngineSpec],
+        max_rows: Optional[int] = None,
+    ) -> pa.Table:
+        """
+        Convert DBAPI rows fetched in chunks into a table, one chunk at a time, so
+        that the rows of a single chunk are held as Python objects at once.
+
+        Columns get the type Arrow would infer if all the rows were converted
+        together: when the type of a chunk differs from the type of the previous
+        ones the column is cast to a common type, see `get_common_arrow_type`, or
+        serialized to strings when there is none.
+
+        :param chunks: The chunks of DBAPI rows, see `BaseEngineSpec.fetch_data_chunks`
+        :param db_engine_spec: Engine spec of the database the data comes from
+        :param max_rows: Stop consuming chunks once this many rows were read
+        :returns: A table with positional column names, to be passed to
+            `BridgeResultSet` with the cursor description
+        """
+        converter = cls([], None, db_engine_spec)
+        arrays: List[List[pa.Array]] = []
+        column_types: List[pa.DataType] = []
+        stringified: List[bool] = []
+        row_count = 0
+        for chunk in chunks:
+            if max_rows is not None:
+                chunk = chunk[: max_rows - row_count]
+            if not chunk:
+                break
+            if not arrays:
+                arrays = [[] for _ in chunk[0]]
+                column_types = [pa.null()] * len(arrays)
+                stringified = [False] * len(arrays)
+
+            for index, values in enumerate(transpose_rows(chunk, len(arrays))):
+                pa_array, is_stringified = converter._array_from_values(values)
+                column_type: Optional[pa.DataType] = None
+                if not is_stringified and not stringified[index]:
+                    column_type = get_common_arrow_type(
+                        column_types[index], pa_array.type
+                    )
+                if column_type is not None:
+                    column_types[index] = column_type
+                else:
+                    if not stringified[index]:
+                        # each column is serialized to strings at most once
+                        arrays[index] = [
+                            pa.array(stringify_values(to_object_array(arr.to_pylist())))
+                            for arr in arrays[index]
+                        ]
+                        column_types[index] = pa.string()
+                        stringified[index] = True
+                    if not is_stringified:
+                        pa_array = pa.array(
+                            stringify_values(to_object_array(pa_array.to_pylist()))
+                        )
+                arrays[index].append(pa_array)
+
+            row_count += len(chunk)
+            del chunk
+            if max_rows is not None and row_count >= max_rows:
+                break
+
+        # the common types are never narrower than the types of the chunks, so
+        # integers cast to floats are the only values which can lose precision, as
+        # when converting them together
+        columns = [
+            pa.chunked_array(
+                [arr.cast(column_type, safe=False) for arr in column_arrays],
+                type=column_type,
+            )
+            for column_arrays, column_type in zip(arrays, column_types)
+        ]
+        return pa.Table.from_arrays(
+            columns, names=[str(index) for index in range(len(columns))]
+        )
+
+    def _localize_temporal(self, values: Sequence[Any], pa_array: pa.Array) -> pa.Array:
+        """
+        Workaround for bug converting `psycopg2.tz.FixedOffsetTimezone` tzinfo
+        values. related: https://issues.apache.org/jira/browse/ARROW-5248
+        """
+        sample = self.first_nonempty(values)
+        if sample and isinstance(sample, datetime.datetime):
+            try:
+                if sample.tzinfo:
+                    tz = sample.tzinfo
+                    series = pd.Series(to_object_array(values), dtype="datetime64[ns]")
+                    series = pd.to_datetime(series).dt.tz_localize(tz)
+                    return pa.Array.from_pandas(series, type=pa.timestamp("ns", tz=tz))
+            except Exception as ex:  # pylint: disable=broad-except
+                logger.exception(ex)
+        return pa_array
+
     @staticmethod
     def convert_pa_dtype(pa_dtype: pa.DataType) -> Optional[str]:
         if pa.types.is_boolean(pa_dtype):
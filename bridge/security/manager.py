@@ -19,7 +19,6 @@
 import logging
 import re
 import time
-from collections import defaultdict
 from typing import (
     Any,
     Callable,
@@ -32,14 +31,14 @@ from typing import (
     TYPE_CHECKING,
     Union,
 )
+from uuid import uuid4
 
-from flask import current_app, Flask, g, Request
+from flask import current_app, Flask, g, has_app_context, Request
 from flask_appbuilder import Model
 from flask_appbuilder.models.sqla.interface import SQLAInterface
 from flask_appbuilder.security.sqla.manager import SecurityManager
 from flask_appbuilder.security.sqla.models import (
     assoc_permissionview_role,
-    assoc_user_role,
     Permission,
     PermissionView,
     Role,
@@ -58,9 +57,8 @@ from flask_login import AnonymousUserMixin, LoginManager
 from jwt.api_jwt import _jwt_global_obj
 from sqlalchemy import and_, inspect, or_
 from sqlalchemy.engine.base import Connection
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import object_session, Session
 from sqlalchemy.orm.mapper import Mapper
-from sqlalchemy.orm.query import Query as SqlaQuery
 
 from bridge import sql_parse
 from bridge.constants import RouteMethod
@@ -77,6 +75,7 @@ from bridge.security.guest_token import (
     GuestTokenUser,
     GuestUser,
 )
+from bridge.security.permission_index import PermissionIndex
 from bridge.utils.core import (
     DatasourceName,
     DatasourceType,
@@ -103,6 +102,17 @@ class DatabaseAndSchema(NamedTuple):
     schema: str
 
 
+class RowLevelSecurityFilterRule(NamedTuple):
+    id: int
+    group_key: Optional[str]
+    clause: str
+
+
+RLS_FILTERS_VERSION_CACHE_KEY = "rls_filters_version"
+# flags a session whose transaction changed RLS filters, see `invalidate_rls_filters`
+RLS_FILTERS_SESSION_INFO_KEY = "invalidate_rls_filters"
+
+
 class BridgeSecurityListWidget(ListWidget):  # pylint: disable=too-few-public-methods
     """
     Redeclaring to avoid circular imports
@@ -146,10 +156,9 @@ RoleModelView.edit_columns = ["name", "permissions", "user"]
 RoleModelView.related_views = []
 
 
-class BridgeSecurityManager(  # pylint: disable=too-many-public-methods
-    SecurityManager
-):
+class BridgeSecurityManager(SecurityManager):  # pylint: disable=too-many-public-methods
     userstatschartview = None
+    permission_index = PermissionIndex()
     READ_ONLY_MODEL_VIEWS = {"Database", "DruidClusterModelView", "DynamicPlugin"}
 
     USER_MODEL_VIEWS = {
@@ -309,9 +318,36 @@ class BridgeSecurityManager(  # pylint: disable=too-many-public-methods
 
         user = g.user
         if user.is_anonymous:
-            return self.is_item_public(permission_name, view_name)
+            public_role = self.get_public_role()
+            return public_role is not None and self.permission_index.has_permission(
+                self.get_session, [public_role.id], permission_name, view_name
+            )
         return self._has_view_access(user, permission_name, view_name)
 
+    def _has_view_access(
+        self, user: object, permission_name: str, view_name: str
+    ) -> bool:
+        """
+        Return True if the user has the FAB permission/view, checking the
+        statically configured roles first, and the permission index otherwise.
+
+        :param user: The user
+        :param permission_name: The FAB permission name
+        :param view_name: The FAB view-menu name
+        :returns: Whether the user has the FAB permission/view
+        """
+
+        db_role_ids = []
+        for role in user.roles:  # type: ignore
+            if role.name in self.builtin_roles:
+                if self._has_access_builtin_roles(role, permission_name, view_name):
+                    return True
+            else:
+                db_role_ids.append(role.id)
+        return self.permission_index.has_permission(
+            self.get_session, db_role_ids, permission_name, view_name
+        )
+
     def can_access_all_queries(self) -> bool:
         """
         Return True if the user can access all SQL Lab queries, False otherwise.
@@ -485,35 +521,38 @@ class BridgeSecurityManager(  # pylint: disable=too-many-public-methods
         :returns: The list of datasources
         """
 
-        user_perms = self.user_view_menu_names("datasource_access")
-        schema_perms = self.user_view_menu_names("schema_access")
-        user_datasources = set()
-
         # pylint: disable=import-outside-toplevel
         from bridge.connectors.sqla.models import SqlaTable
 
+        session = self.get_session
+        roles = self.permission_index.get_roles(
+            session, [role.id for role in self.get_user_roles()]
+        )
+        datasource_ids = set().union(*(role.datasource_ids for role in roles))
+        schema_perms = set().union(*(role.schema_perms for role in roles))
+        database_ids = set().union(*(role.database_ids for role in roles))
+        user_datasources = set()
+
         user_datasources.update(
-            self.get_session.query(SqlaTable)
+            session.query(SqlaTable)
             .filter(
                 or_(
-                    SqlaTable.perm.in_(user_perms),
+                    SqlaTable.id.in_(datasource_ids),
                     SqlaTable.schema_perm.in_(schema_perms),
                 )
             )
             .all()
         )
 
-        # group all datasources by database
-        session = self.get_session
-        all_datasources = SqlaTable.get_all_datasources(session)
-        datasources_by_database: Dict["Database", Set["SqlaTable"]] = defaultdict(set)
-        for datasource in all_datasources:
-            datasources_by_database[datasource.database].add(datasource)
-
         # add datasources with implicit permission (eg, database access)
-        for database, datasources in datasources_by_database.items():
-            if self.can_access_database(database):
-                user_datasources.update(datasources)
+        if self.can_access_all_datasources() or self.can_access_all_databases():
+            user_datasources.update(SqlaTable.get_all_datasources(session))
+        elif database_ids:
+            user_datasources.update(
+                SqlaTable.default_query(session.query(SqlaTable))
+                .filter(SqlaTable.database_id.in_(database_ids))
+                .all()
+            )
 
         return list(user_datasources)
 
@@ -534,35 +573,18 @@ class BridgeSecurityManager(  # pylint: disable=too-many-public-methods
         return True
 
     def user_view_menu_names(self, permission_name: str) -> Set[str]:
-        base_query = (
-            self.get_session.query(self.viewmenu_model.name)
-            .join(self.permissionview_model)
-            .join(self.permission_model)
-            .join(assoc_permissionview_role)
-            .join(self.role_model)
-        )
+        """
+        Return the names of the view menus the user has the FAB permission on.
 
-        if not g.user.is_anonymous:
-            # filter by user id
-            view_menu_names = (
-                base_query.join(assoc_user_role)
-                .join(self.user_model)
-                .filter(self.user_model.id == get_user_id())
-                .filter(self.permission_model.name == permission_name)
-            ).all()
-            return {s.name for s in view_menu_names}
-
-        # Properly treat anonymous user
-        public_role = self.get_public_role()
-        if public_role:
-            # filter by public role
-            view_menu_names = (
-                base_query.filter(self.role_model.id == public_role.id).filter(
-                    self.permission_model.name == permission_name
-                )
-            ).all()
-            return {s.name for s in view_menu_names}
-        return set()
+        :param permission_name: The FAB permission name
+        :returns: The FAB view-menu names
+        """
+
+        return self.permission_index.view_menu_names(
+            self.get_session,
+            [role.id for role in self.get_user_roles()],
+            permission_name,
+        )
 
     def get_schemas_accessible_by_user(
         self, database: "Database", schemas: List[str], hierarchical: bool = True
@@ -1615,6 +1637,8 @@ class BridgeSecurityManager(  # pylint: disable=too-many-public-methods
         Hook that allows for further custom operations when a Role update
         is created by SQLAlchemy events.
 
+        Invalidates the permission index, so overrides should call `super()`.
+
         On SQLAlchemy after_insert events, we cannot
         create new view_menu's using a session, so any SQLAlchemy events hooked to
         `ViewMenu` will not trigger an after_insert.
@@ -1623,6 +1647,7 @@ class BridgeSecurityManager(  # pylint: disable=too-many-public-methods
         :param connection: The DB-API connection
         :param target: The mapped instance being changed
         """
+        self.invalidate_permission_index(mapper, connection, target)
 
     def on_view_menu_after_insert(
         self, mapper: Mapper, connection: Connection, target: ViewMenu
@@ -1647,6 +1672,8 @@ class BridgeSecurityManager(  # pylint: disable=too-many-public-methods
         Hook that allows for further custom operations when a new ViewMenu
         is updated
 
+        Invalidates the permission index, so overrides should call `super()`.
+
         Since the update may be performed on after_update event. We cannot
         update ViewMenus using a session, so any SQLAlchemy events hooked to
         `ViewMenu` will not trigger an after_update.
@@ -1655,6 +1682,7 @@ class BridgeSecurityManager(  # pylint: disable=too-many-public-methods
         :param connection: The DB-API connection
         :param target: The mapped instance being persisted
         """
+        self.invalidate_permission_index(mapper, connection, target)
 
     def on_permission_after_insert(
         self, mapper: Mapper, connection: Connection, target: Permission
@@ -1679,6 +1707,8 @@ class BridgeSecurityManager(  # pylint: disable=too-many-public-methods
         Hook that allows for further custom operations when a new PermissionView
         is created by SQLAlchemy events.
 
+        Invalidates the permission index, so overrides should call `super()`.
+
         On SQLAlchemy after_insert events, we cannot
         create new pvms using a session, so any SQLAlchemy events hooked to
         `PermissionView` will not trigger an after_insert.
@@ -1687,6 +1717,7 @@ class BridgeSecurityManager(  # pylint: disable=too-many-public-methods
         :param connection: The DB-API connection
         :param target: The mapped instance being persisted
         """
+        self.invalidate_permission_index(mapper, connection, target)
 
     def on_permission_view_after_delete(
         self, mapper: Mapper, connection: Connection, target: PermissionView
@@ -1695,6 +1726,8 @@ class BridgeSecurityManager(  # pylint: disable=too-many-public-methods
         Hook that allows for further custom operations when a new PermissionView
         is delete by SQLAlchemy events.
 
+        Invalidates the permission index, so overrides should call `super()`.
+
         On SQLAlchemy after_delete events, we cannot
         delete pvms using a session, so any SQLAlchemy events hooked to
         `PermissionView` will not trigger an after_delete.
@@ -1703,6 +1736,22 @@ class BridgeSecurityManager(  # pylint: disable=too-many-public-methods
         :param connection: The DB-API connection
         :param target: The mapped instance being persisted
         """
+        self.invalidate_permission_index(mapper, connection, target)
+
+    def invalidate_permission_index(  # pylint: disable=unused-argument
+        self, mapper: Mapper, connection: Connection, target: Model
+    ) -> None:
+        """
+        Invalidates the permission index, when permissions or view menus are changed
+        through the ORM, once the transaction changing them is committed.
+
+        :param mapper: The table mapper
+        :param connection: The DB-API connection
+        :param target: The mapped instance being changed
+        """
+        self.permission_index.invalidate_after_commit(
+            object_session(target) or self.get_session
+        )
 
     @staticmethod
     def get_exclude_users_from_lists() -> List[str]:
@@ -1859,11 +1908,17 @@ class BridgeSecurityManager(  # pylint: disable=too-many-public-methods
             ]
         return []
 
-    def get_rls_filters(self, table: "BaseDatasource") -> List[SqlaQuery]:
+    def get_rls_filters(
+        self, table: "BaseDatasource"
+    ) -> List[RowLevelSecurityFilterRule]:
         """
         Retrieves the appropriate row level security filters for the current user and
         the passed table.
 
+        The filters are memoized for the duration of the request, per user roles and
+        table, and cached across requests in the metadata cache until the row level
+        security filters change.
+
         :param table: The table to check against
         :returns: A list of filters
         """
@@ -1871,6 +1926,60 @@ class BridgeSecurityManager(  # pylint: disable=too-many-public-methods
         if not (hasattr(g, "user") and g.user is not None):
             return []
 
+        user_roles = sorted(role.id for role in self.get_user_roles(g.user))
+        key = (tuple(user_roles), table.id)
+        request_filters = g.setdefault("rls_filters", {})
+        if key not in request_filters:
+            request_filters[key] = self._get_cached_rls_filters(user_roles, table.id)
+        return request_filters[key]
+
+    def _get_cached_rls_filters(
+        self, user_roles: List[int], table_id: int
+    ) -> List[RowLevelSecurityFilterRule]:
+        """
+        Retrieves the row level security filters of the roles and the table from the
+        metadata cache, or from the metadata database on a cache miss.
+
+        The cache keys include a version, that is replaced whenever the filters
+        change, see `invalidate_rls_filters`. The filters aren't cached when the
+        cache isn't shared by the processes, as the other processes wouldn't see
+        the version change.
+        """
+        # pylint: disable=import-outside-toplevel
+        from bridge.extensions import cache_manager
+        from bridge.utils.cache import is_shared_cache
+
+        cache = cache_manager.cache
+        if not is_shared_cache(cache):
+            return self._get_rls_filters(user_roles, table_id)
+
+        version = cache.get(RLS_FILTERS_VERSION_CACHE_KEY)
+        if version is None:
+            cache.add(RLS_FILTERS_VERSION_CACHE_KEY, uuid4().hex, timeout=0)
+            version = cache.get(RLS_FILTERS_VERSION_CACHE_KEY)
+        if version is None:
+            # the version was evicted in the meantime
+            return self._get_rls_filters(user_roles, table_id)
+
+        cache_key = f"rls_filters:{version}:{table_id}:{','.join(map(str, user_roles))}"
+        filters = cache.get(cache_key)
+        if filters is None:
+            filters = self._get_rls_filters(user_roles, table_id)
+            cache.set(
+                cache_key,
+                [tuple(filter_) for filter_ in filters],
+                timeout=current_app.config["RLS_FILTERS_CACHE_TIMEOUT"],
+            )
+            return filters
+        return [RowLevelSecurityFilterRule(*filter_) for filter_ in filters]
+
+    def _get_rls_filters(
+        self, user_roles: List[int], table_id: int
+    ) -> List[RowLevelSecurityFilterRule]:
+        """
+        Retrieves the row level security filters of the roles and the table from the
+        metadata database.
+        """
         # pylint: disable=import-outside-toplevel
         from bridge.connectors.sqla.models import (
             RLSFilterRoles,
@@ -1878,7 +1987,6 @@ class BridgeSecurityManager(  # pylint: disable=too-many-public-methods
             RowLevelSecurityFilter,
         )
 
-        user_roles = [role.id for role in self.get_user_roles(g.user)]
         regular_filter_roles = (
             self.get_session()
             .query(RLSFilterRoles.c.rls_filter_id)
@@ -1900,7 +2008,7 @@ class BridgeSecurityManager(  # pylint: disable=too-many-public-methods
         filter_tables = (
             self.get_session()
             .query(RLSFilterTables.c.rls_filter_id)
-            .filter(RLSFilterTables.c.table_id == table.id)
+            .filter(RLSFilterTables.c.table_id == table_id)
         )
         query = (
             self.get_session()
@@ -1925,7 +2033,53 @@ class BridgeSecurityManager(  # pylint: disable=too-many-public-methods
                 )
             )
         )
-        return query.all()
+        return [
+            RowLevelSecurityFilterRule(id_, group_key, clause)
+            for id_, group_key, clause in query.all()
+        ]
+
+    @staticmethod
+    def invalidate_rls_filters(  # pylint: disable=unused-argument
+        mapper: Mapper, connection: Connection, target: Any
+    ) -> None:
+        """
+        Invalidates the cached row level security filters when a filter changes, once
+        the transaction changing it is committed, see `on_rls_filters_after_commit`.
+        The filters of other processes could otherwise be cached from the metadata
+        database before the change is visible to them.
+
+        :param mapper: The table mapper
+        :param connection: The DB-API connection
+        :param target: The changed row level security filter
+        """
+        object_session(target).info[RLS_FILTERS_SESSION_INFO_KEY] = True
+
+    @staticmethod
+    def on_rls_filters_after_commit(session: Session) -> None:
+        """
+        Invalidates the cached row level security filters if the committed
+        transaction changed them.
+
+        :param session: The committed session
+        """
+        # pylint: disable=import-outside-toplevel
+        from bridge.extensions import cache_manager
+
+        if not session.info.pop(RLS_FILTERS_SESSION_INFO_KEY, False):
+            return
+        cache_manager.cache.set(RLS_FILTERS_VERSION_CACHE_KEY, uuid4().hex, timeout=0)
+        if has_app_context():
+            g.pop("rls_filters", None)
+
+    @staticmethod
+    def on_rls_filters_after_rollback(session: Session) -> None:
+        """
+        Discards the invalidation of the cached row level security filters by a
+        rolled back transaction.
+
+        :param session: The rolled back session
+        """
+        session.info.pop(RLS_FILTERS_SESSION_INFO_KEY, None)
 
     def get_rls_ids(self, table: "BaseDatasource") -> List[int]:
         """
@@ -0,0 +1,253 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+A process-wide index of the permissions of roles, to check the access of users
+without walking the role, permission and view menu relationships of each check.
+"""
+import re
+import sys
+from dataclasses import dataclass
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+from uuid import uuid4
+
+from flask import current_app, g, has_app_context
+from flask_appbuilder.security.sqla.models import (
+    assoc_permissionview_role,
+    Permission,
+    PermissionView,
+    ViewMenu,
+)
+from sqlalchemy.orm import Session
+
+PERMISSION_INDEX_VERSION_CACHE_KEY = "permission_index_version"
+# flags a session whose transaction changed permissions, see `invalidate_after_commit`
+PERMISSION_INDEX_SESSION_INFO_KEY = "invalidate_permission_index"
+
+# the id of databases and datasets, at the end of their permission view menu names
+view_menu_id_re = re.compile(r"\(id:(\d+)\)$")
+
+
+@dataclass(frozen=True)
+class RolePermissions:
+    """
+    The permissions of a role.
+    """
+
+    # (permission name, view menu name) pairs
+    permissions: FrozenSet[Tuple[str, str]]
+    # view menu names, by permission name
+    view_menus: Dict[str, FrozenSet[str]]
+    # ids of the databases and datasets, and names of the schemas, the role can access
+    database_ids: FrozenSet[int]
+    datasource_ids: FrozenSet[int]
+    schema_perms: FrozenSet[str]
+
+    @classmethod
+    def from_permissions(
+        cls, permissions: Iterable[Tuple[str, str]]
+    ) -> "RolePermissions":
+        pairs = frozenset(
+            (sys.intern(permission_name), sys.intern(view_menu_name))
+            for permission_name, view_menu_name in permissions
+        )
+        view_menus: Dict[str, Set[str]] = {}
+        for permission_name, view_menu_name in pairs:
+            view_menus.setdefault(permission_name, set()).add(view_menu_name)
+
+        def get_ids(permission_name: str) -> FrozenSet[int]:
+            return frozenset(
+                int(match.group(1))
+                for match in map(
+                    view_menu_id_re.search, view_menus.get(permission_name, ())
+                )
+                if match
+            )
+
+        return cls(
+            permissions=pairs,
+            view_menus={
+                permission_name: frozenset(names)
+                for permission_name, names in view_menus.items()
+            },
+            database_ids=get_ids("database_access"),
+            datasource_ids=get_ids("datasource_access"),
+            schema_perms=frozenset(view_menus.get("schema_access", ())),
+        )
+
+
+class PermissionIndex:
+    """
+    The permissions of roles, loaded lazily from the metadata database and shared
+    across requests.
+
+    The index is versioned with a token stored in the metadata cache, checked once
+    per request, so that changes to permissions made by any process invalidate the
+    index of all processes. The token expires after `PERMISSION_INDEX_TIMEOUT`
+    seconds, bounding how long an index loaded from a stale read can be used. When
+    the metadata cache isn't shared by the processes, eg `NullCache` or
+    `SimpleCache`, the index only lives for the duration of a request.
+    """
+
+    def __init__(self) -> None:
+        self._roles: Dict[int, RolePermissions] = {}
+        self._version: Optional[str] = None
+
+    @staticmethod
+    def _get_cache() -> Any:
+        # pylint: disable=import-outside-toplevel
+        from bridge.extensions import cache_manager
+
+        return cache_manager.cache
+
+    def _check_version(self) -> None:
+        # pylint: disable=import-outside-toplevel
+        from bridge.utils.cache import is_shared_cache
+
+        if has_app_context() and "permission_index_version" in g:
+            return
+
+        cache = self._get_cache()
+        if is_shared_cache(cache):
+            version = cache.get(PERMISSION_INDEX_VERSION_CACHE_KEY)
+            if version is None:
+                cache.add(
+                    PERMISSION_INDEX_VERSION_CACHE_KEY,
+                    uuid4().hex,
+                    timeout=current_app.config["PERMISSION_INDEX_TIMEOUT"],
+                )
+                version = cache.get(PERMISSION_INDEX_VERSION_CACHE_KEY)
+        else:
+            # changes made by other processes can't be seen, so reload the index
+            version = None
+        if version is None or version != self._version:
+            self._roles = {}
+            self._version = version
+        if has_app_context():
+            g.permission_index_version = version
+
+    def get_roles(
+        self, session: Session, role_ids: Iterable[int]
+    ) -> List[RolePermissions]:
+        """
+        Return the permissions of roles, loading the ones missing from the index in a
+        single query.
+
+        :param session: The metadata database session
+        :param role_ids: The role ids
+        :returns: The permissions of each role
+        """
+        self._check_version()
+        roles = self._roles
+        role_ids = set(role_ids)
+        missing_role_ids = role_ids - roles.keys()
+        if missing_role_ids:
+            permissions: Dict[int, List[Tuple[str, str]]] = {
+                role_id: [] for role_id in missing_role_ids
+            }
+            rows = (
+                session.query(
+                    assoc_permissionview_role.c.role_id,
+                    Permission.name,
+                    ViewMenu.name,
+                )
+                .join(
+                    PermissionView,
+                    PermissionView.id == assoc_permissionview_role.c.permission_view_id,
+                )
+                .join(Permission, Permission.id == PermissionView.permission_id)
+                .join(ViewMenu, ViewMenu.id == PermissionView.view_menu_id)
+                .filter(assoc_permissionview_role.c.role_id.in_(missing_role_ids))
+            )
+            for role_id, permission_name, view_menu_name in rows:
+                permissions[role_id].append((permission_name, view_menu_name))
+            for role_id, role_permissions in permissions.items():
+                roles[role_id] = RolePermissions.from_permissions(role_permissions)
+        return [roles[role_id] for role_id in role_ids]
+
+    def has_permission(
+        self,
+        session: Session,
+        role_ids: Iterable[int],
+        permission_name: str,
+        view_menu_name: str,
+    ) -> bool:
+        """
+        Return True if any of the roles has the permission on the view menu.
+        """
+        permission = (permission_name, view_menu_name)
+        return any(
+            permission in role.permissions for role in self.get_roles(session, role_ids)
+        )
+
+    def view_menu_names(
+        self, session: Session, role_ids: Iterable[int], permission_name: str
+    ) -> Set[str]:
+        """
+        Return the names of the view menus any of the roles has the permission on.
+        """
+        names: Set[str] = set()
+        for role in self.get_roles(session, role_ids):
+            names.update(role.view_menus.get(permission_name, ()))
+        return names
+
+    def invalidate(self) -> None:
+        """
+        Invalidate the index of all processes, after permissions changed.
+
+        This only affects the current process when the metadata cache isn't shared.
+        Permissions changed in a transaction should use `invalidate_after_commit`
+        instead, so that other processes don't reload them before the transaction is
+        committed.
+        """
+        # pylint: disable=import-outside-toplevel
+        from bridge.utils.cache import is_shared_cache
+
+        self._roles = {}
+        cache = self._get_cache()
+        if is_shared_cache(cache):
+            cache.set(
+                PERMISSION_INDEX_VERSION_CACHE_KEY,
+                uuid4().hex,
+                timeout=current_app.config["PERMISSION_INDEX_TIMEOUT"],
+            )
+        if has_app_context():
+            g.pop("permission_index_version", None)
+
+    @staticmethod
+    def invalidate_after_commit(session: Session) -> None:
+        """
+        Invalidate the index once the transaction of the session is committed, see
+        `on_after_commit`. Called while the session is flushed, when the changes aren't
+        visible to other processes yet.
+
+        :param session: The metadata database session changing permissions
+        """
+        session.info[PERMISSION_INDEX_SESSION_INFO_KEY] = True
+
+    def on_after_commit(self, session: Session) -> None:
+        """
+        Invalidate the index if the committed transaction changed permissions.
+        """
+        if session.info.pop(PERMISSION_INDEX_SESSION_INFO_KEY, False):
+            self.invalidate()
+
+    @staticmethod
+    def on_after_rollback(session: Session) -> None:
+        """
+        Discard the invalidation of the index by a rolled back transaction.
+        """
+        session.info.pop(PERMISSION_INDEX_SESSION_INFO_KEY, None)
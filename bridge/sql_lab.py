@@ -24,7 +24,6 @@ from typing import Any, cast, Dict, List, Optional, Tuple, Union
 
 import backoff
 import msgpack
-import pyarrow as pa
 import simplejson as json
 from celery import Task
 from celery.exceptions import SoftTimeLimitExceeded
@@ -49,13 +48,13 @@ from bridge.models.sql_lab import Query
 from bridge.result_set import BridgeResultSet
 from bridge.sql_parse import CtasMethod, insert_rls, ParsedQuery
 from bridge.sqllab.limiting_factor import LimitingFactor
+from bridge.sqllab.utils import compress_results_payload, serialize_arrow_table
 from bridge.utils.celery import session_scope
 from bridge.utils.core import (
     get_username,
     json_iso_dttm_ser,
     override_user,
     QuerySource,
-    zlib_compress,
 )
 from bridge.utils.dates import now_as_float
 from bridge.utils.decorators import stats_timing
@@ -66,6 +65,7 @@ SQLLAB_TIMEOUT = config["SQLLAB_ASYNC_TIME_LIMIT_SEC"]
 SQLLAB_HARD_TIMEOUT = SQLLAB_TIMEOUT + 60
 SQL_MAX_ROW = config["SQL_MAX_ROW"]
 SQLLAB_CTAS_NO_LIMIT = config["SQLLAB_CTAS_NO_LIMIT"]
+SQLLAB_FETCH_CHUNK_SIZE = config["SQLLAB_FETCH_CHUNK_SIZE"]
 SQL_QUERY_MUTATOR = config["SQL_QUERY_MUTATOR"]
 log_query = config["QUERY_LOGGER"]
 logger = logging.getLogger(__name__)
@@ -284,8 +284,23 @@ def execute_sql_statement(  # pylint: disable=too-many-arguments,too-many-statem
                 query.id,
                 str(query.to_dict()),
             )
-            data = db_engine_spec.fetch_data(cursor, increased_limit)
-            if query.limit is None or len(data) <= query.limit:
+            # statements which were not limited in SQL are capped while fetching
+            fetch_limit = increased_limit
+            if fetch_limit is None and SQL_MAX_ROW:
+                fetch_limit = SQL_MAX_ROW + 1
+            data = db_engine_spec.fetch_data_as_arrow(cursor, fetch_limit)
+            if data is None and SQLLAB_FETCH_CHUNK_SIZE:
+                data = BridgeResultSet.table_from_chunks(
+                    db_engine_spec.fetch_data_chunks(cursor, SQLLAB_FETCH_CHUNK_SIZE),
+                    db_engine_spec,
+                    max_rows=fetch_limit,
+                )
+            elif data is None:
+                data = db_engine_spec.fetch_data(cursor, increased_limit)
+            if query.limit is None and fetch_limit and len(data) >= fetch_limit:
+                query.limiting_factor = LimitingFactor.DROPDOWN
+                data = data[:SQL_MAX_ROW]
+            elif query.limit is None or len(data) <= query.limit:
                 query.limiting_factor = LimitingFactor.NOT_LIMITED
             else:
                 # return 1 row less than increased_query
@@ -358,11 +373,10 @@ def _serialize_and_expand_data(
         with stats_timing(
             "sqllab.query.results_backend_pa_serialization", stats_logger
         ):
-            data = (
-                pa.default_serialization_context()
-                .serialize(result_set.pa_table)
-                .to_buffer()
-                .to_pybytes()
+            data = serialize_arrow_table(
+                result_set.pa_table,
+                batch_size=config["RESULTS_BACKEND_ARROW_BATCH_SIZE"],
+                compression=config["RESULTS_BACKEND_ARROW_COMPRESSION"],
             )
 
         # expand when loading data from results backend
@@ -463,8 +477,11 @@ def execute_sql_statements(  # pylint: disable=too-many-arguments, too-many-loca
             )
         )
 
+    # SQL Lab statements can change the state of the session (`SET`, `USE`, temporary
+    # tables...), so they run on a connection of their own rather than on a pooled one
+    # from the engine cache
     with database.get_sqla_engine_with_context(
-        query.schema, source=QuerySource.SQL_LAB
+        query.schema, nullpool=True, source=QuerySource.SQL_LAB
     ) as engine:
         # Sharing a single connection and cursor across the
         # execution of all statements (if many)
@@ -574,7 +591,7 @@ def execute_sql_statements(  # pylint: disable=too-many-arguments, too-many-loca
             if cache_timeout is None:
                 cache_timeout = config["CACHE_DEFAULT_TIMEOUT"]
 
-            compressed = zlib_compress(serialized_payload)
+            compressed = compress_results_payload(serialized_payload, use_arrow_data)
             logger.debug(
                 "*** serialized payload size: %i", getsizeof(serialized_payload)
             )
@@ -21,16 +21,19 @@ from typing import Any, Dict, TYPE_CHECKING
 
 import simplejson as json
 
-import bridgels.core as utils
-from bridgelab.command_status import SqlJsonExecutionStatus
-from bridgelab.utils import apply_display_max_row_configuration_if_require
+import bridge.utils.core as utils
+from bridge.sqllab.command_status import SqlJsonExecutionStatus
+from bridge.sqllab.utils import (
+    apply_display_max_row_configuration_if_require,
+    set_results_page,
+)
 
 logger = logging.getLogger(__name__)
 
 if TYPE_CHECKING:
-    from bridgeels.sql_lab import Query
-    from bridgelab.sql_json_executer import SqlResults
-    from bridgelab.sqllab_execution_context import SqlJsonExecutionContext
+    from bridge.models.sql_lab import Query
+    from bridge.sqllab.sql_json_executer import SqlResults
+    from bridge.sqllab.sqllab_execution_context import SqlJsonExecutionContext
 
 
 class ExecutionContextConvertor:
@@ -55,8 +58,10 @@ class ExecutionContextConvertor:
     def serialize_payload(self) -> str:
         if self._exc_status == SqlJsonExecutionStatus.HAS_RESULTS:
             return json.dumps(
-                apply_display_max_row_configuration_if_require(
-                    self.payload, self._max_row_in_display_configuration
+                set_results_page(
+                    apply_display_max_row_configuration_if_require(
+                        self.payload, self._max_row_in_display_configuration
+                    )
                 ),
                 default=utils.pessimistic_json_iso_dttm_ser,
                 ignore_nan=True,
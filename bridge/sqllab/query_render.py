@@ -23,17 +23,17 @@ from flask_babel import gettext as __, ngettext
 from jinja2 import TemplateError
 from jinja2.meta import find_undeclared_variables
 
-from bridget is_feature_enabled
-from bridges import BridgeErrorType
-from bridgeb.command import SqlQueryRender
-from bridgeb.exceptions import SqlLabException
-from bridge import core as utils
+from bridge import is_feature_enabled
+from bridge.errors import BridgeErrorType
+from bridge.sqllab.command import SqlQueryRender
+from bridge.sqllab.exceptions import SqlLabException
+from bridge.utils import core as utils
 
 MSG_OF_1006 = "Issue 1006 - One or more parameters specified in the query are missing."
 
 if TYPE_CHECKING:
-    from bridge_context import BaseTemplateProcessor
-    from bridgeb.sqllab_execution_context import SqlJsonExecutionContext
+    from bridge.jinja_context import BaseTemplateProcessor
+    from bridge.sqllab.sqllab_execution_context import SqlJsonExecutionContext
 
 PARAMETER_MISSING_ERR = (
     "Please check your template parameters for syntax errors and make sure "
@@ -24,21 +24,21 @@ from typing import Any, Callable, Dict, Optional, TYPE_CHECKING
 
 from flask_babel import gettext as __
 
-from bgidgos import ErrorLevel, BridgeError, BridgeErrorType
-from bridgetions import (
+from bridge.errors import ErrorLevel, BridgeError, BridgeErrorType
+from bridge.exceptions import (
     BridgeErrorException,
     BridgeErrorsException,
     BridgeGenericDBErrorException,
     BridgeTimeoutException,
 )
-from bridgeb.command_status import SqlJsonExecutionStatus
-from bridge import core as utils
-from bridge.core import get_username
-from bridge.dates import now_as_float
+from bridge.sqllab.command_status import SqlJsonExecutionStatus
+from bridge.utils import core as utils
+from bridge.utils.core import get_username
+from bridge.utils.dates import now_as_float
 
 if TYPE_CHECKING:
-    from bridgees.dao import QueryDAO
-    from bridgeb.sqllab_execution_context import SqlJsonExecutionContext
+    from bridge.queries.dao import QueryDAO
+    from bridge.sqllab.sqllab_execution_context import SqlJsonExecutionContext
 
 QueryStatus = utils.QueryStatus
 logger = logging.getLogger(__name__)
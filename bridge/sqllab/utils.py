@@ -14,9 +14,22 @@
 # KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations
 # under the License.
-from typing import Any, Dict
+from bisect import bisect_right
+from typing import Any, Dict, List, Optional, Union
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import simplejson as json
 
 from bridge.common.db_query_status import QueryStatus
+from bridge.utils.core import zlib_compress, zlib_decompress
+
+# Results stored as Arrow IPC are framed with this prefix instead of being zlib
+# compressed as a whole, the record batches carry their own compression
+ARROW_RESULTS_PREFIX = b"BRIDGE_ARROW_IPC:"
+ARROW_IPC_FILE_MAGIC = b"ARROW1"
+BATCH_OFFSETS_METADATA_KEY = b"bridge:batch_offsets"
 
 
 def apply_display_max_row_configuration_if_require(  # pylint: disable=invalid-name
@@ -45,3 +58,192 @@ def apply_display_max_row_configuration_if_require(  # pylint: disable=invalid-n
         sql_results["data"] = sql_results["data"][:max_rows_in_result]
         sql_results["displayLimitReached"] = True
     return sql_results
+
+
+def set_results_page(sql_results: Dict[str, Any], offset: int = 0) -> Dict[str, Any]:
+    """
+    Add the position of the returned rows to a `sql_results` nested structure.
+
+    The total row count lets the client page through the stored results with the
+    `offset`/`limit` (or `page`/`page_size`) arguments of the results endpoint.
+
+    :param sql_results: The results of a sql query from sql_lab.get_sql_results
+    :param offset: The offset of the first returned row
+    :returns: The mutated sql_results structure
+    """
+    if sql_results["status"] == QueryStatus.SUCCESS:
+        sql_results["offset"] = offset
+        sql_results["total_rows"] = sql_results["query"]["rows"]
+    return sql_results
+
+
+def serialize_arrow_table(
+    table: pa.Table, batch_size: int, compression: Optional[str] = None
+) -> bytes:
+    """
+    Serialize a table to the Arrow IPC file format in record batches of at most
+    `batch_size` rows, so a page of the results can be read back without decoding
+    the whole table.
+
+    The starting row of every record batch is kept in the schema metadata.
+
+    :param table: The table to serialize
+    :param batch_size: The maximum number of rows per record batch
+    :param compression: The IPC buffer compression codec (`lz4`, `zstd` or `None`)
+    :returns: The Arrow IPC file bytes
+    """
+    batches = table.to_batches(max_chunksize=batch_size)
+    batch_offsets: List[int] = []
+    row_count = 0
+    for batch in batches:
+        batch_offsets.append(row_count)
+        row_count += batch.num_rows
+
+    schema = table.schema.with_metadata(
+        {
+            **(table.schema.metadata or {}),
+            BATCH_OFFSETS_METADATA_KEY: json.dumps(batch_offsets),
+        }
+    )
+    sink = pa.BufferOutputStream()
+    options = pa.ipc.IpcWriteOptions(compression=compression)
+    with pa.ipc.new_file(sink, schema, options=options) as writer:
+        for batch in batches:
+            writer.write_batch(batch)
+    return sink.getvalue().to_pybytes()
+
+
+def is_arrow_ipc_data(data: Any) -> bool:
+    return isinstance(data, bytes) and data.startswith(ARROW_IPC_FILE_MAGIC)
+
+
+def deserialize_arrow_table(  # pylint: disable=too-many-arguments, too-many-locals
+    data: bytes,
+    offset: int = 0,
+    limit: Optional[int] = None,
+    columns: Optional[List[str]] = None,
+    order_by: Optional[str] = None,
+    order_desc: bool = False,
+) -> pa.Table:
+    """
+    Read rows `[offset, offset + limit)` from data written by `serialize_arrow_table`.
+
+    Only the requested columns of the record batches holding those rows are decoded.
+    When sorting, the `order_by` column is read in full to compute the page, the
+    other columns are still only read for the rows of the page.
+
+    :param data: The Arrow IPC file bytes
+    :param offset: The first row to read
+    :param limit: The maximum number of rows to read, all of them when `None`
+    :param columns: The columns to read, all of them when `None`
+    :param order_by: The column to sort the rows by before paginating
+    :param order_desc: Whether to sort in descending order, nulls are always last
+    :returns: The requested slice of the table
+    """
+    buffer = pa.py_buffer(data)
+    schema = pa.ipc.open_file(buffer).schema
+    metadata = dict(schema.metadata or {})
+    batch_offsets: List[int] = json.loads(metadata.pop(BATCH_OFFSETS_METADATA_KEY))
+    names = columns or schema.names
+
+    def open_reader(fields: List[str]) -> pa.ipc.RecordBatchFileReader:
+        options = pa.ipc.IpcReadOptions(
+            included_fields=sorted({schema.get_field_index(name) for name in fields})
+        )
+        return pa.ipc.open_file(buffer, options=options)
+
+    reader = open_reader(names)
+    if order_by is None:
+        first = max(bisect_right(batch_offsets, offset) - 1, 0)
+        end = None if limit is None else offset + limit
+        batches = []
+        for index in range(first, reader.num_record_batches):
+            if end is not None and batch_offsets[index] >= end:
+                break
+            batches.append(reader.get_batch(index))
+
+        table = pa.Table.from_batches(batches, schema=reader.schema)
+        start = offset - batch_offsets[first] if batches else 0
+        table = table.slice(min(start, table.num_rows), limit)
+    else:
+        sort_reader = open_reader([order_by])
+        sort_table = pa.Table.from_batches(
+            [sort_reader.get_batch(index) for index in range(len(batch_offsets))],
+            schema=sort_reader.schema,
+        )
+        indices = pc.sort_indices(
+            sort_table,
+            sort_keys=[(order_by, "descending" if order_desc else "ascending")],
+            null_placement="at_end",
+        )
+        page = indices.slice(min(offset, len(indices)), limit).to_numpy()
+        batch_ids = np.searchsorted(batch_offsets, page, side="right") - 1
+
+        # read each record batch holding rows of the page once, then restore the
+        # order of the page
+        tables = [pa.Table.from_batches([], schema=reader.schema)]
+        positions = [np.array([], dtype=np.int64)]
+        for batch_id in np.unique(batch_ids):
+            mask = batch_ids == batch_id
+            batch = reader.get_batch(int(batch_id))
+            tables.append(
+                pa.Table.from_batches(
+                    [batch.take(pa.array(page[mask] - batch_offsets[batch_id]))]
+                )
+            )
+            positions.append(np.flatnonzero(mask))
+        table = pa.concat_tables(tables).take(
+            pa.array(np.argsort(np.concatenate(positions)))
+        )
+
+    return table.select(names).replace_schema_metadata(metadata or None)
+
+
+def paginate_arrow_table(  # pylint: disable=too-many-arguments
+    table: pa.Table,
+    offset: int = 0,
+    limit: Optional[int] = None,
+    columns: Optional[List[str]] = None,
+    order_by: Optional[str] = None,
+    order_desc: bool = False,
+) -> pa.Table:
+    """
+    In memory counterpart of `deserialize_arrow_table`, for tables that could not be
+    read lazily.
+    """
+    if order_by is not None:
+        table = table.take(
+            pc.sort_indices(
+                table,
+                sort_keys=[(order_by, "descending" if order_desc else "ascending")],
+                null_placement="at_end",
+            )
+        )
+    table = table.select(columns or table.column_names)
+    return table.slice(min(offset, table.num_rows), limit)
+
+
+def compress_results_payload(
+    payload: Union[bytes, str], use_arrow_data: bool = False
+) -> bytes:
+    """
+    Prepare a serialized SQL Lab payload for the results backend.
+
+    Payloads holding Arrow IPC data are only framed, as compressing them again
+    would force readers to inflate the whole blob to get a single page.
+    """
+    if use_arrow_data and isinstance(payload, bytes):
+        return ARROW_RESULTS_PREFIX + payload
+    return zlib_compress(payload)
+
+
+def decompress_results_payload(
+    blob: bytes, use_msgpack: Optional[bool] = False
+) -> Union[bytes, str]:
+    """
+    Inverse of `compress_results_payload`, also reading zlib compressed payloads
+    written by previous versions.
+    """
+    if blob.startswith(ARROW_RESULTS_PREFIX):
+        return blob[len(ARROW_RESULTS_PREFIX) :]
+    return zlib_decompress(blob, decode=not use_msgpack)
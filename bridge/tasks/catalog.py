@@ -0,0 +1,66 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""Crawls the metadata of the databases into the catalog index"""
+
+import logging
+from typing import List, Optional
+
+from flask import current_app
+
+from bridge.catalog.crawler import CatalogCrawler
+from bridge.extensions import celery_app
+from bridge.models.core import Database
+from bridge.utils.celery import session_scope
+
+logger = logging.getLogger(__name__)
+
+
+@celery_app.task(name="catalog.crawl_database", ignore_result=True)
+def crawl_database(
+    database_id: int,
+    schema_names: Optional[List[str]] = None,
+    force: bool = False,
+) -> None:
+    """
+    Crawl a database into the catalog index, see `CatalogCrawler.crawl`.
+    """
+    with session_scope(nullpool=True) as session:
+        database = session.query(Database).get(database_id)
+        if not database:
+            logger.warning("Database %s not found, skipping crawl", database_id)
+            return
+        stats = CatalogCrawler(database, session).crawl(schema_names, force)
+        logger.info(
+            "Crawled %s schemas and %s tables of database %s",
+            stats["schemas"],
+            stats["tables"],
+            database_id,
+        )
+
+
+@celery_app.task(name="catalog.crawl_databases", ignore_result=True)
+def crawl_databases() -> None:
+    """
+    Schedule a crawl of every database, when the catalog index is enabled.
+    """
+    if not current_app.config["CATALOG_INDEX_ENABLED"]:
+        return
+
+    with session_scope(nullpool=True) as session:
+        database_ids = [database_id for (database_id,) in session.query(Database.id)]
+    for database_id in database_ids:
+        crawl_database.delay(database_id)
@@ -21,18 +21,18 @@ it needs to call create_app() in order to initialize things properly
 """
 from typing import Any
 
-from celery.signals import worker_process_init
+from celery.signals import worker_process_init, worker_process_shutdown
 
 # Bridge framework imports
 from bridge import create_app
-from bridge.extensions import celery_app, db
+from bridge.extensions import celery_app, db, event_logger
 
 # Init the Flask app / configure everything
 flask_app = create_app()
 
 # Need to import late, as the celery_app will have been setup by "create_app()"
 # pylint: disable=wrong-import-position, unused-import
-from . import cache, scheduler  # isort:skip
+from . import cache, catalog, scheduler  # isort:skip
 
 # Export the celery app globally for Celery (as run on the cmd line) to find
 app = celery_app
@@ -43,3 +43,21 @@ def reset_db_connection_pool(**kwargs: Any) -> None:  # pylint: disable=unused-a
     with flask_app.app_context():
         # https://docs.sqlalchemy.org/en/14/core/connections.html#engine-disposal
         db.engine.dispose()
+
+
+@worker_process_shutdown.connect
+def close_webdrivers(**kwargs: Any) -> None:  # pylint: disable=unused-argument
+    # pylint: disable=import-outside-toplevel
+    from bridge.utils.webdriver import webdriver_pool
+
+    with flask_app.app_context():
+        webdriver_pool.clear()
+
+
+@worker_process_shutdown.connect
+def flush_event_logs(**kwargs: Any) -> None:  # pylint: disable=unused-argument
+    # worker processes exit without running the `atexit` handlers
+    shutdown = getattr(event_logger, "shutdown", None)
+    if shutdown:
+        with flask_app.app_context():
+            shutdown()
@@ -24,7 +24,7 @@ from typing import Any, Callable, Dict, Optional, TYPE_CHECKING, Union
 
 from flask import current_app as app, request
 from flask_caching import Cache
-from flask_caching.backends import NullCache
+from flask_caching.backends import NullCache, SimpleCache
 from werkzeug.wrappers import Response
 
 from bridge import db
@@ -46,6 +46,17 @@ def generate_cache_key(values_dict: Dict[str, Any], key_prefix: str = "") -> str
     return f"{key_prefix}{hash_str}"
 
 
+def is_shared_cache(cache: Any) -> bool:
+    """
+    Return True if the cache is shared by the processes of the deployment, ie values
+    set by one process can be read by the others.
+
+    :param cache: A `Cache` or a cache backend
+    """
+    backend = cache.cache if isinstance(cache, Cache) else cache
+    return not isinstance(backend, (NullCache, SimpleCache))
+
+
 def set_and_log_cache(
     cache_instance: Cache,
     cache_key: str,
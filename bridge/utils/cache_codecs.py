@@ -0,0 +1,162 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Codecs used to store DataFrames in the data cache.
+
+The cached value carries the name of the codec that encoded its ``df`` under
+``df_codec``, values written before codecs existed have no such entry and are
+read back with the ``pickle`` codec.
+"""
+from __future__ import annotations
+
+import logging
+from typing import Any, Dict, Optional, Tuple
+
+import pandas as pd
+import pyarrow as pa
+from flask import current_app
+
+logger = logging.getLogger(__name__)
+
+PICKLE_CODEC = "pickle"
+ARROW_CODEC = "arrow"
+
+ARROW_ENCODE_ERRORS = (
+    pa.lib.ArrowInvalid,
+    pa.lib.ArrowTypeError,
+    pa.lib.ArrowNotImplementedError,
+    TypeError,
+    ValueError,
+)
+
+
+class DataFrameCodec:
+    """
+    Base class of the data cache DataFrame codecs
+    """
+
+    name: str
+
+    def can_encode(self, df: pd.DataFrame) -> bool:  # pylint: disable=no-self-use
+        return True
+
+    def encode(self, df: pd.DataFrame) -> Any:
+        raise NotImplementedError()
+
+    def decode(self, payload: Any) -> pd.DataFrame:
+        raise NotImplementedError()
+
+
+class PickleDataFrameCodec(DataFrameCodec):
+    """
+    Store the DataFrame as is, leaving its serialization to the cache backend
+    """
+
+    name = PICKLE_CODEC
+
+    def encode(self, df: pd.DataFrame) -> Any:
+        return df
+
+    def decode(self, payload: Any) -> pd.DataFrame:
+        return payload
+
+
+class ArrowDataFrameCodec(DataFrameCodec):
+    """
+    Store the DataFrame as a compressed Arrow IPC stream
+    """
+
+    name = ARROW_CODEC
+
+    def __init__(self, compression: Optional[str] = "lz4") -> None:
+        self.compression = compression
+
+    def can_encode(self, df: pd.DataFrame) -> bool:
+        # Arrow stringifies column labels and turns nested values into numpy
+        # arrays, neither of which round-trips to the original DataFrame
+        return (
+            len(df.columns) > 0
+            and all(isinstance(column, str) for column in df.columns)
+            and df.columns.is_unique
+        )
+
+    def encode(self, df: pd.DataFrame) -> bytes:
+        table = pa.Table.from_pandas(df)
+        if any(pa.types.is_nested(field.type) for field in table.schema):
+            raise TypeError("Nested types can't be stored as Arrow")
+        sink = pa.BufferOutputStream()
+        options = pa.ipc.IpcWriteOptions(compression=self.compression)
+        with pa.ipc.new_stream(sink, table.schema, options=options) as writer:
+            writer.write_table(table)
+        return sink.getvalue().to_pybytes()
+
+    def decode(self, payload: Any) -> pd.DataFrame:
+        with pa.ipc.open_stream(payload) as reader:
+            table = reader.read_all()
+        # keep integers with nulls as such instead of casting them to floats, which
+        # loses precision, and restore the object columns Arrow gave a native type
+        df = table.to_pandas(integer_object_nulls=True)
+        object_columns = [
+            column["name"]
+            for column in (table.schema.pandas_metadata or {}).get("columns", [])
+            if column["numpy_type"] == "object"
+            and column["name"] in df.columns
+            and df[column["name"]].dtype != object
+        ]
+        if object_columns:
+            df = df.astype({name: object for name in object_columns})
+        return df
+
+
+def get_dataframe_codecs() -> Dict[str, DataFrameCodec]:
+    return {
+        PICKLE_CODEC: PickleDataFrameCodec(),
+        ARROW_CODEC: ArrowDataFrameCodec(
+            compression=current_app.config["DATA_CACHE_ARROW_COMPRESSION"]
+        ),
+        **current_app.config["DATA_CACHE_DATAFRAME_CODECS"],
+    }
+
+
+def encode_dataframe(df: Optional[pd.DataFrame]) -> Tuple[str, Any]:
+    """
+    Encode a DataFrame with the configured codec.
+
+    Falls back to the pickle codec when the DataFrame can't be represented by the
+    configured one.
+
+    :param df: the DataFrame to store in the cache
+    :returns: the name of the codec that was used along with the encoded payload
+    """
+    codec = get_dataframe_codecs()[current_app.config["DATA_CACHE_DATAFRAME_CODEC"]]
+    if df is not None and codec.can_encode(df):
+        try:
+            return codec.name, codec.encode(df)
+        except ARROW_ENCODE_ERRORS as ex:
+            logger.debug("Unable to encode DataFrame with %s: %s", codec.name, ex)
+    return PICKLE_CODEC, df
+
+
+def decode_dataframe(payload: Any, codec_name: Optional[str] = None) -> pd.DataFrame:
+    """
+    Decode a DataFrame stored in the cache by `encode_dataframe`.
+
+    :param payload: the encoded DataFrame
+    :param codec_name: the name of the codec that encoded it, pickle if missing
+    :returns: the DataFrame
+    """
+    return get_dataframe_codecs()[codec_name or PICKLE_CODEC].decode(payload)
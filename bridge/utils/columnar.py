@@ -0,0 +1,106 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Column oriented encodings of query results.
+
+Rather than a record per row, these encode a DataFrame one column at a time so
+that every column is converted by a single vectorized call.
+"""
+from __future__ import annotations
+
+import logging
+from typing import Any, Dict
+
+import pandas as pd
+import pyarrow as pa
+import simplejson
+from simplejson import RawJSON
+
+from bridge.utils.core import json_int_dttm_ser
+
+logger = logging.getLogger(__name__)
+
+ARROW_STREAM_MIMETYPE = "application/vnd.apache.arrow.stream"
+
+
+def series_to_json(series: pd.Series) -> str:
+    """
+    Encode a series as a JSON array.
+
+    Temporal values are encoded as milliseconds since epoch, like
+    `json_int_dttm_ser` does for the records of the row oriented format.
+
+    :param series: the series to encode
+    :returns: the JSON array
+    """
+    if pd.api.types.is_datetime64_any_dtype(series.dtype):
+        if getattr(series.dtype, "tz", None) is not None:
+            # keep the wall time, as `datetime_to_epoch` does
+            series = series.dt.tz_localize(None)
+        return series.to_json(orient="values", date_format="epoch", date_unit="ms")
+    return simplejson.dumps(
+        series.tolist(),
+        default=json_int_dttm_ser,
+        ignore_nan=True,
+    )
+
+
+def df_to_columnar_json(df: pd.DataFrame) -> Dict[Any, RawJSON]:
+    """
+    Encode a DataFrame as a mapping of its columns to their JSON arrays.
+
+    The arrays are already serialized, so the mapping can be embedded as is in a
+    larger payload dumped with `simplejson`.
+
+    :param df: the DataFrame to encode
+    :returns: the JSON array of every column, by column name
+    """
+    return {column: RawJSON(series_to_json(series)) for column, series in df.items()}
+
+
+def series_to_arrow(series: pd.Series) -> pa.Array:
+    """
+    Convert a series to an Arrow array, falling back to strings for columns
+    mixing types Arrow can't represent in a single array.
+
+    :param series: the series to convert
+    :returns: the Arrow array
+    """
+    try:
+        return pa.Array.from_pandas(series)
+    except (pa.lib.ArrowInvalid, pa.lib.ArrowTypeError, TypeError) as ex:
+        logger.debug("Converting column %s to strings: %s", series.name, ex)
+        return pa.Array.from_pandas(
+            series.map(str, na_action="ignore"), type=pa.string()
+        )
+
+
+def df_to_arrow_stream(df: pd.DataFrame) -> bytes:
+    """
+    Encode a DataFrame as an Arrow IPC stream.
+
+    :param df: the DataFrame to encode
+    :returns: the Arrow IPC stream
+    """
+    table = pa.Table.from_arrays(
+        [series_to_arrow(series) for _, series in df.items()],
+        names=[str(column) for column in df.columns],
+    )
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
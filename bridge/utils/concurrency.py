@@ -0,0 +1,127 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Helpers to run the independent queries of a single request concurrently.
+"""
+from __future__ import annotations
+
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import wraps
+from typing import Any, Callable, Dict, List, Optional, Sequence, TypeVar
+
+from flask import _request_ctx_stack, current_app, g, has_request_context
+
+from bridge import db
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+U = TypeVar("U")
+
+_local = threading.local()
+_database_semaphores: Dict[Any, threading.BoundedSemaphore] = {}
+_database_semaphores_lock = threading.Lock()
+
+
+def get_database_semaphore(database_id: Any) -> threading.BoundedSemaphore:
+    """
+    Return the process-wide semaphore bounding the number of concurrent queries
+    run against a database by `map_concurrently`.
+    """
+    with _database_semaphores_lock:
+        if database_id not in _database_semaphores:
+            _database_semaphores[database_id] = threading.BoundedSemaphore(
+                current_app.config["DATA_QUERY_MAX_CONCURRENCY_PER_DATABASE"]
+            )
+        return _database_semaphores[database_id]
+
+
+def is_in_worker() -> bool:
+    return getattr(_local, "in_worker", False)
+
+
+def copy_current_context(func: Callable[..., T]) -> Callable[..., T]:
+    """
+    Wrap a function so that it runs in a copy of the current app and request
+    contexts, carrying over the attributes of `flask.g` (eg the logged in user).
+
+    The wrapped function can be called once, from another thread.
+    """
+    app = current_app._get_current_object()  # pylint: disable=protected-access
+    request_context = _request_ctx_stack.top.copy() if has_request_context() else None
+    g_values = dict(vars(g._get_current_object()))  # pylint: disable=protected-access
+
+    @wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> T:
+        with request_context or app.app_context():
+            for key, value in g_values.items():
+                setattr(g, key, value)
+            _local.in_worker = True
+            try:
+                result = func(*args, **kwargs)
+                # the session of the worker thread is discarded along with its
+                # context, persist the objects it added, eg cache keys
+                if db.session.new:
+                    db.session.commit()
+                return result
+            finally:
+                _local.in_worker = False
+
+    return wrapper
+
+
+def map_concurrently(
+    func: Callable[[T], U],
+    items: Sequence[T],
+    database_id: Optional[Any] = None,
+    max_workers: Optional[int] = None,
+) -> List[U]:
+    """
+    Apply a function to each item on a bounded pool of worker threads.
+
+    The items are processed serially when `max_workers` is lower than 2,
+    when there is a single item or when already running in a worker thread, so
+    that nested calls don't multiply threads. Queries against the same database
+    are further bounded process-wide by `DATA_QUERY_MAX_CONCURRENCY_PER_DATABASE`.
+
+    :param func: the function to apply, run with the current app context and user
+    :param items: the items to apply the function to
+    :param database_id: the id of the database queried by `func`
+    :param max_workers: the maximum number of threads, `DATA_QUERY_MAX_WORKERS` if
+        not set
+    :returns: the results, in the order of the items
+    :raises Exception: the error of the first failed item, once all items are done
+    """
+    max_workers = min(
+        max_workers or current_app.config["DATA_QUERY_MAX_WORKERS"], len(items)
+    )
+    if max_workers < 2 or is_in_worker():
+        return [func(item) for item in items]
+
+    semaphore = get_database_semaphore(database_id)
+
+    def run(item: T) -> U:
+        with semaphore:
+            return func(item)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures: List[Future[U]] = [
+            executor.submit(copy_current_context(run), item) for item in items
+        ]
+    return [future.result() for future in futures]
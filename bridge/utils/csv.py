@@ -16,13 +16,10 @@
 # under the License.
 import logging
 import re
-import urllib.request
-from typing import Any, Dict, Optional
-from urllib.error import URLError
+from typing import Any, Dict, Iterator
 
 import numpy as np
 import pandas as pd
-import simplejson
 
 from bridge.utils.core import GenericDataType
 
@@ -64,72 +61,109 @@ def escape_value(value: str) -> str:
     return value
 
 
+def escape_values(column: pd.Series) -> pd.Series:
+    """
+    Escapes the string values of a column, see `escape_value`.
+
+    :param column: the column to escape
+    :returns: the escaped column, or the column itself if nothing needed escaping
+    """
+    if column.dtype != np.dtype(object):
+        return column
+
+    values = column.values
+    is_string = np.fromiter(
+        (isinstance(value, str) for value in values), dtype=bool, count=len(values)
+    )
+    if not is_string.any():
+        return column
+
+    strings = pd.Series(values[is_string])
+    needs_escaping = (
+        strings.str.match(problematic_chars_re) & ~strings.str.match(negative_number_re)
+    ).to_numpy(dtype=bool)
+    if not needs_escaping.any():
+        return column
+
+    escaped = "'" + strings[needs_escaping].str.replace("|", "\\|", regex=False)
+    values = values.copy()
+    values[np.flatnonzero(is_string)[needs_escaping]] = escaped.values
+    return pd.Series(values, index=column.index, name=column.name)
+
+
+def escape_df(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Escapes the headers and string values of a DataFrame, see `escape_value`.
+    """
+    df = df.rename(
+        columns=lambda v: escape_value(v) if isinstance(v, str) else v, copy=False
+    )
+    for i in range(len(df.columns)):
+        column = df.iloc[:, i]
+        escaped = escape_values(column)
+        if escaped is not column:
+            df.isetitem(i, escaped)
+    return df
+
+
 def df_to_escaped_csv(df: pd.DataFrame, **kwargs: Any) -> Any:
-    escape_values = lambda v: escape_value(v) if isinstance(v, str) else v
-
-    # Escape csv headers
-    df = df.rename(columns=escape_values)
-
-    # Escape csv values
-    for name, column in df.items():
-        if column.dtype == np.dtype(object):
-            for idx, value in enumerate(column.values):
-                if isinstance(value, str):
-                    df.at[idx, name] = escape_value(value)
-
-    return df.to_csv(**kwargs)
-
-
-def get_chart_csv_data(
-    chart_url: str, auth_cookies: Optional[Dict[str, str]] = None
-) -> Optional[bytes]:
-    content = None
-    if auth_cookies:
-        opener = urllib.request.build_opener()
-        cookie_str = ";".join([f"{key}={val}" for key, val in auth_cookies.items()])
-        opener.addheaders.append(("Cookie", cookie_str))
-        response = opener.open(chart_url)
-        content = response.read()
-        if response.getcode() != 200:
-            raise URLError(response.getcode())
-    if content:
-        return content
-    return None
-
-
-def get_chart_dataframe(
-    chart_url: str, auth_cookies: Optional[Dict[str, str]] = None
-) -> Optional[pd.DataFrame]:
+    return escape_df(df).to_csv(**kwargs)
+
+
+def df_to_escaped_csv_chunks(
+    df: pd.DataFrame, chunk_size: int = 10000, **kwargs: Any
+) -> Iterator[str]:
+    """
+    Writes a DataFrame as escaped CSV, `chunk_size` rows at a time, so that the
+    whole CSV never needs to be held in memory.
+
+    :param df: the DataFrame to write
+    :param chunk_size: the number of rows written per chunk
+    :param kwargs: the arguments passed to `DataFrame.to_csv`
+    :returns: an iterator over the CSV chunks
+    """
+    header = kwargs.pop("header", True)
+    kwargs.pop("path_or_buf", None)
+    for start in range(0, max(len(df.index), 1), chunk_size):
+        chunk = escape_df(df.iloc[start : start + chunk_size])
+        yield chunk.to_csv(header=header if start == 0 else False, **kwargs)
+
+
+def chart_data_to_dataframe(query: Dict[str, Any]) -> pd.DataFrame:
+    """
+    Builds a DataFrame from the JSON formatted result of a chart data query,
+    restoring the temporal columns and the hierarchical columns and index of
+    post-processed results.
+
+    :param query: a query result, as returned by the chart data API
+    :returns: the query data as a DataFrame
+    """
     # Disable all the unnecessary-lambda violations in this function
     # pylint: disable=unnecessary-lambda
-    content = get_chart_csv_data(chart_url, auth_cookies)
-    if content is None:
-        return None
-
-    result = simplejson.loads(content.decode("utf-8"))
     # need to convert float value to string to show full long number
     pd.set_option("display.float_format", lambda x: str(x))
-    df = pd.DataFrame.from_dict(result["result"][0]["data"])
+    df = pd.DataFrame.from_dict(query["data"])
 
     try:
         # if any column type is equal to 2, need to convert data into
         # datetime timestamp for that column.
-        if GenericDataType.TEMPORAL in result["result"][0]["coltypes"]:
-            for i in range(len(result["result"][0]["coltypes"])):
-                if result["result"][0]["coltypes"][i] == GenericDataType.TEMPORAL:
-                    df[result["result"][0]["colnames"][i]] = df[
-                        result["result"][0]["colnames"][i]
-                    ].astype("datetime64[ms]")
+        if GenericDataType.TEMPORAL in query["coltypes"]:
+            for i in range(len(query["coltypes"])):
+                if query["coltypes"][i] == GenericDataType.TEMPORAL:
+                    df[query["colnames"][i]] = df[query["colnames"][i]].astype(
+                        "datetime64[ms]"
+                    )
     except BaseException as err:
         logger.error(err)
 
     # rebuild hierarchical columns and index
     df.columns = pd.MultiIndex.from_tuples(
-        tuple(colname) if isinstance(colname, list) else (colname,)
-        for colname in result["result"][0]["colnames"]
-    )
-    df.index = pd.MultiIndex.from_tuples(
-        tuple(indexname) if isinstance(indexname, list) else (indexname,)
-        for indexname in result["result"][0]["indexnames"]
+        tuple(colname) if isinstance(colname, (list, tuple)) else (colname,)
+        for colname in query["colnames"]
     )
+    if "indexnames" in query:
+        df.index = pd.MultiIndex.from_tuples(
+            tuple(indexname) if isinstance(indexname, (list, tuple)) else (indexname,)
+            for indexname in query["indexnames"]
+        )
     return df
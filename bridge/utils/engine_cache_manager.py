@@ -0,0 +1,158 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from flask import Flask
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
+from sqlalchemy.engine.url import URL
+from sqlalchemy.pool import QueuePool
+
+from bridge.stats_logger import BaseStatsLogger, DummyStatsLogger
+from bridge.utils.hashing import md5_sha_from_str
+
+logger = logging.getLogger(__name__)
+
+# pool options only understood by ``QueuePool`` based pools
+QUEUE_POOL_OPTIONS = {"pool_size", "max_overflow", "pool_timeout", "pool_use_lifo"}
+
+EngineKey = Tuple[int, str]
+
+
+class EngineCacheManager:
+    """
+    Process-wide LRU cache of SQLAlchemy engines.
+
+    Reusing engines saves the dialect initialization and, thanks to their connection
+    pool, the connection (often TCP + TLS + authentication) on every query. Engines
+    are keyed by database id, connection URL and engine params, so that impersonated
+    users or per-schema URLs each get their own engine.
+    """
+
+    def __init__(self) -> None:
+        self._enabled = False
+        self._max_size = 100
+        self._pool_options: Dict[str, Any] = {}
+        self._stats_logger: BaseStatsLogger = DummyStatsLogger()
+        self._engines: "OrderedDict[EngineKey, Engine]" = OrderedDict()
+        self._lock = threading.RLock()
+        self._pid = os.getpid()
+
+    def init_app(self, app: Flask) -> None:
+        self._enabled = app.config["SQLALCHEMY_ENGINE_CACHE_ENABLED"]
+        self._max_size = app.config["SQLALCHEMY_ENGINE_CACHE_SIZE"]
+        self._pool_options = app.config["SQLALCHEMY_ENGINE_POOL_OPTIONS"]
+        self._stats_logger = app.config["STATS_LOGGER"]
+
+    @property
+    def enabled(self) -> bool:
+        return self._enabled
+
+    @staticmethod
+    def get_key(database_id: int, url: URL, params: Dict[str, Any]) -> EngineKey:
+        payload = json.dumps(
+            {
+                "url": url.render_as_string(hide_password=False),
+                "params": params,
+            },
+            sort_keys=True,
+            default=str,
+        )
+        return database_id, md5_sha_from_str(payload)
+
+    def get_engine(self, database_id: int, url: URL, params: Dict[str, Any]) -> Engine:
+        """
+        Return the cached engine for a database connection, creating it if needed.
+
+        :param database_id: The id of the ``Database``
+        :param url: The final SQLAlchemy URL
+        :param params: The params to pass to ``create_engine``
+        :returns: A pooled engine
+        """
+        key = self.get_key(database_id, url, params)
+        with self._lock:
+            self._reset_after_fork()
+            engine = self._engines.get(key)
+            if engine is not None:
+                self._engines.move_to_end(key)
+                self._stats_logger.incr("engine_cache.hit")
+                return engine
+
+            self._stats_logger.incr("engine_cache.miss")
+            engine = create_engine(url, **self._get_engine_params(url, params))
+            self._instrument(engine)
+            self._engines[key] = engine
+            while len(self._engines) > self._max_size:
+                _, evicted = self._engines.popitem(last=False)
+                self._stats_logger.incr("engine_cache.evict")
+                evicted.dispose()
+            return engine
+
+    def invalidate(self, database_id: Optional[int] = None) -> None:
+        """
+        Dispose the cached engines of a database, or all of them.
+
+        Only the engines of the current process are disposed: the other processes
+        keep using theirs until they are invalidated there too, or evicted.
+        """
+        with self._lock:
+            for key in list(self._engines):
+                if database_id is None or key[0] == database_id:
+                    self._engines.pop(key).dispose()
+
+    def _get_engine_params(self, url: URL, params: Dict[str, Any]) -> Dict[str, Any]:
+        pool_options = dict(self._pool_options)
+        poolclass = params.get("poolclass") or url.get_dialect().get_pool_class(url)
+        if not issubclass(poolclass, QueuePool):
+            for option in QUEUE_POOL_OPTIONS:
+                pool_options.pop(option, None)
+        return {**pool_options, **params}
+
+    def _instrument(self, engine: Engine) -> None:
+        stats_logger = self._stats_logger
+
+        def on_connect(*args: Any) -> None:
+            stats_logger.incr("engine_pool.connect")
+
+        def on_checkout(*args: Any) -> None:
+            stats_logger.incr("engine_pool.checkout")
+            if isinstance(engine.pool, QueuePool):
+                stats_logger.gauge("engine_pool.checked_out", engine.pool.checkedout())
+
+        def on_checkin(*args: Any) -> None:
+            stats_logger.incr("engine_pool.checkin")
+
+        event.listen(engine, "connect", on_connect)
+        event.listen(engine, "checkout", on_checkout)
+        event.listen(engine, "checkin", on_checkin)
+
+    def _reset_after_fork(self) -> None:
+        """
+        Pooled connections can't be shared with a forked process, drop the engines
+        inherited from the parent without closing their connections.
+        """
+        pid = os.getpid()
+        if pid != self._pid:
+            for engine in self._engines.values():
+                engine.dispose(close=False)
+            self._engines.clear()
+            self._pid = pid
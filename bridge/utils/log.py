@@ -16,11 +16,16 @@
 # under the License.
 from __future__ import annotations
 
+import atexit
 import functools
 import inspect
 import json
 import logging
+import os
+import queue
 import textwrap
+import threading
+import time
 from abc import ABC, abstractmethod
 from contextlib import contextmanager
 from datetime import datetime, timedelta
@@ -30,6 +35,7 @@ from typing import (
     cast,
     Dict,
     Iterator,
+    List,
     Optional,
     Tuple,
     Type,
@@ -373,3 +379,169 @@ class DBEventLogger(AbstractEventLogger):
         except SQLAlchemyError as ex:
             logging.error("DBEventLogger failed to log event(s)")
             logging.exception(ex)
+
+
+class AsyncDBEventLogger(DBEventLogger):
+    """
+    Event logger that buffers logs in a bounded in-process queue, and writes them
+    to the Bridge DB in batches from a background thread, on a connection of its
+    own. Logs are written when `batch_size` of them are buffered, or at the latest
+    every `flush_interval` seconds.
+
+    When the queue is full, logs are dropped rather than blocking the request that
+    produced them; the `dropped` counter keeps track of them. Buffered logs are
+    written when the process exits.
+    """
+
+    def __init__(
+        self,
+        max_queue_size: int = 10000,
+        batch_size: int = 500,
+        flush_interval: float = 1.0,
+    ) -> None:
+        self.max_queue_size = max_queue_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.logged = 0
+        self.dropped = 0
+        self.failed = 0
+        self._reported_dropped = 0
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._reset()
+        atexit.register(self.shutdown)
+
+    def _reset(self) -> None:
+        self._pid = os.getpid()
+        self._queue: queue.Queue[Dict[str, Any]] = queue.Queue(self.max_queue_size)
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._engine: Any = None
+
+    def _ensure_started(self) -> None:
+        """
+        Start the writer thread on the first log of the process. Processes forked
+        from one that already logged get a queue and a thread of their own.
+        """
+        if self._thread is not None and self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._pid != os.getpid():
+                self._reset()
+            if self._thread is None:
+                self._engine = current_app.appbuilder.get_session.get_bind()
+                self._stopped = threading.Event()
+                self._thread = threading.Thread(
+                    target=self._run, name="AsyncDBEventLogger", daemon=True
+                )
+                self._thread.start()
+
+    def log(  # pylint: disable=too-many-arguments
+        self,
+        user_id: Optional[int],
+        action: str,
+        dashboard_id: Optional[int],
+        duration_ms: Optional[int],
+        slice_id: Optional[int],
+        referrer: Optional[str],
+        *args: Any,
+        **kwargs: Any,
+    ) -> None:
+        self._ensure_started()
+        dttm = datetime.utcnow()
+        for record in kwargs.get("records", []):
+            json_string: Optional[str]
+            try:
+                json_string = json.dumps(record)
+            except Exception:  # pylint: disable=broad-except
+                json_string = None
+            try:
+                self._queue.put_nowait(
+                    {
+                        "action": action,
+                        "json": json_string,
+                        "dashboard_id": dashboard_id,
+                        "slice_id": slice_id,
+                        "duration_ms": duration_ms,
+                        "referrer": referrer,
+                        "user_id": user_id,
+                        "dttm": dttm,
+                    }
+                )
+            except queue.Full:
+                with self._lock:
+                    self.dropped += 1
+
+    def _get_batch(self) -> List[Dict[str, Any]]:
+        """
+        Wait for up to `batch_size` logs, for at most `flush_interval` seconds.
+        """
+        batch: List[Dict[str, Any]] = []
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=timeout))
+            except queue.Empty:
+                break
+        return batch
+
+    def _write(self, batch: List[Dict[str, Any]]) -> None:
+        # pylint: disable=import-outside-toplevel
+        from bridge.models.core import Log
+
+        try:
+            with self._write_lock, self._engine.begin() as connection:
+                connection.execute(Log.__table__.insert(), batch)
+            self.logged += len(batch)
+        except SQLAlchemyError as ex:
+            self.failed += len(batch)
+            logger.error("AsyncDBEventLogger failed to log %i event(s)", len(batch))
+            logger.exception(ex)
+
+        if self.dropped > self._reported_dropped:
+            logger.warning(
+                "AsyncDBEventLogger dropped %i event(s) because its queue was full",
+                self.dropped - self._reported_dropped,
+            )
+            self._reported_dropped = self.dropped
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            batch = self._get_batch()
+            if batch:
+                self._write(batch)
+
+    def flush(self) -> None:
+        """
+        Write all the buffered logs, in the calling thread.
+        """
+        if self._engine is None:
+            return
+        while True:
+            batch: List[Dict[str, Any]] = []
+            try:
+                while len(batch) < self.batch_size:
+                    batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                pass
+            if batch:
+                self._write(batch)
+            if len(batch) < self.batch_size:
+                return
+
+    def shutdown(self, timeout: Optional[float] = None) -> None:
+        """
+        Stop the writer thread, and write the logs that are still buffered.
+
+        :param timeout: how long to wait for the writer thread to stop, defaults
+            to twice the flush interval
+        """
+        if self._thread is None or self._pid != os.getpid():
+            return
+        self._stopped.set()
+        self._thread.join(timeout if timeout is not None else 2 * self.flush_interval)
+        self._thread = None
+        self.flush()
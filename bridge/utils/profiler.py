@@ -15,16 +15,192 @@
 # specific language governing permissions and limitations
 # under the License.
 
-from typing import Any, Callable
+import atexit
+import json
+import logging
+import os
+import random
+import re
+import sys
+import threading
+import time
+from typing import Any, Callable, Counter, Dict, List, Optional, Tuple
 from unittest import mock
 
+from werkzeug.exceptions import HTTPException
+from werkzeug.routing import Map
 from werkzeug.wrappers import Request, Response
+from werkzeug.wsgi import ClosingIterator
 
 try:
     from pyinstrument import Profiler
 except ModuleNotFoundError:
     Profiler = None
 
+logger = logging.getLogger(__name__)
+
+unsafe_filename_chars_re = re.compile(r"[^\w.-]+")
+
+
+def get_frame_name(identifier: str) -> Tuple[str, str, int]:
+    """
+    Parse the identifier of a frame sampled by pyinstrument.
+
+    :param identifier: the frame identifier
+    :returns: the function name, the shortened file path and the line number
+    """
+    function, file_path, line_no = identifier.split("\x01")[0].split("\x00")
+    # shorten the path, relative to the longest `sys.path` entry containing it
+    for path in sorted(sys.path, key=len, reverse=True):
+        if path and file_path.startswith(path + os.sep):
+            file_path = file_path[len(path) + 1 :]
+            break
+    return function.replace(";", ":"), file_path.replace(";", ":"), int(line_no)
+
+
+class SamplingProfiler:
+    """
+    Statistical profiler of a fraction of the requests and Celery tasks.
+
+    The stacks sampled by pyinstrument are aggregated over time per endpoint or task
+    name, and regularly exported to `output_dir`, both as collapsed stacks (for
+    `flamegraph.pl` and similar tools) and as speedscope files. Each process writes
+    files of its own, suffixed with its pid.
+    """
+
+    def __init__(
+        self,
+        sample_rate: float,
+        interval: float,
+        output_dir: str,
+        export_interval: float,
+    ) -> None:
+        self.sample_rate = sample_rate
+        self.interval = interval
+        self.output_dir = output_dir
+        self.export_interval = export_interval
+        self._stacks: Dict[str, Counter[Tuple[str, ...]]] = {}
+        self._lock = threading.Lock()
+        self._export_lock = threading.Lock()
+        self._local = threading.local()
+        self._last_export = time.monotonic()
+        atexit.register(self.export)
+
+    def start(self, key: str) -> Optional[Callable[[], None]]:
+        """
+        Start profiling the current thread, if it is sampled.
+
+        :param key: the name the samples are aggregated under, eg the endpoint
+        :returns: the function to stop profiling, or None if not sampled
+        """
+        if (
+            Profiler is None
+            or getattr(self._local, "active", False)
+            or random.random() >= self.sample_rate
+        ):
+            return None
+
+        profiler = Profiler(interval=self.interval)
+        profiler.start()
+        self._local.active = True
+
+        def stop() -> None:
+            self._local.active = False
+            session = profiler.stop()
+            self.add(key, session.frame_records)
+            if time.monotonic() - self._last_export >= self.export_interval:
+                self.export()
+
+        return stop
+
+    def add(self, key: str, frame_records: List[Tuple[List[str], float]]) -> None:
+        """
+        Aggregate the stacks sampled in a pyinstrument session.
+
+        :param key: the name the samples are aggregated under
+        :param frame_records: the sampled stacks, with the time spent in each
+        """
+        counter: Counter[Tuple[str, ...]] = Counter()
+        for stack, duration in frame_records:
+            # skip the thread the frames were sampled from
+            counter[tuple(stack[1:])] += duration
+        with self._lock:
+            self._stacks.setdefault(key, Counter()).update(counter)
+
+    def export(self) -> None:
+        """
+        Write the stacks aggregated so far to the output directory.
+        """
+        with self._export_lock:
+            with self._lock:
+                self._last_export = time.monotonic()
+                stacks = {
+                    key: Counter(counter) for key, counter in self._stacks.items()
+                }
+            try:
+                os.makedirs(self.output_dir, exist_ok=True)
+                for key, counter in stacks.items():
+                    name = f"{unsafe_filename_chars_re.sub('_', key)}-{os.getpid()}"
+                    path = os.path.join(self.output_dir, name)
+                    with open(f"{path}.collapsed", "w") as file:
+                        file.write(self.to_collapsed(counter))
+                    with open(f"{path}.speedscope.json", "w") as file:
+                        json.dump(self.to_speedscope(key, counter), file)
+            except OSError:
+                logger.exception("Failed exporting profiles to %s", self.output_dir)
+
+    @staticmethod
+    def to_collapsed(stacks: Counter[Tuple[str, ...]]) -> str:
+        """
+        Format stacks as collapsed stacks, weighted in microseconds.
+        """
+        lines = []
+        for stack, duration in sorted(stacks.items()):
+            names = (
+                "{} ({}:{})".format(*get_frame_name(identifier)) for identifier in stack
+            )
+            lines.append(f"{';'.join(names)} {round(duration * 1e6)}\n")
+        return "".join(lines)
+
+    @staticmethod
+    def to_speedscope(key: str, stacks: Counter[Tuple[str, ...]]) -> Dict[str, Any]:
+        """
+        Format stacks as a sampled speedscope profile, weighted in microseconds.
+        """
+        frames: List[Dict[str, Any]] = []
+        frame_indexes: Dict[str, int] = {}
+        samples = []
+        weights = []
+        for stack, duration in stacks.items():
+            sample = []
+            for identifier in stack:
+                if identifier not in frame_indexes:
+                    function, file_path, line_no = get_frame_name(identifier)
+                    frame_indexes[identifier] = len(frames)
+                    frames.append(
+                        {"name": function, "file": file_path, "line": line_no}
+                    )
+                sample.append(frame_indexes[identifier])
+            samples.append(sample)
+            weights.append(round(duration * 1e6))
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "name": key,
+            "exporter": "bridge",
+            "shared": {"frames": frames},
+            "profiles": [
+                {
+                    "type": "sampled",
+                    "name": key,
+                    "unit": "microseconds",
+                    "startValue": 0,
+                    "endValue": sum(weights),
+                    "samples": samples,
+                    "weights": weights,
+                }
+            ],
+        }
+
 
 class BridgeProfiler:  # pylint: disable=too-few-public-methods
     """
@@ -32,21 +208,58 @@ class BridgeProfiler:  # pylint: disable=too-few-public-methods
 
     To see the instrumentation for a given page, set `PROFILING=True`
     in the config, and append `?_instrument=1` to the page.
+
+    When a sampling profiler is passed, a fraction of the requests are profiled, and
+    their samples aggregated per endpoint.
     """
 
     def __init__(
         self,
         app: Callable[[Any, Any], Any],
         interval: float = 0.0001,
+        instrument: bool = True,
+        sampling_profiler: Optional[SamplingProfiler] = None,
+        url_map: Optional[Map] = None,
     ):
         self.app = app
         self.interval = interval
+        self.instrument = instrument
+        self.sampling_profiler = sampling_profiler
+        self.url_map = url_map
+
+    def __call__(
+        self, environ: Dict[str, Any], start_response: Callable[..., Any]
+    ) -> Any:
+        if self.instrument and Request(environ).args.get("_instrument") == "1":
+            return self.instrument_request(Request(environ))(environ, start_response)
+
+        stop = self.sampling_profiler and self.sampling_profiler.start(
+            self.get_endpoint(environ)
+        )
+        if not stop:
+            return self.app(environ, start_response)
+
+        try:
+            app_iter = self.app(environ, start_response)
+        except BaseException:
+            stop()
+            raise
+        # streamed responses are profiled until they are fully sent
+        return ClosingIterator(app_iter, [stop])
 
-    @Request.application
-    def __call__(self, request: Request) -> Response:
-        if request.args.get("_instrument") != "1":
-            return Response.from_app(self.app, request.environ)
+    def get_endpoint(self, environ: Dict[str, Any]) -> str:
+        """
+        Return the name of the endpoint a request is routed to.
+        """
+        if self.url_map is None:
+            return environ.get("PATH_INFO", "")
+        try:
+            endpoint, _ = self.url_map.bind_to_environ(environ).match()
+        except HTTPException:
+            return "unknown"
+        return endpoint
 
+    def instrument_request(self, request: Request) -> Response:
         if Profiler is None:
             raise Exception("The module pyinstrument is not installed.")
 
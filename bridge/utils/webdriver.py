@@ -18,9 +18,12 @@
 from __future__ import annotations
 
 import logging
+import os
+import threading
+from dataclasses import dataclass, field
 from enum import Enum
-from time import sleep
-from typing import Any, Dict, Optional, Tuple, TYPE_CHECKING
+from time import monotonic, sleep
+from typing import Any, Callable, Dict, List, Optional, Tuple, TYPE_CHECKING
 
 from flask import current_app
 from selenium.common.exceptions import (
@@ -38,6 +41,7 @@ from bridge.extensions import machine_auth_provider_factory
 from bridge.utils.retries import retry_call
 
 WindowSize = Tuple[int, int]
+PoolKey = Tuple[str, str, WindowSize]
 logger = logging.getLogger(__name__)
 
 
@@ -51,6 +55,140 @@ class DashboardStandaloneMode(Enum):
     REPORT = 3
 
 
+@dataclass
+class PooledWebDriver:
+    driver: WebDriver
+    created_at: float = field(default_factory=monotonic)
+    uses: int = 0
+
+
+class WebDriverPool:
+    """
+    A per process pool of idle, authenticated drivers.
+
+    Drivers are keyed by driver type, user and window size. An idle driver is
+    health checked before being handed out again, and is reset when given back so
+    that no page state leaks from one screenshot to the next. Drivers are retired
+    once older than `WEBDRIVER_POOL_MAX_AGE` seconds or used
+    `WEBDRIVER_POOL_MAX_USES` times, expired idle drivers being closed whenever a
+    driver is taken or given back, and at most `WEBDRIVER_POOL_SIZE` idle drivers
+    are kept.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._idle: Dict[PoolKey, List[PooledWebDriver]] = {}
+        self._pid = os.getpid()
+
+    def _check_process(self) -> None:
+        # drivers are child processes of the process which started them, a forked
+        # worker starts with an empty pool
+        if self._pid != os.getpid():
+            self._idle = {}
+            self._pid = os.getpid()
+
+    def acquire(self, key: PoolKey, create: Callable[[], WebDriver]) -> PooledWebDriver:
+        self._destroy(self._reap())
+        while True:
+            with self._lock:
+                self._check_process()
+                idle = self._idle.get(key)
+                pooled = idle.pop() if idle else None
+            if pooled is None:
+                return PooledWebDriver(create())
+            if not self._is_expired(pooled) and self._is_healthy(pooled.driver):
+                logger.debug("Reusing pooled selenium driver")
+                return pooled
+            WebDriverProxy.destroy(pooled.driver)
+
+    def release(self, key: PoolKey, pooled: PooledWebDriver, reusable: bool) -> None:
+        pooled.uses += 1
+        if not reusable or self._is_expired(pooled) or not self._reset(pooled.driver):
+            WebDriverProxy.destroy(pooled.driver)
+            return
+
+        with self._lock:
+            self._check_process()
+            self._idle.setdefault(key, []).append(pooled)
+        self._destroy(self._reap())
+
+    def _reap(self) -> List[PooledWebDriver]:
+        """
+        Remove the expired idle drivers, then the oldest ones past the pool size,
+        so that drivers of keys which are no longer used don't linger until the
+        worker exits.
+
+        :returns: The removed drivers, to be destroyed outside of the lock
+        """
+        with self._lock:
+            self._check_process()
+            idle = sorted(
+                (item for drivers in self._idle.values() for item in drivers),
+                key=lambda item: item.created_at,
+            )
+            evicted: List[PooledWebDriver] = []
+            kept: List[PooledWebDriver] = []
+            for item in idle:
+                (evicted if self._is_expired(item) else kept).append(item)
+            evicted += kept[
+                : max(len(kept) - current_app.config["WEBDRIVER_POOL_SIZE"], 0)
+            ]
+            evicted_ids = {id(item) for item in evicted}
+            for pool_key in list(self._idle):
+                drivers = [
+                    item for item in self._idle[pool_key] if id(item) not in evicted_ids
+                ]
+                if drivers:
+                    self._idle[pool_key] = drivers
+                else:
+                    del self._idle[pool_key]
+        return evicted
+
+    @staticmethod
+    def _destroy(drivers: List[PooledWebDriver]) -> None:
+        for pooled in drivers:
+            WebDriverProxy.destroy(pooled.driver)
+
+    def clear(self) -> None:
+        """Destroy all the idle drivers"""
+        with self._lock:
+            self._check_process()
+            idle, self._idle = self._idle, {}
+        for drivers in idle.values():
+            self._destroy(drivers)
+
+    @staticmethod
+    def _is_expired(pooled: PooledWebDriver) -> bool:
+        return (
+            monotonic() - pooled.created_at
+            >= current_app.config["WEBDRIVER_POOL_MAX_AGE"]
+            or pooled.uses >= current_app.config["WEBDRIVER_POOL_MAX_USES"]
+        )
+
+    @staticmethod
+    def _is_healthy(driver: WebDriver) -> bool:
+        try:
+            driver.execute_script("return 1")
+        except WebDriverException:
+            logger.info("Discarding unresponsive pooled selenium driver")
+            return False
+        return True
+
+    @staticmethod
+    def _reset(driver: WebDriver) -> bool:
+        try:
+            driver.execute_script(
+                "window.localStorage.clear(); window.sessionStorage.clear();"
+            )
+            driver.get("about:blank")
+        except WebDriverException:
+            return False
+        return True
+
+
+webdriver_pool = WebDriverPool()
+
+
 class WebDriverProxy:
     def __init__(self, driver_type: str, window: Optional[WindowSize] = None):
         self._driver_type = driver_type
@@ -105,18 +243,42 @@ class WebDriverProxy:
         except Exception:  # pylint: disable=broad-except
             pass
 
-    def get_screenshot(
+    def get_pool_key(self, user: Optional[User]) -> Optional[PoolKey]:
+        if not user or current_app.config["WEBDRIVER_POOL_SIZE"] <= 0:
+            return None
+        return (self._driver_type, user.username, self._window)
+
+    @staticmethod
+    def wait_for_document_ready(driver: WebDriver, timeout: int) -> None:
+        """Wait for the page to be loaded, for at most `timeout` seconds"""
+        logger.debug("Wait up to %i seconds for the page to be loaded", timeout)
+        try:
+            WebDriverWait(driver, timeout).until(
+                lambda driver: driver.execute_script("return document.readyState")
+                == "complete"
+            )
+        except TimeoutException:
+            logger.debug("Page is still loading, looking for the element anyway")
+
+    def get_screenshot(  # pylint: disable=too-many-locals
         self, url: str, element_name: str, user: User
     ) -> Optional[bytes]:
-        driver = self.auth(user)
-        driver.set_window_size(*self._window)
-        driver.get(url)
+        pool_key = self.get_pool_key(user)
+        pooled: Optional[PooledWebDriver] = None
+        if pool_key:
+            pooled = webdriver_pool.acquire(pool_key, lambda: self.auth(user))
+            driver = pooled.driver
+        else:
+            driver = self.auth(user)
         img: Optional[bytes] = None
-        selenium_headstart = current_app.config["SCREENSHOT_SELENIUM_HEADSTART"]
-        logger.debug("Sleeping for %i seconds", selenium_headstart)
-        sleep(selenium_headstart)
+        reusable = False
 
         try:
+            driver.set_window_size(*self._window)
+            driver.get(url)
+            selenium_headstart = current_app.config["SCREENSHOT_SELENIUM_HEADSTART"]
+            self.wait_for_document_ready(driver, selenium_headstart)
+
             logger.debug("Wait for the presence of %s", element_name)
             element = WebDriverWait(driver, self._screenshot_locate_wait).until(
                 EC.presence_of_element_located((By.CLASS_NAME, element_name))
@@ -131,6 +293,7 @@ class WebDriverProxy:
                     (By.CLASS_NAME, "slice_container")
                 )
             )
+            # charts are animated in canvases, which can't be observed from the DOM
             selenium_animation_wait = current_app.config[
                 "SCREENSHOT_SELENIUM_ANIMATION_WAIT"
             ]
@@ -142,16 +305,22 @@ class WebDriverProxy:
                 user.username,
             )
             img = element.screenshot_as_png
+            reusable = True
         except TimeoutException:
             logger.warning("Selenium timed out requesting url %s", url, exc_info=True)
+            reusable = True
         except StaleElementReferenceException:
             logger.error(
                 "Selenium got a stale element while requesting url %s",
                 url,
                 exc_info=True,
             )
+            reusable = True
         except WebDriverException as ex:
             logger.error(ex, exc_info=True)
         finally:
-            self.destroy(driver, current_app.config["SCREENSHOT_SELENIUM_RETRIES"])
+            if pool_key and pooled:
+                webdriver_pool.release(pool_key, pooled, reusable)
+            else:
+                self.destroy(driver, current_app.config["SCREENSHOT_SELENIUM_RETRIES"])
         return img
@@ -123,7 +123,11 @@ from bridge.sqllab.sql_json_executer import (
     SynchronousSqlJsonExecutor,
 )
 from bridge.sqllab.sqllab_execution_context import SqlJsonExecutionContext
-from bridge.sqllab.utils import apply_display_max_row_configuration_if_require
+from bridge.sqllab.utils import (
+    apply_display_max_row_configuration_if_require,
+    decompress_results_payload,
+    set_results_page,
+)
 from bridge.sqllab.validators import CanAccessQueryValidatorImpl
 from bridge.bridge_typing import FlaskResponse
 from bridge.tasks.async_queries import load_explore_json_into_cache
@@ -2178,12 +2182,49 @@ class Bridge(BaseBridgeView):  # pylint: disable=too-many-public-methods
     def results(self, key: str) -> FlaskResponse:
         return self.results_exec(key)
 
+    @staticmethod
+    def _get_int_request_arg(name: str) -> Optional[int]:
+        if name not in request.args:
+            return None
+        try:
+            value = int(request.args[name])
+        except ValueError as ex:
+            raise BridgeErrorException(
+                BridgeError(
+                    message=__(
+                        "The provided `%(name)s` argument is not a valid integer.",
+                        name=name,
+                    ),
+                    error_type=BridgeErrorType.INVALID_PAYLOAD_SCHEMA_ERROR,
+                    level=ErrorLevel.ERROR,
+                ),
+                status=400,
+            ) from ex
+        if value < 0:
+            raise BridgeErrorException(
+                BridgeError(
+                    message=__(
+                        "The provided `%(name)s` argument must not be negative.",
+                        name=name,
+                    ),
+                    error_type=BridgeErrorType.INVALID_PAYLOAD_SCHEMA_ERROR,
+                    level=ErrorLevel.ERROR,
+                ),
+                status=400,
+            )
+        return value
+
     @staticmethod
     def results_exec(key: str) -> FlaskResponse:
         """Serves a key off of the results backend
 
         It is possible to pass the `rows` query argument to limit the number
-        of rows returned.
+        of rows returned, and the `offset` and `limit` (or `page` and `page_size`)
+        query arguments to fetch a single page of the results. The rows can be
+        sorted with `order_by` and `order_desc`, and restricted to a comma
+        separated list of `columns`. Only the requested rows and columns are
+        decoded when the results are stored as Arrow IPC, the total number of
+        rows is returned as `total_rows`.
         """
         if not results_backend:
             raise BridgeErrorException(
@@ -2242,10 +2283,38 @@ class Bridge(BaseBridgeView):  # pylint: disable=too-many-public-methods
                 status=403,
             ) from ex
 
-        payload = utils.zlib_decompress(blob, decode=not results_backend_use_msgpack)
+        rows = Bridge._get_int_request_arg("rows")
+        offset = Bridge._get_int_request_arg("offset") or 0
+        limit = Bridge._get_int_request_arg("limit")
+        page_size = Bridge._get_int_request_arg("page_size")
+        if page_size is None and "page" in request.args:
+            raise BridgeErrorException(
+                BridgeError(
+                    message=__("The `page` argument requires a `page_size`."),
+                    error_type=BridgeErrorType.INVALID_PAYLOAD_SCHEMA_ERROR,
+                    level=ErrorLevel.ERROR,
+                ),
+                status=400,
+            )
+        if page_size is not None:
+            offset = (Bridge._get_int_request_arg("page") or 0) * page_size
+            limit = page_size
+        if rows is not None:
+            limit = rows if limit is None else min(limit, rows)
+
+        payload = decompress_results_payload(blob, results_backend_use_msgpack)
         try:
             obj = _deserialize_results_payload(
-                payload, query, cast(bool, results_backend_use_msgpack)
+                payload,
+                query,
+                cast(bool, results_backend_use_msgpack),
+                offset=offset,
+                limit=limit,
+                columns=request.args["columns"].split(",")
+                if request.args.get("columns")
+                else None,
+                order_by=request.args.get("order_by") or None,
+                order_desc=utils.parse_boolean_string(request.args.get("order_desc")),
             )
         except SerializationError as ex:
             raise BridgeErrorException(
@@ -2261,22 +2330,9 @@ class Bridge(BaseBridgeView):  # pylint: disable=too-many-public-methods
                 status=404,
             ) from ex
 
-        if "rows" in request.args:
-            try:
-                rows = int(request.args["rows"])
-            except ValueError as ex:
-                raise BridgeErrorException(
-                    BridgeError(
-                        message=__(
-                            "The provided `rows` argument is not a valid integer."
-                        ),
-                        error_type=BridgeErrorType.INVALID_PAYLOAD_SCHEMA_ERROR,
-                        level=ErrorLevel.ERROR,
-                    ),
-                    status=400,
-                ) from ex
-
+        if rows is not None:
             obj = apply_display_max_row_configuration_if_require(obj, rows)
+        obj = set_results_page(obj, offset)
 
         return json_success(
             json.dumps(
@@ -2488,9 +2544,7 @@ class Bridge(BaseBridgeView):  # pylint: disable=too-many-public-methods
             blob = results_backend.get(query.results_key)
         if blob:
             logger.info("Decompressing")
-            payload = utils.zlib_decompress(
-                blob, decode=not results_backend_use_msgpack
-            )
+            payload = decompress_results_payload(blob, results_backend_use_msgpack)
             obj = _deserialize_results_payload(
                 payload, query, cast(bool, results_backend_use_msgpack)
             )
@@ -15,10 +15,11 @@
 # specific language governing permissions and limitations
 # under the License.
 import io
+import logging
 import os
 import tempfile
 import zipfile
-from typing import Any, TYPE_CHECKING
+from typing import Any, Callable, Iterator, TYPE_CHECKING
 
 import pandas as pd
 from flask import flash, g, redirect
@@ -34,6 +35,7 @@ import bridge.models.core as models
 from bridge import app, db
 from bridge.connectors.sqla.models import SqlaTable
 from bridge.constants import MODEL_VIEW_RW_METHOD_PERMISSION_MAP, RouteMethod
+from bridge.dataframe import coerce_chunks, read_parquet_chunks, split_df
 from bridge.exceptions import CertificateException
 from bridge.extensions import event_logger
 from bridge.sql_parse import Table
@@ -50,6 +52,7 @@ if TYPE_CHECKING:
 
 config = app.config
 stats_logger = config["STATS_LOGGER"]
+logger = logging.getLogger(__name__)
 
 
 def sqlalchemy_uri_form_validator(_: _, field: StringField) -> None:
@@ -81,6 +84,13 @@ def upload_stream_write(form_file_field: "FileStorage", path: str) -> None:
             file_description.write(chunk)
 
 
+def log_upload_progress(table: Table) -> Callable[[int], None]:
+    def log_progress(rows: int) -> None:
+        logger.info("Uploaded %i rows to table %s", rows, table)
+
+    return log_progress
+
+
 class DatabaseView(
     DatabaseMixin, BridgeModelView, DeleteMixin, YamlExportMixin
 ):  # pylint: disable=too-many-ancestors
@@ -188,45 +198,47 @@ class CsvToDatabaseView(CustomFormView):
         if form.delimiter.data == "other":
             delimiter_input = form.otherInput.data
 
-        try:
-            df = pd.concat(
-                pd.read_csv(
-                    chunksize=1000,
-                    encoding="utf-8",
-                    filepath_or_buffer=form.csv_file.data,
-                    header=form.header.data if form.header.data else 0,
-                    index_col=form.index_col.data,
-                    infer_datetime_format=form.infer_datetime_format.data,
-                    iterator=True,
-                    keep_default_na=not form.null_values.data,
-                    mangle_dupe_cols=form.overwrite_duplicate.data,
-                    usecols=form.use_cols.data if form.use_cols.data else None,
-                    na_values=form.null_values.data if form.null_values.data else None,
-                    nrows=form.nrows.data,
-                    parse_dates=form.parse_dates.data,
-                    sep=delimiter_input,
-                    skip_blank_lines=form.skip_blank_lines.data,
-                    skipinitialspace=form.skip_initial_space.data,
-                    skiprows=form.skiprows.data,
-                )
+        def read_chunks() -> Iterator[pd.DataFrame]:
+            # the file is read twice, see `coerce_chunks`
+            form.csv_file.data.seek(0)
+            return pd.read_csv(
+                chunksize=config["UPLOAD_ROWS_PER_CHUNK"],
+                encoding="utf-8",
+                filepath_or_buffer=form.csv_file.data,
+                header=form.header.data if form.header.data else 0,
+                index_col=form.index_col.data,
+                infer_datetime_format=form.infer_datetime_format.data,
+                iterator=True,
+                keep_default_na=not form.null_values.data,
+                mangle_dupe_cols=form.overwrite_duplicate.data,
+                usecols=form.use_cols.data if form.use_cols.data else None,
+                na_values=form.null_values.data if form.null_values.data else None,
+                nrows=form.nrows.data,
+                parse_dates=form.parse_dates.data,
+                sep=delimiter_input,
+                skip_blank_lines=form.skip_blank_lines.data,
+                skipinitialspace=form.skip_initial_space.data,
+                skiprows=form.skiprows.data,
             )
 
+        try:
             database = (
                 db.session.query(models.Database)
                 .filter_by(id=form.data.get("database").data.get("id"))
                 .one()
             )
 
-            database.db_engine_spec.df_to_sql(
+            rows = database.db_engine_spec.df_chunks_to_sql(
                 database,
                 csv_table,
-                df,
+                coerce_chunks(read_chunks),
                 to_sql_kwargs={
                     "chunksize": 1000,
                     "if_exists": form.if_exists.data,
                     "index": form.dataframe_index.data,
                     "index_label": form.index_label.data,
                 },
+                progress=log_upload_progress(csv_table),
             )
 
             # Connect table to the database that should be used for exploration.
@@ -293,6 +305,7 @@ class CsvToDatabaseView(CustomFormView):
             database=form.database.data.name,
             schema=form.schema.data,
             table=form.table_name.data,
+            rows=rows,
         )
         return redirect("/tablemodelview/list/")
 
@@ -354,16 +367,18 @@ class ExcelToDatabaseView(SimpleFormView):
                 .one()
             )
 
-            database.db_engine_spec.df_to_sql(
+            # pandas reads a whole sheet at once, it's still written in chunks
+            rows = database.db_engine_spec.df_chunks_to_sql(
                 database,
                 excel_table,
-                df,
+                split_df(df, config["UPLOAD_ROWS_PER_CHUNK"]),
                 to_sql_kwargs={
                     "chunksize": 1000,
                     "if_exists": form.if_exists.data,
                     "index": form.index.data,
                     "index_label": form.index_label.data,
                 },
+                progress=log_upload_progress(excel_table),
             )
 
             # Connect table to the database that should be used for exploration.
@@ -430,6 +445,7 @@ class ExcelToDatabaseView(SimpleFormView):
             database=form.database.data.name,
             schema=form.schema.data,
             table=form.name.data,
+            rows=rows,
         )
         return redirect("/tablemodelview/list/")
 
@@ -469,11 +485,6 @@ class ColumnarToDatabaseView(SimpleFormView):
             flash(message, "danger")
             return redirect("/columnartodatabaseview/form")
 
-        read = pd.read_parquet
-        kwargs = {
-            "columns": form.usecols.data if form.usecols.data else None,
-        }
-
         if not schema_allows_file_upload(database, columnar_table.schema):
             message = __(
                 'Database "%(database_name)s" schema "%(schema_name)s" '
@@ -485,26 +496,31 @@ class ColumnarToDatabaseView(SimpleFormView):
             flash(message, "danger")
             return redirect("/columnartodatabaseview/form")
 
-        try:
-            chunks = [read(file, **kwargs) for file in files]
-            df = pd.concat(chunks)
+        def read_chunks() -> Iterator[pd.DataFrame]:
+            return read_parquet_chunks(
+                files,
+                config["UPLOAD_ROWS_PER_CHUNK"],
+                columns=form.usecols.data if form.usecols.data else None,
+            )
 
+        try:
             database = (
                 db.session.query(models.Database)
                 .filter_by(id=form.data.get("database").data.get("id"))
                 .one()
             )
 
-            database.db_engine_spec.df_to_sql(
+            rows = database.db_engine_spec.df_chunks_to_sql(
                 database,
                 columnar_table,
-                df,
+                coerce_chunks(read_chunks),
                 to_sql_kwargs={
                     "chunksize": 1000,
                     "if_exists": form.if_exists.data,
                     "index": form.index.data,
                     "index_label": form.index_label.data,
                 },
+                progress=log_upload_progress(columnar_table),
             )
 
             # Connect table to the database that should be used for exploration.
@@ -571,5 +587,6 @@ class ColumnarToDatabaseView(SimpleFormView):
             database=form.database.data.name,
             schema=form.schema.data,
             table=form.name.data,
+            rows=rows,
         )
         return redirect("/tablemodelview/list/")
@@ -36,6 +36,7 @@ from bridge.datasource.dao import DatasourceDAO
 from bridge.errors import ErrorLevel, BridgeError, BridgeErrorType
 from bridge.exceptions import (
     CacheLoadError,
+    InvalidPayloadFormatError,
     SerializationError,
     BridgeException,
     BridgeSecurityException,
@@ -47,6 +48,11 @@ from bridge.models.dashboard import Dashboard
 from bridge.models.slice import Slice
 from bridge.models.sql_lab import Query
 from bridge.bridge_typing import FormData
+from bridge.sqllab.utils import (
+    deserialize_arrow_table,
+    is_arrow_ipc_data,
+    paginate_arrow_table,
+)
 from bridge.utils.core import DatasourceType
 from bridge.utils.decorators import stats_timing
 from bridge.viz import BaseViz
@@ -550,9 +556,23 @@ def check_slice_perms(_self: Any, slice_id: int) -> None:
         viz_obj.raise_for_access()
 
 
-def _deserialize_results_payload(
-    payload: Union[bytes, str], query: Query, use_msgpack: Optional[bool] = False
+def _deserialize_results_payload(  # pylint: disable=too-many-arguments
+    payload: Union[bytes, str],
+    query: Query,
+    use_msgpack: Optional[bool] = False,
+    offset: int = 0,
+    limit: Optional[int] = None,
+    columns: Optional[List[str]] = None,
+    order_by: Optional[str] = None,
+    order_desc: bool = False,
 ) -> Dict[str, Any]:
+    """
+    Deserialize a SQL Lab results payload.
+
+    The rows are sorted by `order_by`, restricted to `columns` and sliced to
+    `[offset, offset + limit)`. When the data is stored as Arrow IPC only the
+    requested rows and columns are decoded, other formats are fully loaded first.
+    """
     logger.debug("Deserializing from msgpack: %r", use_msgpack)
     if use_msgpack:
         with stats_timing(
@@ -560,10 +580,27 @@ def _deserialize_results_payload(
         ):
             ds_payload = msgpack.loads(payload, raw=False)
 
+        selected_columns = _get_results_columns(
+            ds_payload["selected_columns"], columns, order_by
+        )
+        names = [column["name"] for column in selected_columns]
         with stats_timing("sqllab.query.results_backend_pa_deserialize", stats_logger):
             try:
-                pa_table = pa.deserialize(ds_payload["data"])
-            except pa.ArrowSerializationError as ex:
+                if is_arrow_ipc_data(ds_payload["data"]):
+                    pa_table = deserialize_arrow_table(
+                        ds_payload["data"], offset, limit, names, order_by, order_desc
+                    )
+                else:
+                    # results written before the Arrow IPC format was introduced
+                    pa_table = paginate_arrow_table(
+                        pa.deserialize(ds_payload["data"]),
+                        offset,
+                        limit,
+                        names,
+                        order_by,
+                        order_desc,
+                    )
+            except (pa.ArrowException, AttributeError, KeyError) as ex:
                 raise SerializationError("Unable to deserialize table") from ex
 
         df = result_set.BridgeResultSet.convert_table_to_df(pa_table)
@@ -571,16 +608,72 @@ def _deserialize_results_payload(
 
         db_engine_spec = query.database.db_engine_spec
         all_columns, data, expanded_columns = db_engine_spec.expand_data(
-            ds_payload["selected_columns"], ds_payload["data"]
+            selected_columns, ds_payload["data"]
         )
         ds_payload.update(
-            {"data": data, "columns": all_columns, "expanded_columns": expanded_columns}
+            {
+                "data": data,
+                "columns": all_columns,
+                "selected_columns": selected_columns,
+                "expanded_columns": expanded_columns,
+            }
         )
 
         return ds_payload
 
     with stats_timing("sqllab.query.results_backend_json_deserialize", stats_logger):
-        return json.loads(payload)
+        ds_payload = json.loads(payload)
+    rows = ds_payload.get("data") or []
+    if columns is not None or order_by is not None:
+        ds_payload["columns"] = _get_results_columns(
+            ds_payload["columns"], columns, order_by
+        )
+        if order_by is not None:
+            rows = sorted(
+                (row for row in rows if row.get(order_by) is not None),
+                key=lambda row: _get_results_sort_key(row[order_by]),
+                reverse=order_desc,
+            ) + [row for row in rows if row.get(order_by) is None]
+        names = [column["name"] for column in ds_payload["columns"]]
+        rows = [{name: row.get(name) for name in names} for row in rows]
+    if "data" in ds_payload:
+        end = None if limit is None else offset + limit
+        ds_payload["data"] = rows[offset:end]
+    return ds_payload
+
+
+def _get_results_sort_key(value: Any) -> Tuple[int, str, Any]:
+    """
+    Return the key to sort the rows of JSON results by a column, whose values are not
+    necessarily of the same type: numbers are sorted first, then strings, then other
+    values grouped by type and compared as strings.
+    """
+    if isinstance(value, (int, float)):
+        return 0, "", value
+    if isinstance(value, str):
+        return 1, "", value
+    return 2, type(value).__name__, str(value)
+
+
+def _get_results_columns(
+    results_columns: List[Dict[str, Any]],
+    columns: Optional[List[str]] = None,
+    order_by: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Return the metadata of the requested results columns, in the requested order.
+
+    :raises InvalidPayloadFormatError: When a requested column is not in the results
+    """
+    columns_by_name = {column["name"]: column for column in results_columns}
+    for name in (columns or []) + ([order_by] if order_by is not None else []):
+        if name not in columns_by_name:
+            raise InvalidPayloadFormatError(
+                _("Column %(name)s is not part of the results", name=name)
+            )
+    if columns is None:
+        return results_columns
+    return [columns_by_name[name] for name in columns]
 
 
 def get_cta_schema_name(
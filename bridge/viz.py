@@ -52,6 +52,7 @@ import simplejson as json
 from dateutil import relativedelta as rdelta
 from flask import request
 from flask_babel import lazy_gettext as _
+from flask_caching.backends import NullCache
 from geopy.point import Point
 from pandas.tseries.frequencies import to_offset
 
@@ -78,6 +79,7 @@ from bridge.bridge_typing import (
 )
 from bridge.utils import core as utils, csv
 from bridge.utils.cache import set_and_log_cache
+from bridge.utils.cache_codecs import decode_dataframe, encode_dataframe
 from bridge.utils.core import (
     apply_max_row_limit,
     DateColumn,
@@ -533,7 +535,9 @@ class BaseViz:  # pylint: disable=too-many-public-methods
             if cache_value:
                 stats_logger.incr("loading_from_cache")
                 try:
-                    df = cache_value["df"]
+                    df = decode_dataframe(
+                        cache_value["df"], cache_value.get("df_codec")
+                    )
                     self.query = cache_value["query"]
                     self.applied_template_filters = cache_value.get(
                         "applied_template_filters", []
@@ -606,11 +610,17 @@ class BaseViz:  # pylint: disable=too-many-public-methods
                 self.status = QueryStatus.FAILED
                 stacktrace = utils.get_stacktrace()
 
-            if is_loaded and cache_key and self.status != QueryStatus.FAILED:
+            if (
+                is_loaded
+                and cache_key
+                and self.status != QueryStatus.FAILED
+                and not isinstance(cache_manager.data_cache.cache, NullCache)
+            ):
+                df_codec, df_payload = encode_dataframe(df)
                 set_and_log_cache(
                     cache_manager.data_cache,
                     cache_key,
-                    {"df": df, "query": self.query},
+                    {"df": df_payload, "df_codec": df_codec, "query": self.query},
                     self.cache_timeout,
                     self.datasource.uid,
                 )
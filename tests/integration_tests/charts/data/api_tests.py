@@ -26,6 +26,7 @@ from unittest import mock
 from zipfile import ZipFile
 
 from flask import Response
+import pyarrow as pa
 from tests.integration_tests.conftest import with_feature_flags
 from bridge.models.sql_lab import Query
 from tests.integration_tests.base_tests import (
@@ -265,6 +266,37 @@ class TestPostChartDataApi(BaseTestChartDataApi):
         assert rv.status_code == 200
         assert rv.mimetype == "text/csv"
 
+    @pytest.mark.usefixtures("load_birth_names_dashboard_with_slices")
+    def test_with_csv_result_format_streamed(self):
+        """
+        Chart data API: Test chart data streamed with CSV result format
+        """
+        self.query_context_payload["result_format"] = "csv"
+        expected = self.post_assert_metric(
+            CHART_DATA_URI, self.query_context_payload, "data"
+        )
+        rv = self.post_assert_metric(
+            f"{CHART_DATA_URI}?stream=true", self.query_context_payload, "data"
+        )
+        assert rv.status_code == 200
+        assert rv.mimetype == "text/csv"
+        assert rv.is_streamed
+        assert rv.get_data() == expected.get_data()
+
+    @pytest.mark.usefixtures("load_birth_names_dashboard_with_slices")
+    def test_with_json_result_format_streamed(self):
+        """
+        Chart data API: Test chart data streamed as JSON records
+        """
+        expected = self.post_assert_metric(
+            CHART_DATA_URI, self.query_context_payload, "data"
+        )
+        rv = self.post_assert_metric(
+            f"{CHART_DATA_URI}?stream=true", self.query_context_payload, "data"
+        )
+        assert rv.status_code == 200
+        assert json.loads(rv.data) == expected.json["result"][0]["data"]
+
     @pytest.mark.usefixtures("load_birth_names_dashboard_with_slices")
     def test_with_multi_query_csv_result_format(self):
         """
@@ -280,6 +312,56 @@ class TestPostChartDataApi(BaseTestChartDataApi):
         zipfile = ZipFile(BytesIO(rv.data), "r")
         assert zipfile.namelist() == ["query_1.csv", "query_2.csv"]
 
+    @pytest.mark.usefixtures("load_birth_names_dashboard_with_slices")
+    def test_with_json_columnar_result_format(self):
+        """
+        Chart data API: Test chart data with columnar JSON result format
+        """
+        expected = self.post_assert_metric(
+            CHART_DATA_URI, self.query_context_payload, "data"
+        )
+        self.query_context_payload["result_format"] = "json_columnar"
+        rv = self.post_assert_metric(CHART_DATA_URI, self.query_context_payload, "data")
+        assert rv.status_code == 200
+        records = expected.json["result"][0]["data"]
+        columns = rv.json["result"][0]["data"]
+        assert columns == {
+            column: [record[column] for record in records]
+            for column in rv.json["result"][0]["colnames"]
+        }
+
+    @pytest.mark.usefixtures("load_birth_names_dashboard_with_slices")
+    def test_with_arrow_result_format(self):
+        """
+        Chart data API: Test chart data with Arrow result format
+        """
+        expected = self.post_assert_metric(
+            CHART_DATA_URI, self.query_context_payload, "data"
+        )
+        self.query_context_payload["result_format"] = "arrow"
+        rv = self.post_assert_metric(CHART_DATA_URI, self.query_context_payload, "data")
+        assert rv.status_code == 200
+        assert rv.mimetype == "application/vnd.apache.arrow.stream"
+        with pa.ipc.open_stream(rv.data) as reader:
+            table = reader.read_all()
+        assert table.column_names == expected.json["result"][0]["colnames"]
+        assert table.num_rows == expected.json["result"][0]["rowcount"]
+
+    @pytest.mark.usefixtures("load_birth_names_dashboard_with_slices")
+    def test_with_multi_query_arrow_result_format(self):
+        """
+        Chart data API: Test chart data with multi-query Arrow result format
+        """
+        self.query_context_payload["result_format"] = "arrow"
+        self.query_context_payload["queries"].append(
+            self.query_context_payload["queries"][0]
+        )
+        rv = self.post_assert_metric(CHART_DATA_URI, self.query_context_payload, "data")
+        assert rv.status_code == 200
+        assert rv.mimetype == "application/zip"
+        zipfile = ZipFile(BytesIO(rv.data), "r")
+        assert zipfile.namelist() == ["query_1.arrow", "query_2.arrow"]
+
     @pytest.mark.usefixtures("load_birth_names_dashboard_with_slices")
     def test_with_csv_result_format_when_actor_not_permitted_for_csv__403(self):
         """
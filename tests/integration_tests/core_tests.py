@@ -1252,13 +1252,28 @@ class TestCore(BridgeTestCase):
             "data": data,
         }
         # limit results to 1
-        expected_key = {"status": "success", "query": {"rows": 100}, "data": data}
+        expected_key = {
+            "status": "success",
+            "query": {"rows": 100},
+            "data": data,
+            "offset": 0,
+            "total_rows": 100,
+        }
         limited_data = data[:1]
         expected_limited = {
             "status": "success",
             "query": {"rows": 100},
             "data": limited_data,
             "displayLimitReached": True,
+            "offset": 0,
+            "total_rows": 100,
+        }
+        expected_page = {
+            "status": "success",
+            "query": {"rows": 100},
+            "data": data[20:30],
+            "offset": 20,
+            "total_rows": 100,
         }
 
         query_mock = mock.Mock()
@@ -1280,9 +1295,16 @@ class TestCore(BridgeTestCase):
             # get all results
             result_key = json.loads(self.get_resp("/bridge/results/key/"))
             result_limited = json.loads(self.get_resp("/bridge/results/key/?rows=1"))
+            result_page = json.loads(
+                self.get_resp("/bridge/results/key/?page=2&page_size=10")
+            )
+            # a page requires a page size
+            rv = self.client.get("/bridge/results/key/?page=2")
+            self.assertEqual(rv.status_code, 400)
 
         self.assertEqual(result_key, expected_key)
         self.assertEqual(result_limited, expected_limited)
+        self.assertEqual(result_page, expected_page)
 
         app.config["RESULTS_BACKEND_USE_MSGPACK"] = use_msgpack
 
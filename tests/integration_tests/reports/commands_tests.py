@@ -29,6 +29,7 @@ from freezegun import freeze_time
 from sqlalchemy.sql import func
 
 from bridge import db
+from bridge.charts.commands.exceptions import ChartDataQueryFailedError
 from bridge.exceptions import BridgeException
 from bridge.models.core import Database
 from bridge.models.dashboard import Dashboard
@@ -841,26 +842,18 @@ def test_email_chart_report_dry_run(
 @pytest.mark.usefixtures(
     "load_birth_names_dashboard_with_slices", "create_report_email_chart_with_csv"
 )
-@patch("bridge.utils.csv.urllib.request.urlopen")
-@patch("bridge.utils.csv.urllib.request.OpenerDirector.open")
 @patch("bridge.reports.notifications.email.send_email_smtp")
-@patch("bridge.utils.csv.get_chart_csv_data")
+@patch("bridge.reports.commands.execute.BaseReportState._get_chart_data")
 def test_email_chart_report_schedule_with_csv(
-    csv_mock,
+    chart_data_mock,
     email_mock,
-    mock_open,
-    mock_urlopen,
     create_report_email_chart_with_csv,
 ):
     """
     ExecuteReport Command: Test chart email report schedule with CSV
     """
-    # setup csv mock
-    response = Mock()
-    mock_open.return_value = response
-    mock_urlopen.return_value = response
-    mock_urlopen.return_value.getcode.return_value = 200
-    response.read.return_value = CSV_FILE
+    # setup chart data mock
+    chart_data_mock.return_value = {"queries": [{"data": CSV_FILE.decode()}]}
 
     with freeze_time("2020-01-01T00:00:00Z"):
         AsyncExecuteReportScheduleCommand(
@@ -891,31 +884,35 @@ def test_email_chart_report_schedule_with_csv(
     "load_birth_names_dashboard_with_slices",
     "create_report_email_chart_with_csv_no_query_context",
 )
-@patch("bridge.utils.csv.urllib.request.urlopen")
-@patch("bridge.utils.csv.urllib.request.OpenerDirector.open")
 @patch("bridge.reports.notifications.email.send_email_smtp")
-@patch("bridge.utils.csv.get_chart_csv_data")
+@patch("bridge.reports.commands.execute.apply_post_process")
+@patch("bridge.reports.commands.execute.ChartDataCommand")
+@patch("bridge.reports.commands.execute.ChartDataQueryContextSchema")
 @patch("bridge.utils.screenshots.ChartScreenshot.get_screenshot")
 def test_email_chart_report_schedule_with_csv_no_query_context(
     screenshot_mock,
-    csv_mock,
+    schema_mock,
+    command_mock,
+    post_process_mock,
     email_mock,
-    mock_open,
-    mock_urlopen,
     create_report_email_chart_with_csv_no_query_context,
 ):
     """
     ExecuteReport Command: Test chart email report schedule with CSV (no query context)
     """
-    # setup screenshot mock
-    screenshot_mock.return_value = SCREENSHOT_FILE
+    chart_id = create_report_email_chart_with_csv_no_query_context.chart.id
+
+    # setup screenshot mock, rendering the chart saves its query context
+    def save_query_context(*args, **kwargs):
+        chart = db.session.query(Slice).get(chart_id)
+        chart.query_context = json.dumps({"queries": []})
+        db.session.commit()
+        return SCREENSHOT_FILE
+
+    screenshot_mock.side_effect = save_query_context
 
-    # setup csv mock
-    response = Mock()
-    mock_open.return_value = response
-    mock_urlopen.return_value = response
-    mock_urlopen.return_value.getcode.return_value = 200
-    response.read.return_value = CSV_FILE
+    # setup chart data mock
+    post_process_mock.return_value = {"queries": [{"data": CSV_FILE.decode()}]}
 
     with freeze_time("2020-01-01T00:00:00Z"):
         AsyncExecuteReportScheduleCommand(
@@ -931,43 +928,31 @@ def test_email_chart_report_schedule_with_csv_no_query_context(
 @pytest.mark.usefixtures(
     "load_birth_names_dashboard_with_slices", "create_report_email_chart_with_text"
 )
-@patch("bridge.utils.csv.urllib.request.urlopen")
-@patch("bridge.utils.csv.urllib.request.OpenerDirector.open")
 @patch("bridge.reports.notifications.email.send_email_smtp")
-@patch("bridge.utils.csv.get_chart_dataframe")
+@patch("bridge.reports.commands.execute.BaseReportState._get_chart_data")
 def test_email_chart_report_schedule_with_text(
-    dataframe_mock,
+    chart_data_mock,
     email_mock,
-    mock_open,
-    mock_urlopen,
     create_report_email_chart_with_text,
 ):
     """
     ExecuteReport Command: Test chart email report schedule with text
     """
-    # setup dataframe mock
-    response = Mock()
-    mock_open.return_value = response
-    mock_urlopen.return_value = response
-    mock_urlopen.return_value.getcode.return_value = 200
-
     # test without date type.
-    response.read.return_value = json.dumps(
-        {
-            "result": [
-                {
-                    "data": {
-                        "t1": {0: "c11", 1: "c21"},
-                        "t2": {0: "c12", 1: "c22"},
-                        "t3__sum": {0: "c13", 1: "c23"},
-                    },
-                    "colnames": [("t1",), ("t2",), ("t3__sum",)],
-                    "indexnames": [(0,), (1,)],
-                    "coltypes": [1, 1],
+    chart_data_mock.return_value = {
+        "queries": [
+            {
+                "data": {
+                    "t1": {0: "c11", 1: "c21"},
+                    "t2": {0: "c12", 1: "c22"},
+                    "t3__sum": {0: "c13", 1: "c23"},
                 },
-            ],
-        }
-    ).encode("utf-8")
+                "colnames": [("t1",), ("t2",), ("t3__sum",)],
+                "indexnames": [(0,), (1,)],
+                "coltypes": [1, 1],
+            },
+        ],
+    }
 
     with freeze_time("2020-01-01T00:00:00Z"):
         AsyncExecuteReportScheduleCommand(
@@ -1007,22 +992,20 @@ def test_email_chart_report_schedule_with_text(
     # test with date type.
     dt = datetime(2022, 1, 1).replace(tzinfo=timezone.utc)
     ts = datetime.timestamp(dt) * 1000
-    response.read.return_value = json.dumps(
-        {
-            "result": [
-                {
-                    "data": {
-                        "t1": {0: "c11", 1: "c21"},
-                        "t2__date": {0: ts, 1: ts},
-                        "t3__sum": {0: "c13", 1: "c23"},
-                    },
-                    "colnames": [("t1",), ("t2__date",), ("t3__sum",)],
-                    "indexnames": [(0,), (1,)],
-                    "coltypes": [1, 2],
+    chart_data_mock.return_value = {
+        "queries": [
+            {
+                "data": {
+                    "t1": {0: "c11", 1: "c21"},
+                    "t2__date": {0: ts, 1: ts},
+                    "t3__sum": {0: "c13", 1: "c23"},
                 },
-            ],
-        }
-    ).encode("utf-8")
+                "colnames": [("t1",), ("t2__date",), ("t3__sum",)],
+                "indexnames": [(0,), (1,)],
+                "coltypes": [1, 2],
+            },
+        ],
+    }
 
     with freeze_time("2020-01-01T00:00:00Z"):
         AsyncExecuteReportScheduleCommand(
@@ -1166,25 +1149,17 @@ def test_slack_chart_report_schedule(
     "load_birth_names_dashboard_with_slices", "create_report_slack_chart_with_csv"
 )
 @patch("bridge.reports.notifications.slack.WebClient.files_upload")
-@patch("bridge.utils.csv.urllib.request.urlopen")
-@patch("bridge.utils.csv.urllib.request.OpenerDirector.open")
-@patch("bridge.utils.csv.get_chart_csv_data")
+@patch("bridge.reports.commands.execute.BaseReportState._get_chart_data")
 def test_slack_chart_report_schedule_with_csv(
-    csv_mock,
-    mock_open,
-    mock_urlopen,
+    chart_data_mock,
     file_upload_mock,
     create_report_slack_chart_with_csv,
 ):
     """
     ExecuteReport Command: Test chart slack report schedule with CSV
     """
-    # setup csv mock
-    response = Mock()
-    mock_open.return_value = response
-    mock_urlopen.return_value = response
-    mock_urlopen.return_value.getcode.return_value = 200
-    response.read.return_value = CSV_FILE
+    # setup chart data mock
+    chart_data_mock.return_value = {"queries": [{"data": CSV_FILE.decode()}]}
 
     with freeze_time("2020-01-01T00:00:00Z"):
         AsyncExecuteReportScheduleCommand(
@@ -1205,39 +1180,29 @@ def test_slack_chart_report_schedule_with_csv(
     "load_birth_names_dashboard_with_slices", "create_report_slack_chart_with_text"
 )
 @patch("bridge.reports.notifications.slack.WebClient.chat_postMessage")
-@patch("bridge.utils.csv.urllib.request.urlopen")
-@patch("bridge.utils.csv.urllib.request.OpenerDirector.open")
-@patch("bridge.utils.csv.get_chart_dataframe")
+@patch("bridge.reports.commands.execute.BaseReportState._get_chart_data")
 def test_slack_chart_report_schedule_with_text(
-    dataframe_mock,
-    mock_open,
-    mock_urlopen,
+    chart_data_mock,
     post_message_mock,
     create_report_slack_chart_with_text,
 ):
     """
     ExecuteReport Command: Test chart slack report schedule with text
     """
-    # setup dataframe mock
-    response = Mock()
-    mock_open.return_value = response
-    mock_urlopen.return_value = response
-    mock_urlopen.return_value.getcode.return_value = 200
-    response.read.return_value = json.dumps(
-        {
-            "result": [
-                {
-                    "data": {
-                        "t1": {0: "c11", 1: "c21"},
-                        "t2": {0: "c12", 1: "c22"},
-                        "t3__sum": {0: "c13", 1: "c23"},
-                    },
-                    "colnames": [("t1",), ("t2",), ("t3__sum",)],
-                    "indexnames": [(0,), (1,)],
+    # setup chart data mock
+    chart_data_mock.return_value = {
+        "queries": [
+            {
+                "data": {
+                    "t1": {0: "c11", 1: "c21"},
+                    "t2": {0: "c12", 1: "c22"},
+                    "t3__sum": {0: "c13", 1: "c23"},
                 },
-            ],
-        }
-    ).encode("utf-8")
+                "colnames": [("t1",), ("t2",), ("t3__sum",)],
+                "indexnames": [(0,), (1,)],
+            },
+        ],
+    }
 
     with freeze_time("2020-01-01T00:00:00Z"):
         AsyncExecuteReportScheduleCommand(
@@ -1588,15 +1553,11 @@ def test_soft_timeout_screenshot(screenshot_mock, email_mock, create_alert_email
 @pytest.mark.usefixtures(
     "load_birth_names_dashboard_with_slices", "create_report_email_chart_with_csv"
 )
-@patch("bridge.utils.csv.urllib.request.urlopen")
-@patch("bridge.utils.csv.urllib.request.OpenerDirector.open")
 @patch("bridge.reports.notifications.email.send_email_smtp")
-@patch("bridge.utils.csv.get_chart_csv_data")
+@patch("bridge.reports.commands.execute.BaseReportState._get_chart_data")
 def test_soft_timeout_csv(
-    csv_mock,
+    chart_data_mock,
     email_mock,
-    mock_open,
-    mock_urlopen,
     create_report_email_chart_with_csv,
 ):
     """
@@ -1604,10 +1565,7 @@ def test_soft_timeout_csv(
     """
     from celery.exceptions import SoftTimeLimitExceeded
 
-    response = Mock()
-    mock_open.return_value = response
-    mock_urlopen.return_value = response
-    mock_urlopen.return_value.getcode.side_effect = SoftTimeLimitExceeded()
+    chart_data_mock.side_effect = SoftTimeLimitExceeded()
 
     with pytest.raises(ReportScheduleCsvTimeout):
         AsyncExecuteReportScheduleCommand(
@@ -1629,25 +1587,17 @@ def test_soft_timeout_csv(
 @pytest.mark.usefixtures(
     "load_birth_names_dashboard_with_slices", "create_report_email_chart_with_csv"
 )
-@patch("bridge.utils.csv.urllib.request.urlopen")
-@patch("bridge.utils.csv.urllib.request.OpenerDirector.open")
 @patch("bridge.reports.notifications.email.send_email_smtp")
-@patch("bridge.utils.csv.get_chart_csv_data")
+@patch("bridge.reports.commands.execute.BaseReportState._get_chart_data")
 def test_generate_no_csv(
-    csv_mock,
+    chart_data_mock,
     email_mock,
-    mock_open,
-    mock_urlopen,
     create_report_email_chart_with_csv,
 ):
     """
     ExecuteReport Command: Test fail on generating csv
     """
-    response = Mock()
-    mock_open.return_value = response
-    mock_urlopen.return_value = response
-    mock_urlopen.return_value.getcode.return_value = 200
-    response.read.return_value = None
+    chart_data_mock.return_value = {"queries": []}
 
     with pytest.raises(ReportScheduleCsvFailedError):
         AsyncExecuteReportScheduleCommand(
@@ -1698,20 +1648,12 @@ def test_fail_screenshot(screenshot_mock, email_mock, create_report_email_chart)
     "load_birth_names_dashboard_with_slices", "create_report_email_chart_with_csv"
 )
 @patch("bridge.reports.notifications.email.send_email_smtp")
-@patch("bridge.utils.csv.urllib.request.urlopen")
-@patch("bridge.utils.csv.urllib.request.OpenerDirector.open")
-@patch("bridge.utils.csv.get_chart_csv_data")
-def test_fail_csv(
-    csv_mock, mock_open, mock_urlopen, email_mock, create_report_email_chart_with_csv
-):
+@patch("bridge.reports.commands.execute.BaseReportState._get_chart_data")
+def test_fail_csv(chart_data_mock, email_mock, create_report_email_chart_with_csv):
     """
     ExecuteReport Command: Test error on csv
     """
-
-    response = Mock()
-    mock_open.return_value = response
-    mock_urlopen.return_value = response
-    mock_urlopen.return_value.getcode.return_value = 500
+    chart_data_mock.side_effect = ChartDataQueryFailedError("Error: query failed")
 
     with pytest.raises(ReportScheduleCsvFailedError):
         AsyncExecuteReportScheduleCommand(
@@ -1723,7 +1665,7 @@ def test_fail_csv(
     assert email_mock.call_args[0][0] == DEFAULT_OWNER_EMAIL
 
     assert_log(
-        ReportState.ERROR, error_message="Failed generating csv <urlopen error 500>"
+        ReportState.ERROR, error_message="Failed generating csv Error: query failed"
     )
 
 
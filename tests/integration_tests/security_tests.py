@@ -37,6 +37,7 @@ from bridge.errors import ErrorLevel, BridgeError, BridgeErrorType
 from bridge.exceptions import BridgeSecurityException
 from bridge.models.core import Database
 from bridge.models.slice import Slice
+from bridge.security.permission_index import PermissionIndex
 from bridge.sql_parse import Table
 from bridge.utils.core import (
     DatasourceType,
@@ -1752,14 +1753,22 @@ class TestAccessRequestEndpoints(BridgeTestCase):
 
 class TestDatasources(BridgeTestCase):
     @patch("bridge.security.manager.g")
-    @patch("bridge.security.BridgeSecurityManager.can_access_database")
+    @patch("bridge.security.BridgeSecurityManager.can_access_all_datasources")
     @patch("bridge.security.BridgeSecurityManager.get_session")
+    @patch(
+        "bridge.security.BridgeSecurityManager.permission_index",
+        new_callable=PermissionIndex,
+    )
     def test_get_user_datasources_admin(
-        self, mock_get_session, mock_can_access_database, mock_g
+        self,
+        mock_permission_index,
+        mock_get_session,
+        mock_can_access_all_datasources,
+        mock_g,
     ):
         Datasource = namedtuple("Datasource", ["database", "schema", "name"])
         mock_g.user = security_manager.find_user("admin")
-        mock_can_access_database.return_value = True
+        mock_can_access_all_datasources.return_value = True
         mock_get_session.query.return_value.filter.return_value.all.return_value = []
 
         with mock.patch.object(
@@ -1780,14 +1789,22 @@ class TestDatasources(BridgeTestCase):
         ]
 
     @patch("bridge.security.manager.g")
-    @patch("bridge.security.BridgeSecurityManager.can_access_database")
+    @patch("bridge.security.BridgeSecurityManager.can_access_all_datasources")
     @patch("bridge.security.BridgeSecurityManager.get_session")
+    @patch(
+        "bridge.security.BridgeSecurityManager.permission_index",
+        new_callable=PermissionIndex,
+    )
     def test_get_user_datasources_gamma(
-        self, mock_get_session, mock_can_access_database, mock_g
+        self,
+        mock_permission_index,
+        mock_get_session,
+        mock_can_access_all_datasources,
+        mock_g,
     ):
         Datasource = namedtuple("Datasource", ["database", "schema", "name"])
         mock_g.user = security_manager.find_user("gamma")
-        mock_can_access_database.return_value = False
+        mock_can_access_all_datasources.return_value = False
         mock_get_session.query.return_value.filter.return_value.all.return_value = []
 
         with mock.patch.object(
@@ -1804,14 +1821,22 @@ class TestDatasources(BridgeTestCase):
         assert datasources == []
 
     @patch("bridge.security.manager.g")
-    @patch("bridge.security.BridgeSecurityManager.can_access_database")
+    @patch("bridge.security.BridgeSecurityManager.can_access_all_datasources")
     @patch("bridge.security.BridgeSecurityManager.get_session")
+    @patch(
+        "bridge.security.BridgeSecurityManager.permission_index",
+        new_callable=PermissionIndex,
+    )
     def test_get_user_datasources_gamma_with_schema(
-        self, mock_get_session, mock_can_access_database, mock_g
+        self,
+        mock_permission_index,
+        mock_get_session,
+        mock_can_access_all_datasources,
+        mock_g,
     ):
         Datasource = namedtuple("Datasource", ["database", "schema", "name"])
         mock_g.user = security_manager.find_user("gamma")
-        mock_can_access_database.return_value = False
+        mock_can_access_all_datasources.return_value = False
 
         mock_get_session.query.return_value.filter.return_value.all.return_value = [
             Datasource("database1", "schema1", "table1"),
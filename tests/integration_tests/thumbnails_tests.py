@@ -76,7 +76,7 @@ class TestWebDriverProxy(BridgeTestCase):
         url = get_url_path("Bridge.slice", slice_id=1, standalone="true")
         app.config["SCREENSHOT_SELENIUM_HEADSTART"] = 5
         webdriver.get_screenshot(url, "chart-container", user=user)
-        assert mock_sleep.call_args_list[0] == call(5)
+        assert mock_webdriver_wait.call_args_list[0] == call(ANY, 5)
 
     @patch("bridge.utils.webdriver.WebDriverWait")
     @patch("bridge.utils.webdriver.firefox")
@@ -88,7 +88,7 @@ class TestWebDriverProxy(BridgeTestCase):
         )
         url = get_url_path("Bridge.slice", slice_id=1, standalone="true")
         webdriver.get_screenshot(url, "chart-container", user=user)
-        assert mock_webdriver_wait.call_args_list[0] == call(ANY, 15)
+        assert mock_webdriver_wait.call_args_list[1] == call(ANY, 15)
 
     @patch("bridge.utils.webdriver.WebDriverWait")
     @patch("bridge.utils.webdriver.firefox")
@@ -100,7 +100,7 @@ class TestWebDriverProxy(BridgeTestCase):
         )
         url = get_url_path("Bridge.slice", slice_id=1, standalone="true")
         webdriver.get_screenshot(url, "chart-container", user=user)
-        assert mock_webdriver_wait.call_args_list[1] == call(ANY, 15)
+        assert mock_webdriver_wait.call_args_list[2] == call(ANY, 15)
 
     @patch("bridge.utils.webdriver.WebDriverWait")
     @patch("bridge.utils.webdriver.firefox")
@@ -115,7 +115,7 @@ class TestWebDriverProxy(BridgeTestCase):
         url = get_url_path("Bridge.slice", slice_id=1, standalone="true")
         app.config["SCREENSHOT_SELENIUM_ANIMATION_WAIT"] = 4
         webdriver.get_screenshot(url, "chart-container", user=user)
-        assert mock_sleep.call_args_list[1] == call(4)
+        assert mock_sleep.call_args_list[0] == call(4)
 
 
 class TestThumbnails(BridgeTestCase):
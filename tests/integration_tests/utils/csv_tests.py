@@ -81,3 +81,33 @@ def test_df_to_escaped_csv():
 
     df = pa.array([1, None]).to_pandas(integer_object_nulls=True).to_frame()
     assert csv.df_to_escaped_csv(df, encoding="utf8", index=False) == '0\n1\n""\n'
+
+
+def test_df_to_escaped_csv_index():
+    df = pd.DataFrame(
+        {"a": ["=a", "b", None, 1], "b": [1, 2, 3, 4]}, index=[10, 3, 0, 1]
+    )
+
+    assert csv.df_to_escaped_csv(df, index=False) == "a,b\n'=a,1\nb,2\n,3\n1,4\n"
+    # the DataFrame isn't modified
+    assert df["a"].tolist() == ["=a", "b", None, 1]
+
+
+def test_df_to_escaped_csv_chunks():
+    df = pd.DataFrame(
+        {"=a": ["=a", "-1", "|b", "-b"] * 5, "b": range(20)},
+        index=pd.date_range("2022-01-01", periods=20),
+    )
+
+    chunks = list(csv.df_to_escaped_csv_chunks(df, chunk_size=6, index=True))
+
+    assert len(chunks) == 4
+    assert "".join(chunks) == csv.df_to_escaped_csv(df, index=True)
+    assert chunks[0].splitlines()[:3] == [
+        ",'=a,b",
+        "2022-01-01,'=a,0",
+        "2022-01-02,-1,1",
+    ]
+    assert chunks[1].splitlines()[0] == "2022-01-07,'\\|b,6"
+
+    assert list(csv.df_to_escaped_csv_chunks(df.iloc[:0], index=False)) == ["'=a,b\n"]
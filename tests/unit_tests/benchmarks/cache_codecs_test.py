@@ -0,0 +1,70 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+import pickle
+from typing import Any, Callable, Tuple
+
+import numpy as np
+import pandas as pd
+
+from bridge.utils.cache_codecs import ArrowDataFrameCodec
+
+
+def test_arrow_codec_vs_pickle(
+    benchmark_enabled: bool,
+    benchmark_size: Callable[[int, int], int],
+    timed: Callable[..., Tuple[Any, float]],
+) -> None:
+    """
+    Compare payload size and encode/decode time of the Arrow codec against pickling
+    a typical query result (100k rows x 20 columns).
+    """
+    size = benchmark_size(100_000, 1_000)
+    rng = np.random.default_rng(42)
+    columns = {}
+    for i in range(5):
+        columns[f"dim_{i}"] = rng.choice(["US", "FR", "DE", "IN", None], size)
+        columns[f"name_{i}"] = [f"name {j % 1000}" for j in range(size)]
+        columns[f"metric_{i}"] = rng.random(size) * 1000
+        columns[f"count_{i}"] = rng.integers(0, 10_000, size)
+    columns["__timestamp"] = pd.date_range("2022-01-01", periods=size, freq="min")
+    df = pd.DataFrame(columns)
+
+    pickled, _ = timed("pickle dump", pickle.dumps, df, pickle.HIGHEST_PROTOCOL)
+    timed("pickle load", pickle.loads, pickled)
+
+    for compression in ("lz4", "zstd"):
+        codec = ArrowDataFrameCodec(compression=compression)
+        # the cache backend pickles the encoded bytes as well
+        encoded, _ = timed(
+            f"arrow {compression} encode",
+            lambda codec: pickle.dumps(codec.encode(df), pickle.HIGHEST_PROTOCOL),
+            codec,
+        )
+        decoded, _ = timed(
+            f"arrow {compression} decode",
+            lambda codec, encoded: codec.decode(pickle.loads(encoded)),
+            codec,
+            encoded,
+        )
+        if benchmark_enabled:
+            print(
+                f"pickle: {len(pickled)} bytes, "
+                f"arrow {compression}: {len(encoded)} bytes"
+            )
+
+        pd.testing.assert_frame_equal(decoded, df)
+        assert len(encoded) < len(pickled)
@@ -0,0 +1,75 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Micro-benchmarks comparing hot code paths against their previous implementation.
+
+The benchmarks run on small inputs by default so that they only check that both
+implementations agree. Set ``BRIDGE_BENCHMARK=1`` to run them at full size and
+print the timings, e.g.::
+
+    BRIDGE_BENCHMARK=1 pytest -s tests/unit_tests/benchmarks
+"""
+import os
+import time
+from typing import Any, Callable, Tuple
+
+import pytest
+
+
+def is_benchmark_enabled() -> bool:
+    return bool(os.environ.get("BRIDGE_BENCHMARK"))
+
+
+@pytest.fixture
+def benchmark_enabled() -> bool:
+    """
+    Whether benchmarks are enabled, to only report and compare timings then: wall
+    times are too noisy to be asserted on shared CI runners.
+    """
+    return is_benchmark_enabled()
+
+
+@pytest.fixture
+def benchmark_size() -> Callable[[int, int], int]:
+    """
+    Pick the full benchmark size when benchmarks are enabled, the smoke test size
+    otherwise.
+    """
+
+    def size(full: int, smoke: int) -> int:
+        return full if is_benchmark_enabled() else smoke
+
+    return size
+
+
+@pytest.fixture
+def timed() -> Callable[..., Tuple[Any, float]]:
+    """
+    Run a function, returning its result and the elapsed wall time in seconds.
+    """
+
+    def run(
+        label: str, func: Callable[..., Any], *args: Any, **kwargs: Any
+    ) -> Tuple[Any, float]:
+        start = time.perf_counter()
+        result = func(*args, **kwargs)
+        elapsed = time.perf_counter() - start
+        if is_benchmark_enabled():
+            print(f"{label}: {elapsed:.3f}s")
+        return result, elapsed
+
+    return run
@@ -0,0 +1,87 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from typing import Any, Callable, Tuple
+
+from bridge.db_engine_specs import (
+    engine_spec_registry,
+    find_engine_spec,
+    get_available_engine_specs,
+    get_engine_spec,
+    load_engine_specs,
+)
+
+BACKENDS = [
+    ("postgresql", "psycopg2"),
+    ("mysql", "mysqldb"),
+    ("presto", None),
+    ("snowflake", "snowflake"),
+    ("unknown", None),
+]
+
+
+def legacy_get_engine_spec(backend: str, driver: Any) -> Any:
+    """
+    The lookup before the registry, scanning all engine spec modules every time.
+    """
+    return find_engine_spec(load_engine_specs(), backend, driver)
+
+
+def test_engine_spec_lookup(
+    benchmark_enabled: bool,
+    benchmark_size: Callable[[int, int], int],
+    timed: Callable[..., Tuple[Any, float]],
+) -> None:
+    """
+    Compare engine spec lookups per request with and without the registry.
+    """
+    requests = benchmark_size(1_000, 20)
+
+    def lookup(get: Callable[[str, Any], Any]) -> Any:
+        return [get(*backend) for _ in range(requests) for backend in BACKENDS]
+
+    engine_spec_registry.invalidate()
+    _, startup_time = timed("registry startup", get_engine_spec, "postgresql")
+    result, registry_time = timed("registry lookups", lookup, get_engine_spec)
+    expected, legacy_time = timed("legacy lookups", lookup, legacy_get_engine_spec)
+
+    assert result == expected
+    if benchmark_enabled:
+        assert registry_time < legacy_time
+        # a cached lookup should be orders of magnitude cheaper than loading specs
+        assert registry_time / (requests * len(BACKENDS)) < startup_time
+
+
+def test_available_engine_specs(
+    benchmark_enabled: bool,
+    benchmark_size: Callable[[int, int], int],
+    timed: Callable[..., Tuple[Any, float]],
+) -> None:
+    """
+    Only the first call to ``get_available_engine_specs`` probes the drivers.
+    """
+    requests = benchmark_size(100, 5)
+
+    engine_spec_registry.invalidate()
+    expected, startup_time = timed("available startup", get_available_engine_specs)
+    results, cached_time = timed(
+        "available cached",
+        lambda: [get_available_engine_specs() for _ in range(requests)],
+    )
+
+    assert all(result == expected for result in results)
+    if benchmark_enabled:
+        assert cached_time / requests < startup_time
@@ -0,0 +1,102 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from typing import Any, Callable, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+from bridge.charts.post_processing import pivot_df, pivot_v2_aggfunc_map
+
+
+def legacy_pivot_df(
+    df: pd.DataFrame,
+    rows: List[str],
+    columns: List[str],
+    metrics: List[str],
+    aggfunc: str = "Sum",
+) -> pd.DataFrame:
+    """
+    `pivot_df` with totals, computed by the insertion loops it previously used.
+    """
+    metric_name = f"Total ({aggfunc})"
+    df = pivot_df(df, rows, columns, metrics, aggfunc)
+
+    groups = df.columns
+    for level in range(df.columns.nlevels):
+        subgroups = {group[:level] for group in groups}
+        for subgroup in subgroups:
+            slice_ = df.columns.get_loc(subgroup)
+            subtotal = pivot_v2_aggfunc_map[aggfunc](df.iloc[:, slice_], axis=1)
+            depth = df.columns.nlevels - len(subgroup) - 1
+            total = metric_name if level == 0 else "Subtotal"
+            subtotal_name = tuple([*subgroup, total, *([""] * depth)])
+            df.insert(int(slice_.stop), subtotal_name, subtotal)
+
+    groups = df.index
+    for level in range(df.index.nlevels):
+        subgroups = {group[:level] for group in groups}
+        for subgroup in subgroups:
+            slice_ = df.index.get_loc(subgroup)
+            subtotal = pivot_v2_aggfunc_map[aggfunc](
+                df.iloc[slice_, :].apply(pd.to_numeric), axis=0
+            )
+            depth = df.index.nlevels - len(subgroup) - 1
+            total = metric_name if level == 0 else "Subtotal"
+            subtotal.name = tuple([*subgroup, total, *([""] * depth)])
+            df = pd.concat(
+                [df[: slice_.stop], subtotal.to_frame().T, df[slice_.stop :]]
+            )
+
+    return df
+
+
+def test_pivot_df_totals(
+    benchmark_enabled: bool,
+    benchmark_size: Callable[[int, int], int],
+    timed: Callable[..., Tuple[Any, float]],
+) -> None:
+    """
+    Compare both implementations on a deep pivot with totals (5k row groups).
+    """
+    groups = benchmark_size(5_000, 60)
+    rng = np.random.default_rng(42)
+    size = groups * 4
+    df = pd.DataFrame(
+        {
+            "country": rng.integers(0, groups // 50 + 1, size).astype(str),
+            "state": rng.integers(0, 5, size).astype(str),
+            "city": rng.integers(0, 10, size).astype(str),
+            "gender": rng.choice(["boy", "girl"], size),
+            "year": rng.choice(["2020", "2021", "2022"], size),
+            "num": rng.integers(0, 1000, size),
+            "ratio": rng.random(size),
+        }
+    )
+    args = (df, ["country", "state", "city"], ["gender", "year"], ["num", "ratio"])
+
+    expected, legacy_time = timed("legacy pivot_df totals", legacy_pivot_df, *args)
+    result, vectorized_time = timed(
+        "pivot_df totals",
+        pivot_df,
+        *args,
+        show_rows_total=True,
+        show_columns_total=True,
+    )
+
+    pd.testing.assert_frame_equal(result, expected, check_exact=True)
+    if benchmark_enabled:
+        assert vectorized_time < legacy_time
@@ -0,0 +1,70 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+import json
+from typing import Any, Callable, Tuple
+
+import numpy as np
+import pandas as pd
+
+from bridge.result_set import stringify_values, to_object_array
+from bridge.utils import core as utils
+
+
+def legacy_stringify_values(array: np.ndarray) -> np.ndarray:
+    """
+    The per-cell implementation `stringify_values` replaced.
+    """
+    result = np.copy(array)
+
+    with np.nditer(result, flags=["refs_ok"], op_flags=["readwrite"]) as it:
+        for obj in it:
+            if pd.isna(obj):
+                obj[pd.isna(obj)] = None
+            else:
+                obj[...] = json.dumps(obj, default=utils.json_iso_dttm_ser)
+
+    return result
+
+
+def test_stringify_nested_values(
+    benchmark_enabled: bool,
+    benchmark_size: Callable[[int, int], int],
+    timed: Callable[..., Tuple[Any, float]],
+) -> None:
+    """
+    Compare both implementations on a column of nested values (1M cells).
+    """
+    size = benchmark_size(1_000_000, 1_000)
+    values = to_object_array(
+        [
+            None
+            if i % 10 == 0
+            else [i, i + 1, "foo"]
+            if i % 2
+            else {"key": i, "values": [1.5, None]}
+            for i in range(size)
+        ]
+    )
+
+    expected, legacy_time = timed(
+        "legacy stringify_values", legacy_stringify_values, values
+    )
+    result, vectorized_time = timed("stringify_values", stringify_values, values)
+
+    assert np.array_equal(result, expected)
+    if benchmark_enabled:
+        assert vectorized_time < legacy_time
@@ -0,0 +1,249 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+# pylint: disable=import-outside-toplevel, redefined-outer-name, unused-argument
+import json
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+import pytest
+from pytest_mock import MockFixture
+from sqlalchemy import create_engine
+from sqlalchemy.orm.session import Session
+
+
+@pytest.fixture
+def warehouse(tmp_path: Path) -> str:
+    """
+    A SQLite database to crawl
+    """
+    uri = f"sqlite:///{tmp_path / 'warehouse.db'}"
+    engine = create_engine(uri)
+    with engine.begin() as connection:
+        connection.execute("CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT)")
+        connection.execute(
+            "CREATE TABLE orders (id INTEGER PRIMARY KEY, "
+            "user_id INTEGER REFERENCES users (id), amount FLOAT)"
+        )
+        connection.execute("CREATE INDEX ix_orders_amount ON orders (amount)")
+        connection.execute("CREATE VIEW user_names AS SELECT name FROM users")
+    engine.dispose()
+    return uri
+
+
+@pytest.fixture
+def database(session: Session, warehouse: str) -> Any:
+    from bridge.models.catalog import CatalogTable
+    from bridge.models.core import Database
+
+    CatalogTable.metadata.create_all(session.get_bind())  # pylint: disable=no-member
+    database = Database(database_name="warehouse", sqlalchemy_uri=warehouse)
+    session.add(database)
+    session.commit()
+    return database
+
+
+def get_tables(session: Session) -> Any:
+    from bridge.models.catalog import CatalogTable
+
+    return {
+        table.name: table
+        for table in session.query(CatalogTable).order_by(CatalogTable.name)
+    }
+
+
+def test_crawl(session: Session, database: Any) -> None:
+    """
+    Test that the schemas, tables, columns and keys of a database are indexed
+    """
+    from bridge.catalog.crawler import CatalogCrawler
+    from bridge.models.catalog import CatalogSchema
+
+    stats = CatalogCrawler(database, session, ttl=60, max_tables=10).crawl()
+
+    assert stats == {"schemas": 1, "tables": 3}
+    assert [schema.name for schema in session.query(CatalogSchema)] == ["main"]
+    tables = get_tables(session)
+    assert {name: table.type for name, table in tables.items()} == {
+        "orders": "table",
+        "user_names": "view",
+        "users": "table",
+    }
+    orders = tables["orders"]
+    assert [(column.name, column.type) for column in orders.columns] == [
+        ("id", "INTEGER"),
+        ("user_id", "INTEGER"),
+        ("amount", "FLOAT"),
+    ]
+    assert json.loads(orders.primary_key) == database.get_pk_constraint(
+        "orders", "main"
+    )
+    assert json.loads(orders.foreign_keys)[0]["referred_table"] == "users"
+    assert json.loads(orders.indexes)[0]["column_names"] == ["amount"]
+    assert orders.crawled_on is not None
+
+
+def test_crawl_incremental(session: Session, database: Any, warehouse: str) -> None:
+    """
+    Test that only stale schemas and tables are crawled again, and that dropped
+    tables are removed
+    """
+    from bridge.catalog.crawler import CatalogCrawler
+
+    crawler = CatalogCrawler(database, session, ttl=60, max_tables=2)
+    assert crawler.crawl() == {"schemas": 1, "tables": 2}
+    assert crawler.crawl() == {"schemas": 0, "tables": 1}
+    assert crawler.crawl() == {"schemas": 0, "tables": 0}
+
+    engine = create_engine(warehouse)
+    with engine.begin() as connection:
+        connection.execute("DROP VIEW user_names")
+        connection.execute("CREATE TABLE products (id INTEGER PRIMARY KEY)")
+    engine.dispose()
+
+    # the changes are picked up once the schema is stale
+    assert crawler.crawl() == {"schemas": 0, "tables": 0}
+    assert "products" not in get_tables(session)
+    tables = get_tables(session)
+    tables["users"].schema.crawled_on = datetime.utcnow() - timedelta(minutes=2)
+    tables["users"].crawled_on = datetime.utcnow() - timedelta(minutes=2)
+    session.commit()
+
+    assert crawler.crawl() == {"schemas": 1, "tables": 2}
+    tables = get_tables(session)
+    assert set(tables) == {"orders", "products", "users"}
+    assert [column.name for column in tables["products"].columns] == ["id"]
+
+    assert crawler.crawl(force=True) == {"schemas": 1, "tables": 2}
+
+
+def test_crawl_table_failure(
+    mocker: MockFixture, session: Session, database: Any
+) -> None:
+    """
+    Test that tables failing to be reflected don't fail the crawl
+    """
+    from bridge.catalog.crawler import CatalogCrawler
+    from bridge.db_engine_specs.sqlite import SqliteEngineSpec
+
+    mocker.patch.object(
+        SqliteEngineSpec, "get_table_comment", side_effect=Exception("denied")
+    )
+
+    assert CatalogCrawler(database, session, ttl=60).crawl() == {
+        "schemas": 1,
+        "tables": 0,
+    }
+    tables = get_tables(session)
+    assert all(table.crawled_on for table in tables.values())
+    assert not any(table.columns for table in tables.values())
+
+
+def test_get_table_metadata(
+    mocker: MockFixture, app: Any, session: Session, database: Any
+) -> None:
+    """
+    Test that the table metadata is served from the index
+    """
+    from bridge.catalog.crawler import CatalogCrawler
+    from bridge.databases.utils import get_table_metadata
+
+    live_metadata = get_table_metadata(database, "orders", "main")
+
+    mocker.patch.dict(app.config, {"CATALOG_INDEX_ENABLED": True})
+    CatalogCrawler(database, session, ttl=60).crawl()
+    get_columns = mocker.patch.object(database, "get_columns")
+
+    assert get_table_metadata(database, "orders", "main") == live_metadata
+    get_columns.assert_not_called()
+
+
+def test_get_all_table_names_in_schema(
+    mocker: MockFixture, session: Session, database: Any
+) -> None:
+    """
+    Test that the tables and views of the crawled schemas are served from the index
+    """
+    from bridge.catalog.crawler import CatalogCrawler
+    from bridge.catalog.dao import CatalogDAO
+    from bridge.models.core import config
+
+    mocker.patch.dict(config, {"CATALOG_INDEX_ENABLED": True})
+    CatalogCrawler(database, session, ttl=60).crawl_schemas(["main"])
+    get_table_names = mocker.spy(database.db_engine_spec, "get_table_names")
+
+    # not crawled yet
+    assert database.get_all_table_names_in_schema(schema="main") == {
+        ("orders", "main"),
+        ("users", "main"),
+    }
+    assert get_table_names.call_count == 1
+
+    CatalogCrawler(database, session, ttl=60).crawl()
+    assert database.get_all_table_names_in_schema(schema="main") == {
+        ("orders", "main"),
+        ("users", "main"),
+    }
+    assert database.get_all_view_names_in_schema(schema="main") == {
+        ("user_names", "main")
+    }
+    assert get_table_names.call_count == 2
+
+    assert [table.name for table in CatalogDAO.find_tables(database, "main", "us")] == [
+        "user_names",
+        "users",
+    ]
+    assert CatalogDAO.find_tables(database, "main", "u%") == []
+
+
+def test_get_all_table_names_in_schema_force(
+    mocker: MockFixture, app: Any, session: Session, database: Any, warehouse: str
+) -> None:
+    """
+    Test that forcing the listing of the tables refreshes the index, so that the
+    next reads see the new tables and the new columns of altered tables
+    """
+    from bridge.catalog.crawler import CatalogCrawler
+    from bridge.databases.utils import get_table_metadata
+    from bridge.models.core import config
+
+    mocker.patch.dict(config, {"CATALOG_INDEX_ENABLED": True})
+    mocker.patch.dict(app.config, {"CATALOG_INDEX_ENABLED": True})
+    CatalogCrawler(database, session, ttl=60).crawl()
+
+    engine = create_engine(warehouse)
+    with engine.begin() as connection:
+        connection.execute("CREATE TABLE products (id INTEGER PRIMARY KEY)")
+        connection.execute("ALTER TABLE users ADD COLUMN email TEXT")
+    engine.dispose()
+
+    assert ("products", "main") not in database.get_all_table_names_in_schema(
+        schema="main"
+    )
+    assert ("products", "main") in database.get_all_table_names_in_schema(
+        schema="main", force=True
+    )
+    get_table_names = mocker.spy(database.db_engine_spec, "get_table_names")
+    assert database.get_all_table_names_in_schema(schema="main") == {
+        ("orders", "main"),
+        ("products", "main"),
+        ("users", "main"),
+    }
+    get_table_names.assert_not_called()
+
+    columns = get_table_metadata(database, "users", "main")["columns"]
+    assert [column["name"] for column in columns] == ["id", "name", "email"]
@@ -0,0 +1,149 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+# pylint: disable=import-outside-toplevel, redefined-outer-name
+import gzip
+from datetime import datetime
+from typing import Any, Dict, Iterator, List
+from unittest.mock import MagicMock
+
+import pytest
+from flask import Flask, Response
+from flask_caching import Cache
+from pytest_mock import MockFixture
+
+
+@pytest.fixture
+def data_cache(mocker: MockFixture, app: Flask) -> Iterator[Cache]:
+    from bridge.common.utils import query_cache_manager
+    from bridge.constants import CacheRegion
+    from bridge.extensions import cache_manager
+
+    cache = Cache(app, config={"CACHE_TYPE": "SimpleCache"})
+    mocker.patch.object(cache_manager, "_data_cache", cache)
+    mocker.patch.dict(query_cache_manager._cache, {CacheRegion.DATA: cache})
+    mocker.patch.dict(app.config, {"CHART_DATA_RESPONSE_CACHE": True})
+    yield cache
+    cache.clear()
+
+
+def get_query_context(result_format: str = "json") -> MagicMock:
+    query_context = MagicMock(
+        force=False,
+        result_type="full",
+        result_format=result_format,
+        queries=[MagicMock(result_type=None)],
+    )
+    query_context.query_cache_key.return_value = "data_key"
+    query_context.get_cache_timeout.return_value = 60
+    return query_context
+
+
+def get_queries(is_cached: bool = True) -> List[Dict[str, Any]]:
+    return [
+        {
+            "is_cached": is_cached,
+            "cached_dttm": datetime.utcnow().isoformat().split(".")[0],
+            "cache_timeout": 60,
+        }
+    ]
+
+
+def test_response_cache(app: Flask, data_cache: Cache) -> None:
+    """
+    Test that the responses of data cache hits are stored compressed, with an ETag
+    """
+    from bridge.charts.data.response_cache import ChartDataResponseCache
+
+    with app.test_request_context(headers={"Accept-Encoding": "gzip"}):
+        response_cache = ChartDataResponseCache(get_query_context())
+        assert response_cache.get() is None
+        response = response_cache.set(
+            Response('{"result": []}', mimetype="application/json"), get_queries()
+        )
+        etag, _ = response.get_etag()
+        assert etag
+
+        cached_response = ChartDataResponseCache(get_query_context()).get()
+        assert cached_response is not None
+        assert cached_response.headers["Content-Encoding"] == "gzip"
+        assert cached_response.mimetype == "application/json"
+        assert cached_response.get_etag() == (etag, True)
+        assert gzip.decompress(cached_response.get_data()) == b'{"result": []}'
+
+    with app.test_request_context():
+        cached_response = ChartDataResponseCache(get_query_context()).get()
+        assert cached_response is not None
+        assert "Content-Encoding" not in cached_response.headers
+        assert cached_response.get_data() == b'{"result": []}'
+
+    with app.test_request_context(headers={"If-None-Match": f'W/"{etag}"'}):
+        cached_response = ChartDataResponseCache(get_query_context()).get()
+        assert cached_response is not None
+        assert cached_response.status_code == 304
+
+
+def test_response_cache_not_cached(app: Flask, data_cache: Cache) -> None:
+    """
+    Test that responses aren't stored when their data wasn't loaded from the cache,
+    nor looked up for formats that aren't cached or when forcing a refresh
+    """
+    from bridge.charts.data.response_cache import ChartDataResponseCache
+
+    with app.test_request_context():
+        response_cache = ChartDataResponseCache(get_query_context())
+        response_cache.set(Response("{}"), get_queries(is_cached=False))
+        assert ChartDataResponseCache(get_query_context()).get() is None
+
+        response_cache = ChartDataResponseCache(get_query_context("csv"))
+        response_cache.set(Response("a\n"), get_queries())
+        assert ChartDataResponseCache(get_query_context("csv")).get() is None
+
+        query_context = get_query_context()
+        query_context.force = True
+        response_cache = ChartDataResponseCache(query_context)
+        response_cache.set(Response("{}"), get_queries())
+        query_context.query_cache_key.assert_not_called()
+        assert ChartDataResponseCache(get_query_context()).get() is None
+
+
+def test_response_cache_invalidation(app: Flask, data_cache: Cache) -> None:
+    """
+    Test that responses are invalidated when their data cache entries are written
+    or deleted
+    """
+    from bridge.charts.data.response_cache import ChartDataResponseCache
+    from bridge.common.utils.query_cache_manager import QueryCacheManager
+    from bridge.constants import CacheRegion
+
+    with app.test_request_context():
+        ChartDataResponseCache(get_query_context()).set(Response("{}"), get_queries())
+        assert ChartDataResponseCache(get_query_context()).get() is not None
+
+        QueryCacheManager.set("data_key", {}, region=CacheRegion.DATA)
+        assert ChartDataResponseCache(get_query_context()).get() is None
+
+        ChartDataResponseCache(get_query_context()).set(Response("{}"), get_queries())
+        assert ChartDataResponseCache(get_query_context()).get() is not None
+
+        QueryCacheManager.delete("data_key", region=CacheRegion.DATA)
+        assert ChartDataResponseCache(get_query_context()).get() is None
+
+        # the data was replaced while the response was being built
+        response_cache = ChartDataResponseCache(get_query_context())
+        QueryCacheManager.set("data_key", {}, region=CacheRegion.DATA)
+        response_cache.set(Response("{}"), get_queries())
+        assert ChartDataResponseCache(get_query_context()).get() is None
@@ -0,0 +1,196 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+# pylint: disable=redefined-outer-name
+import threading
+import time
+from typing import Iterator, List
+
+import pytest
+from flask import Flask
+from flask_caching import Cache
+from pandas import DataFrame
+from pytest_mock import MockFixture
+
+from bridge.constants import CacheRegion
+
+
+@pytest.fixture
+def data_cache(mocker: MockFixture, app: Flask) -> Iterator[Cache]:
+    from bridge.common.utils import query_cache_manager
+
+    cache = Cache(app, config={"CACHE_TYPE": "SimpleCache"})
+    mocker.patch.dict(query_cache_manager._cache, {CacheRegion.DATA: cache})
+    mocker.patch.dict(
+        query_cache_manager.config,
+        {
+            "DATA_CACHE_SINGLE_FLIGHT": True,
+            "DATA_CACHE_LEASE_TIMEOUT": 10,
+            "DATA_CACHE_LEASE_WAIT_TIMEOUT": 1,
+            "DATA_CACHE_LEASE_POLL_INTERVAL": 0.01,
+        },
+    )
+    yield cache
+    cache.clear()
+
+
+def cache_result(key: str) -> None:
+    from bridge.common.utils.query_cache_manager import QueryCacheManager
+    from bridge.models.helpers import QueryResult
+
+    QueryCacheManager().set_query_result(
+        key=key,
+        query_result=QueryResult(
+            df=DataFrame({"a": [1]}), query="SELECT 1", duration=0
+        ),
+        region=CacheRegion.DATA,
+    )
+
+
+def test_single_flight_disabled(mocker: MockFixture, data_cache: Cache) -> None:
+    """
+    No lease is taken when single-flight is disabled or the query is forced
+    """
+    from bridge.common.utils import query_cache_manager
+    from bridge.common.utils.query_cache_manager import get_lease_key, QueryCacheManager
+
+    mocker.patch.dict(query_cache_manager.config, {"DATA_CACHE_SINGLE_FLIGHT": False})
+    with QueryCacheManager.single_flight("key", CacheRegion.DATA) as coalesced:
+        assert coalesced is None
+        assert not data_cache.get(get_lease_key("key"))
+
+    mocker.patch.dict(query_cache_manager.config, {"DATA_CACHE_SINGLE_FLIGHT": True})
+    with QueryCacheManager.single_flight(
+        "key", CacheRegion.DATA, force_query=True
+    ) as coalesced:
+        assert coalesced is None
+        assert not data_cache.get(get_lease_key("key"))
+
+
+def test_single_flight_lease(data_cache: Cache) -> None:
+    """
+    The first caller holds the lease until it's done
+    """
+    from bridge.common.utils.query_cache_manager import get_lease_key, QueryCacheManager
+
+    with QueryCacheManager.single_flight("key", CacheRegion.DATA) as coalesced:
+        assert coalesced is None
+        assert data_cache.get(get_lease_key("key"))
+
+    assert not data_cache.get(get_lease_key("key"))
+
+
+def test_single_flight_lease_released_without_value(data_cache: Cache) -> None:
+    """
+    Waiting callers compute the value themselves when the lease holder failed
+    """
+    from bridge.common.utils.query_cache_manager import get_lease_key, QueryCacheManager
+
+    data_cache.add(get_lease_key("key"), "token")
+    threading.Timer(0.05, data_cache.delete, [get_lease_key("key")]).start()
+
+    start = time.monotonic()
+    with QueryCacheManager.single_flight("key", CacheRegion.DATA) as coalesced:
+        assert coalesced is None
+    assert time.monotonic() - start < 1
+
+
+def test_single_flight_wait_timeout(data_cache: Cache) -> None:
+    """
+    Waiting callers give up after the wait timeout
+    """
+    from bridge.common.utils.query_cache_manager import get_lease_key, QueryCacheManager
+
+    data_cache.add(get_lease_key("key"), "token")
+
+    start = time.monotonic()
+    with QueryCacheManager.single_flight("key", CacheRegion.DATA) as coalesced:
+        assert coalesced is None
+    assert time.monotonic() - start >= 1
+
+
+def test_single_flight_coalesces_concurrent_calls(
+    app: Flask, data_cache: Cache
+) -> None:
+    """
+    Only one of the concurrent callers computes the value, the others reuse it
+    """
+    from bridge.common.db_query_status import QueryStatus
+    from bridge.common.utils.query_cache_manager import QueryCacheManager
+
+    computed: List[int] = []
+    results: List[QueryCacheManager] = []
+
+    def load() -> None:
+        with app.app_context():
+            query_cache = QueryCacheManager.get("key", CacheRegion.DATA)
+            if not query_cache.is_loaded:
+                with QueryCacheManager.single_flight(
+                    "key", CacheRegion.DATA
+                ) as coalesced:
+                    if coalesced:
+                        query_cache = coalesced
+                    else:
+                        computed.append(1)
+                        time.sleep(0.1)
+                        cache_result("key")
+                        query_cache = QueryCacheManager.get("key", CacheRegion.DATA)
+            results.append(query_cache)
+
+    threads = [threading.Thread(target=load) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(computed) == 1
+    assert len(results) == 5
+    assert all(result.status == QueryStatus.SUCCESS for result in results)
+    assert all(result.df.equals(DataFrame({"a": [1]})) for result in results)
+
+
+def test_get_decodes_df_lazily(mocker: MockFixture, data_cache: Cache) -> None:
+    """
+    DataFrames are cached as Arrow and decoded on first access
+    """
+    from bridge.common.utils.query_cache_manager import QueryCacheManager
+    from bridge.utils import cache_codecs
+
+    cache_result("key")
+    assert data_cache.get("key")["df_codec"] == "arrow"
+    assert isinstance(data_cache.get("key")["df"], bytes)
+
+    decode_dataframe = mocker.spy(cache_codecs.ArrowDataFrameCodec, "decode")
+    query_cache = QueryCacheManager.get("key", CacheRegion.DATA)
+    decode_dataframe.assert_not_called()
+
+    assert query_cache.df.equals(DataFrame({"a": [1]}))
+    assert query_cache.df.equals(DataFrame({"a": [1]}))
+    decode_dataframe.assert_called_once()
+
+
+def test_get_legacy_value(data_cache: Cache) -> None:
+    """
+    Values cached before DataFrame codecs were introduced are still readable
+    """
+    from bridge.common.utils.query_cache_manager import QueryCacheManager
+
+    data_cache.set("key", {"df": DataFrame({"a": [1]}), "query": "", "dttm": None})
+
+    query_cache = QueryCacheManager.get("key", CacheRegion.DATA)
+
+    assert query_cache.is_loaded
+    assert query_cache.df.equals(DataFrame({"a": [1]}))
@@ -0,0 +1,200 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+# pylint: disable=import-outside-toplevel
+import json
+import threading
+import time
+from typing import Any, Dict
+from unittest.mock import MagicMock
+
+import pandas as pd
+import pytest
+from flask import Flask, g
+from pytest_mock import MockFixture
+
+
+def test_get_payload_concurrent(mocker: MockFixture, app: Flask) -> None:
+    """
+    Test that the query objects are resolved concurrently, in the user's context,
+    and returned in order
+    """
+    from bridge.common.query_context_processor import QueryContextProcessor
+
+    query_context = MagicMock()
+    query_context.queries = [MagicMock(row_limit=i) for i in range(4)]
+    threads = set()
+
+    def get_query_results(
+        result_type: Any, query_context: Any, query_obj: Any, force_cached: bool
+    ) -> Dict[str, Any]:
+        time.sleep(0.01 * (4 - query_obj.row_limit))
+        threads.add(threading.current_thread())
+        return {"row_limit": query_obj.row_limit, "user": g.user}
+
+    mocker.patch(
+        "bridge.common.query_context_processor.get_query_results",
+        side_effect=get_query_results,
+    )
+
+    with app.test_request_context():
+        g.user = "admin"
+        payload = QueryContextProcessor(query_context).get_payload()
+
+    assert payload == {"queries": [{"row_limit": i, "user": "admin"} for i in range(4)]}
+    assert threading.main_thread() not in threads
+
+
+def test_get_payload_error(mocker: MockFixture, app: Flask) -> None:
+    """
+    Test that the error of the first failing query object is raised
+    """
+    from bridge.common.query_context_processor import QueryContextProcessor
+    from bridge.exceptions import QueryObjectValidationError
+
+    query_context = MagicMock()
+    query_context.queries = [MagicMock(row_limit=i) for i in range(3)]
+
+    def get_query_results(
+        result_type: Any, query_context: Any, query_obj: Any, force_cached: bool
+    ) -> Dict[str, Any]:
+        if query_obj.row_limit:
+            raise QueryObjectValidationError(str(query_obj.row_limit))
+        return {}
+
+    mocker.patch(
+        "bridge.common.query_context_processor.get_query_results",
+        side_effect=get_query_results,
+    )
+
+    with pytest.raises(QueryObjectValidationError, match="1"):
+        QueryContextProcessor(query_context).get_payload()
+
+
+@pytest.fixture
+def streaming_processor(mocker: MockFixture, app: Flask) -> Any:
+    from bridge.common import query_context_processor
+    from bridge.common.query_context_processor import QueryContextProcessor
+
+    mocker.patch.dict(
+        query_context_processor.config, {"CHART_DATA_STREAMING_CHUNK_SIZE": 2}
+    )
+    query_context = MagicMock()
+    query_context.datasource.data = {"verbose_map": {"a": "A"}}
+    query_context.datasource.iter_query.return_value = iter(
+        [
+            pd.DataFrame({"a": [1, 2], "b": ["=x", "y"]}),
+            pd.DataFrame({"a": [3], "b": [None]}),
+        ]
+    )
+    processor = QueryContextProcessor(query_context)
+    mocker.patch.object(processor, "query_cache_key", return_value=None)
+    mocker.patch.object(processor, "normalize_df", side_effect=lambda df, _: df)
+    return processor
+
+
+def test_get_data_chunks_csv(streaming_processor: Any) -> None:
+    """
+    Test that CSV data is streamed from the cursor, one chunk at a time
+    """
+    from bridge.common.chart_data import ChartDataResultFormat
+
+    streaming_processor._query_context.result_format = ChartDataResultFormat.CSV
+    query_obj = MagicMock(post_processing=[], time_offsets=[])
+
+    chunks = list(streaming_processor.get_data_chunks(query_obj))
+
+    assert chunks == ["A,b\n1,'=x\n2,y\n", "3,\n"]
+    streaming_processor._qc_datasource.iter_query.assert_called_once_with(
+        query_obj.to_dict(), 2
+    )
+
+
+def test_get_data_chunks_json(streaming_processor: Any) -> None:
+    """
+    Test that JSON data is streamed as a single array of records
+    """
+    from bridge.common.chart_data import ChartDataResultFormat
+
+    streaming_processor._query_context.result_format = ChartDataResultFormat.JSON
+    query_obj = MagicMock(post_processing=[], time_offsets=[])
+
+    data = "".join(streaming_processor.get_data_chunks(query_obj))
+
+    assert json.loads(data) == [
+        {"a": 1, "b": "=x"},
+        {"a": 2, "b": "y"},
+        {"a": 3, "b": None},
+    ]
+
+
+def test_get_data_chunks_post_processed(
+    mocker: MockFixture, streaming_processor: Any
+) -> None:
+    """
+    Test that post-processed data is loaded as a whole and streamed in chunks
+    """
+    from bridge.common.chart_data import ChartDataResultFormat
+    from bridge.common.db_query_status import QueryStatus
+
+    streaming_processor._query_context.result_format = ChartDataResultFormat.JSON
+    mocker.patch.object(
+        streaming_processor,
+        "get_df_payload",
+        return_value={
+            "status": QueryStatus.SUCCESS,
+            "df": pd.DataFrame({"a": range(5)}),
+        },
+    )
+    query_obj = MagicMock(post_processing=[{"operation": "pivot"}], time_offsets=[])
+
+    chunks = list(streaming_processor.get_data_chunks(query_obj))
+
+    assert chunks == [
+        "[",
+        '{"a": 0}, {"a": 1}',
+        ', {"a": 2}, {"a": 3}',
+        ', {"a": 4}',
+        "]",
+    ]
+    streaming_processor._qc_datasource.iter_query.assert_not_called()
+
+
+def test_get_data_columnar(app: Flask) -> None:
+    """
+    Test that the data of a query is returned in the requested columnar format
+    """
+    import pyarrow as pa
+    import simplejson
+
+    from bridge.common.chart_data import ChartDataResultFormat
+    from bridge.common.query_context_processor import QueryContextProcessor
+
+    df = pd.DataFrame({"a": [1, 2], "ds": pd.to_datetime(["1970-01-01", None])})
+    query_context = MagicMock()
+    processor = QueryContextProcessor(query_context)
+
+    query_context.result_format = ChartDataResultFormat.JSON_COLUMNAR
+    data = processor.get_data(df)
+    assert simplejson.dumps(data) == '{"a": [1, 2], "ds": [0,null]}'
+
+    query_context.result_format = ChartDataResultFormat.ARROW
+    data = processor.get_data(df)
+    with pa.ipc.open_stream(data) as reader:
+        assert reader.read_all().to_pydict() == {
+            "a": [1, 2],
+            "ds": [pd.Timestamp("1970-01-01").to_pydatetime(), None],
+        }
@@ -32,6 +32,7 @@ from bridge import security_manager
 from bridge.app import BridgeApp
 from bridge.common.chart_data import ChartDataResultType
 from bridge.common.query_object_factory import QueryObjectFactory
+from bridge.db_engine_specs import engine_spec_registry
 from bridge.extensions import appbuilder
 from bridge.initialization import BridgeAppInitializer
 
@@ -123,6 +124,17 @@ def app_context(app: BridgeApp) -> Iterator[None]:
         yield
 
 
+@pytest.fixture(autouse=True)
+def reset_engine_spec_registry() -> Iterator[None]:
+    """
+    Tests often mock the loaded engine specs, make sure each test starts and leaves
+    with an empty engine spec registry.
+    """
+    engine_spec_registry.invalidate()
+    yield
+    engine_spec_registry.invalidate()
+
+
 @pytest.fixture
 def full_api_access(mocker: MockFixture) -> Iterator[None]:
     """
@@ -191,3 +191,54 @@ def test_non_zip_import(client: Any, full_api_access: None) -> None:
             }
         ]
     }
+
+
+@pytest.mark.parametrize("catalog_index_enabled", [False, True])
+def test_tables(
+    mocker: MockFixture,
+    app: Any,
+    session: Session,
+    client: Any,
+    full_api_access: None,
+    tmp_path: Any,
+    catalog_index_enabled: bool,
+) -> None:
+    """
+    Test that the tables of a schema are listed by prefix, from the catalog index
+    when it's enabled.
+    """
+    import prison
+    from sqlalchemy import create_engine
+
+    from bridge.databases.api import DatabaseRestApi
+    from bridge.models.catalog import CatalogTable
+    from bridge.models.core import Database
+
+    mocker.patch.dict(app.config, {"CATALOG_INDEX_ENABLED": catalog_index_enabled})
+    DatabaseRestApi.datamodel.session = session
+    CatalogTable.metadata.create_all(session.get_bind())  # pylint: disable=no-member
+
+    uri = f"sqlite:///{tmp_path / 'warehouse.db'}"
+    engine = create_engine(uri)
+    with engine.begin() as connection:
+        connection.execute("CREATE TABLE orders (id INTEGER PRIMARY KEY)")
+        connection.execute("CREATE TABLE order_items (id INTEGER PRIMARY KEY)")
+        connection.execute("CREATE TABLE users (id INTEGER PRIMARY KEY)")
+        connection.execute("CREATE VIEW order_totals AS SELECT id FROM orders")
+    engine.dispose()
+    session.add(Database(database_name="warehouse", sqlalchemy_uri=uri))
+    session.commit()
+
+    query = prison.dumps({"schema_name": "main", "prefix": "order", "limit": 2})
+    response = client.get(f"/api/v1/database/1/tables/?q={query}")
+    assert response.status_code == 200
+    assert response.json == {
+        "count": 3,
+        "result": [
+            {"value": "order_items", "type": "table"},
+            {"value": "order_totals", "type": "view"},
+        ],
+    }
+
+    response = client.get("/api/v1/database/2/tables/?q=(schema_name:main)")
+    assert response.status_code == 404
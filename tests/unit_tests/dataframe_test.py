@@ -16,6 +16,7 @@
 # under the License.
 # pylint: disable=unused-argument, import-outside-toplevel
 from datetime import datetime
+from pathlib import Path
 
 import pytest
 from pandas import Timestamp
@@ -105,3 +106,99 @@ def test_max_pandas_timestamp(input_, expected) -> None:
     df = results.to_pandas_df()
 
     assert df_to_records(df) == expected
+
+
+def test_split_df() -> None:
+    import pandas as pd
+
+    from bridge.dataframe import split_df
+
+    df = pd.DataFrame({"a": [1, 2, 3]})
+    assert [chunk["a"].tolist() for chunk in split_df(df, 2)] == [[1, 2], [3]]
+    assert [len(chunk) for chunk in split_df(df.iloc[:0], 2)] == [0]
+
+
+def test_read_parquet_chunks(tmp_path: Path) -> None:
+    import pandas as pd
+
+    from bridge.dataframe import read_parquet_chunks
+
+    pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"]}).to_parquet(
+        tmp_path / "full.parquet"
+    )
+    pd.DataFrame({"a": [], "b": []}).to_parquet(tmp_path / "empty.parquet")
+
+    chunks = list(
+        read_parquet_chunks(
+            [tmp_path / "full.parquet", tmp_path / "empty.parquet"], 2, columns=["a"]
+        )
+    )
+    assert [chunk.to_dict("list") for chunk in chunks] == [
+        {"a": [1, 2]},
+        {"a": [3]},
+        {"a": []},
+    ]
+
+
+def test_coerce_chunks() -> None:
+    import pandas as pd
+
+    from bridge.dataframe import coerce_chunks
+
+    def read_chunks():
+        return iter(
+            [
+                pd.DataFrame({"a": [1, 2], "b": [True, False], "c": [1.5, 2.0]}),
+                pd.DataFrame({"a": [None, None], "b": [None, True], "c": [3, 4]}),
+            ]
+        )
+
+    chunks = list(coerce_chunks(read_chunks))
+    for chunk in chunks:
+        assert [str(dtype) for dtype in chunk.dtypes] == ["Int64", "boolean", "float64"]
+    assert chunks[0]["a"].tolist() == [1, 2]
+    assert chunks[1]["a"].tolist() == [pd.NA, pd.NA]
+    assert chunks[1]["b"].tolist() == [pd.NA, True]
+
+
+def test_coerce_chunks_text_after_empty_chunk() -> None:
+    import pandas as pd
+
+    from bridge.dataframe import coerce_chunks
+
+    def read_chunks():
+        return iter(
+            [
+                pd.DataFrame({"a": [1, 2], "b": [None, None]}),
+                pd.DataFrame({"a": [3, 4], "b": ["foo", None]}),
+            ]
+        )
+
+    chunks = list(coerce_chunks(read_chunks))
+    assert [str(chunk["b"].dtype) for chunk in chunks] == ["object", "object"]
+    assert chunks[1]["b"].tolist() == ["foo", None]
+    assert [str(chunk["a"].dtype) for chunk in chunks] == ["int64", "int64"]
+
+
+def test_coerce_chunks_float_after_integer_chunk() -> None:
+    import pandas as pd
+
+    from bridge.dataframe import coerce_chunks
+
+    def read_chunks():
+        return iter(
+            [
+                pd.DataFrame({"a": [1, None]}, dtype="Int64"),
+                pd.DataFrame({"a": [1.5, 2.0]}),
+                pd.DataFrame({"a": ["3", "foo"], "b": [1, 2]}),
+            ]
+        )
+
+    chunks = list(coerce_chunks(read_chunks))
+    assert [str(chunk["a"].dtype) for chunk in chunks] == ["object"] * 3
+
+    chunks = list(coerce_chunks(lambda: list(read_chunks())[:2]))
+    assert [str(chunk["a"].dtype) for chunk in chunks] == ["float64", "float64"]
+    assert chunks[0]["a"].tolist()[0] == 1.0
+    assert pd.isna(chunks[0]["a"].tolist()[1])
+    assert chunks[1]["a"].tolist() == [1.5, 2.0]
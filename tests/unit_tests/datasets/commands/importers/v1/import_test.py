@@ -19,8 +19,11 @@
 import copy
 import json
 import uuid
+from pathlib import Path
 from typing import Any, Dict
 
+import pytest
+from pytest_mock import MockFixture
 from sqlalchemy.orm.session import Session
 
 
@@ -366,3 +369,152 @@ def test_import_dataset_managed_externally(session: Session) -> None:
     sqla_table = import_dataset(session, config)
     assert sqla_table.is_managed_externally is True
     assert sqla_table.external_url == "https://example.org/my_table"
+
+
+@pytest.mark.parametrize(
+    "file_name", ["data.csv", "data.csv.gz", "data.parquet", "data.arrow"]
+)
+def test_import_dataset_data(
+    mocker: MockFixture, session: Session, tmp_path: Path, file_name: str
+) -> None:
+    """
+    Test that the data of a dataset is loaded in chunks, from any supported format.
+    """
+    import pandas as pd
+    import pyarrow as pa
+    from sqlalchemy import create_engine
+
+    from bridge.connectors.sqla.models import SqlaTable
+    from bridge.datasets.commands.importers.v1.utils import import_dataset
+    from bridge.models.core import Database
+
+    mocker.patch("bridge.datasets.commands.importers.v1.utils.READ_CHUNKSIZE", 2)
+    SqlaTable.metadata.create_all(session.get_bind())  # pylint: disable=no-member
+
+    df = pd.DataFrame(
+        {
+            "id": [1, 2, None],
+            "name": ["a", "b", "c"],
+            "ds": ["2022-01-01", "2022-01-02", "2022-01-03"],
+        }
+    )
+    path = tmp_path / file_name
+    if file_name.endswith(".parquet"):
+        df.to_parquet(path)
+    elif file_name.endswith(".arrow"):
+        table = pa.Table.from_pandas(df)
+        with pa.ipc.new_file(path, table.schema) as writer:
+            writer.write_table(table)
+    else:
+        df.to_csv(path, index=False)
+
+    uri = f"sqlite:///{tmp_path / 'warehouse.db'}"
+    database = Database(database_name="warehouse", sqlalchemy_uri=uri)
+    session.add(database)
+    session.flush()
+
+    config = {
+        "table_name": "my_table",
+        "schema": None,
+        "uuid": uuid.uuid4(),
+        "database_id": database.id,
+        "data": path.as_uri(),
+        "columns": [
+            {"column_name": "id", "type": "BIGINT"},
+            {"column_name": "name", "type": "VARCHAR(255)"},
+            {"column_name": "ds", "type": "DATETIME"},
+        ],
+    }
+    import_dataset(session, config)
+
+    engine = create_engine(uri)
+    assert engine.execute("SELECT * FROM my_table").fetchall() == [
+        (1, "a", "2022-01-01 00:00:00.000000"),
+        (2, "b", "2022-01-02 00:00:00.000000"),
+        (None, "c", "2022-01-03 00:00:00.000000"),
+    ]
+
+
+def test_import_dataset_data_widening_types(
+    mocker: MockFixture, session: Session, tmp_path: Path
+) -> None:
+    """
+    Test loading data whose types widen after the first chunk.
+    """
+    from sqlalchemy import create_engine
+
+    from bridge.connectors.sqla.models import SqlaTable
+    from bridge.datasets.commands.importers.v1.utils import import_dataset
+    from bridge.models.core import Database
+
+    mocker.patch("bridge.datasets.commands.importers.v1.utils.READ_CHUNKSIZE", 2)
+    SqlaTable.metadata.create_all(session.get_bind())  # pylint: disable=no-member
+
+    path = tmp_path / "data.csv"
+    path.write_text("id,amount,comment\n1,1,\n2,2,\n3,1.5,foo\n4,,bar\n")
+
+    uri = f"sqlite:///{tmp_path / 'warehouse.db'}"
+    database = Database(database_name="warehouse", sqlalchemy_uri=uri)
+    session.add(database)
+    session.flush()
+
+    config = {
+        "table_name": "my_table",
+        "schema": None,
+        "uuid": uuid.uuid4(),
+        "database_id": database.id,
+        "data": path.as_uri(),
+        "columns": [
+            {"column_name": "id", "type": "BIGINT"},
+            {"column_name": "amount", "type": "FLOAT"},
+            {"column_name": "comment", "type": "VARCHAR(255)"},
+        ],
+    }
+    import_dataset(session, config)
+
+    engine = create_engine(uri)
+    assert engine.execute("SELECT * FROM my_table").fetchall() == [
+        (1, 1.0, None),
+        (2, 2.0, None),
+        (3, 1.5, "foo"),
+        (4, None, "bar"),
+    ]
+
+
+def test_load_datasets_data(mocker: MockFixture, session: Session) -> None:
+    """
+    Test that the data of datasets is loaded serially into SQLite, and concurrently
+    into other databases.
+    """
+    from bridge.connectors.sqla.models import SqlaTable
+    from bridge.datasets.commands.importers.v1.utils import load_datasets_data
+    from bridge.models.core import Database
+
+    load_data = mocker.patch("bridge.datasets.commands.importers.v1.utils.load_data")
+    map_concurrently = mocker.patch(
+        "bridge.datasets.commands.importers.v1.utils.map_concurrently"
+    )
+    mocker.patch.dict(
+        "flask.current_app.config",
+        {"SQLALCHEMY_DATABASE_URI": "sqlite://", "DATASET_IMPORT_MAX_WORKERS": 3},
+    )
+
+    metadata = Database(database_name="metadata", sqlalchemy_uri="sqlite://")
+    warehouse = Database(database_name="warehouse", sqlalchemy_uri="sqlite:///w.db")
+    postgres = Database(database_name="postgres", sqlalchemy_uri="postgresql://")
+    pending_data = [
+        ("file:///a.csv", SqlaTable(table_name="a", database=metadata)),
+        ("file:///b.csv", SqlaTable(table_name="b", database=warehouse)),
+        ("file:///c.csv", SqlaTable(table_name="c", database=postgres)),
+        ("file:///d.csv", SqlaTable(table_name="d", database=postgres)),
+    ]
+
+    load_datasets_data(session, pending_data)
+
+    load_data.assert_called_once_with(
+        "file:///a.csv", pending_data[0][1], metadata, session
+    )
+    assert [
+        (call.args[1], call.kwargs["max_workers"])
+        for call in map_concurrently.call_args_list
+    ] == [(pending_data[1:2], 1), (pending_data[2:], 3)]
@@ -17,8 +17,10 @@
 # pylint: disable=unused-argument, import-outside-toplevel, protected-access
 
 from textwrap import dedent
+from typing import Any
 
 import pytest
+from pytest_mock import MockFixture
 from sqlalchemy.types import TypeEngine
 
 
@@ -99,3 +101,48 @@ def test_cte_query_parsing(original: TypeEngine, expected: str) -> None:
 
     actual = BaseEngineSpec.get_cte_query(original)
     assert actual == expected
+
+
+def test_fetch_data_chunks(mocker: MockFixture) -> None:
+    """
+    Test that results are fetched from the cursor one chunk at a time
+    """
+    from bridge.db_engine_specs.base import BaseEngineSpec
+
+    cursor = mocker.MagicMock()
+    cursor.fetchmany.side_effect = [[(1,), (2,)], [(3,)], []]
+
+    chunks = BaseEngineSpec.fetch_data_chunks(cursor, 2)
+
+    cursor.fetchmany.assert_not_called()
+    assert list(chunks) == [[(1,), (2,)], [(3,)]]
+    cursor.fetchmany.assert_called_with(2)
+
+
+def test_df_chunks_to_sql(mocker: MockFixture, tmp_path: Any) -> None:
+    """
+    Test that chunks are written one after the other, in a single transaction
+    """
+    import pandas as pd
+    from sqlalchemy import create_engine
+
+    from bridge.db_engine_specs.base import BaseEngineSpec
+    from bridge.sql_parse import Table
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'upload.db'}")
+    engine.execute("CREATE TABLE t (a INTEGER)")
+    database = mocker.MagicMock()
+    database.get_sqla_engine_with_context.return_value.__enter__.return_value = engine
+    progress = mocker.MagicMock()
+
+    rows = BaseEngineSpec.df_chunks_to_sql(
+        database,
+        Table("t"),
+        iter([pd.DataFrame({"a": [1, 2]}), pd.DataFrame({"a": [3]})]),
+        {"if_exists": "replace", "index": False},
+        progress=progress,
+    )
+
+    assert rows == 3
+    assert progress.call_args_list == [mocker.call(2), mocker.call(3)]
+    assert engine.execute("SELECT a FROM t").fetchall() == [(1,), (2,), (3,)]
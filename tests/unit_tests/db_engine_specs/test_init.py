@@ -78,3 +78,69 @@ def test_get_available_engine_specs_with_denylist(mocker: MockFixture) -> None:
     )
     available = get_available_engine_specs()
     assert list(available.keys()) == [DatabricksNativeEngineSpec]
+
+
+def test_get_engine_spec_loads_engine_specs_once(mocker: MockFixture) -> None:
+    """
+    Engine specs are only loaded once, lookups are then served from the registry
+    """
+    from bridge.db_engine_specs import (
+        BaseEngineSpec,
+        get_engine_spec,
+        load_engine_specs,
+    )
+    from bridge.db_engine_specs.postgres import PostgresEngineSpec
+
+    load_engine_specs_mock = mocker.patch(
+        "bridge.db_engine_specs.load_engine_specs", wraps=load_engine_specs
+    )
+
+    for _ in range(3):
+        assert get_engine_spec("postgresql", "psycopg2") == PostgresEngineSpec
+        assert get_engine_spec("postgresql") == PostgresEngineSpec
+        assert get_engine_spec("unknown") == BaseEngineSpec
+
+    load_engine_specs_mock.assert_called_once()
+
+
+def test_engine_spec_registry_invalidated_by_new_distribution(
+    mocker: MockFixture,
+) -> None:
+    """
+    Installing a new distribution reloads the engine specs, as it might be a plugin
+    """
+    from bridge.db_engine_specs import (
+        _on_distribution_added,
+        get_engine_spec,
+        load_engine_specs,
+    )
+
+    load_engine_specs_mock = mocker.patch(
+        "bridge.db_engine_specs.load_engine_specs", wraps=load_engine_specs
+    )
+
+    get_engine_spec("postgresql")
+    _on_distribution_added(mocker.MagicMock())
+    get_engine_spec("postgresql")
+
+    assert load_engine_specs_mock.call_count == 2
+
+
+def test_get_available_engine_specs_probes_drivers_once(mocker: MockFixture) -> None:
+    """
+    The installed drivers are only probed once
+    """
+    get_installed_drivers = mocker.patch(
+        "bridge.db_engine_specs.get_installed_drivers",
+        return_value={"postgresql": {"psycopg2"}},
+    )
+
+    for _ in range(3):
+        available = get_available_engine_specs()
+
+    get_installed_drivers.assert_called_once()
+    assert {
+        engine_spec.engine: drivers
+        for engine_spec, drivers in available.items()
+        if drivers
+    } == {"postgresql": {"psycopg2"}}
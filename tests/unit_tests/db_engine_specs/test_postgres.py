@@ -0,0 +1,64 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+# pylint: disable=unused-argument, import-outside-toplevel
+
+from pytest_mock import MockFixture
+
+
+def test_copy_from_stdin(mocker: MockFixture) -> None:
+    """
+    Test that rows are inserted with COPY, keeping empty strings apart from NULLs
+    """
+    from sqlalchemy.dialects import postgresql
+
+    from bridge.db_engine_specs.postgres import copy_from_stdin
+
+    connection = mocker.MagicMock()
+    connection.dialect = postgresql.dialect()
+    buffers = []
+    cursor = connection.connection.cursor.return_value.__enter__.return_value
+    cursor.copy_expert.side_effect = lambda sql, buffer: buffers.append(buffer.read())
+    table = mocker.MagicMock()
+    table.name = "Sales"
+    table.schema = "public"
+
+    copy_from_stdin(
+        table,
+        connection,
+        ["id", "name"],
+        iter([(1, 'say "hi"'), (2, ""), (3, None)]),
+    )
+
+    cursor.copy_expert.assert_called_once_with(
+        'COPY public."Sales" (id, name) FROM STDIN WITH (FORMAT csv)', mocker.ANY
+    )
+    assert buffers == ['"1","say ""hi"""\n"2",""\n"3",\n']
+
+
+def test_get_df_to_sql_method(mocker: MockFixture) -> None:
+    """
+    Test that COPY is only used with psycopg2
+    """
+    from bridge.db_engine_specs.postgres import copy_from_stdin, PostgresEngineSpec
+
+    engine = mocker.MagicMock()
+    engine.dialect.driver = "psycopg2"
+    assert PostgresEngineSpec.get_df_to_sql_method(engine) is copy_from_stdin
+
+    engine.dialect.driver = "pg8000"
+    engine.dialect.supports_multivalues_insert = True
+    assert PostgresEngineSpec.get_df_to_sql_method(engine) == "multi"
@@ -145,3 +145,60 @@ def test_get_db_engine_spec(mocker: MockFixture) -> None:
         ).db_engine_spec
         == OldDBEngineSpec
     )
+
+
+def test_get_sqla_engine_with_engine_cache(mocker: MockFixture) -> None:
+    """
+    Saved databases reuse pooled engines when the engine cache is enabled.
+    """
+    from sqlalchemy.pool import NullPool
+
+    from bridge.models.core import Database
+
+    engine_cache_manager = mocker.patch("bridge.models.core.engine_cache_manager")
+    create_engine = mocker.patch("bridge.models.core.create_engine")
+
+    database = Database(id=1, database_name="db", sqlalchemy_uri="sqlite://")
+    engine = database._get_sqla_engine()  # pylint: disable=protected-access
+    assert engine == engine_cache_manager.get_engine.return_value
+    create_engine.assert_not_called()
+
+    # an explicit NullPool bypasses the cache
+    database._get_sqla_engine(nullpool=True)  # pylint: disable=protected-access
+    assert create_engine.call_args[1]["poolclass"] == NullPool
+
+    # as do unsaved databases, eg, when testing a connection
+    engine_cache_manager.get_engine.reset_mock()
+    database = Database(database_name="db", sqlalchemy_uri="sqlite://")
+    database._get_sqla_engine()  # pylint: disable=protected-access
+    engine_cache_manager.get_engine.assert_not_called()
+
+    engine_cache_manager.enabled = False
+    database = Database(id=1, database_name="db", sqlalchemy_uri="sqlite://")
+    database._get_sqla_engine()  # pylint: disable=protected-access
+    engine_cache_manager.get_engine.assert_not_called()
+    assert create_engine.call_args[1]["poolclass"] == NullPool
+
+
+def test_iter_df() -> None:
+    """
+    Test that ``iter_df`` returns the result of a query in chunks.
+    """
+    from bridge.models.core import Database
+
+    database = Database(database_name="my_database", sqlalchemy_uri="sqlite://")
+    sql = (
+        "WITH RECURSIVE t(x) AS (SELECT 1 UNION ALL SELECT x + 1 FROM t WHERE x < 25) "
+        "SELECT x, 'row ' || x AS name FROM t"
+    )
+
+    dfs = list(database.iter_df(sql, chunk_size=10))
+
+    assert [len(df) for df in dfs] == [10, 10, 5]
+    assert all(list(df.columns) == ["x", "name"] for df in dfs)
+    assert [x for df in dfs for x in df["x"]] == list(range(1, 26))
+    assert database.get_df(sql)["x"].tolist() == list(range(1, 26))
+
+    dfs = list(database.iter_df(f"{sql} WHERE x > 100", chunk_size=10))
+    assert len(dfs) == 1
+    assert dfs[0].empty
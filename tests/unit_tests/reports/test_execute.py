@@ -0,0 +1,201 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+import json
+from datetime import datetime
+from io import BytesIO
+from typing import Any, Optional
+from unittest.mock import MagicMock
+from uuid import uuid4
+from zipfile import ZipFile
+
+import pytest
+from flask_appbuilder.security.sqla.models import User
+from pytest_mock import MockFixture
+
+
+def _get_report_state(
+    query_context: Optional[str] = "{}", viz_type: str = "table"
+) -> Any:
+    from bridge.reports.commands.execute import BaseReportState
+
+    report_schedule = MagicMock()
+    report_schedule.force_screenshot = True
+    report_schedule.chart.query_context = query_context
+    report_schedule.chart.params = json.dumps({"viz_type": viz_type})
+    return BaseReportState(MagicMock(), report_schedule, datetime.utcnow(), uuid4())
+
+
+def test_get_chart_data(mocker: MockFixture, app_context: None) -> None:
+    """
+    Test that the chart data is fetched in-process, as the report executor
+    """
+    from bridge.common.chart_data import ChartDataResultFormat
+
+    user = User(id=1, username="executor")
+    mocker.patch("bridge.reports.commands.execute.get_executor", return_value=user)
+    override_user = mocker.patch("bridge.reports.commands.execute.override_user")
+    schema = mocker.patch("bridge.reports.commands.execute.ChartDataQueryContextSchema")
+    command = mocker.patch("bridge.reports.commands.execute.ChartDataCommand")
+    post_process = mocker.patch("bridge.reports.commands.execute.apply_post_process")
+
+    state = _get_report_state(query_context=json.dumps({"queries": [{}]}))
+    result = state._get_chart_data(ChartDataResultFormat.JSON)
+
+    override_user.assert_called_once_with(user)
+    schema.return_value.load.assert_called_once_with(
+        {
+            "queries": [{}],
+            "result_format": "json",
+            "result_type": "post_processed",
+            "force": True,
+        }
+    )
+    command.return_value.validate.assert_called_once()
+    post_process.assert_called_once_with(
+        command.return_value.run.return_value,
+        {"viz_type": "table"},
+        schema.return_value.load.return_value.datasource,
+    )
+    assert result == post_process.return_value
+
+
+def test_get_chart_data_no_query_context(
+    mocker: MockFixture, app_context: None
+) -> None:
+    """
+    Test that a chart without query context is rendered to save it, and that the
+    report fails if it is still missing
+    """
+    from bridge.common.chart_data import ChartDataResultFormat
+    from bridge.reports.commands.exceptions import ReportScheduleChartDataFailedError
+
+    state = _get_report_state(query_context=None)
+    update_query_context = mocker.patch.object(state, "_update_query_context")
+
+    with pytest.raises(ReportScheduleChartDataFailedError):
+        state._get_chart_data(ChartDataResultFormat.CSV)
+    update_query_context.assert_called_once()
+    state._session.refresh.assert_called_once_with(state._report_schedule.chart)
+
+
+def test_get_csv_data(mocker: MockFixture, app_context: None) -> None:
+    """
+    Test that the CSV of a single query is returned as is, and the CSVs of multiple
+    queries are bundled as a zip file
+    """
+    state = _get_report_state()
+    get_chart_data = mocker.patch.object(state, "_get_chart_data")
+
+    get_chart_data.return_value = {"queries": [{"data": "a,b\n1,2\n"}]}
+    assert state._get_csv_data() == b"a,b\n1,2\n"
+
+    get_chart_data.return_value = {"queries": [{"data": "a\n1\n"}, {"data": "b\n2\n"}]}
+    with ZipFile(BytesIO(state._get_csv_data())) as bundle:
+        assert bundle.read("query_1.csv") == b"a\n1\n"
+        assert bundle.read("query_2.csv") == b"b\n2\n"
+
+
+def test_get_csv_data_failures(mocker: MockFixture, app_context: None) -> None:
+    """
+    Test that the errors when fetching the chart data are mapped to report errors
+    """
+    from celery.exceptions import SoftTimeLimitExceeded
+
+    from bridge.reports.commands.exceptions import (
+        ReportScheduleChartDataFailedError,
+        ReportScheduleCsvFailedError,
+        ReportScheduleCsvTimeout,
+    )
+
+    state = _get_report_state()
+    get_chart_data = mocker.patch.object(state, "_get_chart_data")
+
+    get_chart_data.return_value = {"queries": []}
+    with pytest.raises(ReportScheduleCsvFailedError):
+        state._get_csv_data()
+
+    get_chart_data.side_effect = ReportScheduleChartDataFailedError("no context")
+    with pytest.raises(ReportScheduleCsvFailedError, match="no context"):
+        state._get_csv_data()
+
+    get_chart_data.side_effect = SoftTimeLimitExceeded()
+    with pytest.raises(ReportScheduleCsvTimeout):
+        state._get_csv_data()
+
+    get_chart_data.side_effect = Exception("boom")
+    with pytest.raises(ReportScheduleCsvFailedError, match="boom"):
+        state._get_csv_data()
+
+
+def test_get_embedded_data(mocker: MockFixture, app_context: None) -> None:
+    """
+    Test that the post-processed chart data is returned as a DataFrame, with its
+    hierarchical columns and index
+    """
+    state = _get_report_state(viz_type="pivot_table_v2")
+    mocker.patch.object(
+        state,
+        "_get_chart_data",
+        return_value={
+            "queries": [
+                {
+                    "data": {"SUM(num) boy": {"CA": 10}, "SUM(num) girl": {"CA": 20}},
+                    "colnames": [("SUM(num)", "boy"), ("SUM(num)", "girl")],
+                    "indexnames": [("CA",)],
+                    "coltypes": [0, 0],
+                }
+            ]
+        },
+    )
+
+    df = state._get_embedded_data()
+    assert df.columns.tolist() == [("SUM(num)", "boy"), ("SUM(num)", "girl")]
+    assert df.index.tolist() == [("CA",)]
+    assert df.values.tolist() == [[10, 20]]
+
+
+def test_get_embedded_data_failures(mocker: MockFixture, app_context: None) -> None:
+    """
+    Test that the errors when fetching the chart data to embed are reported as
+    dataframe errors, not CSV ones
+    """
+    from celery.exceptions import SoftTimeLimitExceeded
+
+    from bridge.reports.commands.exceptions import (
+        ReportScheduleChartDataFailedError,
+        ReportScheduleDataFrameFailedError,
+        ReportScheduleDataFrameTimeout,
+    )
+
+    state = _get_report_state()
+    get_chart_data = mocker.patch.object(state, "_get_chart_data")
+
+    get_chart_data.return_value = {"queries": []}
+    with pytest.raises(ReportScheduleDataFrameFailedError):
+        state._get_embedded_data()
+
+    get_chart_data.side_effect = ReportScheduleChartDataFailedError("no context")
+    with pytest.raises(ReportScheduleDataFrameFailedError, match="no context"):
+        state._get_embedded_data()
+
+    get_chart_data.side_effect = SoftTimeLimitExceeded()
+    with pytest.raises(ReportScheduleDataFrameTimeout):
+        state._get_embedded_data()
+
+    get_chart_data.side_effect = Exception("boom")
+    with pytest.raises(ReportScheduleDataFrameFailedError, match="boom"):
+        state._get_embedded_data()
@@ -21,6 +21,7 @@
 import numpy as np
 import pandas as pd
 from numpy.core.multiarray import array
+from pytest_mock import MockFixture
 
 from bridge.result_set import stringify_values
 
@@ -106,3 +107,127 @@ def test_stringify_with_null_integers():
     )
 
     assert np.array_equal(result_set, expected)
+
+
+def test_mixed_column_falls_back_to_string() -> None:
+    """
+    Test that only the columns that can't be converted to Arrow are stringified.
+    """
+    from bridge.db_engine_specs.base import BaseEngineSpec
+    from bridge.result_set import BridgeResultSet
+
+    data = [(1, "a", [1, 2]), (2, 1.5, [3]), (3, None, None)]
+    description = [("id",), ("mixed",), ("nested",)]
+    result_set = BridgeResultSet(data, description, BaseEngineSpec)  # type: ignore
+
+    assert result_set.columns == [
+        {"name": "id", "type": "INT", "is_dttm": False},
+        {"name": "mixed", "type": "STRING", "is_dttm": False},
+        {"name": "nested", "type": "STRING", "is_dttm": False},
+    ]
+    assert result_set.to_pandas_df().to_dict(orient="records") == [
+        {"id": 1, "mixed": '"a"', "nested": "[1, 2]"},
+        {"id": 2, "mixed": "1.5", "nested": "[3]"},
+        {"id": 3, "mixed": None, "nested": None},
+    ]
+
+
+def test_arrow_table_data() -> None:
+    """
+    Test that Arrow-native results are used without going through Python tuples.
+    """
+    import pyarrow as pa
+
+    from bridge.db_engine_specs.base import BaseEngineSpec
+    from bridge.result_set import BridgeResultSet
+
+    table = pa.table(
+        {
+            "id": pa.array([1, 2], type=pa.int32()),
+            "name": ["foo", "bar"],
+            "tags": [["a"], ["b", "c"]],
+        }
+    )
+    result_set = BridgeResultSet(table, None, BaseEngineSpec)  # type: ignore
+
+    assert result_set.pa_table.column("id").type == pa.int32()
+    assert result_set.columns == [
+        {"name": "id", "type": "INT", "is_dttm": False},
+        {"name": "name", "type": "STRING", "is_dttm": False},
+        {"name": "tags", "type": "STRING", "is_dttm": False},
+    ]
+    assert result_set.to_pandas_df().to_dict(orient="records") == [
+        {"id": 1, "name": "foo", "tags": '["a"]'},
+        {"id": 2, "name": "bar", "tags": '["b", "c"]'},
+    ]
+
+
+def test_fetch_data_as_arrow(mocker: MockFixture) -> None:
+    """
+    Test that engine specs only fetch Arrow tables when the driver supports it.
+    """
+    import pyarrow as pa
+
+    from bridge.db_engine_specs.base import BaseEngineSpec
+    from bridge.db_engine_specs.duckdb import DuckDBEngineSpec
+
+    cursor = mocker.MagicMock()
+    cursor.fetch_arrow_table.return_value = pa.table({"a": [1, 2, 3]})
+
+    assert BaseEngineSpec.fetch_data_as_arrow(cursor) is None
+    assert DuckDBEngineSpec.fetch_data_as_arrow(cursor, limit=2).num_rows == 2
+
+
+def test_table_from_chunks_types() -> None:
+    """
+    Test that results converted in chunks match results converted at once.
+    """
+    from datetime import datetime
+
+    from bridge.db_engine_specs.base import BaseEngineSpec
+    from bridge.result_set import BridgeResultSet
+
+    rows = [
+        (1, "a", None, None, 1, [1]),
+        (2, "b", None, 1.5, 2, [2]),
+        (None, "c", 3, 2, "x", None),
+        (4, None, None, 2.5, 3, [3]),
+        (5, "e", datetime(2020, 1, 1), 3, 4, [4]),
+    ]
+    cursor_description = [(name, None) for name in "abcdef"]
+    expected = BridgeResultSet(rows, cursor_description, BaseEngineSpec).table
+
+    for chunk_size in range(1, 6):
+        chunks = (
+            rows[start : start + chunk_size]
+            for start in range(0, len(rows), chunk_size)
+        )
+        table = BridgeResultSet.table_from_chunks(chunks, BaseEngineSpec)
+        result_set = BridgeResultSet(table, cursor_description, BaseEngineSpec)
+        assert result_set.table.equals(expected)
+
+
+def test_table_from_chunks_common_types(mocker: MockFixture) -> None:
+    """
+    Test that chunks of different types are cast to a common type, without
+    converting the values of the previous chunks again.
+    """
+    from decimal import Decimal
+
+    from bridge.db_engine_specs.base import BaseEngineSpec
+    from bridge.result_set import BridgeResultSet
+
+    rows = [
+        (index if index % 4 < 2 else index + 0.5, Decimal(index) / 10**index)
+        for index in range(8)
+    ]
+    cursor_description = [("a", None), ("b", None)]
+    expected = BridgeResultSet(rows, cursor_description, BaseEngineSpec).table
+
+    array_from_values = mocker.spy(BridgeResultSet, "_array_from_values")
+    chunks = (rows[start : start + 2] for start in range(0, len(rows), 2))
+    table = BridgeResultSet.table_from_chunks(chunks, BaseEngineSpec)
+    assert array_from_values.call_count == 8
+
+    result_set = BridgeResultSet(table, cursor_description, BaseEngineSpec)
+    assert result_set.table.equals(expected)
@@ -0,0 +1,100 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+# pylint: disable=import-outside-toplevel
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+from flask import g
+from flask_appbuilder.security.sqla.models import Role, User
+from flask_caching.backends import FileSystemCache, NullCache, SimpleCache
+from pytest_mock import MockFixture
+from sqlalchemy.orm import Session
+
+
+def test_get_rls_filters_cache(mocker: MockFixture, tmp_path: Path) -> None:
+    """
+    Test that the RLS filters are memoized per request, and cached across requests
+    until the RLS filters change.
+    """
+    from bridge.extensions import cache_manager, security_manager
+    from bridge.security.manager import RowLevelSecurityFilterRule
+
+    mocker.patch.object(cache_manager, "_cache", FileSystemCache(str(tmp_path)))
+    get_rls_filters = mocker.patch.object(
+        security_manager,
+        "_get_rls_filters",
+        return_value=[RowLevelSecurityFilterRule(1, None, "a = 1")],
+    )
+    table = mocker.MagicMock(id=10)
+    g.user = User(roles=[Role(id=2), Role(id=1)])
+
+    assert security_manager.get_rls_filters(table) == [
+        RowLevelSecurityFilterRule(1, None, "a = 1")
+    ]
+    assert security_manager.get_rls_ids(table) == [1]
+    get_rls_filters.assert_called_once_with([1, 2], 10)
+
+    # a new request reads the filters from the cache
+    g.pop("rls_filters")
+    assert security_manager.get_rls_filters(table) == [
+        RowLevelSecurityFilterRule(1, None, "a = 1")
+    ]
+    get_rls_filters.assert_called_once()
+
+    # other roles or tables are looked up
+    security_manager.get_rls_filters(mocker.MagicMock(id=11))
+    assert get_rls_filters.call_count == 2
+
+    # changing a filter invalidates the cache, once committed
+    session = Session()
+    mocker.patch("bridge.security.manager.object_session", return_value=session)
+    security_manager.invalidate_rls_filters(None, None, None)
+    session.rollback()
+    g.pop("rls_filters")
+    security_manager.get_rls_filters(table)
+    assert get_rls_filters.call_count == 2
+
+    security_manager.invalidate_rls_filters(None, None, None)
+    session.commit()
+    assert "rls_filters" not in g
+    security_manager.get_rls_filters(table)
+    assert get_rls_filters.call_count == 3
+
+
+@pytest.mark.parametrize("cache", [NullCache(), SimpleCache()])
+def test_get_rls_filters_no_shared_cache(mocker: MockFixture, cache: Any) -> None:
+    """
+    Test that the RLS filters are only memoized per request without a shared cache.
+    """
+    from bridge.extensions import cache_manager, security_manager
+
+    mocker.patch.object(cache_manager, "_cache", cache)
+    get_rls_filters = mocker.patch.object(
+        security_manager, "_get_rls_filters", return_value=[]
+    )
+    table = mocker.MagicMock(id=10)
+    g.user = User(roles=[Role(id=1)])
+
+    assert security_manager.get_rls_filters(table) == []
+    assert security_manager.get_rls_filters(table) == []
+    get_rls_filters.assert_called_once_with([1], 10)
+
+    g.pop("rls_filters")
+    security_manager.get_rls_filters(table)
+    assert get_rls_filters.call_count == 2
@@ -0,0 +1,208 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+# pylint: disable=import-outside-toplevel
+
+from pathlib import Path
+
+from flask import g
+from flask_appbuilder.security.sqla.models import (
+    assoc_permissionview_role,
+    Permission,
+    PermissionView,
+    Role,
+    ViewMenu,
+)
+from flask_caching.backends import FileSystemCache, SimpleCache
+from pytest_mock import MockFixture
+from sqlalchemy.orm.session import Session
+
+
+def _permission_view(permission_name: str, view_menu_name: str) -> PermissionView:
+    return PermissionView(
+        permission=Permission(name=permission_name),
+        view_menu=ViewMenu(name=view_menu_name),
+    )
+
+
+def test_permission_index(
+    mocker: MockFixture, session: Session, tmp_path: Path
+) -> None:
+    """
+    Test that the permissions of roles are indexed, and reloaded after the index is
+    invalidated.
+    """
+    from bridge.extensions import cache_manager
+    from bridge.models.core import Database
+    from bridge.security.permission_index import PermissionIndex, RolePermissions
+
+    Database.metadata.create_all(session.get_bind())  # pylint: disable=no-member
+    mocker.patch.object(cache_manager, "_cache", FileSystemCache(str(tmp_path)))
+
+    role = Role(
+        name="role",
+        permissions=[
+            _permission_view("can_read", "Chart"),
+            _permission_view("database_access", "[examples].(id:1)"),
+            _permission_view("schema_access", "[examples].[public]"),
+            _permission_view("datasource_access", "[examples].[birth_names](id:3)"),
+        ],
+    )
+    other_role = Role(name="other_role")
+    session.add_all([role, other_role])
+    session.flush()
+
+    index = PermissionIndex()
+    roles = index.get_roles(session, [role.id])
+    assert roles == [
+        RolePermissions(
+            permissions=frozenset(
+                {
+                    ("can_read", "Chart"),
+                    ("database_access", "[examples].(id:1)"),
+                    ("schema_access", "[examples].[public]"),
+                    ("datasource_access", "[examples].[birth_names](id:3)"),
+                }
+            ),
+            view_menus={
+                "can_read": frozenset({"Chart"}),
+                "database_access": frozenset({"[examples].(id:1)"}),
+                "schema_access": frozenset({"[examples].[public]"}),
+                "datasource_access": frozenset({"[examples].[birth_names](id:3)"}),
+            },
+            database_ids=frozenset({1}),
+            datasource_ids=frozenset({3}),
+            schema_perms=frozenset({"[examples].[public]"}),
+        )
+    ]
+    assert index.has_permission(session, [other_role.id, role.id], "can_read", "Chart")
+    assert not index.has_permission(session, [other_role.id], "can_read", "Chart")
+    assert index.view_menu_names(
+        session, [role.id, other_role.id], "schema_access"
+    ) == {"[examples].[public]"}
+
+    # changing the permissions of a role invalidates the index, once committed
+    other_role.permissions.append(_permission_view("can_write", "Dashboard"))
+    session.flush()
+    assert not index.has_permission(session, [other_role.id], "can_write", "Dashboard")
+    session.commit()
+    assert index.has_permission(session, [other_role.id], "can_write", "Dashboard")
+
+    # changes which are rolled back don't
+    roles = index.get_roles(session, [role.id])
+    role.permissions.append(_permission_view("can_export", "Report"))
+    session.flush()
+    session.rollback()
+    g.pop("permission_index_version")
+    assert index.get_roles(session, [role.id])[0] is roles[0]
+
+
+def test_permission_index_invalidated_by_other_process(
+    mocker: MockFixture, session: Session, tmp_path: Path
+) -> None:
+    """
+    Test that the index is reloaded when another process invalidated it.
+    """
+    from bridge.extensions import cache_manager
+    from bridge.models.core import Database
+    from bridge.security.permission_index import PermissionIndex
+
+    Database.metadata.create_all(session.get_bind())  # pylint: disable=no-member
+    mocker.patch.object(cache_manager, "_cache", FileSystemCache(str(tmp_path)))
+
+    role = Role(name="role")
+    session.add(role)
+    session.flush()
+
+    index, other_index = PermissionIndex(), PermissionIndex()
+    assert not index.has_permission(session, [role.id], "can_read", "Chart")
+
+    # grant the permission without triggering the role events
+    permission_view = _permission_view("can_read", "Chart")
+    session.add(permission_view)
+    session.flush()
+    session.execute(
+        assoc_permissionview_role.insert().values(
+            permission_view_id=permission_view.id, role_id=role.id
+        )
+    )
+
+    # the version is checked once per request
+    g.pop("permission_index_version")
+    assert not index.has_permission(session, [role.id], "can_read", "Chart")
+
+    other_index.invalidate()
+    g.pop("permission_index_version", None)
+    assert index.has_permission(session, [role.id], "can_read", "Chart")
+
+
+def test_permission_index_version_timeout(
+    mocker: MockFixture, session: Session, tmp_path: Path
+) -> None:
+    """
+    Test that the index is reloaded once its version expires.
+    """
+    from bridge.extensions import cache_manager
+    from bridge.models.core import Database
+    from bridge.security.permission_index import (
+        PERMISSION_INDEX_VERSION_CACHE_KEY,
+        PermissionIndex,
+    )
+
+    Database.metadata.create_all(session.get_bind())  # pylint: disable=no-member
+    cache = FileSystemCache(str(tmp_path))
+    mocker.patch.object(cache_manager, "_cache", cache)
+    add = mocker.spy(cache, "add")
+
+    role = Role(name="role")
+    session.add(role)
+    session.flush()
+
+    index = PermissionIndex()
+    roles = index.get_roles(session, [role.id])
+    add.assert_called_once_with(PERMISSION_INDEX_VERSION_CACHE_KEY, mocker.ANY, 300)
+
+    g.pop("permission_index_version")
+    assert index.get_roles(session, [role.id])[0] is roles[0]
+
+    cache.delete(PERMISSION_INDEX_VERSION_CACHE_KEY)
+    g.pop("permission_index_version")
+    assert index.get_roles(session, [role.id])[0] is not roles[0]
+
+
+def test_permission_index_not_shared_cache(
+    mocker: MockFixture, session: Session
+) -> None:
+    """
+    Test that the index only lives for a request when the cache isn't shared.
+    """
+    from bridge.extensions import cache_manager
+    from bridge.models.core import Database
+    from bridge.security.permission_index import PermissionIndex
+
+    Database.metadata.create_all(session.get_bind())  # pylint: disable=no-member
+    mocker.patch.object(cache_manager, "_cache", SimpleCache())
+
+    role = Role(name="role")
+    session.add(role)
+    session.flush()
+
+    index = PermissionIndex()
+    roles = index.get_roles(session, [role.id])
+    assert index.get_roles(session, [role.id])[0] is roles[0]
+
+    g.pop("permission_index_version")
+    assert index.get_roles(session, [role.id])[0] is not roles[0]
@@ -16,6 +16,9 @@
 # under the License.
 # pylint: disable=import-outside-toplevel, invalid-name, unused-argument, too-many-locals
 
+from typing import Any, Dict
+
+import pytest
 import sqlparse
 from pytest_mock import MockerFixture
 from sqlalchemy.orm.session import Session
@@ -39,11 +42,13 @@ def test_execute_sql_statement(mocker: MockerFixture, app: None) -> None:
     database.apply_limit_to_sql.return_value = "SELECT 42 AS answer LIMIT 2"
     db_engine_spec = database.db_engine_spec
     db_engine_spec.is_select_query.return_value = True
+    db_engine_spec.fetch_data_as_arrow.return_value = None
     db_engine_spec.fetch_data.return_value = [(42,)]
 
     session = mocker.MagicMock()
     cursor = mocker.MagicMock()
     BridgeResultSet = mocker.patch("bridge.sql_lab.BridgeResultSet")
+    mocker.patch("bridge.sql_lab.SQLLAB_FETCH_CHUNK_SIZE", 0)
 
     execute_sql_statement(
         sql_statement,
@@ -61,6 +66,114 @@ def test_execute_sql_statement(mocker: MockerFixture, app: None) -> None:
     BridgeResultSet.assert_called_with([(42,)], cursor.description, db_engine_spec)
 
 
+def test_execute_sql_statement_fetch_chunks(mocker: MockerFixture, app: None) -> None:
+    """
+    Test that `execute_sql_statement` fetches results in chunks up to the limit.
+    """
+    from bridge.sql_lab import execute_sql_statement
+
+    query = mocker.MagicMock()
+    query.limit = 4
+    query.select_as_cta_used = False
+    database = query.database
+    database.allow_dml = False
+    database.apply_limit_to_sql.return_value = "SELECT a FROM t LIMIT 5"
+    db_engine_spec = database.db_engine_spec
+    db_engine_spec.is_select_query.return_value = True
+    db_engine_spec.fetch_data_as_arrow.return_value = None
+    db_engine_spec.fetch_data_chunks.return_value = iter(
+        [[(0,), (1,)], [(2,), (3,)], [(4,), (5,)], [(6,)]]
+    )
+    db_engine_spec.get_datatype.return_value = None
+    cursor = mocker.MagicMock()
+    cursor.description = [("a", "int")]
+    mocker.patch("bridge.sql_lab.SQLLAB_FETCH_CHUNK_SIZE", 2)
+
+    result_set = execute_sql_statement(
+        "SELECT a FROM t",
+        query,
+        session=mocker.MagicMock(),
+        cursor=cursor,
+        log_params={},
+        apply_ctas=False,
+    )
+
+    db_engine_spec.fetch_data_chunks.assert_called_with(cursor, 2)
+    db_engine_spec.fetch_data.assert_not_called()
+    assert result_set.to_pandas_df()["a"].tolist() == [0, 1, 2, 3]
+
+
+def test_execute_sql_statement_fetch_max_row(mocker: MockerFixture, app: None) -> None:
+    """
+    Test that rows of statements not limited in SQL are capped to `SQL_MAX_ROW`.
+    """
+    from bridge.sql_lab import execute_sql_statement
+    from bridge.sqllab.limiting_factor import LimitingFactor
+
+    query = mocker.MagicMock()
+    query.limit = None
+    query.select_as_cta_used = False
+    database = query.database
+    database.allow_dml = True
+    db_engine_spec = database.db_engine_spec
+    db_engine_spec.is_select_query.return_value = False
+    db_engine_spec.fetch_data_as_arrow.return_value = None
+    db_engine_spec.fetch_data_chunks.return_value = iter(
+        [[("a",), ("b",)], [("c",), ("d",)], [("e",)]]
+    )
+    db_engine_spec.get_datatype.return_value = None
+    cursor = mocker.MagicMock()
+    cursor.description = [("name", "string")]
+    mocker.patch("bridge.sql_lab.SQL_MAX_ROW", 2)
+
+    result_set = execute_sql_statement(
+        "SHOW TABLES",
+        query,
+        session=mocker.MagicMock(),
+        cursor=cursor,
+        log_params={},
+        apply_ctas=False,
+    )
+
+    assert result_set.to_pandas_df()["name"].tolist() == ["a", "b"]
+    assert query.limiting_factor == LimitingFactor.DROPDOWN
+
+
+def test_execute_sql_statements_dedicated_connection(
+    mocker: MockerFixture, app: None
+) -> None:
+    """
+    Test that SQL Lab statements don't run on a connection from the engine cache.
+    """
+    from bridge.sql_lab import execute_sql_statements
+    from bridge.utils.core import QuerySource
+
+    query = mocker.MagicMock()
+    query.select_as_cta = False
+    query.schema = "public"
+    database = query.database
+    database.allow_run_async = False
+    database.db_engine_spec.run_multiple_statements_as_one = False
+    database.get_sqla_engine_with_context.side_effect = RuntimeError("stop")
+    mocker.patch("bridge.sql_lab.get_query", return_value=query)
+
+    with pytest.raises(RuntimeError, match="stop"):
+        execute_sql_statements(
+            query_id=1,
+            rendered_query="SET search_path TO other",
+            return_results=True,
+            store_results=False,
+            session=mocker.MagicMock(),
+            start_time=None,
+            expand_data=False,
+            log_params=None,
+        )
+
+    database.get_sqla_engine_with_context.assert_called_once_with(
+        "public", nullpool=True, source=QuerySource.SQL_LAB
+    )
+
+
 def test_execute_sql_statement_with_rls(
     mocker: MockerFixture,
 ) -> None:
@@ -81,11 +194,13 @@ def test_execute_sql_statement_with_rls(
     )
     db_engine_spec = database.db_engine_spec
     db_engine_spec.is_select_query.return_value = True
+    db_engine_spec.fetch_data_as_arrow.return_value = None
     db_engine_spec.fetch_data.return_value = [(42,)]
 
     session = mocker.MagicMock()
     cursor = mocker.MagicMock()
     BridgeResultSet = mocker.patch("bridge.sql_lab.BridgeResultSet")
+    mocker.patch("bridge.sql_lab.SQLLAB_FETCH_CHUNK_SIZE", 0)
     mocker.patch(
         "bridge.sql_lab.insert_rls",
         return_value=sqlparse.parse("SELECT * FROM sales WHERE organization_id=42")[0],
@@ -216,3 +331,173 @@ def test_sql_lab_insert_rls(
 |  3 |   9 |""".strip()
     )
     assert query.executed_sql == "SELECT c FROM t WHERE (t.c > 5)\nLIMIT 6"
+
+
+def test_serialize_and_expand_data_arrow_pages(
+    mocker: MockerFixture, app: None
+) -> None:
+    """
+    Test that results stored as Arrow IPC can be read back one page at a time.
+    """
+    from bridge.db_engine_specs.base import BaseEngineSpec
+    from bridge.result_set import BridgeResultSet
+    from bridge.sql_lab import _serialize_and_expand_data, _serialize_payload, config
+    from bridge.sqllab.utils import (
+        compress_results_payload,
+        decompress_results_payload,
+        is_arrow_ipc_data,
+    )
+    from bridge.views.utils import _deserialize_results_payload
+
+    mocker.patch.dict(
+        config,
+        {
+            "RESULTS_BACKEND_ARROW_BATCH_SIZE": 3,
+            "RESULTS_BACKEND_ARROW_COMPRESSION": "zstd",
+        },
+    )
+    db_engine_spec = BaseEngineSpec()
+    result_set = BridgeResultSet(
+        [(i, f"name_{i}") for i in range(10)],
+        (("id", "int"), ("name", "string")),
+        db_engine_spec,
+    )
+    data, selected_columns, all_columns, expanded_columns = _serialize_and_expand_data(
+        result_set, db_engine_spec, use_msgpack=True
+    )
+    assert is_arrow_ipc_data(data)
+
+    blob = compress_results_payload(
+        _serialize_payload(
+            {
+                "data": data,
+                "columns": all_columns,
+                "selected_columns": selected_columns,
+                "expanded_columns": expanded_columns,
+            },
+            use_msgpack=True,
+        ),
+        use_arrow_data=True,
+    )
+    query = mocker.MagicMock()
+    query.database.db_engine_spec = db_engine_spec
+
+    def get_payload(**kwargs: Any) -> Dict[str, Any]:
+        return _deserialize_results_payload(
+            decompress_results_payload(blob, use_msgpack=True), query, True, **kwargs
+        )
+
+    assert len(get_payload()["data"]) == 10
+    assert get_payload(offset=2, limit=4)["data"] == [
+        {"id": i, "name": f"name_{i}"} for i in range(2, 6)
+    ]
+    assert get_payload(offset=9, limit=4)["data"] == [{"id": 9, "name": "name_9"}]
+    assert get_payload(offset=12)["data"] == []
+    assert get_payload(limit=0)["data"] == []
+
+
+def test_deserialize_legacy_results_payload(mocker: MockerFixture, app: None) -> None:
+    """
+    Test that zlib compressed JSON payloads can still be read and sliced.
+    """
+    import simplejson as json
+
+    from bridge.sqllab.utils import compress_results_payload, decompress_results_payload
+    from bridge.views.utils import _deserialize_results_payload
+
+    blob = compress_results_payload(json.dumps({"data": [{"a": i} for i in range(5)]}))
+    payload = decompress_results_payload(blob, use_msgpack=False)
+    assert _deserialize_results_payload(
+        payload, mocker.MagicMock(), False, offset=1, limit=2
+    ) == {"data": [{"a": 1}, {"a": 2}]}
+
+
+def test_deserialize_arrow_table_projection_and_order() -> None:
+    """
+    Test reading a sorted page of a subset of the columns of stored results.
+    """
+    import pyarrow as pa
+
+    from bridge.sqllab.utils import deserialize_arrow_table, serialize_arrow_table
+
+    table = pa.table(
+        {
+            "id": [5, 3, None, 9, 1, 7, 2],
+            "name": ["a", "b", "c", "d", "e", "f", "g"],
+            "value": [1.5] * 7,
+        }
+    )
+    data = serialize_arrow_table(table, batch_size=2, compression="lz4")
+
+    assert deserialize_arrow_table(data, 1, 3, columns=["name"]).to_pydict() == {
+        "name": ["b", "c", "d"]
+    }
+    assert deserialize_arrow_table(
+        data, columns=["name", "id"], order_by="id"
+    ).to_pydict() == {
+        "name": ["e", "g", "b", "a", "f", "d", "c"],
+        "id": [1, 2, 3, 5, 7, 9, None],
+    }
+    assert deserialize_arrow_table(
+        data, 1, 3, columns=["name"], order_by="id", order_desc=True
+    ).to_pydict() == {"name": ["f", "a", "b"]}
+    assert deserialize_arrow_table(data, 10, 3, order_by="id").num_rows == 0
+
+
+def test_deserialize_json_results_payload_projection(
+    mocker: MockerFixture, app: None
+) -> None:
+    """
+    Test sorting and projecting JSON results, and rejecting unknown columns.
+    """
+    import simplejson as json
+
+    from bridge.exceptions import InvalidPayloadFormatError
+    from bridge.views.utils import _deserialize_results_payload
+
+    payload = json.dumps(
+        {
+            "columns": [{"name": "a"}, {"name": "b"}],
+            "data": [{"a": 2, "b": "x"}, {"a": None, "b": "y"}, {"a": 1, "b": "z"}],
+        }
+    )
+    assert _deserialize_results_payload(
+        payload, mocker.MagicMock(), False, columns=["b"], order_by="a"
+    ) == {
+        "columns": [{"name": "b"}],
+        "data": [{"b": "z"}, {"b": "x"}, {"b": "y"}],
+    }
+    with pytest.raises(InvalidPayloadFormatError):
+        _deserialize_results_payload(payload, mocker.MagicMock(), False, columns=["c"])
+
+
+def test_deserialize_json_results_payload_mixed_types(
+    mocker: MockerFixture, app: None
+) -> None:
+    """
+    Test sorting JSON results by a column holding values of different types.
+    """
+    import simplejson as json
+
+    from bridge.views.utils import _deserialize_results_payload
+
+    payload = json.dumps(
+        {
+            "columns": [{"name": "a"}],
+            "data": [{"a": "b"}, {"a": 2.5}, {"a": None}, {"a": 1}, {"a": True}],
+        }
+    )
+    result = _deserialize_results_payload(
+        payload, mocker.MagicMock(), False, order_by="a"
+    )
+    assert result["data"] == [
+        {"a": 1},
+        {"a": True},
+        {"a": 2.5},
+        {"a": "b"},
+        {"a": None},
+    ]
+    result = _deserialize_results_payload(
+        payload, mocker.MagicMock(), False, order_by="a", order_desc=True
+    )
+    assert [row["a"] for row in result["data"]] == ["b", 2.5, 1, True, None]
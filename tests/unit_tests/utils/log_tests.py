@@ -16,6 +16,10 @@
 # under the License.
 
 
+from pytest_mock import MockFixture
+from sqlalchemy import create_engine, select
+from sqlalchemy.pool import StaticPool
+
 from bridge.utils.log import get_logger_from_status
 
 
@@ -35,3 +39,49 @@ def test_log_from_status_info() -> None:
     (func, log_level) = get_logger_from_status(300)
     assert func.__name__ == "info"
     assert log_level == "info"
+
+
+def test_async_db_event_logger(mocker: MockFixture) -> None:
+    """
+    Test that the logs are written in batches by the background thread, and that
+    the buffered logs are written on shutdown.
+    """
+    from bridge.models.core import Log
+    from bridge.utils.log import AsyncDBEventLogger
+
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Log.__table__.create(engine)
+    get_session = mocker.patch("flask_appbuilder.AppBuilder.get_session")
+    get_session.get_bind.return_value = engine
+
+    event_logger = AsyncDBEventLogger(batch_size=2, flush_interval=0.05)
+    event_logger.log(1, "action", None, 10, 2, None, records=[{"a": 1}, {"b": 2}])
+    event_logger.log(1, "action", None, 10, 2, None, records=[{"c": 3}])
+    event_logger.shutdown()
+
+    with engine.connect() as connection:
+        rows = connection.execute(
+            select([Log.__table__.c.json, Log.__table__.c.slice_id])
+        ).fetchall()
+    assert sorted(row[0] for row in rows) == ['{"a": 1}', '{"b": 2}', '{"c": 3}']
+    assert {row[1] for row in rows} == {2}
+    assert event_logger.logged == 3
+    assert event_logger.dropped == 0
+
+
+def test_async_db_event_logger_full_queue(mocker: MockFixture) -> None:
+    """
+    Test that logs are dropped, and counted, when the queue is full.
+    """
+    from bridge.utils.log import AsyncDBEventLogger
+
+    event_logger = AsyncDBEventLogger(max_queue_size=2, batch_size=2)
+    mocker.patch.object(event_logger, "_ensure_started")
+
+    event_logger.log(1, "action", None, 10, None, None, records=[{}, {}, {}])
+    assert event_logger.dropped == 1
+    assert len(event_logger._get_batch()) == 2
@@ -0,0 +1,120 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+# pylint: disable=import-outside-toplevel
+from datetime import date, datetime
+from decimal import Decimal
+
+import pandas as pd
+import pytest
+from flask import Flask
+from pytest_mock import MockFixture
+
+
+@pytest.mark.parametrize("compression", ["lz4", "zstd", None])
+def test_arrow_codec_round_trip(compression: str) -> None:
+    """
+    Test that DataFrames round-trip through the Arrow codec
+    """
+    from bridge.utils.cache_codecs import ArrowDataFrameCodec
+
+    df = pd.DataFrame(
+        {
+            "int": [1, 2, 3],
+            "float": [1.5, None, 3.0],
+            "str": ["a", None, "c"],
+            "bool": [True, False, None],
+            "dttm": pd.to_datetime(["2022-01-01", None, "2022-01-03"]),
+            "dttm_tz": pd.to_datetime(["2022-01-01", None, "2022-01-03"], utc=True),
+            "date": [date(2022, 1, 1), None, date(2022, 1, 3)],
+            "decimal": [Decimal("1.10"), None, Decimal("3.30")],
+            "empty": [None, None, None],
+        },
+        index=pd.Index(["x", "y", "z"], name="idx"),
+    )
+    codec = ArrowDataFrameCodec(compression=compression)
+
+    payload = codec.encode(df)
+
+    assert isinstance(payload, bytes)
+    pd.testing.assert_frame_equal(codec.decode(payload), df)
+
+
+def test_arrow_codec_round_trip_object_integers() -> None:
+    """
+    Test that object columns of integers, eg with nulls as built by the result set,
+    round-trip without being cast to floats
+    """
+    from bridge.utils.cache_codecs import ArrowDataFrameCodec
+
+    df = pd.DataFrame(
+        {
+            "nullable": pd.Series([1, None, 10**18 + 1], dtype=object),
+            "not_null": pd.Series([1, 2, 10**18 + 1], dtype=object),
+        }
+    )
+    codec = ArrowDataFrameCodec()
+
+    decoded = codec.decode(codec.encode(df))
+
+    pd.testing.assert_frame_equal(decoded, df)
+    assert decoded["nullable"].tolist() == [1, None, 10**18 + 1]
+
+
+def test_encode_dataframe(app: Flask) -> None:
+    """
+    Test that DataFrames are encoded with the Arrow codec by default
+    """
+    from bridge.utils.cache_codecs import decode_dataframe, encode_dataframe
+
+    df = pd.DataFrame({"a": range(100), "b": [datetime(2022, 1, 1)] * 100})
+
+    codec_name, payload = encode_dataframe(df)
+
+    assert codec_name == "arrow"
+    pd.testing.assert_frame_equal(decode_dataframe(payload, codec_name), df)
+
+
+@pytest.mark.parametrize(
+    "df",
+    [
+        pd.DataFrame(),
+        pd.DataFrame({0: [1], 1: [2]}),
+        pd.DataFrame([[1, 2]], columns=["a", "a"]),
+        pd.DataFrame({"a": [[1, 2], [3]]}),
+        pd.DataFrame({"a": [1, "b"]}),
+    ],
+)
+def test_encode_dataframe_fallback(app: Flask, df: pd.DataFrame) -> None:
+    """
+    Test that DataFrames Arrow can't represent faithfully are pickled
+    """
+    from bridge.utils.cache_codecs import encode_dataframe
+
+    assert encode_dataframe(df) == ("pickle", df)
+
+
+def test_encode_dataframe_pickle(mocker: MockFixture, app: Flask) -> None:
+    """
+    Test that the codec is configurable and that legacy values are unpickled
+    """
+    from bridge.utils.cache_codecs import decode_dataframe, encode_dataframe
+
+    df = pd.DataFrame({"a": [1, 2]})
+    mocker.patch.dict(app.config, {"DATA_CACHE_DATAFRAME_CODEC": "pickle"})
+
+    assert encode_dataframe(df) == ("pickle", df)
+    assert decode_dataframe(df) is df
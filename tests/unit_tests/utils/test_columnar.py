@@ -0,0 +1,106 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+# pylint: disable=import-outside-toplevel
+from datetime import date, datetime
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import simplejson
+
+
+def get_df() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "dttm": pd.to_datetime(["2022-01-01", None]),
+            "dttm_tz": pd.to_datetime(["2022-01-01", None]).tz_localize("US/Pacific"),
+            "date": [date(2022, 1, 1), None],
+            "float": [1.5, np.nan],
+            "int": [1, 2],
+            "bool": [True, False],
+            "str": ["a", None],
+            "mixed": [1, "a"],
+        }
+    )
+
+
+def test_df_to_columnar_json() -> None:
+    """
+    Test that the columns are encoded like the records of the row oriented format
+    """
+    from bridge.utils.columnar import df_to_columnar_json
+    from bridge.utils.core import json_int_dttm_ser
+
+    df = get_df()
+
+    columns = simplejson.loads(simplejson.dumps(df_to_columnar_json(df)))
+    records = simplejson.loads(
+        simplejson.dumps(
+            df.to_dict(orient="records"),
+            default=json_int_dttm_ser,
+            ignore_nan=True,
+        )
+    )
+
+    assert list(columns) == list(df.columns)
+    assert columns == {
+        column: [record[column] for record in records] for column in df.columns
+    }
+    assert columns["dttm"] == [1640995200000, None]
+
+
+def test_df_to_columnar_json_empty() -> None:
+    """
+    Test that the columns of an empty DataFrame are encoded as empty arrays
+    """
+    from bridge.utils.columnar import df_to_columnar_json
+
+    df = pd.DataFrame({"a": pd.Series([], dtype="float"), "b": []})
+
+    assert simplejson.dumps(df_to_columnar_json(df)) == '{"a": [], "b": []}'
+
+
+def test_df_to_arrow_stream() -> None:
+    """
+    Test that DataFrames are encoded as an Arrow IPC stream, mixed columns as
+    strings
+    """
+    from bridge.utils.columnar import df_to_arrow_stream
+
+    df = get_df()
+
+    with pa.ipc.open_stream(df_to_arrow_stream(df)) as reader:
+        table = reader.read_all()
+
+    assert table.column_names == list(df.columns)
+    assert table.schema.field("dttm").type == pa.timestamp("ns")
+    assert table.schema.field("date").type == pa.date32()
+    assert table.schema.field("float").type == pa.float64()
+    assert table.schema.field("mixed").type == pa.string()
+    assert table.to_pydict() == {
+        "dttm": [datetime(2022, 1, 1), None],
+        "dttm_tz": [
+            pd.Timestamp("2022-01-01", tz="US/Pacific").to_pydatetime(),
+            None,
+        ],
+        "date": [date(2022, 1, 1), None],
+        "float": [1.5, None],
+        "int": [1, 2],
+        "bool": [True, False],
+        "str": ["a", None],
+        "mixed": ["1", "a"],
+    }
@@ -0,0 +1,134 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+# pylint: disable=import-outside-toplevel
+import threading
+import time
+from typing import List
+
+import pytest
+from flask import current_app, Flask, g
+from pytest_mock import MockFixture
+
+
+def test_map_concurrently(app: Flask) -> None:
+    """
+    Test that items are processed on worker threads, results keeping their order
+    """
+    from bridge.utils.concurrency import map_concurrently
+
+    def square(item: int) -> int:
+        time.sleep(0.01 * (5 - item))
+        assert threading.current_thread() is not threading.main_thread()
+        return item * item
+
+    assert map_concurrently(square, range(5)) == [0, 1, 4, 9, 16]
+
+
+def test_map_concurrently_serial(mocker: MockFixture, app: Flask) -> None:
+    """
+    Test that items are processed serially when concurrency is disabled
+    """
+    from bridge.utils.concurrency import map_concurrently
+
+    mocker.patch.dict(app.config, {"DATA_QUERY_MAX_WORKERS": 1})
+    threads = map_concurrently(lambda _: threading.current_thread(), range(3))
+
+    assert threads == [threading.main_thread()] * 3
+
+
+def test_map_concurrently_context(app: Flask) -> None:
+    """
+    Test that the app, request and user context are available in worker threads
+    """
+    from bridge.utils.concurrency import map_concurrently
+
+    with app.test_request_context("/?foo=bar"):
+        g.user = "admin"
+
+        def get_context(_: int) -> List[str]:
+            from flask import request
+
+            assert current_app._get_current_object() is app
+            return [g.user, request.args["foo"]]
+
+        assert map_concurrently(get_context, range(2)) == [["admin", "bar"]] * 2
+
+
+def test_map_concurrently_error(app: Flask) -> None:
+    """
+    Test that the error of the first failed item is raised, once all items are done
+    """
+    from bridge.utils.concurrency import map_concurrently
+
+    done: List[int] = []
+
+    def fail(item: int) -> int:
+        if item in (1, 2):
+            time.sleep(0.01 * (2 - item))
+            raise ValueError(item)
+        time.sleep(0.05)
+        done.append(item)
+        return item
+
+    with pytest.raises(ValueError, match="1"):
+        map_concurrently(fail, range(4))
+    assert sorted(done) == [0, 3]
+
+
+def test_map_concurrently_database_limit(mocker: MockFixture, app: Flask) -> None:
+    """
+    Test that concurrent queries against a database are bounded
+    """
+    from bridge.utils import concurrency
+
+    mocker.patch.dict(
+        app.config,
+        {"DATA_QUERY_MAX_WORKERS": 4, "DATA_QUERY_MAX_CONCURRENCY_PER_DATABASE": 2},
+    )
+    mocker.patch.dict(concurrency._database_semaphores, clear=True)
+    lock = threading.Lock()
+    running: List[int] = []
+    max_running: List[int] = []
+
+    def query(item: int) -> int:
+        with lock:
+            running.append(item)
+            max_running.append(len(running))
+        time.sleep(0.02)
+        with lock:
+            running.remove(item)
+        return item
+
+    assert concurrency.map_concurrently(query, range(6), database_id=1) == list(
+        range(6)
+    )
+    assert max(max_running) == 2
+
+
+def test_map_concurrently_nested(app: Flask) -> None:
+    """
+    Test that nested calls run in the worker thread of the outer call
+    """
+    from bridge.utils.concurrency import map_concurrently
+
+    def outer(_: int) -> bool:
+        thread = threading.current_thread()
+        return map_concurrently(
+            lambda _: threading.current_thread() is thread, range(2)
+        ) == [True, True]
+
+    assert map_concurrently(outer, range(2)) == [True, True]
@@ -0,0 +1,122 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+# pylint: disable=protected-access, redefined-outer-name
+from typing import Iterator
+
+import pytest
+from pytest_mock import MockFixture
+from sqlalchemy.engine.url import make_url
+from sqlalchemy.pool import NullPool, QueuePool
+
+from bridge.utils.engine_cache_manager import EngineCacheManager
+
+
+@pytest.fixture
+def engine_cache_manager(mocker: MockFixture) -> Iterator[EngineCacheManager]:
+    manager = EngineCacheManager()
+    manager._enabled = True
+    manager._max_size = 2
+    manager._pool_options = {"pool_size": 3, "max_overflow": 1, "pool_pre_ping": True}
+    manager._stats_logger = mocker.MagicMock()
+    yield manager
+    manager.invalidate()
+
+
+def test_get_engine_reuses_engines(engine_cache_manager: EngineCacheManager) -> None:
+    """
+    Engines are reused for the same database, URL and params.
+    """
+    url = make_url("sqlite://")
+    engine = engine_cache_manager.get_engine(1, url, {})
+
+    assert engine_cache_manager.get_engine(1, make_url("sqlite://"), {}) is engine
+    assert engine_cache_manager.get_engine(2, url, {}) is not engine
+    other_url = make_url("sqlite:///a.db")
+    assert engine_cache_manager.get_engine(1, other_url, {}) is not engine
+    engine_cache_manager._stats_logger.incr.assert_any_call("engine_cache.hit")
+    engine_cache_manager._stats_logger.incr.assert_any_call("engine_cache.miss")
+
+
+def test_get_engine_params(engine_cache_manager: EngineCacheManager) -> None:
+    """
+    Pool options are only applied to QueuePool based engines, database params win.
+    """
+    sqlite_engine = engine_cache_manager.get_engine(1, make_url("sqlite://"), {})
+    queue_engine = engine_cache_manager.get_engine(
+        1,
+        make_url("sqlite:///a.db"),
+        {"poolclass": QueuePool, "pool_size": 7},
+    )
+    null_engine = engine_cache_manager.get_engine(
+        2, make_url("sqlite://"), {"poolclass": NullPool}
+    )
+
+    assert not isinstance(sqlite_engine.pool, QueuePool)
+    assert sqlite_engine.pool._pre_ping
+    assert queue_engine.pool.size() == 7
+    assert queue_engine.pool._max_overflow == 1
+    assert isinstance(null_engine.pool, NullPool)
+
+
+def test_get_engine_evicts_lru(
+    mocker: MockFixture, engine_cache_manager: EngineCacheManager
+) -> None:
+    """
+    The least recently used engine is disposed when the cache is full.
+    """
+    first = engine_cache_manager.get_engine(1, make_url("sqlite://"), {})
+    second = engine_cache_manager.get_engine(2, make_url("sqlite://"), {})
+    dispose = mocker.patch.object(second, "dispose")
+
+    engine_cache_manager.get_engine(1, make_url("sqlite://"), {})
+    engine_cache_manager.get_engine(3, make_url("sqlite://"), {})
+
+    dispose.assert_called_once()
+    assert engine_cache_manager.get_engine(1, make_url("sqlite://"), {}) is first
+    engine_cache_manager._stats_logger.incr.assert_any_call("engine_cache.evict")
+
+
+def test_invalidate(
+    mocker: MockFixture, engine_cache_manager: EngineCacheManager
+) -> None:
+    """
+    Invalidating a database disposes all of its engines.
+    """
+    first = engine_cache_manager.get_engine(1, make_url("sqlite://"), {})
+    second = engine_cache_manager.get_engine(2, make_url("sqlite://"), {})
+    dispose_first = mocker.patch.object(first, "dispose")
+    dispose_second = mocker.patch.object(second, "dispose")
+
+    engine_cache_manager.invalidate(1)
+
+    dispose_first.assert_called_once()
+    dispose_second.assert_not_called()
+    assert engine_cache_manager.get_engine(1, make_url("sqlite://"), {}) is not first
+    assert engine_cache_manager.get_engine(2, make_url("sqlite://"), {}) is second
+
+
+def test_pool_metrics(engine_cache_manager: EngineCacheManager) -> None:
+    """
+    Pool checkouts are reported to the stats logger.
+    """
+    engine = engine_cache_manager.get_engine(1, make_url("sqlite://"), {})
+    with engine.connect():
+        pass
+
+    engine_cache_manager._stats_logger.incr.assert_any_call("engine_pool.connect")
+    engine_cache_manager._stats_logger.incr.assert_any_call("engine_pool.checkout")
+    engine_cache_manager._stats_logger.incr.assert_any_call("engine_pool.checkin")
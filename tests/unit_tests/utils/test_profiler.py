@@ -0,0 +1,120 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator
+
+from werkzeug.routing import Map, Rule
+from werkzeug.test import Client
+from werkzeug.wrappers import Response
+
+from bridge.utils.profiler import BridgeProfiler, SamplingProfiler
+
+
+def busy() -> None:
+    end = time.monotonic() + 0.02
+    while time.monotonic() < end:
+        pass
+
+
+def test_sampling_profiler(tmp_path: Path) -> None:
+    """
+    Test that the sampled stacks are aggregated per key, and exported as collapsed
+    stacks and speedscope files.
+    """
+    profiler = SamplingProfiler(
+        sample_rate=1, interval=0.001, output_dir=str(tmp_path), export_interval=60
+    )
+    for _ in range(2):
+        stop = profiler.start("Chart.data")
+        assert stop is not None
+        busy()
+        stop()
+    profiler.export()
+
+    name = f"Chart.data-{os.getpid()}"
+    collapsed = (tmp_path / f"{name}.collapsed").read_text().splitlines()
+    assert collapsed
+    assert any(
+        "test_sampling_profiler (" in line and ";busy (" in line for line in collapsed
+    )
+    assert all(int(line.rsplit(" ", 1)[1]) >= 0 for line in collapsed)
+
+    speedscope = json.loads((tmp_path / f"{name}.speedscope.json").read_text())
+    assert speedscope["name"] == "Chart.data"
+    frames = speedscope["shared"]["frames"]
+    assert "busy" in {frame["name"] for frame in frames}
+    (profile,) = speedscope["profiles"]
+    assert profile["type"] == "sampled"
+    assert profile["unit"] == "microseconds"
+    assert len(profile["samples"]) == len(profile["weights"]) == len(collapsed)
+    # the two runs spent about 40ms
+    assert 20000 < profile["endValue"] < 1000000
+
+
+def test_sampling_profiler_sample_rate(tmp_path: Path) -> None:
+    """
+    Test that nothing is profiled with a null sample rate, and that profiles don't
+    nest.
+    """
+    profiler = SamplingProfiler(
+        sample_rate=0, interval=0.001, output_dir=str(tmp_path), export_interval=60
+    )
+    assert profiler.start("Chart.data") is None
+
+    profiler.sample_rate = 1
+    stop = profiler.start("Chart.data")
+    assert stop is not None
+    assert profiler.start("Chart.data") is None
+    stop()
+
+
+def test_bridge_profiler_sampling(tmp_path: Path) -> None:
+    """
+    Test that the middleware profiles streamed responses, per endpoint.
+    """
+
+    def app(environ: Dict[str, Any], start_response: Callable[..., Any]) -> Any:
+        def generate() -> Iterator[str]:
+            yield "a"
+            busy()
+            yield "b"
+
+        return Response(generate())(environ, start_response)
+
+    sampling_profiler = SamplingProfiler(
+        sample_rate=1, interval=0.001, output_dir=str(tmp_path), export_interval=60
+    )
+    middleware = BridgeProfiler(
+        app,
+        instrument=False,
+        sampling_profiler=sampling_profiler,
+        url_map=Map([Rule("/api/v1/chart/data", endpoint="ChartDataRestApi.data")]),
+    )
+    client = Client(middleware)
+    for path in ("/api/v1/chart/data", "/missing"):
+        response = client.get(path)
+        assert response.get_data() == b"ab"
+        response.close()
+    sampling_profiler.export()
+
+    pid = os.getpid()
+    collapsed = (tmp_path / f"ChartDataRestApi.data-{pid}.collapsed").read_text()
+    assert "busy (" in collapsed
+    assert (tmp_path / f"unknown-{pid}.collapsed").exists()
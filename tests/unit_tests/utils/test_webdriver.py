@@ -0,0 +1,174 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+# pylint: disable=import-outside-toplevel
+from flask import Flask
+from pytest_mock import MockFixture
+from selenium.common.exceptions import WebDriverException
+
+
+def test_webdriver_pool_reuses_drivers(mocker: MockFixture, app: Flask) -> None:
+    """
+    Test that a released driver is reset and handed out again for the same key
+    """
+    from bridge.utils.webdriver import WebDriverPool
+
+    mocker.patch.dict(app.config, {"WEBDRIVER_POOL_SIZE": 2})
+    pool = WebDriverPool()
+    create = mocker.MagicMock(side_effect=lambda: mocker.MagicMock())
+    key = ("firefox", "admin", (800, 600))
+
+    pooled = pool.acquire(key, create)
+    pool.release(key, pooled, reusable=True)
+    pooled.driver.get.assert_called_with("about:blank")
+
+    assert pool.acquire(key, create) is pooled
+    assert pool.acquire(("firefox", "gamma", (800, 600)), create) is not pooled
+    assert create.call_count == 2
+    assert pooled.uses == 1
+
+
+def test_webdriver_pool_discards_drivers(mocker: MockFixture, app: Flask) -> None:
+    """
+    Test that broken, unhealthy and worn out drivers are not reused
+    """
+    from bridge.utils.webdriver import WebDriverPool
+
+    mocker.patch.dict(
+        app.config, {"WEBDRIVER_POOL_SIZE": 2, "WEBDRIVER_POOL_MAX_USES": 2}
+    )
+    pool = WebDriverPool()
+    create = mocker.MagicMock(side_effect=lambda: mocker.MagicMock())
+    key = ("firefox", "admin", (800, 600))
+
+    broken = pool.acquire(key, create)
+    pool.release(key, broken, reusable=False)
+    broken.driver.quit.assert_called_once()
+
+    unhealthy = pool.acquire(key, create)
+    pool.release(key, unhealthy, reusable=True)
+    unhealthy.driver.execute_script.side_effect = WebDriverException()
+    assert pool.acquire(key, create) is not unhealthy
+    unhealthy.driver.quit.assert_called_once()
+
+    worn_out = pool.acquire(key, create)
+    worn_out.uses = 1
+    pool.release(key, worn_out, reusable=True)
+    worn_out.driver.quit.assert_called_once()
+    assert create.call_count == 4
+
+
+def test_webdriver_pool_size(mocker: MockFixture, app: Flask) -> None:
+    """
+    Test that the oldest idle drivers are evicted past the pool size
+    """
+    from bridge.utils.webdriver import WebDriverPool
+
+    mocker.patch.dict(app.config, {"WEBDRIVER_POOL_SIZE": 1})
+    pool = WebDriverPool()
+    create = mocker.MagicMock(side_effect=lambda: mocker.MagicMock())
+    first_key = ("firefox", "admin", (800, 600))
+    second_key = ("firefox", "admin", (1600, 1200))
+
+    first = pool.acquire(first_key, create)
+    second = pool.acquire(second_key, create)
+    pool.release(first_key, first, reusable=True)
+    pool.release(second_key, second, reusable=True)
+    first.driver.quit.assert_called_once()
+    second.driver.quit.assert_not_called()
+
+    pool.clear()
+    second.driver.quit.assert_called_once()
+
+
+def test_webdriver_pool_reaps_expired_drivers(mocker: MockFixture, app: Flask) -> None:
+    """
+    Test that expired idle drivers are closed when another driver is given back
+    """
+    from bridge.utils.webdriver import WebDriverPool
+
+    mocker.patch.dict(
+        app.config, {"WEBDRIVER_POOL_SIZE": 2, "WEBDRIVER_POOL_MAX_AGE": 60}
+    )
+    monotonic = mocker.patch("bridge.utils.webdriver.monotonic", return_value=0)
+    pool = WebDriverPool()
+    create = mocker.MagicMock(side_effect=lambda: mocker.MagicMock())
+    first_key = ("firefox", "admin", (800, 600))
+    second_key = ("firefox", "gamma", (800, 600))
+
+    first = pool.acquire(first_key, create)
+    first.created_at = 0
+    pool.release(first_key, first, reusable=True)
+    first.driver.quit.assert_not_called()
+
+    monotonic.return_value = 30
+    second = pool.acquire(second_key, create)
+    second.created_at = 30
+    monotonic.return_value = 60
+    pool.release(second_key, second, reusable=True)
+    first.driver.quit.assert_called_once()
+    second.driver.quit.assert_not_called()
+
+    monotonic.return_value = 90
+    pool.acquire(first_key, create)
+    second.driver.quit.assert_called_once()
+    assert create.call_count == 3
+
+
+def test_get_screenshot_pooled(mocker: MockFixture, app: Flask) -> None:
+    """
+    Test that screenshots of the same user reuse the same driver
+    """
+    from bridge.utils.webdriver import WebDriverPool, WebDriverProxy
+
+    mocker.patch.dict(app.config, {"WEBDRIVER_POOL_SIZE": 2})
+    mocker.patch("bridge.utils.webdriver.webdriver_pool", WebDriverPool())
+    mocker.patch("bridge.utils.webdriver.WebDriverWait")
+    mocker.patch("bridge.utils.webdriver.sleep")
+    firefox = mocker.patch("bridge.utils.webdriver.firefox")
+    mocker.patch(
+        "bridge.utils.webdriver.machine_auth_provider_factory"
+    ).instance.authenticate_webdriver.side_effect = lambda driver, user: driver
+    user = mocker.MagicMock(username="admin")
+
+    proxy = WebDriverProxy("firefox")
+    proxy.get_screenshot("http://localhost/chart/1", "chart-container", user)
+    proxy.get_screenshot("http://localhost/chart/2", "chart-container", user)
+
+    firefox.webdriver.WebDriver.assert_called_once()
+    firefox.webdriver.WebDriver.return_value.quit.assert_not_called()
+
+
+def test_get_screenshot_not_pooled(mocker: MockFixture, app: Flask) -> None:
+    """
+    Test that each screenshot starts its own driver unless pooling is enabled
+    """
+    from bridge.utils.webdriver import WebDriverProxy
+
+    mocker.patch("bridge.utils.webdriver.WebDriverWait")
+    mocker.patch("bridge.utils.webdriver.sleep")
+    firefox = mocker.patch("bridge.utils.webdriver.firefox")
+    mocker.patch(
+        "bridge.utils.webdriver.machine_auth_provider_factory"
+    ).instance.authenticate_webdriver.side_effect = lambda driver, user: driver
+    user = mocker.MagicMock(username="admin")
+
+    proxy = WebDriverProxy("firefox")
+    proxy.get_screenshot("http://localhost/chart/1", "chart-container", user)
+    proxy.get_screenshot("http://localhost/chart/2", "chart-container", user)
+
+    assert firefox.webdriver.WebDriver.call_count == 2
+    assert firefox.webdriver.WebDriver.return_value.quit.call_count == 2